@@ -352,25 +352,46 @@ async def _async_setup_device_entry(hass: HomeAssistant, entry: KKTKolbeConfigEn
             if not smartlife_token_info:
                 _LOGGER.warning("SmartLife parent entry %s has no token info", parent_entry_id[:8])
             else:
-                # Create TuyaSharingClient from stored tokens for cloud fallback
+                # Share one TuyaSharingClient per account: its device cache
+                # snapshot then serves every child device instead of each
+                # device re-fetching the whole account on every poll.
+                from .const import SMARTLIFE_SHARED_CLIENTS_KEY
+
+                shared_clients: dict[str, Any] = hass.data.setdefault(SMARTLIFE_SHARED_CLIENTS_KEY, {})
+                smartlife_client = shared_clients.get(parent_entry_id)
+                if smartlife_client is not None and smartlife_client.get_token_info_for_storage().get(
+                    "refresh_token"
+                ) != smartlife_token_info.get("refresh_token"):
+                    # Account was re-authenticated since the client was created
+                    _LOGGER.debug("Replacing shared SmartLife client for %s (tokens changed)", parent_entry_id[:8])
+                    stale_client = shared_clients.pop(parent_entry_id)
+                    smartlife_client = None
+                    try:
+                        await stale_client.async_close()
+                    except Exception as err:
+                        _LOGGER.debug("Error closing shared SmartLife client: %s", err)
+
                 try:
-                    from .clients.tuya_sharing_client import TuyaSharingClient
+                    if smartlife_client is None:
+                        from .clients.tuya_sharing_client import TuyaSharingClient
 
-                    smartlife_client = await TuyaSharingClient.async_from_stored_tokens(hass, smartlife_token_info)
+                        smartlife_client = await TuyaSharingClient.async_from_stored_tokens(hass, smartlife_token_info)
 
-                    # Register token persistence callback to update parent entry
-                    # when tokens are refreshed by the SDK
-                    async def update_parent_tokens(new_token_info: dict) -> None:
-                        """Persist refreshed tokens to parent config entry."""
-                        if parent_entry:
-                            _LOGGER.info(
-                                "Persisting refreshed SmartLife tokens to parent entry %s", parent_entry.entry_id[:8]
-                            )
-                            new_data = dict(parent_entry.data)
-                            new_data[CONF_SMARTLIFE_TOKEN_INFO] = new_token_info
-                            hass.config_entries.async_update_entry(parent_entry, data=new_data)
+                        # Register token persistence callback to update parent entry
+                        # when tokens are refreshed by the SDK
+                        async def update_parent_tokens(new_token_info: dict) -> None:
+                            """Persist refreshed tokens to parent config entry."""
+                            if parent_entry:
+                                _LOGGER.info(
+                                    "Persisting refreshed SmartLife tokens to parent entry %s",
+                                    parent_entry.entry_id[:8],
+                                )
+                                new_data = dict(parent_entry.data)
+                                new_data[CONF_SMARTLIFE_TOKEN_INFO] = new_token_info
+                                hass.config_entries.async_update_entry(parent_entry, data=new_data)
 
-                    smartlife_client.set_token_update_callback(update_parent_tokens)
+                        smartlife_client.set_token_update_callback(update_parent_tokens)
+                        shared_clients[parent_entry_id] = smartlife_client
 
                     _LOGGER.info("SmartLife client restored from stored tokens for device %s", entry.entry_id[:8])
                 except Exception as err:
@@ -397,10 +418,15 @@ async def _async_setup_device_entry(hass: HomeAssistant, entry: KKTKolbeConfigEn
         endpoint = entry.data.get("api_endpoint", "https://openapi.tuyaeu.com")
 
         if client_id and client_secret:
+            from .api.token_cache import async_load_token_store
+
+            # Restores the project's token from before the restart, if still valid
+            await async_load_token_store(hass)
             api_client = TuyaCloudClient(
                 client_id=client_id,
                 client_secret=client_secret,
                 endpoint=endpoint,
+                hass=hass,
             )
             _LOGGER.info("API client initialized for TinyTuya Cloud API")
 
@@ -526,6 +552,9 @@ async def _async_setup_device_entry(hass: HomeAssistant, entry: KKTKolbeConfigEn
             )
 
     if ip_address and device_id and local_key:
+        from .const import CONF_ENABLE_ASYNC_TRANSPORT
+        from .const import LOCAL_TRANSPORT_ASYNCIO
+        from .const import LOCAL_TRANSPORT_TINYTUYA
         from .tuya_device import KKTKolbeTuyaDevice
 
         device = KKTKolbeTuyaDevice(
@@ -533,6 +562,11 @@ async def _async_setup_device_entry(hass: HomeAssistant, entry: KKTKolbeConfigEn
             ip_address=ip_address,
             local_key=local_key,
             hass=hass,  # Pass hass for proper executor job scheduling
+            transport=(
+                LOCAL_TRANSPORT_ASYNCIO
+                if entry.options.get(CONF_ENABLE_ASYNC_TRANSPORT, False)
+                else LOCAL_TRANSPORT_TINYTUYA
+            ),
         )
         _LOGGER.info("Local device initialized")
     elif integration_mode == "manual":
@@ -544,6 +578,12 @@ async def _async_setup_device_entry(hass: HomeAssistant, entry: KKTKolbeConfigEn
         if not local_key:
             raise ValueError("Local key not found in config entry data")
 
+    # Import the model's DP/entity definitions off the event loop, before
+    # the coordinator reads its DP mapping
+    from .device_types import async_load_device_data
+
+    await async_load_device_data(hass, entry.data.get("device_type"))
+
     # Initialize appropriate coordinator based on mode
     # SmartLife mode uses HybridCoordinator with smartlife_client for cloud fallback
     if setup_mode == SETUP_MODE_SMARTLIFE and (device or smartlife_client):
@@ -645,6 +685,7 @@ async def _async_setup_device_entry(hass: HomeAssistant, entry: KKTKolbeConfigEn
             _LOGGER.warning("Could not detect device type, using default_hood")
 
     platforms = get_device_platforms(device_info["category"])
+    await async_load_device_data(hass, effective_device_type)
 
     # Store runtime data using modern pattern (HA 2024.6+)
     entry.runtime_data = KKTKolbeRuntimeData(
@@ -875,6 +916,9 @@ async def _async_unload_device_entry(hass: HomeAssistant, entry: KKTKolbeConfigE
         # Remove from hass.data (backward compatibility)
         hass.data[DOMAIN].pop(entry.entry_id, None)
 
+        # Close the account's shared SmartLife client with its last device
+        await _async_release_shared_smartlife_client(hass, entry)
+
         # Count remaining device entries (exclude account entries)
         device_entries = [
             e for e in hass.data[DOMAIN].values() if isinstance(e, dict) and e.get("entry_type") != ENTRY_TYPE_ACCOUNT
@@ -892,3 +936,27 @@ async def _async_unload_device_entry(hass: HomeAssistant, entry: KKTKolbeConfigE
             await async_stop_discovery()
 
     return unload_ok
+
+
+async def _async_release_shared_smartlife_client(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Close the shared SmartLife client once no loaded device of its account remains."""
+    from .const import SMARTLIFE_SHARED_CLIENTS_KEY
+
+    parent_entry_id = entry.data.get("parent_entry_id")
+    shared_clients: dict[str, Any] = hass.data.get(SMARTLIFE_SHARED_CLIENTS_KEY, {})
+    if not parent_entry_id or parent_entry_id not in shared_clients:
+        return
+
+    for config_entry in hass.config_entries.async_entries(DOMAIN):
+        if (
+            config_entry.entry_id != entry.entry_id
+            and config_entry.data.get("parent_entry_id") == parent_entry_id
+            and config_entry.entry_id in hass.data[DOMAIN]
+        ):
+            return
+
+    client = shared_clients.pop(parent_entry_id)
+    try:
+        await client.async_close()
+    except Exception as err:
+        _LOGGER.debug("Error closing shared SmartLife client: %s", err)
@@ -0,0 +1,130 @@
+"""Activity model driving the poll cadence.
+
+The coordinators polled an idle cooktop overnight exactly as often as one
+with four zones boiling. ``ActivityCadence`` classifies the device from the
+DP values already cached (main power, zone level bitfield, fan speed,
+timers) and picks the poll interval:
+
+* burst  - shortly after a user command, to pick up its consequences
+* active - zones, fan or a timer running
+* on     - powered on but nothing running (the normal interval)
+* idle   - switched off
+
+DPs are found by their property code in the device's DP mapping, because
+the numbers overlap between device types (DP 101 is the cooktop's main
+power but a hood's RGB mode).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from collections.abc import Mapping
+from datetime import timedelta
+from enum import Enum
+from typing import Any
+
+from .bitfield_utils import get_decoded_bitfield
+from .const import POLL_BURST_DURATION_SECONDS
+from .const import POLL_INTERVAL_ACTIVE_SECONDS
+from .const import POLL_INTERVAL_BURST_SECONDS
+from .const import POLL_INTERVAL_IDLE_SECONDS
+
+# Property codes (hoods, IND7705HC cooktop, EB8313HC oven and the generic mapping)
+POWER_CODES = frozenset({"switch", "user_device_power_switch"})
+ZONE_BITFIELD_CODES = frozenset(
+    {"oem_hob_level_num", "zone_levels_bitfield", "oem_hob_timer_num", "zone_timer_remaining"}
+)
+FAN_CODES = frozenset({"fan_speed_enum", "fan_speed", "fan_speed_set"})
+TIMER_CODES = frozenset({"countdown", "countdown_1", "oem_device_timer_num", "general_timer", "djs"})
+RUN_SWITCH_CODES = frozenset({"kg"})
+
+# Values of fan/timer DPs meaning "not running"
+_STOPPED_VALUES = frozenset({"", "0", "off", "cancel"})
+
+
+class DeviceActivity(Enum):
+    """Device activity levels, fastest cadence first."""
+
+    BURST = "burst"
+    ACTIVE = "active"
+    ON = "on"
+    IDLE = "idle"
+
+
+def _is_running(value: Any) -> bool:
+    """Return True if a fan/timer/switch value is non-zero / not off."""
+    if value is None or value is False:
+        return False
+    if isinstance(value, (int, float)):
+        return value != 0
+    return str(value).lower() not in _STOPPED_VALUES
+
+
+class ActivityCadence:
+    """Classify a device from its DPs and choose the matching poll interval."""
+
+    def __init__(
+        self,
+        owner: Any,
+        data_points: Mapping[int, str],
+        normal_interval: timedelta,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cadence.
+
+        Args:
+            owner: Coordinator the decoded zone bitfields are cached for
+            data_points: DP id -> property code mapping of the device
+            normal_interval: Interval while powered on with nothing running
+            clock: Monotonic time source
+        """
+        self._owner = owner
+        self._clock = clock
+        self._power_dps = self._dps_for(data_points, POWER_CODES)
+        self._zone_dps = self._dps_for(data_points, ZONE_BITFIELD_CODES)
+        self._running_dps = self._dps_for(data_points, FAN_CODES | TIMER_CODES | RUN_SWITCH_CODES)
+        self._burst_until = 0.0
+
+        self.intervals: dict[DeviceActivity, timedelta] = {
+            DeviceActivity.BURST: min(timedelta(seconds=POLL_INTERVAL_BURST_SECONDS), normal_interval),
+            DeviceActivity.ACTIVE: min(timedelta(seconds=POLL_INTERVAL_ACTIVE_SECONDS), normal_interval),
+            DeviceActivity.ON: normal_interval,
+            DeviceActivity.IDLE: max(timedelta(seconds=POLL_INTERVAL_IDLE_SECONDS), normal_interval),
+        }
+        self.activity = DeviceActivity.ON
+
+    @staticmethod
+    def _dps_for(data_points: Mapping[int, str], codes: frozenset[str]) -> tuple[str, ...]:
+        """Return the DP ids (as DPS dict keys) whose code is in ``codes``."""
+        return tuple(str(dp) for dp, code in data_points.items() if code in codes)
+
+    def note_command(self) -> None:
+        """Start a burst of fast polls after a user command."""
+        self._burst_until = self._clock() + POLL_BURST_DURATION_SECONDS
+
+    def classify(self, dps: Mapping[str, Any]) -> DeviceActivity:
+        """Return (and remember) the activity level for the given DP values."""
+        self.activity = self._classify(dps)
+        return self.activity
+
+    def _classify(self, dps: Mapping[str, Any]) -> DeviceActivity:
+        """Return the activity level without remembering it."""
+        if self._clock() < self._burst_until:
+            return DeviceActivity.BURST
+        # Idle only when a power DP was reported and all are off; leftover
+        # fan/timer values of a switched-off device don't count
+        power = [dps[dp] for dp in self._power_dps if dp in dps]
+        if power and not any(power):
+            return DeviceActivity.IDLE
+        for dp in self._zone_dps:
+            raw = dps.get(dp)
+            if raw and any(get_decoded_bitfield(self._owner, int(dp), raw).data):
+                return DeviceActivity.ACTIVE
+        if any(_is_running(dps.get(dp)) for dp in self._running_dps):
+            return DeviceActivity.ACTIVE
+        return DeviceActivity.ON
+
+    def interval(self, dps: Mapping[str, Any]) -> timedelta:
+        """Classify the device and return the poll interval for its activity."""
+        return self.intervals[self.classify(dps)]
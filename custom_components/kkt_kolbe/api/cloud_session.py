@@ -0,0 +1,93 @@
+"""Traced Home Assistant session for the short-lived Tuya OpenAPI clients.
+
+Config flow credential checks, discovery, options and repairs all create
+short-lived ``TuyaCloudClient`` instances without a session. They borrow one
+session created with ``async_create_clientsession`` instead of opening their
+own, so their requests run over Home Assistant's shared connector and its
+keep-alive connections and DNS cache. The session only adds aiohttp tracing:
+per host, requests, new connections, reused connections and DNS cache
+hits/misses, for the diagnostics.
+"""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from ..const import CLOUD_SESSION_KEY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TracedCloudSession:
+    """Lend the session-less cloud clients a traced Home Assistant session."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize without a session; it is created on first use."""
+        self._hass = hass
+        self._session: aiohttp.ClientSession | None = None
+        self._stats: dict[str, dict[str, int]] = {}
+
+    @callback
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the traced session.
+
+        The session is managed by Home Assistant; callers must not close it.
+        """
+        if self._session is None or self._session.closed:
+            _LOGGER.debug("Created traced cloud session")
+            self._session = async_create_clientsession(self._hass, trace_configs=[self._trace_config()])
+        return self._session
+
+    @property
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return the reuse counters per host."""
+        return {host: dict(stats) for host, stats in self._stats.items()}
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """Return a trace config counting connection reuse per host."""
+
+        async def _on_request_start(
+            session: aiohttp.ClientSession, context: SimpleNamespace, params: aiohttp.TraceRequestStartParams
+        ) -> None:
+            # Connection events carry no URL; they find the host's counters in the request context
+            context.stats = self._stats.setdefault(
+                params.url.host or "",
+                {
+                    "requests": 0,
+                    "connections_created": 0,
+                    "connections_reused": 0,
+                    "dns_cache_hits": 0,
+                    "dns_cache_misses": 0,
+                },
+            )
+            context.stats["requests"] += 1
+
+        def _count(key: str) -> Any:
+            async def _on_event(session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+                if (stats := getattr(context, "stats", None)) is not None:
+                    stats[key] += 1
+
+            return _on_event
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(_on_request_start)
+        trace.on_connection_create_end.append(_count("connections_created"))
+        trace.on_connection_reuseconn.append(_count("connections_reused"))
+        trace.on_dns_cache_hit.append(_count("dns_cache_hits"))
+        trace.on_dns_cache_miss.append(_count("dns_cache_misses"))
+        return trace
+
+
+@callback
+def get_traced_cloud_session(hass: HomeAssistant) -> TracedCloudSession:
+    """Return the traced cloud session of this Home Assistant instance."""
+    if (traced := hass.data.get(CLOUD_SESSION_KEY)) is None:
+        traced = hass.data[CLOUD_SESSION_KEY] = TracedCloudSession(hass)
+    return traced
@@ -5,8 +5,14 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from dataclasses import field
+from typing import TYPE_CHECKING
 from typing import Any
 
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .tuya_cloud_client import TuyaCloudClient
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -91,7 +97,7 @@ class DynamicDeviceFactory:
         # Extract basic device info
         device_info = self._extract_device_info(api_data)
 
-        # Parse the model data (JSON string in API response)
+        # Parse the model data (JSON string in API response, or already parsed from the spec store)
         model_data = self._parse_model_data(api_data.get("result", {}).get("model", "{}"))
 
         # Create device config
@@ -108,6 +114,40 @@ class DynamicDeviceFactory:
         _LOGGER.info(f"Created device config with {len(device_config.entities)} entities")
         return device_config
 
+    async def async_analyze_device(
+        self, hass: HomeAssistant, client: TuyaCloudClient, device: dict[str, Any]
+    ) -> DeviceConfig:
+        """Analyze a device of the cloud device list, reading its spec through the spec store.
+
+        The Things Data Model is only fetched from the cloud for a product or
+        firmware version the store does not know yet.
+        """
+        from ..spec_store import SPEC_SOURCE_OPENAPI
+        from ..spec_store import async_get_spec_store
+
+        device_id = device["id"]
+        store = await async_get_spec_store(hass)
+        properties = (
+            await store.async_get_spec(
+                SPEC_SOURCE_OPENAPI,
+                device_id,
+                device.get("product_id"),
+                lambda: client.get_device_properties(device_id),
+                lambda: client.get_firmware_info(device_id),
+            )
+            or {}
+        )
+        return await self.analyze_device_properties(
+            {
+                "result": {
+                    "device_id": device_id,
+                    "model_id": device.get("model") or "unknown",
+                    "name": device.get("name", "KKT Kolbe Device"),
+                    "model": properties.get("model", "{}"),
+                }
+            }
+        )
+
     def _extract_device_info(self, api_data: dict) -> dict:
         """Extract basic device information from API response."""
         result = api_data.get("result", {})
@@ -118,8 +158,10 @@ class DynamicDeviceFactory:
             "name": result.get("name", "KKT Kolbe Device"),
         }
 
-    def _parse_model_data(self, model_json: str) -> dict[str, Any]:
+    def _parse_model_data(self, model_json: str | dict[str, Any]) -> dict[str, Any]:
         """Parse the nested JSON model data from API response."""
+        if isinstance(model_json, dict):
+            return model_json
         try:
             import json
 
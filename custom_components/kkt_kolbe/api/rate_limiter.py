@@ -0,0 +1,157 @@
+"""Account-wide token bucket for Tuya OpenAPI requests.
+
+Tuya enforces its request quota per cloud project (``client_id``), but every
+device entry, config flow and repair creates its own ``TuyaCloudClient``. The
+clients of one project therefore share one ``AccountRateLimiter``, kept in
+``hass.data``:
+
+- Requests run concurrently as long as the bucket has tokens; it refills at
+  ``RATE_LIMIT_REQUESTS_PER_MINUTE`` and holds up to ``RATE_LIMIT_BURST``.
+- Waiting requests are served by priority, so user commands overtake
+  background polls queued before them.
+- A 1011 answer to any client starts an exponential backoff for the whole
+  project; the first successful request after it ends the backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
+
+from ..const import RATE_LIMITERS_KEY
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rate limiting configuration (per cloud project)
+RATE_LIMIT_REQUESTS_PER_MINUTE = 15  # Conservative limit for Tuya Free tier
+# Requests that may run back to back; like the former sliding window, a full
+# minute's quota is available at once
+RATE_LIMIT_BURST = RATE_LIMIT_REQUESTS_PER_MINUTE
+RATE_LIMIT_BACKOFF_BASE = 5  # Base seconds for backoff after rate limit hit
+RATE_LIMIT_BACKOFF_MAX = 300  # Max backoff (5 minutes)
+
+# Request priorities, lower is served first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class AccountRateLimiter:
+    """Token bucket with priority queue and backoff, shared by one project's clients."""
+
+    def __init__(
+        self,
+        requests_per_minute: float = RATE_LIMIT_REQUESTS_PER_MINUTE,
+        burst: int = RATE_LIMIT_BURST,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            requests_per_minute: Sustained request rate
+            burst: Bucket capacity
+        """
+        self._rate = requests_per_minute / 60
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._backoff: float = 0
+        self._blocked_until: float = 0  # time.monotonic()
+        self._counter = itertools.count()
+        # (priority, arrival, future) of requests waiting for a token
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._wakeup: asyncio.TimerHandle | None = None
+        self.stats: dict[str, int] = {"requests": 0, "waited": 0, "rate_limited": 0}
+
+    @property
+    def backoff_remaining(self) -> float:
+        """Return the seconds left of the current 1011 backoff."""
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    async def async_acquire(self, priority: int = PRIORITY_POLL) -> None:
+        """Wait for a request slot; higher priority waiters are served first."""
+        self.stats["requests"] += 1
+        self._refill()
+        if not self._waiters and self._tokens >= 1 and time.monotonic() >= self._blocked_until:
+            self._tokens -= 1
+            return
+
+        self.stats["waited"] += 1
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        self._schedule_wakeup()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation: hand the token on
+                self._tokens += 1
+            self._release()
+            raise
+
+    def report_rate_limited(self) -> int:
+        """Start (or double) the project-wide backoff after a 1011 answer.
+
+        Returns the backoff in seconds, for use as ``retry_after``.
+        """
+        if self._backoff == 0:
+            self._backoff = RATE_LIMIT_BACKOFF_BASE
+        else:
+            self._backoff = min(self._backoff * 2, RATE_LIMIT_BACKOFF_MAX)
+        self._refill()
+        self._blocked_until = time.monotonic() + self._backoff
+        self._tokens = 0
+        self.stats["rate_limited"] += 1
+        _LOGGER.warning("Rate limit hit! Backing off for %ss", self._backoff)
+        return int(self._backoff)
+
+    def report_success(self) -> None:
+        """Reset the backoff after a successful request."""
+        if self._backoff > 0:
+            self._backoff = 0
+            _LOGGER.debug("Rate limit backoff reset")
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _release(self) -> None:
+        """Grant tokens to waiters in priority order, then wait for the next token."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        self._refill()
+        while self._waiters and self._tokens >= 1 and time.monotonic() >= self._blocked_until:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        # Drop cancelled waiters at the head so they don't keep the timer alive
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        self._schedule_wakeup()
+
+    def _schedule_wakeup(self) -> None:
+        """Run ``_release`` once the next token is available (or the backoff ends)."""
+        if not self._waiters or self._wakeup is not None:
+            return
+        delay = max(self._blocked_until - time.monotonic(), (1 - self._tokens) / self._rate, 0)
+        if delay > 1:
+            _LOGGER.debug("Rate limit reached, waiting %.1fs", delay)
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._release)
+
+
+@callback
+def get_account_rate_limiter(hass: HomeAssistant, client_id: str) -> AccountRateLimiter:
+    """Return the limiter shared by all clients of the cloud project ``client_id``."""
+    limiters: dict[str, AccountRateLimiter] = hass.data.setdefault(RATE_LIMITERS_KEY, {})
+    if (limiter := limiters.get(client_id)) is None:
+        limiter = limiters[client_id] = AccountRateLimiter()
+    return limiter
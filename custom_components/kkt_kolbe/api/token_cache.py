@@ -0,0 +1,198 @@
+"""Account-wide access tokens for the Tuya OpenAPI.
+
+Every device entry in API mode, every ``TuyaAPIManager`` and every config flow
+check used to log in on its own, so an account with six devices fetched six
+tokens at startup, and a client whose token ran out made the next request
+(possibly a user command) wait for a login first.
+
+Clients of one cloud project and endpoint now share an ``AccountToken``:
+
+- Concurrent logins are single-flight; every waiter gets the same token.
+- Within ``TOKEN_PROACTIVE_REFRESH`` seconds of expiry the next caller starts
+  a background login and keeps using the current token, so requests only
+  wait for a login when there is no usable token at all.
+- The cache lives in ``hass.data``; with ``async_load_token_store`` tokens
+  are persisted in HA storage and restored after a restart until they expire.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from ..const import CLOUD_TOKEN_CACHE_KEY
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# A token is no longer handed out this many seconds before it expires
+TOKEN_EXPIRY_MARGIN = 300
+# A background refresh starts this many seconds before expiry
+TOKEN_PROACTIVE_REFRESH = 900
+TOKEN_SAVE_DELAY = 10
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.cloud_tokens"
+
+# Performs the login and returns (access_token, expires_at as time.time())
+LoginCallback = Callable[[], Awaitable[tuple[str, float]]]
+
+
+class AccountToken:
+    """The access token of one cloud project on one endpoint."""
+
+    def __init__(self, cache: AccountTokenCache, key: str) -> None:
+        """Initialize without a token."""
+        self._cache = cache
+        self._key = key
+        self.access_token: str | None = None
+        self.expires_at: float | None = None  # time.time()
+        self._login_task: asyncio.Task[str] | None = None
+        self.stats: dict[str, int] = {"logins": 0, "proactive_refreshes": 0, "coalesced": 0}
+
+    def is_valid(self, now: float | None = None) -> bool:
+        """Return True if the token can still be used for a request."""
+        if self.access_token is None or self.expires_at is None:
+            return False
+        return (now if now is not None else time.time()) < self.expires_at - TOKEN_EXPIRY_MARGIN
+
+    async def async_get(self, login: LoginCallback) -> str:
+        """Return a usable token, logging in only if there is none.
+
+        A token close to expiry is still returned while a background login
+        replaces it.
+        """
+        now = time.time()
+        if self.is_valid(now):
+            assert self.access_token is not None and self.expires_at is not None
+            if self.expires_at - now < TOKEN_PROACTIVE_REFRESH and not self._login_in_flight:
+                self.stats["proactive_refreshes"] += 1
+                self._start_login(login).add_done_callback(_log_background_login_error)
+            return self.access_token
+        return await self.async_login(login)
+
+    async def async_login(self, login: LoginCallback) -> str:
+        """Log in now, or join the login already in flight."""
+        if self._login_in_flight:
+            self.stats["coalesced"] += 1
+            assert self._login_task is not None
+            task = self._login_task
+        else:
+            task = self._start_login(login)
+        # Shield so a cancelled caller does not cancel the login others wait on
+        return await asyncio.shield(task)
+
+    def invalidate(self, access_token: str | None) -> None:
+        """Forget ``access_token`` after the platform rejected it (code 1010)."""
+        if access_token is not None and access_token == self.access_token:
+            self.access_token = None
+            self.expires_at = None
+            self._cache.async_schedule_save()
+
+    @property
+    def _login_in_flight(self) -> bool:
+        return self._login_task is not None and not self._login_task.done()
+
+    def _start_login(self, login: LoginCallback) -> asyncio.Task[str]:
+        """Run ``login`` as the single in-flight login of this token."""
+
+        async def _login() -> str:
+            access_token, expires_at = await login()
+            self.access_token = access_token
+            self.expires_at = expires_at
+            self.stats["logins"] += 1
+            self._cache.async_schedule_save()
+            return access_token
+
+        self._login_task = asyncio.get_running_loop().create_task(_login())
+        return self._login_task
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the persisted form of the token."""
+        return {"access_token": self.access_token, "expires_at": self.expires_at}
+
+
+class AccountTokenCache:
+    """Tokens of all cloud projects, backed by HA storage when created with hass."""
+
+    def __init__(self, hass: HomeAssistant | None = None) -> None:
+        """Initialize an empty cache (call async_load to restore and persist tokens)."""
+        self._tokens: dict[str, AccountToken] = {}
+        self._store: Store[dict[str, dict[str, Any]]] | None = (
+            Store(hass, STORAGE_VERSION, STORAGE_KEY, private=True) if hass is not None else None
+        )
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    def get(self, client_id: str, endpoint: str) -> AccountToken:
+        """Return the shared token of ``client_id`` on ``endpoint``."""
+        key = f"{client_id}@{endpoint.rstrip('/')}"
+        if (token := self._tokens.get(key)) is None:
+            token = self._tokens[key] = AccountToken(self, key)
+        return token
+
+    async def async_load(self) -> None:
+        """Restore unexpired tokens from storage and persist new ones from now on."""
+        async with self._load_lock:
+            if self._loaded or self._store is None:
+                return
+            try:
+                data = await self._store.async_load() or {}
+            except Exception as err:
+                _LOGGER.warning("Failed to load cloud tokens: %s", err)
+                data = {}
+            now = time.time()
+            for key, stored in data.items():
+                token = self._tokens.setdefault(key, AccountToken(self, key))
+                if token.access_token is None and isinstance(stored, dict):
+                    token.access_token = stored.get("access_token")
+                    token.expires_at = stored.get("expires_at")
+                    if not token.is_valid(now):
+                        token.access_token = token.expires_at = None
+            self._loaded = True
+            _LOGGER.debug(
+                "Restored %d valid cloud token(s)", sum(token.is_valid(now) for token in self._tokens.values())
+            )
+
+    def async_schedule_save(self) -> None:
+        """Persist the tokens soon, once storage is loaded."""
+        if self._loaded and self._store is not None:
+            self._store.async_delay_save(self._data_to_save, TOKEN_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the unexpired tokens to persist."""
+        now = time.time()
+        return {key: token.as_dict() for key, token in self._tokens.items() if token.is_valid(now)}
+
+
+def _log_background_login_error(task: asyncio.Task[str]) -> None:
+    """Log a failed proactive refresh; the current token stays in use."""
+    if not task.cancelled() and (err := task.exception()) is not None:
+        _LOGGER.warning("Proactive token refresh failed: %s", err)
+
+
+@callback
+def get_token_cache(hass: HomeAssistant) -> AccountTokenCache:
+    """Return the token cache of this HA instance."""
+    if (cache := hass.data.get(CLOUD_TOKEN_CACHE_KEY)) is None:
+        cache = hass.data[CLOUD_TOKEN_CACHE_KEY] = AccountTokenCache(hass)
+    return cache
+
+
+@callback
+def get_account_token(hass: HomeAssistant, client_id: str, endpoint: str) -> AccountToken:
+    """Return the token shared by all clients of ``client_id`` on ``endpoint``."""
+    return get_token_cache(hass).get(client_id, endpoint)
+
+
+async def async_load_token_store(hass: HomeAssistant) -> None:
+    """Restore the stored tokens once and persist new ones from now on."""
+    await get_token_cache(hass).async_load()
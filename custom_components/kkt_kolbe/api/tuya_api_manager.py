@@ -20,6 +20,7 @@ from ..const import CONF_API_ENDPOINT
 from ..const import DEFAULT_API_ENDPOINT
 from .api_exceptions import TuyaAPIError
 from .api_exceptions import TuyaAuthenticationError
+from .token_cache import async_load_token_store
 from .tuya_cloud_client import TuyaCloudClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -60,12 +61,14 @@ class TuyaAPIManager:
         """Get authenticated API client."""
         async with self._lock:
             if self._client is None:
-                session = async_get_clientsession(self.hass)
+                await async_load_token_store(self.hass)
+                # Shares the access token of the project
                 self._client = TuyaCloudClient(
                     client_id=self.client_id,
                     client_secret=self.client_secret,
                     endpoint=self.endpoint,
-                    session=session,
+                    session=async_get_clientsession(self.hass),
+                    hass=self.hass,
                 )
 
             try:
@@ -104,14 +107,28 @@ class TuyaAPIManager:
             _LOGGER.error("Failed to get device list: %s", err)
             raise
 
-    async def async_get_device_properties(self, device_id: str) -> dict[str, Any]:
-        """Get device properties with error handling."""
+    async def async_get_device_properties(self, device_id: str, product_id: str | None = None) -> dict[str, Any]:
+        """Get device properties with error handling.
+
+        Served from the spec store unless the product or its firmware is new.
+        """
         import async_timeout
 
+        from ..spec_store import SPEC_SOURCE_OPENAPI
+        from ..spec_store import async_get_spec_store
+
         try:
             async with async_timeout.timeout(10):
                 client = await self.async_get_client()
-                return await client.get_device_properties(device_id)
+                store = await async_get_spec_store(self.hass)
+                spec = await store.async_get_spec(
+                    SPEC_SOURCE_OPENAPI,
+                    device_id,
+                    product_id,
+                    lambda: client.get_device_properties(device_id),
+                    lambda: client.get_firmware_info(device_id),
+                )
+                return spec or {}
         except TimeoutError:
             _LOGGER.error("Timeout getting device properties for %s", device_id)
             raise UpdateFailed("API request timed out") from None
@@ -7,8 +7,214 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from ..dp_codec import compile_codec
+
 _LOGGER = logging.getLogger(__name__)
 
+# Tuya types → Home Assistant entity types
+_ENTITY_MAPPING: dict[str, dict[str, str]] = {
+    "Boolean": {"entity_type": "switch", "data_type": "bool"},
+    "Integer": {"entity_type": "number", "data_type": "value"},
+    "Enum": {"entity_type": "select", "data_type": "enum"},
+    "String": {"entity_type": "sensor", "data_type": "string"},
+    "Bitmap": {"entity_type": "sensor", "data_type": "string"},  # Will be formatted as text
+}
+
+# Friendly names for common codes
+_FRIENDLY_NAMES: dict[str, str] = {
+    # YYJ - Range Hood
+    "fan_speed_enum": "Fan Speed",
+    "switch_lamp": "Light Strip",
+    "light": "Light",
+    "countdown": "Timer",
+    "countdown_left": "Timer Remaining",
+    "disinfection": "Disinfection",
+    "anion": "Anion",
+    "switch_wash": "Wash Mode",
+    "switch": "Power",
+    "warm": "Warm",
+    "drying": "Drying",
+    "fault": "Fault Status",
+    "status": "Device Status",
+    "total_runtime": "Total Runtime",
+    # DCL - Cooktop
+    "work_mode": "Cooking Mode",
+    "appointment_time": "Appointment Time",
+    "cook_temperature": "Cooking Temperature",
+    "current_temperature": "Current Temperature",
+    "cook_power": "Cooking Power",
+    "pause": "Pause/Resume",
+    "work_status": "Work Status",
+    "start": "Start",
+    "cook_time": "Cooking Time",
+    "remaining_time": "Remaining Time",
+    # XFJ - Ventilation
+    "mode": "Work Mode",
+    "air_volume": "Air Volume",
+    "loop_mode": "Loop Mode",
+    "supply_fan_speed": "Supply Fan Speed",
+    "exhaust_fan_speed": "Exhaust Fan Speed",
+    "fresh_air_valve": "Fresh Air Valve",
+    "air_exhaust_fan": "Air Exhaust Fan",
+    "primary_filter_reset": "Primary Filter Reset",
+    "medium_filter_reset": "Medium Filter Reset",
+    "high_filter_reset": "High Filter Reset",
+    "sterilize": "Sterilize",
+    "bypass_function": "Bypass Function",
+    "heat": "Electric Heating",
+    "pm25_set": "PM2.5 Setting",
+    "eco2_set": "eCO2 Setting",
+    "temp_set": "Temperature Setting",
+    "humidity_set": "Humidity Setting",
+    "tvoc_set": "TVOC Setting",
+    "air_conditioning": "Air Conditioning",
+    "backlight": "Backlight Brightness",
+    "purify_mode": "Purify Mode",
+    "purification": "Purification",
+    "dehumidifier": "Dehumidifier",
+    "defrost": "Defrost",
+    "countdown_set": "Countdown Setting",
+    "factory_reset": "Factory Reset",
+    "child_lock": "Child Lock",
+    "filter_reset": "Filter Reset",
+    "uv_light": "UV Light",
+    "pm10_set": "PM10 Setting",
+    "pm10": "PM10",
+    "humidity_outdoor": "Outdoor Humidity",
+    "temp_outdoor": "Outdoor Temperature",
+    "air_quality": "Air Quality",
+    "supply_temp": "Supply Temperature",
+    "exhaust_temp": "Exhaust Temperature",
+    "supply_air_vol": "Supply Air Volume",
+    "exhaust_air_vol": "Exhaust Air Volume",
+    "primary_filter_life": "Primary Filter Life",
+    "medium_filter_life": "Medium Filter Life",
+    "high_filter_life": "High Filter Life",
+    "filter_life": "Filter Life",
+    "uv_life": "UV Life",
+    "temp_indoor": "Indoor Temperature",
+    "humidity_indoor": "Indoor Humidity",
+    "tvoc": "TVOC",
+    "eco2": "eCO2",
+    "pm25": "PM2.5",
+    "hcho_sensor_value": "HCHO Level",
+}
+
+# Icons for common codes
+_ICONS: dict[str, str] = {
+    # YYJ - Range Hood
+    "fan_speed_enum": "mdi:fan",
+    "switch_lamp": "mdi:lightbulb",
+    "light": "mdi:lightbulb",
+    "countdown": "mdi:timer",
+    "countdown_left": "mdi:timer-sand",
+    "disinfection": "mdi:spray-bottle",
+    "anion": "mdi:air-filter",
+    "switch_wash": "mdi:washing-machine",
+    "switch": "mdi:power",
+    "warm": "mdi:thermometer",
+    "drying": "mdi:air-filter",
+    "fault": "mdi:alert-circle",
+    "status": "mdi:information",
+    "total_runtime": "mdi:clock-time-eight",
+    # DCL - Cooktop
+    "work_mode": "mdi:chef-hat",
+    "appointment_time": "mdi:clock-outline",
+    "cook_temperature": "mdi:thermometer",
+    "current_temperature": "mdi:thermometer",
+    "cook_power": "mdi:flash",
+    "pause": "mdi:pause",
+    "work_status": "mdi:stove",
+    "start": "mdi:play",
+    "cook_time": "mdi:timer",
+    "remaining_time": "mdi:timer-sand",
+    # XFJ - Ventilation
+    "mode": "mdi:cog",
+    "air_volume": "mdi:weather-windy",
+    "loop_mode": "mdi:sync",
+    "supply_fan_speed": "mdi:fan",
+    "exhaust_fan_speed": "mdi:fan",
+    "fresh_air_valve": "mdi:valve",
+    "air_exhaust_fan": "mdi:fan",
+    "primary_filter_reset": "mdi:filter",
+    "medium_filter_reset": "mdi:filter",
+    "high_filter_reset": "mdi:filter",
+    "sterilize": "mdi:spray-bottle",
+    "bypass_function": "mdi:swap-horizontal",
+    "heat": "mdi:radiator",
+    "pm25_set": "mdi:air-filter",
+    "eco2_set": "mdi:molecule-co2",
+    "temp_set": "mdi:thermometer",
+    "humidity_set": "mdi:water-percent",
+    "tvoc_set": "mdi:chemical-weapon",
+    "air_conditioning": "mdi:air-conditioner",
+    "backlight": "mdi:brightness-6",
+    "purify_mode": "mdi:air-purifier",
+    "purification": "mdi:air-purifier",
+    "dehumidifier": "mdi:air-humidifier-off",
+    "defrost": "mdi:snowflake-melt",
+    "countdown_set": "mdi:timer-cog",
+    "factory_reset": "mdi:factory",
+    "child_lock": "mdi:lock",
+    "filter_reset": "mdi:filter-check",
+    "uv_light": "mdi:lightbulb-fluorescent-tube",
+    "pm10_set": "mdi:air-filter",
+    "pm10": "mdi:air-filter",
+    "humidity_outdoor": "mdi:water-percent",
+    "temp_outdoor": "mdi:thermometer",
+    "air_quality": "mdi:air-purifier",
+    "supply_temp": "mdi:thermometer-plus",
+    "exhaust_temp": "mdi:thermometer-minus",
+    "supply_air_vol": "mdi:weather-windy",
+    "exhaust_air_vol": "mdi:weather-windy",
+    "primary_filter_life": "mdi:filter-check",
+    "medium_filter_life": "mdi:filter-check",
+    "high_filter_life": "mdi:filter-check",
+    "filter_life": "mdi:filter-check",
+    "uv_life": "mdi:lightbulb-fluorescent-tube",
+    "temp_indoor": "mdi:home-thermometer",
+    "humidity_indoor": "mdi:home-thermometer",
+    "tvoc": "mdi:chemical-weapon",
+    "eco2": "mdi:molecule-co2",
+    "pm25": "mdi:air-filter",
+    "hcho_sensor_value": "mdi:chemical-weapon",
+}
+
+# Read-only properties, always exposed as sensors
+_READONLY_CODES = frozenset(
+    {
+        # YYJ - Range Hood
+        "countdown_left",
+        "fault",
+        "status",
+        "total_runtime",
+        # DCL - Cooktop
+        "current_temperature",
+        "work_status",
+        "remaining_time",
+        # XFJ - Ventilation (sensors/monitoring)
+        "temp_indoor",
+        "humidity_indoor",
+        "temp_outdoor",
+        "humidity_outdoor",
+        "pm25",
+        "pm10",
+        "tvoc",
+        "eco2",
+        "air_quality",
+        "hcho_sensor_value",
+        "supply_temp",
+        "exhaust_temp",
+        "supply_air_vol",
+        "exhaust_air_vol",
+        "primary_filter_life",
+        "medium_filter_life",
+        "high_filter_life",
+        "filter_life",
+        "uv_life",
+    }
+)
+
 
 class TuyaCategorySpecs:
     """Manages Tuya category specifications for device configuration."""
@@ -255,234 +461,29 @@ class TuyaCategorySpecs:
             if not code or not data_type:
                 return None
 
-            # Parse values JSON
-            try:
-                values = json.loads(values_str) if values_str else {}
-            except json.JSONDecodeError:
-                values = {}
-
-            # Map Tuya types to Home Assistant entity types
-            entity_mapping = {
-                "Boolean": {"entity_type": "switch", "data_type": "bool"},
-                "Integer": {"entity_type": "number", "data_type": "value"},
-                "Enum": {"entity_type": "select", "data_type": "enum"},
-                "String": {"entity_type": "sensor", "data_type": "string"},
-                "Bitmap": {"entity_type": "sensor", "data_type": "string"},  # Will be formatted as text
-            }
-
-            mapping = entity_mapping.get(data_type)
+            mapping = _ENTITY_MAPPING.get(data_type)
             if not mapping:
                 _LOGGER.warning("Unknown Tuya type: %s for code: %s", data_type, code)
                 return None
 
-            # Generate friendly names for common codes
-            friendly_names = {
-                # YYJ - Range Hood
-                "fan_speed_enum": "Fan Speed",
-                "switch_lamp": "Light Strip",
-                "light": "Light",
-                "countdown": "Timer",
-                "countdown_left": "Timer Remaining",
-                "disinfection": "Disinfection",
-                "anion": "Anion",
-                "switch_wash": "Wash Mode",
-                "switch": "Power",
-                "warm": "Warm",
-                "drying": "Drying",
-                "fault": "Fault Status",
-                "status": "Device Status",
-                "total_runtime": "Total Runtime",
-                # DCL - Cooktop
-                "work_mode": "Cooking Mode",
-                "appointment_time": "Appointment Time",
-                "cook_temperature": "Cooking Temperature",
-                "current_temperature": "Current Temperature",
-                "cook_power": "Cooking Power",
-                "pause": "Pause/Resume",
-                "work_status": "Work Status",
-                "start": "Start",
-                "cook_time": "Cooking Time",
-                "remaining_time": "Remaining Time",
-                # XFJ - Ventilation
-                "mode": "Work Mode",
-                "air_volume": "Air Volume",
-                "loop_mode": "Loop Mode",
-                "supply_fan_speed": "Supply Fan Speed",
-                "exhaust_fan_speed": "Exhaust Fan Speed",
-                "fresh_air_valve": "Fresh Air Valve",
-                "air_exhaust_fan": "Air Exhaust Fan",
-                "primary_filter_reset": "Primary Filter Reset",
-                "medium_filter_reset": "Medium Filter Reset",
-                "high_filter_reset": "High Filter Reset",
-                "sterilize": "Sterilize",
-                "bypass_function": "Bypass Function",
-                "heat": "Electric Heating",
-                "pm25_set": "PM2.5 Setting",
-                "eco2_set": "eCO2 Setting",
-                "temp_set": "Temperature Setting",
-                "humidity_set": "Humidity Setting",
-                "tvoc_set": "TVOC Setting",
-                "air_conditioning": "Air Conditioning",
-                "backlight": "Backlight Brightness",
-                "purify_mode": "Purify Mode",
-                "purification": "Purification",
-                "dehumidifier": "Dehumidifier",
-                "defrost": "Defrost",
-                "countdown_set": "Countdown Setting",
-                "factory_reset": "Factory Reset",
-                "child_lock": "Child Lock",
-                "filter_reset": "Filter Reset",
-                "uv_light": "UV Light",
-                "pm10_set": "PM10 Setting",
-                "pm10": "PM10",
-                "humidity_outdoor": "Outdoor Humidity",
-                "temp_outdoor": "Outdoor Temperature",
-                "air_quality": "Air Quality",
-                "supply_temp": "Supply Temperature",
-                "exhaust_temp": "Exhaust Temperature",
-                "supply_air_vol": "Supply Air Volume",
-                "exhaust_air_vol": "Exhaust Air Volume",
-                "primary_filter_life": "Primary Filter Life",
-                "medium_filter_life": "Medium Filter Life",
-                "high_filter_life": "High Filter Life",
-                "filter_life": "Filter Life",
-                "uv_life": "UV Life",
-                "temp_indoor": "Indoor Temperature",
-                "humidity_indoor": "Indoor Humidity",
-                "tvoc": "TVOC",
-                "eco2": "eCO2",
-                "pm25": "PM2.5",
-                "hcho_sensor_value": "HCHO Level",
-            }
-
-            # Generate icon for common codes
-            icons = {
-                # YYJ - Range Hood
-                "fan_speed_enum": "mdi:fan",
-                "switch_lamp": "mdi:lightbulb",
-                "light": "mdi:lightbulb",
-                "countdown": "mdi:timer",
-                "countdown_left": "mdi:timer-sand",
-                "disinfection": "mdi:spray-bottle",
-                "anion": "mdi:air-filter",
-                "switch_wash": "mdi:washing-machine",
-                "switch": "mdi:power",
-                "warm": "mdi:thermometer",
-                "drying": "mdi:air-filter",
-                "fault": "mdi:alert-circle",
-                "status": "mdi:information",
-                "total_runtime": "mdi:clock-time-eight",
-                # DCL - Cooktop
-                "work_mode": "mdi:chef-hat",
-                "appointment_time": "mdi:clock-outline",
-                "cook_temperature": "mdi:thermometer",
-                "current_temperature": "mdi:thermometer",
-                "cook_power": "mdi:flash",
-                "pause": "mdi:pause",
-                "work_status": "mdi:stove",
-                "start": "mdi:play",
-                "cook_time": "mdi:timer",
-                "remaining_time": "mdi:timer-sand",
-                # XFJ - Ventilation
-                "mode": "mdi:cog",
-                "air_volume": "mdi:weather-windy",
-                "loop_mode": "mdi:sync",
-                "supply_fan_speed": "mdi:fan",
-                "exhaust_fan_speed": "mdi:fan",
-                "fresh_air_valve": "mdi:valve",
-                "air_exhaust_fan": "mdi:fan",
-                "primary_filter_reset": "mdi:filter",
-                "medium_filter_reset": "mdi:filter",
-                "high_filter_reset": "mdi:filter",
-                "sterilize": "mdi:spray-bottle",
-                "bypass_function": "mdi:swap-horizontal",
-                "heat": "mdi:radiator",
-                "pm25_set": "mdi:air-filter",
-                "eco2_set": "mdi:molecule-co2",
-                "temp_set": "mdi:thermometer",
-                "humidity_set": "mdi:water-percent",
-                "tvoc_set": "mdi:chemical-weapon",
-                "air_conditioning": "mdi:air-conditioner",
-                "backlight": "mdi:brightness-6",
-                "purify_mode": "mdi:air-purifier",
-                "purification": "mdi:air-purifier",
-                "dehumidifier": "mdi:air-humidifier-off",
-                "defrost": "mdi:snowflake-melt",
-                "countdown_set": "mdi:timer-cog",
-                "factory_reset": "mdi:factory",
-                "child_lock": "mdi:lock",
-                "filter_reset": "mdi:filter-check",
-                "uv_light": "mdi:lightbulb-fluorescent-tube",
-                "pm10_set": "mdi:air-filter",
-                "pm10": "mdi:air-filter",
-                "humidity_outdoor": "mdi:water-percent",
-                "temp_outdoor": "mdi:thermometer",
-                "air_quality": "mdi:air-purifier",
-                "supply_temp": "mdi:thermometer-plus",
-                "exhaust_temp": "mdi:thermometer-minus",
-                "supply_air_vol": "mdi:weather-windy",
-                "exhaust_air_vol": "mdi:weather-windy",
-                "primary_filter_life": "mdi:filter-check",
-                "medium_filter_life": "mdi:filter-check",
-                "high_filter_life": "mdi:filter-check",
-                "filter_life": "mdi:filter-check",
-                "uv_life": "mdi:lightbulb-fluorescent-tube",
-                "temp_indoor": "mdi:home-thermometer",
-                "humidity_indoor": "mdi:home-thermometer",
-                "tvoc": "mdi:chemical-weapon",
-                "eco2": "mdi:molecule-co2",
-                "pm25": "mdi:air-filter",
-                "hcho_sensor_value": "mdi:chemical-weapon",
-            }
+            # Values JSON is parsed once per distinct spec (shared with the DP codecs)
+            values = compile_codec(data_type, values_str).spec
 
             config = {
                 "dp_id": dp_id,
                 "property_code": code,
                 "entity_type": mapping["entity_type"],
-                "name": friendly_names.get(code, name),
+                "name": _FRIENDLY_NAMES.get(code, name),
                 "data_type": mapping["data_type"],
                 "description": f"Tuya {data_type} property: {name}",
-                "icon": icons.get(code),
+                "icon": _ICONS.get(code),
             }
 
             # Add range data for value/enum types
             if values:
-                config["range_data"] = values
-
-            # Special handling for read-only properties
-            readonly_codes = [
-                # YYJ - Range Hood
-                "countdown_left",
-                "fault",
-                "status",
-                "total_runtime",
-                # DCL - Cooktop
-                "current_temperature",
-                "work_status",
-                "remaining_time",
-                # XFJ - Ventilation (sensors/monitoring)
-                "temp_indoor",
-                "humidity_indoor",
-                "temp_outdoor",
-                "humidity_outdoor",
-                "pm25",
-                "pm10",
-                "tvoc",
-                "eco2",
-                "air_quality",
-                "hcho_sensor_value",
-                "supply_temp",
-                "exhaust_temp",
-                "supply_air_vol",
-                "exhaust_air_vol",
-                "primary_filter_life",
-                "medium_filter_life",
-                "high_filter_life",
-                "filter_life",
-                "uv_life",
-                "countdown_left",
-            ]
-            if code in readonly_codes and mapping["entity_type"] != "sensor":
+                config["range_data"] = dict(values)
+
+            if code in _READONLY_CODES and mapping["entity_type"] != "sensor":
                 config["entity_type"] = "sensor"
 
             return config
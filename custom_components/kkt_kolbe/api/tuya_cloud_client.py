@@ -9,24 +9,30 @@ import json
 import logging
 import time
 import uuid
-from collections import deque
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
 from aiohttp import ClientSession
+from homeassistant.core import HomeAssistant
 
 from .api_exceptions import TuyaAPIError
 from .api_exceptions import TuyaAuthenticationError
 from .api_exceptions import TuyaDeviceNotFoundError
 from .api_exceptions import TuyaRateLimitError
+from .cloud_session import get_traced_cloud_session
+from .rate_limiter import PRIORITY_COMMAND
+from .rate_limiter import PRIORITY_POLL
+from .rate_limiter import AccountRateLimiter
+from .rate_limiter import get_account_rate_limiter
+from .token_cache import AccountTokenCache
+from .token_cache import get_account_token
 
 _LOGGER = logging.getLogger(__name__)
 
-# Rate limiting configuration
-RATE_LIMIT_REQUESTS_PER_MINUTE = 15  # Conservative limit for Tuya Free tier
-RATE_LIMIT_MIN_INTERVAL = 0.5  # Minimum seconds between requests
-RATE_LIMIT_BACKOFF_BASE = 5  # Base seconds for backoff after rate limit hit
-RATE_LIMIT_BACKOFF_MAX = 300  # Max backoff (5 minutes)
+# Device enrichment (get_device_list_with_details)
+DEVICE_DETAILS_BATCH_SIZE = 20  # Device ids per /v2.0/cloud/thing/batch request
+DEVICE_DETAILS_CONCURRENCY = 4  # Parallel per-device requests without the batch endpoint
 
 
 class TuyaCloudClient:
@@ -38,30 +44,46 @@ class TuyaCloudClient:
         client_secret: str,
         endpoint: str = "https://openapi.tuyaeu.com",
         session: ClientSession | None = None,
+        hass: HomeAssistant | None = None,
     ) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
         self.endpoint = endpoint.rstrip("/")
+        # Without a session the client borrows the pooled one of its endpoint,
+        # or opens a private one when there is no hass to pool it in
         self.session = session
-        self._own_session = session is None
-        self._access_token: str | None = None
-        self._token_expires_at: float | None = None
+        self._hass = hass
+        self._own_session = False
+
+        # Quota and 1011 backoff are shared by every client of the project,
+        # the access token by every client of the project on this endpoint;
+        # without hass the client keeps both to itself
+        if hass is not None:
+            self._rate_limiter = get_account_rate_limiter(hass, client_id)
+            self._token = get_account_token(hass, client_id, self.endpoint)
+        else:
+            self._rate_limiter = AccountRateLimiter()
+            self._token = AccountTokenCache().get(client_id, self.endpoint)
+        # Cleared once the project answers the batch details endpoint with an error
+        self._batch_details_supported = True
+
+    @property
+    def _access_token(self) -> str | None:
+        """Return the shared access token, if any."""
+        return self._token.access_token
 
-        # Rate limiting state
-        self._request_times: deque[float] = deque(maxlen=RATE_LIMIT_REQUESTS_PER_MINUTE)
-        self._last_request_time: float = 0
-        self._rate_limit_backoff: float = 0
-        self._rate_limit_until: float = 0
-        self._request_lock = asyncio.Lock()
+    @property
+    def _token_expires_at(self) -> float | None:
+        """Return when the shared access token expires (``time.time()``)."""
+        return self._token.expires_at
 
     async def __aenter__(self):
         """Async context manager entry."""
-        if self._own_session:
-            self.session = aiohttp.ClientSession()
+        await self._ensure_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
+        """Async context manager exit; pooled connections stay open for the next client."""
         if self._own_session and self.session:
             await self.session.close()
 
@@ -107,7 +129,7 @@ class TuyaCloudClient:
 
         return signature
 
-    def _build_headers(self, method: str, url: str, body: str = "") -> dict[str, str]:
+    def _build_headers(self, method: str, url: str, body: str = "", access_token: str | None = None) -> dict[str, str]:
         """Build headers with authentication and signature.
 
         For Smart Home Industry projects:
@@ -127,7 +149,7 @@ class TuyaCloudClient:
             headers["Content-Type"] = "application/json"
 
         # Determine if this is a token request (no access_token yet)
-        is_token_request = not self._access_token
+        is_token_request = not access_token
         nonce = ""
 
         if is_token_request:
@@ -136,8 +158,8 @@ class TuyaCloudClient:
             headers["nonce"] = nonce
         else:
             # API requests with access_token don't use nonce
-            # We know _access_token is not None here because is_token_request is False
-            headers["access_token"] = self._access_token or ""
+            # We know access_token is not None here because is_token_request is False
+            headers["access_token"] = access_token or ""
 
         # Generate and add signature
         signature = self._generate_signature(method, url, headers, body, nonce)
@@ -146,72 +168,52 @@ class TuyaCloudClient:
         return headers
 
     async def _ensure_session(self) -> None:
-        """Ensure aiohttp session is available."""
+        """Ensure aiohttp session is available, borrowing the traced Home Assistant session."""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession()
-            self._own_session = True
-
-    async def _wait_for_rate_limit(self) -> None:
-        """Wait if necessary to respect rate limits."""
-        async with self._request_lock:
-            current_time = time.time()
-
-            # Check backoff period
-            if current_time < self._rate_limit_until:
-                wait_time = self._rate_limit_until - current_time
-                _LOGGER.warning(f"Rate limit backoff active, waiting {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
-                current_time = time.time()
-
-            # Enforce minimum interval
-            time_since_last = current_time - self._last_request_time
-            if time_since_last < RATE_LIMIT_MIN_INTERVAL:
-                await asyncio.sleep(RATE_LIMIT_MIN_INTERVAL - time_since_last)
-                current_time = time.time()
-
-            # Sliding window check
-            window_start = current_time - 60
-            while self._request_times and self._request_times[0] < window_start:
-                self._request_times.popleft()
-
-            if len(self._request_times) >= RATE_LIMIT_REQUESTS_PER_MINUTE:
-                oldest = self._request_times[0]
-                wait_time = oldest + 60 - current_time + 0.1
-                if wait_time > 0:
-                    _LOGGER.debug(f"Rate limit reached, waiting {wait_time:.1f}s")
-                    await asyncio.sleep(wait_time)
-                    current_time = time.time()
-
-            self._request_times.append(current_time)
-            self._last_request_time = current_time
+            if self._hass is not None:
+                self.session = get_traced_cloud_session(self._hass).get_session()
+            else:
+                self.session = aiohttp.ClientSession()
+                self._own_session = True
+
+    async def _wait_for_rate_limit(self, priority: int = PRIORITY_POLL) -> None:
+        """Wait for a request slot of the project's shared quota."""
+        await self._rate_limiter.async_acquire(priority)
 
     def _handle_rate_limit_error(self) -> int:
-        """Handle rate limit error with exponential backoff.
+        """Handle rate limit error with exponential backoff for the whole project.
 
         Returns the calculated backoff time in seconds for use with retry_after.
         """
-        if self._rate_limit_backoff == 0:
-            self._rate_limit_backoff = RATE_LIMIT_BACKOFF_BASE
-        else:
-            self._rate_limit_backoff = min(self._rate_limit_backoff * 2, RATE_LIMIT_BACKOFF_MAX)
-        self._rate_limit_until = time.time() + self._rate_limit_backoff
-        _LOGGER.warning(f"Rate limit hit! Backing off for {self._rate_limit_backoff}s")
-        return int(self._rate_limit_backoff)
+        return self._rate_limiter.report_rate_limited()
 
     def _reset_rate_limit_backoff(self) -> None:
         """Reset backoff after successful request."""
-        if self._rate_limit_backoff > 0:
-            self._rate_limit_backoff = 0
-            _LOGGER.debug("Rate limit backoff reset")
+        self._rate_limiter.report_success()
 
-    async def _make_request(self, method: str, path: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make authenticated request to Tuya API with rate limiting."""
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        data: dict[str, Any] | None = None,
+        priority: int = PRIORITY_POLL,
+        *,
+        token_request: bool = False,
+        retry_rejected_token: bool = True,
+    ) -> dict[str, Any]:
+        """Make authenticated request to Tuya API with rate limiting.
+
+        Requests with ``PRIORITY_COMMAND`` are served before waiting polls. A
+        request whose token the platform no longer accepts (1010, e.g. a token
+        restored after a restart) is retried once after a fresh login.
+        """
         await self._ensure_session()
-        await self._wait_for_rate_limit()
+        await self._wait_for_rate_limit(priority)
 
         url = f"{self.endpoint}{path}"
         body = json.dumps(data) if data else ""
-        headers = self._build_headers(method, url, body)
+        access_token = None if token_request else self._token.access_token
+        headers = self._build_headers(method, url, body, access_token)
 
         _LOGGER.debug(f"Making {method} request to {path}")
 
@@ -232,12 +234,15 @@ class TuyaCloudClient:
                     )
 
                     # Common error codes
-                    if error_code == 1010:
+                    if error_code == 1010 and access_token and retry_rejected_token:
+                        self._token.invalidate(access_token)
+                    elif error_code == 1010:
+                        self._token.invalidate(access_token)
                         raise TuyaAuthenticationError(f"{error_msg} (Check client_id and client_secret)", error_code)
-                    if error_code == 1011:
+                    elif error_code == 1011:
                         retry_after = self._handle_rate_limit_error()
                         raise TuyaRateLimitError(error_msg, retry_after=retry_after)
-                    if error_code == 1004:
+                    elif error_code == 1004:
                         raise TuyaAuthenticationError(
                             f"Sign validation failed. Possible causes:\n"
                             f"1. Client Secret is incorrect\n"
@@ -245,40 +250,56 @@ class TuyaCloudClient:
                             f"3. Endpoint {self.endpoint} is wrong for your region",
                             error_code,
                         )
-                    raise TuyaAPIError(f"{error_msg} (Code: {error_code})", error_code)
-
-                # Success - reset rate limit backoff
-                self._reset_rate_limit_backoff()
-                return response_data
+                    else:
+                        raise TuyaAPIError(f"{error_msg} (Code: {error_code})", error_code)
+                else:
+                    # Success - reset rate limit backoff
+                    self._reset_rate_limit_backoff()
+                    return response_data
 
         except aiohttp.ClientError as err:
             raise TuyaAPIError(f"HTTP request failed: {err}") from err
 
+        # Only reached when the platform rejected the token
+        _LOGGER.debug("Access token was rejected, logging in again")
+        await self._ensure_authenticated()
+        return await self._make_request(method, path, data, priority, retry_rejected_token=False)
+
     async def authenticate(self) -> str:
-        """Authenticate and get access token."""
+        """Authenticate and get access token.
+
+        Always logs in (joining a login already in flight), so this also
+        verifies the credentials. The token is shared with every client of the
+        project on this endpoint.
+        """
+        return await self._token.async_login(self._login)
+
+    async def _login(self) -> tuple[str, float]:
+        """Request a new access token; returns it with its expiry time."""
         _LOGGER.debug("Authenticating with Tuya Cloud API")
 
-        response = await self._make_request("GET", "/v1.0/token?grant_type=1")
+        # Every other request of the project waits for the token
+        response = await self._make_request(
+            "GET", "/v1.0/token?grant_type=1", priority=PRIORITY_COMMAND, token_request=True
+        )
 
         result = response.get("result", {})
-        self._access_token = result.get("access_token")
+        access_token = result.get("access_token")
         expires_in = result.get("expire_time", 7200)  # Default 2 hours
-        self._token_expires_at = time.time() + expires_in
 
-        if not self._access_token:
+        if not access_token:
             raise TuyaAuthenticationError("No access token in response")
 
         _LOGGER.info("Successfully authenticated with Tuya Cloud API")
-        return self._access_token
+        return access_token, time.time() + expires_in
 
     async def _ensure_authenticated(self) -> None:
-        """Ensure we have a valid access token."""
-        if (
-            not self._access_token
-            or not self._token_expires_at
-            or time.time() >= self._token_expires_at - 300  # Refresh 5 min early
-        ):
-            await self.authenticate()
+        """Ensure we have a valid access token.
+
+        Near expiry the shared token is refreshed in the background, so only
+        the very first request (or one after a rejected token) waits for a login.
+        """
+        await self._token.async_get(self._login)
 
     def _normalize_device_response(self, device: dict[str, Any], api_version: str) -> dict[str, Any]:
         """Normalize device response to consistent format.
@@ -410,40 +431,115 @@ class TuyaCloudClient:
 
         return {}
 
-    async def get_device_list_with_details(self) -> list[dict[str, Any]]:
+    async def get_device_list_with_details(
+        self, details_cache: dict[str, dict[str, Any]] | None = None
+    ) -> list[dict[str, Any]]:
         """Get device list with full details for each device.
 
-        First gets basic device list, then enriches each device with
-        full details from /v1.0/devices/{id} to get product_id, local_key, etc.
+        First gets basic device list, then enriches the devices with full
+        details (product_id, local_key, etc.). Details come from the batch
+        endpoint (``/v2.0/cloud/thing/batch``, up to ``DEVICE_DETAILS_BATCH_SIZE``
+        devices per request). Projects without it fall back to
+        ``get_device_details`` with at most ``DEVICE_DETAILS_CONCURRENCY``
+        requests in flight; both share the project's rate limiter. A device
+        whose details cannot be fetched is returned as listed.
+
+        Args:
+            details_cache: Details per device id, e.g. kept by a config flow
+                across retries; cached devices are not fetched again and
+                fetched details are added.
 
         Returns:
-            List of fully populated device dicts.
+            List of fully populated device dicts, in device list order.
         """
-        # Get basic device list
         devices = await self.get_device_list()
 
-        # Enrich each device with full details
-        enriched_devices = []
+        # Enrichment finishes in any order, restore the order of the device list
+        order = {id(device): index for index, device in enumerate(devices)}
+        enriched_devices: list[dict[str, Any]] = list(devices)
+        async for device, details in self._iter_device_details(devices, details_cache):
+            enriched_devices[order[id(device)]] = self._merge_device_details(device, details)
+
+        _LOGGER.info(f"Retrieved {len(enriched_devices)} devices with full details")
+        return enriched_devices
+
+    async def _iter_device_details(
+        self, devices: list[dict[str, Any]], details_cache: dict[str, dict[str, Any]] | None
+    ) -> AsyncIterator[tuple[dict[str, Any], dict[str, Any]]]:
+        """Yield (device, details) as they become known; details are empty if unavailable."""
+        cache = details_cache if details_cache is not None else {}
+
+        pending: dict[str, dict[str, Any]] = {}
         for device in devices:
             device_id = device.get("id")
-            if device_id:
-                try:
-                    details = await self.get_device_details(device_id)
-                    if details:
-                        # Merge: details take priority, keep any fields from list that aren't in details
-                        merged = {**device, **details}
-                        enriched_devices.append(merged)
-                        _LOGGER.debug(f"Enriched device {device_id[:8]}: product_id={details.get('product_id', 'N/A')}")
-                    else:
-                        enriched_devices.append(device)
-                except Exception as e:
-                    _LOGGER.debug(f"Could not enrich device {device_id[:8]}: {e}")
-                    enriched_devices.append(device)
+            if device_id and device_id in cache:
+                yield device, cache[device_id]
+            elif device_id:
+                pending[device_id] = device
             else:
-                enriched_devices.append(device)
+                yield device, {}
+
+        ids = list(pending)
+        while ids and self._batch_details_supported:
+            chunk, ids = ids[:DEVICE_DETAILS_BATCH_SIZE], ids[DEVICE_DETAILS_BATCH_SIZE:]
+            batch = await self._get_device_details_batch(chunk)
+            for device_id in chunk:
+                if details := batch.get(device_id):
+                    cache[device_id] = details
+                    yield pending.pop(device_id), details
+
+        # Devices the batch endpoint did not answer for are fetched one by one
+        semaphore = asyncio.Semaphore(DEVICE_DETAILS_CONCURRENCY)
+
+        async def _fetch(device: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+            device_id = device["id"]
+            try:
+                async with semaphore:
+                    details = await self.get_device_details(device_id)
+            except Exception as e:
+                _LOGGER.debug(f"Could not enrich device {device_id[:8]}: {e}")
+                return device, {}
+            if details:
+                cache[device_id] = details
+                _LOGGER.debug(f"Enriched device {device_id[:8]}: product_id={details.get('product_id', 'N/A')}")
+            return device, details
+
+        tasks = [asyncio.ensure_future(_fetch(device)) for device in pending.values()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        _LOGGER.info(f"Retrieved {len(enriched_devices)} devices with full details")
-        return enriched_devices
+    async def _get_device_details_batch(self, device_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get details of up to ``DEVICE_DETAILS_BATCH_SIZE`` devices in one request.
+
+        Returns normalized details per device id; empty if the request failed.
+        """
+        await self._ensure_authenticated()
+
+        try:
+            response = await self._make_request("GET", f"/v2.0/cloud/thing/batch?device_ids={','.join(device_ids)}")
+        except TuyaRateLimitError as e:
+            _LOGGER.debug(f"Batch device details rate limited: {e}")
+            return {}
+        except TuyaAPIError as e:
+            _LOGGER.debug(f"Batch device details unavailable, fetching devices one by one: {e}")
+            self._batch_details_supported = False
+            return {}
+
+        result = response.get("result") or []
+        return {
+            device["id"]: self._normalize_device_response(device, "v2.0")
+            for device in result
+            if isinstance(device, dict) and device.get("id")
+        }
+
+    @staticmethod
+    def _merge_device_details(device: dict[str, Any], details: dict[str, Any]) -> dict[str, Any]:
+        """Merge: details take priority, keep any fields from list that aren't in details."""
+        return {**device, **{key: value for key, value in details.items() if value is not None}}
 
     async def get_device_properties(self, device_id: str) -> dict[str, Any]:
         """Get device properties using Things Data Model.
@@ -452,6 +548,7 @@ class TuyaCloudClient:
         Falls back to v1.0 if v2.0 fails.
 
         Returns device functions/properties with metadata (type, range, min/max).
+        From v2.0 the parsed Things Data Model is included as ``model``.
         """
         await self._ensure_authenticated()
 
@@ -480,6 +577,7 @@ class TuyaCloudClient:
                 # Convert to v1.0 functions format for compatibility
                 functions = {
                     "category": result.get("category", ""),
+                    "model": model_data,
                     "functions": [
                         {
                             "code": prop.get("code"),
@@ -523,6 +621,22 @@ class TuyaCloudClient:
                         raise TuyaDeviceNotFoundError(device_id) from err
                     raise
 
+    async def get_firmware_info(self, device_id: str) -> list[dict[str, Any]] | None:
+        """Get the firmware modules of a device (module_type, current_version, ...).
+
+        Returns None if the project may not read firmware information.
+        """
+        await self._ensure_authenticated()
+
+        try:
+            response = await self._make_request("GET", f"/v1.0/iot-03/devices/{device_id}/upgrade-infos")
+        except TuyaAPIError as err:
+            _LOGGER.debug(f"Firmware info unavailable for {device_id[:8]}: {err}")
+            return None
+
+        result = response.get("result")
+        return result if isinstance(result, list) else None
+
     async def get_device_status(self, device_id: str) -> dict[str, Any] | list[dict[str, Any]]:
         """Get current device status.
 
@@ -577,7 +691,7 @@ class TuyaCloudClient:
 
         try:
             response = await self._make_request(
-                "POST", f"/v1.0/devices/{device_id}/commands", data={"commands": commands}
+                "POST", f"/v1.0/devices/{device_id}/commands", data={"commands": commands}, priority=PRIORITY_COMMAND
             )
 
             success: bool = response.get("success", False)
@@ -615,7 +729,10 @@ class TuyaCloudClient:
         try:
             # Try iot-03 API first (supports DPs directly)
             response = await self._make_request(
-                "POST", f"/v1.0/iot-03/devices/{device_id}/commands", data={"commands": commands}
+                "POST",
+                f"/v1.0/iot-03/devices/{device_id}/commands",
+                data={"commands": commands},
+                priority=PRIORITY_COMMAND,
             )
 
             success: bool = response.get("success", False)
@@ -629,7 +746,7 @@ class TuyaCloudClient:
         # Fallback to standard commands API
         try:
             response = await self._make_request(
-                "POST", f"/v1.0/devices/{device_id}/commands", data={"commands": commands}
+                "POST", f"/v1.0/devices/{device_id}/commands", data={"commands": commands}, priority=PRIORITY_COMMAND
             )
 
             std_success: bool = response.get("success", False)
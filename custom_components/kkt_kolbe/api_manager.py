@@ -126,7 +126,10 @@ class GlobalAPIManager:
             from .api import TuyaCloudClient
 
             api_client = TuyaCloudClient(
-                client_id=creds["client_id"], client_secret=creds["client_secret"], endpoint=creds["endpoint"]
+                client_id=creds["client_id"],
+                client_secret=creds["client_secret"],
+                endpoint=creds["endpoint"],
+                hass=self.hass,
             )
 
             async with api_client:
@@ -146,7 +149,10 @@ class GlobalAPIManager:
             from .api import TuyaCloudClient
 
             api_client = TuyaCloudClient(
-                client_id=creds["client_id"], client_secret=creds["client_secret"], endpoint=creds["endpoint"]
+                client_id=creds["client_id"],
+                client_secret=creds["client_secret"],
+                endpoint=creds["endpoint"],
+                hass=self.hass,
             )
 
             async with api_client:
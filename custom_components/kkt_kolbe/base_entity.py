@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Iterable
 from datetime import datetime
 from typing import TYPE_CHECKING
 from typing import Any
@@ -17,6 +18,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .dp_dispatch import DPSubscription
 
 if TYPE_CHECKING:
     from .coordinator import KKTKolbeUpdateCoordinator
@@ -77,6 +79,12 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
         self._optimistic_value: Any = None
         self._optimistic_until: float = 0.0
 
+        # Delta fan-out: DP ids this entity has read (str keys) and the
+        # availability it last wrote. Updates whose changed_dps miss all of
+        # them cannot change the entity's state and are skipped.
+        self._observed_dps: set[str] = set()
+        self._last_written_available: bool | None = None
+
         # Device info cache
         self._device_info_cached: DeviceInfo | None = None
 
@@ -312,6 +320,24 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
 
         return is_available
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator for this entity's DPs only."""
+        # Built here rather than in __init__ so subclasses have set their
+        # extra DP attributes (brightness_dp, zones_dp, ...) by now
+        dps = self._subscribed_dps()
+        if dps is not None:
+            self.coordinator_context = DPSubscription(dps)
+        await super().async_added_to_hass()
+
+    def _subscribed_dps(self) -> Iterable[int | str] | None:
+        """Return the DPs whose changes can affect this entity's state.
+
+        Coordinators with DP dispatch (see dp_dispatch.py) only call
+        ``_handle_coordinator_update`` when one of these changed. Override to
+        add DPs read besides ``self._dp``; return None to get every update.
+        """
+        return (self._dp,)
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -324,6 +350,9 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
                 f"Available DPs: {data_keys}"
             )
 
+        if self._can_skip_coordinator_update():
+            return
+
         # Hard-release optimistic on confirmed device push (v4.7+, Task 3):
         # If this update was triggered by an MQTT report_type=='report' push (real
         # device confirmation, not cached cloud read) AND the pushed value for our
@@ -350,6 +379,28 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
         # Update cached state from coordinator data
         self._update_cached_state()
         self.async_write_ha_state()
+        self._last_written_available = self.available
+
+        # The window ran out without confirmation; the value written above is
+        # the coordinator's again, so stop forcing every update through
+        if self._optimistic_until and not self._is_optimistic_active():
+            self._clear_optimistic()
+
+    def _can_skip_coordinator_update(self) -> bool:
+        """Return True if the update cannot change this entity's state.
+
+        Requires the coordinator payload to carry ``changed_dps`` (see
+        dps_snapshot.py) and the entity to have read its DPs through the
+        base-class getters at least once. Entities with a pending optimistic
+        write or an availability change are always updated.
+        """
+        data = self.coordinator.data
+        changed = data.get("changed_dps") if isinstance(data, dict) else None
+        if changed is None or not self._observed_dps:
+            return False
+        if self._optimistic_until or self.available != self._last_written_available:
+            return False
+        return self._observed_dps.isdisjoint(changed)
 
     def _update_cached_state(self) -> None:
         """Update the cached state from coordinator data."""
@@ -369,6 +420,7 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
         """
         self._optimistic_value = raw_value
         self._optimistic_until = time.monotonic() + ttl
+        self._pin_coordinator_updates(True)
 
     def _is_optimistic_active(self) -> bool:
         """Return True if the optimistic window is still open."""
@@ -378,10 +430,22 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
         """Release the optimistic lock immediately."""
         self._optimistic_value = None
         self._optimistic_until = 0.0
+        self._pin_coordinator_updates(False)
+
+    def _pin_coordinator_updates(self, pinned: bool) -> None:
+        """Receive every coordinator update while an optimistic write is pending.
+
+        Needed so the entity re-renders when the window expires even if its
+        DP never changed (write lost).
+        """
+        pin = getattr(self.coordinator, "async_pin_listener", None)
+        if callable(pin) and isinstance(self.coordinator_context, DPSubscription):
+            pin(self._handle_coordinator_update, pinned)
 
     def _get_data_point_value(self, dp: int | None = None) -> Any:
         """Get value for a specific data point, with zone support and state caching."""
         data_point = dp if dp is not None else self._dp
+        self._observed_dps.add(str(data_point))
 
         # If this entity has a zone, use zone-aware data point extraction
         if self._zone is not None:
@@ -460,11 +524,11 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
         # Use bitfield_utils for Base64 RAW data extraction
         if isinstance(raw_value, str):
             # This is likely a Base64-encoded RAW string
-            from .bitfield_utils import extract_zone_value_from_bitfield
+            from .bitfield_utils import get_decoded_bitfield
 
             try:
-                value = extract_zone_value_from_bitfield(raw_value, zone_number)
-                _LOGGER.debug(f"Zone {zone_number} DP {dp}: Extracted value {value} from Base64 data - cached")
+                value = get_decoded_bitfield(self.coordinator, dp, raw_value).zone_value(zone_number)
+                _LOGGER.debug("Zone %s DP %s: Extracted value %s from Base64 data - cached", zone_number, dp, value)
 
                 # Update cache
                 self._cached_value = value
@@ -498,6 +562,7 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
 
     def _get_zone_data_point_value(self, dp: int, zone: int | None = None) -> Any:
         """Get value for a zone-specific data point with bitfield extraction."""
+        self._observed_dps.add(str(dp))
         if not self.coordinator.data:
             return None
 
@@ -517,11 +582,11 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
         # Use bitfield_utils for Base64 RAW data extraction
         if isinstance(raw_value, str):
             # This is likely a Base64-encoded RAW string
-            from .bitfield_utils import extract_zone_value_from_bitfield
+            from .bitfield_utils import get_decoded_bitfield
 
             try:
-                value = extract_zone_value_from_bitfield(raw_value, zone_number)
-                _LOGGER.debug(f"Zone {zone_number} DP {dp}: Extracted value {value} from Base64 data")
+                value = get_decoded_bitfield(self.coordinator, dp, raw_value).zone_value(zone_number)
+                _LOGGER.debug("Zone %s DP %s: Extracted value %s from Base64 data", zone_number, dp, value)
                 return value
             except Exception as e:
                 _LOGGER.error(f"Failed to extract zone {zone_number} from DP {dp}: {e}")
@@ -550,6 +615,22 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
             _LOGGER.error("Failed to set data point %d to %s for %s: %s", dp, value, self._attr_unique_id, exc)
             raise
 
+    async def _async_set_data_points(self, dps: dict[int, Any]) -> None:
+        """Set several data points, as one command if the coordinator supports it."""
+        # Looked up on the class so coordinators without the batch API (and
+        # plain mocks) fall back to one write per DP
+        if len(dps) > 1 and hasattr(type(self.coordinator), "async_set_data_points"):
+            try:
+                await self.coordinator.async_set_data_points(dps)
+                _LOGGER.debug("Set data points %s for %s", dps, self._attr_unique_id)
+            except Exception as exc:
+                _LOGGER.error("Failed to set data points %s for %s: %s", dps, self._attr_unique_id, exc)
+                raise
+            return
+
+        for dp, value in dps.items():
+            await self._async_set_data_point(dp, value)
+
     async def _async_suppress_fan_auto_start(self) -> None:
         """Suppress fan auto-start after hood power-on.
 
@@ -560,8 +641,18 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
         Active by default for hood devices. Can be disabled via the
         'disable_fan_auto_start' option (set to False to disable).
         """
+        suppression = self._fan_auto_start_suppression()
+        if suppression is not None:
+            await self._async_set_data_point(*suppression)
+
+    def _fan_auto_start_suppression(self) -> tuple[int, Any] | None:
+        """Return the (fan DP, off value) write that suppresses fan auto-start.
+
+        None if the option is disabled, the device is not a hood or has no
+        fan DP. Lets callers batch the fan-off with their own writes.
+        """
         if not self._entry.options.get("disable_fan_auto_start", True):
-            return
+            return None
 
         # Lazy imports (existing pattern from _build_device_info)
         from .const import CATEGORY_HOOD
@@ -576,16 +667,16 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
         # Verify this is a hood device
         device_info = KNOWN_DEVICES.get(lookup_key)
         if not device_info or device_info.get("category") != CATEGORY_HOOD:
-            return
+            return None
 
         # Get fan entity config to determine the correct DP and value type
         fan_config = get_device_entity_config(lookup_key, "fan")
         if not fan_config:
-            return
+            return None
 
         fan_dp = fan_config.get("dp")
         if fan_dp is None:
-            return
+            return None
 
         # Send fan-off: enum mode uses "off", numeric mode uses 0
         if fan_config.get("numeric", False):
@@ -594,7 +685,7 @@ class KKTBaseEntity(CoordinatorEntity["KKTKolbeUpdateCoordinator"]):
             off_value = "off"
 
         _LOGGER.info("Suppressing fan auto-start: sending DP %d = %s for %s", fan_dp, off_value, self._attr_unique_id)
-        await self._async_set_data_point(fan_dp, off_value)
+        return fan_dp, off_value
 
     def _log_entity_state(self, action: str, additional_info: str = "") -> None:
         """Log entity state changes for debugging."""
@@ -627,6 +718,10 @@ class KKTZoneBaseEntity(KKTBaseEntity):
 
         super().__init__(coordinator, entry, config, platform, zone)
 
+        # Zone state is extracted from the bitfield DP (bitfield_utils reads it
+        # directly, bypassing the tracked getters)
+        self._observed_dps.add(str(self._dp))
+
         # Zone entities are typically diagnostic
         from homeassistant.helpers.entity import EntityCategory
 
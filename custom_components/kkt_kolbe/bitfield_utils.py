@@ -6,16 +6,21 @@ import base64
 import logging
 import re
 from typing import Any
+from weakref import WeakKeyDictionary
 
 _LOGGER = logging.getLogger(__name__)
 
+# Hex/Base64 detection, compiled once
+_HEX_RE = re.compile(r"^[0-9a-fA-F]+$")
+_BASE64_RE = re.compile(r"^[A-Za-z0-9+/]+=*$")
+
 
 def is_hex_string(data: str) -> bool:
     """Check if a string is a hex-encoded byte string."""
     # Hex strings have even length and only contain hex characters
     if len(data) % 2 != 0:
         return False
-    return bool(re.match(r"^[0-9a-fA-F]+$", data))
+    return bool(_HEX_RE.match(data))
 
 
 def is_base64_string(data: str) -> bool:
@@ -24,7 +29,7 @@ def is_base64_string(data: str) -> bool:
     if len(data) < 4:
         return False
     # Base64 uses A-Z, a-z, 0-9, +, /, and = for padding
-    if not re.match(r"^[A-Za-z0-9+/]+=*$", data):
+    if not _BASE64_RE.match(data):
         return False
     # Length should be multiple of 4 (with padding)
     return len(data) % 4 == 0
@@ -322,6 +327,52 @@ def update_zone_bit_in_bitfield(
         return str(raw_data) if raw_data else ""
 
 
+def apply_zone_updates(
+    raw_data: str | bytes | bytearray, updates: dict[int, int | bool], zone_type: str, output_format: str = "base64"
+) -> str:
+    """
+    Apply several zone updates to one bitfield with a single decode/encode.
+
+    Args:
+        raw_data: Encoded bitfield data (hex, Base64, or bytes)
+        updates: Zone number -> new value (8-bit value or bit, per ``zone_type``)
+        zone_type: "value" (one byte per zone) or "bit" (one bit per zone)
+        output_format: "base64" or "hex", used when the input format is unknown
+
+    Returns:
+        Updated encoded bitfield data in the input's format
+    """
+    detected_format = output_format
+    if isinstance(raw_data, str) and raw_data:
+        if is_hex_string(raw_data):
+            detected_format = "hex"
+        elif is_base64_string(raw_data):
+            detected_format = "base64"
+
+    if raw_data:
+        data = bytearray(decode_raw_data_to_bytes(raw_data))
+    else:
+        data = bytearray(5 if zone_type == "value" else 1)
+
+    for zone, new_value in updates.items():
+        if zone_type == "value":
+            byte_index, mask = zone - 1, None
+        else:
+            byte_index, mask = (zone - 1) // 8, 1 << ((zone - 1) % 8)
+        while len(data) <= byte_index:
+            data.append(0)
+        if mask is None:
+            data[byte_index] = int(new_value) & 0xFF
+        elif new_value:
+            data[byte_index] |= mask
+        else:
+            data[byte_index] &= ~mask
+
+    if detected_format == "hex":
+        return encode_bytes_to_hex(bytes(data))
+    return encode_bytes_to_base64(bytes(data))
+
+
 # Bitfield configuration for IND7705HC data points
 BITFIELD_CONFIG: dict[int, dict[str, Any]] = {
     # Value-based bitfields (8 bits per zone)
@@ -384,6 +435,71 @@ BITFIELD_CONFIG: dict[int, dict[str, Any]] = {
 }
 
 
+class DecodedBitfield:
+    """A RAW DP value decoded once, with zone accessors shared by all entities.
+
+    Attributes:
+        raw: The raw value this view was decoded from (compared by value)
+        data: The decoded bytes
+    """
+
+    __slots__ = ("data", "raw")
+
+    def __init__(self, raw: Any) -> None:
+        """Decode ``raw`` (hex, Base64 or bytes)."""
+        # Keep an immutable copy so an in-place change of the source is seen as a new value
+        self.raw = bytes(raw) if isinstance(raw, bytearray) else raw
+        self.data = memoryview(decode_raw_data_to_bytes(raw if isinstance(raw, (bytes, bytearray)) else str(raw)))
+
+    def zone_value(self, zone: int) -> int:
+        """Return the 8-bit value of a zone (zone 1 = byte 0), 0 if out of range."""
+        byte_index = zone - 1
+        if 0 <= byte_index < len(self.data):
+            return self.data[byte_index]
+        return 0
+
+    def zone_bit(self, zone: int) -> bool:
+        """Return the bit of a zone (zone 1 = bit 0 of byte 0), False if out of range."""
+        bit_index = zone - 1
+        byte_index = bit_index // 8
+        if 0 <= byte_index < len(self.data):
+            return bool(self.data[byte_index] & (1 << (bit_index % 8)))
+        return False
+
+
+# Per-coordinator decoded views: coordinator -> {dp_id: DecodedBitfield}.
+# Views are compared by value: refreshes rebuild the DP snapshot, so an
+# unchanged RAW DP usually arrives as a new but equal object.
+_DECODED_BITFIELDS: WeakKeyDictionary[Any, dict[Any, DecodedBitfield]] = WeakKeyDictionary()
+
+
+def get_decoded_bitfield(coordinator: Any, dp_id: Any, raw_data: Any) -> DecodedBitfield:
+    """Return the shared decoded view of a RAW DP value for this coordinator.
+
+    Args:
+        coordinator: Coordinator the value was read from (cache owner)
+        dp_id: Data point ID
+        raw_data: The current raw value of the DP
+
+    Returns:
+        The cached view if ``raw_data`` equals the last decoded value,
+        otherwise a freshly decoded one.
+    """
+    try:
+        views = _DECODED_BITFIELDS.setdefault(coordinator, {})
+    except TypeError:
+        # Not weak-referenceable: decode without caching
+        return DecodedBitfield(raw_data)
+
+    view = views.get(dp_id)
+    if view is None or view.raw != raw_data:
+        view = DecodedBitfield(raw_data)
+        views[dp_id] = view
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("DP %s: decoded bitfield %r to %s", dp_id, raw_data, view.data.hex())
+    return view
+
+
 def get_zone_value_from_coordinator(coordinator: Any, dp_id: int, zone: int) -> int | bool:
     """
     Get zone-specific value from coordinator data.
@@ -402,8 +518,6 @@ def get_zone_value_from_coordinator(coordinator: Any, dp_id: int, zone: int) ->
             _LOGGER.debug("Coordinator data is None/empty, skipping zone value extraction")
             return 0 if BITFIELD_CONFIG.get(dp_id, {}).get("type") == "value" else False
 
-        _LOGGER.debug(f"Coordinator data keys: {list(coordinator.data.keys())}")
-
         # Get the DPS dictionary - coordinator may return data with DPs under 'dps' key
         dps_data = coordinator.data.get("dps", coordinator.data)
 
@@ -413,23 +527,22 @@ def get_zone_value_from_coordinator(coordinator: Any, dp_id: int, zone: int) ->
             raw_data = dps_data.get(dp_id)
         if raw_data is None:
             _LOGGER.debug(
-                f"DP {dp_id} not in current update (tried both str and int keys). Zone entities will use cached values."
+                "DP %s not in current update (tried both str and int keys). Zone entities will use cached values.",
+                dp_id,
             )
             return 0 if BITFIELD_CONFIG.get(dp_id, {}).get("type") == "value" else False
 
-        _LOGGER.debug(f"DP {dp_id} raw data: {raw_data} (type: {type(raw_data)})")
-
         # Get bitfield configuration
         config = BITFIELD_CONFIG.get(dp_id)
         if not config:
             _LOGGER.warning(f"No bitfield configuration for DP {dp_id}")
             return 0 if isinstance(raw_data, (int, float)) else False
 
-        # Extract zone value based on type
+        # Extract zone value based on type from the shared decoded view
         if config["type"] == "value":
-            return extract_zone_value_from_bitfield(str(raw_data), zone, config.get("bits_per_zone", 8))
+            return get_decoded_bitfield(coordinator, dp_id, raw_data).zone_value(zone)
         elif config["type"] == "bit":
-            return extract_zone_bit_from_bitfield(str(raw_data), zone)
+            return get_decoded_bitfield(coordinator, dp_id, raw_data).zone_bit(zone)
         else:
             return 0
 
@@ -442,13 +555,24 @@ async def set_zone_value_in_coordinator(coordinator: Any, dp_id: int, zone: int,
     """
     Set zone-specific value in coordinator data.
 
+    Goes through the coordinator's ``ZoneWriteQueue`` when it has one, so
+    zone changes made within the debounce window are merged into a single
+    bitfield write instead of racing each other.
+
     Args:
         coordinator: KKT Kolbe coordinator instance
         dp_id: Data point ID
         zone: Zone number (1-5)
         value: New value for the zone
     """
+    from .command_queue import ZoneWriteQueue
+
     try:
+        queue = getattr(coordinator, "write_queue", None)
+        if isinstance(queue, ZoneWriteQueue):
+            await queue.async_set_zone(dp_id, zone, value)
+            return
+
         # Get the DPS dictionary - coordinator may return data with DPs under 'dps' key
         dps_data = coordinator.data.get("dps", coordinator.data)
 
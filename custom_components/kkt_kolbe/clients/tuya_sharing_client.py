@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -29,6 +30,9 @@ from ..const import QR_LOGIN_POLL_INTERVAL
 from ..const import QR_LOGIN_TIMEOUT
 from ..const import SMARTLIFE_CLIENT_ID
 from ..const import SMARTLIFE_SCHEMA
+from ..const import SMARTLIFE_SNAPSHOT_TTL
+from ..dp_codec import DPCodec
+from ..dp_codec import compile_codec
 from ..exceptions import KKTAuthenticationError
 from ..exceptions import KKTConnectionError
 from ..exceptions import KKTTimeoutError
@@ -196,6 +200,7 @@ class TuyaSharingClient:
         hass: HomeAssistant,
         user_code: str,
         app_schema: str = SMARTLIFE_SCHEMA,
+        snapshot_ttl: float = SMARTLIFE_SNAPSHOT_TTL,
     ) -> None:
         """Initialize the client.
 
@@ -204,6 +209,8 @@ class TuyaSharingClient:
             user_code: User code from SmartLife/Tuya Smart app
                        (found in: Me -> Settings -> Account and Security -> User Code)
             app_schema: App identifier - "smartlife" or "tuyaSmart"
+            snapshot_ttl: Seconds an account snapshot is served to status
+                          readers before the next full cache refresh
         """
         self.hass = hass
         self._user_code = user_code
@@ -222,6 +229,20 @@ class TuyaSharingClient:
         # removed when the last callback is unregistered.
         self._push_callbacks: dict[str, list[PushCallback]] = {}
         self._sdk_listener: Any = None
+        # Account snapshot state. Manager.update_device_cache() re-fetches every
+        # home and device of the account, so all devices sharing this client read
+        # from one snapshot that is refreshed at most once per _snapshot_ttl.
+        # Concurrent callers join the in-flight refresh task (single-flight).
+        self._snapshot_ttl = snapshot_ttl
+        self._snapshot_refreshed_at: float | None = None  # time.monotonic()
+        self._snapshot_task: asyncio.Task[None] | None = None
+        self._device_refreshed_at: dict[str, float] = {}  # device_id -> monotonic
+        self._device_push_at: dict[str, float] = {}  # device_id -> monotonic
+        self._snapshot_stats: dict[str, int] = {
+            "refreshes": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+        }
 
     def set_token_update_callback(
         self,
@@ -328,6 +349,8 @@ class TuyaSharingClient:
             updated_dps: DP-id-keyed dict of changed data points.
             report_type: Currently always "report" (see PushCallback docstring).
         """
+        # The SDK has already applied the push to device.status in the snapshot
+        self._device_push_at[device_id] = time.monotonic()
         for callback in list(self._push_callbacks.get(device_id, [])):
             try:
                 callback(updated_dps, report_type)
@@ -627,15 +650,13 @@ class TuyaSharingClient:
                 TokenListener(client_ref),
             )
 
-        def _fetch_devices() -> list[Any]:
-            """Fetch devices from cloud in executor thread."""
-            self._manager.update_device_cache()
-            return list(self._manager.device_map.values())
-
         try:
             if not self._manager:
                 self._manager = await self.hass.async_add_executor_job(_init_manager)
-            raw_devices = await self.hass.async_add_executor_job(_fetch_devices)
+            # Always fetch fresh (local_key may have rotated), but join a
+            # refresh that is already in flight for another device of the account
+            await self._async_refresh_snapshot(force=True)
+            raw_devices = list(self._manager.device_map.values())
         except Exception as err:
             _LOGGER.error("Failed to fetch devices: %s", err)
             raise KKTConnectionError(
@@ -834,6 +855,91 @@ class TuyaSharingClient:
             _LOGGER.warning("Token validation failed: %s", err)
             return False
 
+    # === Account snapshot ===
+
+    def _snapshot_is_fresh(self, now: float) -> bool:
+        """Return True if the account snapshot is younger than the TTL."""
+        return self._snapshot_refreshed_at is not None and now - self._snapshot_refreshed_at < self._snapshot_ttl
+
+    async def _async_refresh_snapshot(self, force: bool = False) -> None:
+        """Refresh the account-wide device cache at most once per TTL.
+
+        All devices of the account share one ``Manager.update_device_cache()``
+        call. Concurrent callers join the refresh that is already in flight
+        instead of starting their own (single-flight), and callers within the
+        TTL are served from the existing snapshot.
+
+        Args:
+            force: Skip the TTL check. Still joins an in-flight refresh.
+
+        Raises:
+            Exception: Whatever the SDK raised during the refresh; every
+                       waiter of the shared refresh receives the same error.
+        """
+        task = self._snapshot_task
+        if task is not None and not task.done():
+            self._snapshot_stats["coalesced"] += 1
+        elif not force and self._snapshot_is_fresh(time.monotonic()):
+            self._snapshot_stats["cache_hits"] += 1
+            return
+        else:
+            task = self.hass.async_create_task(self._async_do_snapshot_refresh())
+            self._snapshot_task = task
+
+        # Shield so a cancelled caller (e.g. coordinator timeout) does not
+        # cancel the refresh other devices are waiting on
+        await asyncio.shield(task)
+
+    async def _async_do_snapshot_refresh(self) -> None:
+        """Run one full device cache refresh and stamp the snapshot."""
+
+        def _refresh() -> list[str]:
+            """Refresh the SDK device cache in executor thread."""
+            self._manager.update_device_cache()
+            return list(self._manager.device_map)
+
+        device_ids = await self.hass.async_add_executor_job(_refresh)
+        now = time.monotonic()
+        self._snapshot_refreshed_at = now
+        for device_id in device_ids:
+            self._device_refreshed_at[device_id] = now
+        self._snapshot_stats["refreshes"] += 1
+        _LOGGER.debug("SmartLife account snapshot refreshed (%d devices)", len(device_ids))
+
+    def get_device_snapshot_info(self, device_id: str) -> dict[str, Any]:
+        """Return staleness metadata for a device in the account snapshot.
+
+        A device is fresh when either the last full snapshot or the last MQTT
+        push for it (which the SDK applies to the same cached device) is
+        younger than the snapshot TTL.
+
+        Args:
+            device_id: The device ID to describe
+
+        Returns:
+            Dictionary with snapshot/push ages in seconds (None if never seen),
+            whether the device was present in the last snapshot, the overall
+            ``age`` and a ``stale`` flag, plus account-level refresh counters.
+        """
+        now = time.monotonic()
+        refreshed_at = self._device_refreshed_at.get(device_id)
+        push_at = self._device_push_at.get(device_id)
+        last_seen = max((t for t in (refreshed_at, push_at) if t is not None), default=None)
+        age = round(now - last_seen, 1) if last_seen is not None else None
+
+        return {
+            "ttl": self._snapshot_ttl,
+            "snapshot_age": round(now - self._snapshot_refreshed_at, 1)
+            if self._snapshot_refreshed_at is not None
+            else None,
+            "device_snapshot_age": round(now - refreshed_at, 1) if refreshed_at is not None else None,
+            "last_push_age": round(now - push_at, 1) if push_at is not None else None,
+            "in_snapshot": refreshed_at is not None and refreshed_at == self._snapshot_refreshed_at,
+            "age": age,
+            "stale": age is None or age >= self._snapshot_ttl,
+            **self._snapshot_stats,
+        }
+
     async def async_get_device_status(self, device_id: str) -> list[dict[str, Any]]:
         """Get current status of a device.
 
@@ -859,10 +965,10 @@ class TuyaSharingClient:
         if not self._manager:
             await self.async_get_devices()  # This initializes the manager
 
-        def _get_status() -> list[dict[str, Any]]:
-            """Get device status in executor thread."""
-            # Update device cache to get fresh data
-            self._manager.update_device_cache()
+        try:
+            # Served from the shared account snapshot; only refreshes the whole
+            # device cache when the snapshot is older than the TTL.
+            await self._async_refresh_snapshot()
 
             # Find the device in device_map
             device = self._manager.device_map.get(device_id)
@@ -870,18 +976,14 @@ class TuyaSharingClient:
                 _LOGGER.warning("Device %s not found in manager cache", device_id[:8])
                 return []
 
-            # Extract status from device
+            # Extract status from device (copy: the MQTT thread mutates it)
             status_list: list[dict[str, Any]] = []
             if hasattr(device, "status") and device.status:
-                for code, value in device.status.items():
+                for code, value in dict(device.status).items():
                     status_list.append({"code": code, "value": value})
 
+            _LOGGER.debug("Retrieved %d status items for device %s via SmartLife", len(status_list), device_id[:8])
             return status_list
-
-        try:
-            status = await self.hass.async_add_executor_job(_get_status)
-            _LOGGER.debug("Retrieved %d status items for device %s via SmartLife", len(status), device_id[:8])
-            return status
         except Exception as err:
             err_str = str(err)
             # Detect auth/token errors that require re-authentication
@@ -1035,6 +1137,7 @@ class TuyaSharingClient:
             "status": dict(getattr(device, "status", {})),
             "status_range": {code: _serialize(sr) for code, sr in getattr(device, "status_range", {}).items()},
             "local_strategy": {str(dp): _serialize(s) for dp, s in getattr(device, "local_strategy", {}).items()},
+            "snapshot": self.get_device_snapshot_info(device_id),
         }
 
     async def async_refresh_device_cache(self) -> bool:
@@ -1050,7 +1153,7 @@ class TuyaSharingClient:
         if not self._manager:
             return False
         try:
-            await self.hass.async_add_executor_job(self._manager.update_device_cache)
+            await self._async_refresh_snapshot(force=True)
             _LOGGER.info("SmartLife device cache refreshed")
             return True
         except Exception as err:
@@ -1082,6 +1185,44 @@ class TuyaSharingClient:
                 result[int(dp_id)] = code
         return result
 
+    def get_device_dp_types(self, device_id: str) -> dict[int, str]:
+        """Return live ``{dp_id: value_type}`` (e.g. ``"Boolean"``, ``"Enum"``) for a device.
+
+        Read from ``device.local_strategy[dp]["config_item"]["valueType"]``.
+        Returns an empty dict if the manager or device spec is unavailable.
+        """
+        if not self._manager:
+            return {}
+        device = self._manager.device_map.get(device_id) if hasattr(self._manager, "device_map") else None
+        if not device or not getattr(device, "local_strategy", None):
+            return {}
+        result: dict[int, str] = {}
+        for dp_id, entry in device.local_strategy.items():
+            config_item = entry.get("config_item") if isinstance(entry, dict) else getattr(entry, "config_item", None)
+            value_type = config_item.get("valueType") if isinstance(config_item, dict) else None
+            if value_type:
+                result[int(dp_id)] = value_type
+        return result
+
+    def get_device_dp_codecs(self, device_id: str) -> dict[int, DPCodec]:
+        """Return live ``{dp_id: codec}`` compiled from the device's DP specs.
+
+        Built from ``config_item["valueType"]`` and ``config_item["valueDesc"]``
+        of ``device.local_strategy``; codecs are shared per spec.
+        Returns an empty dict if the manager or device spec is unavailable.
+        """
+        if not self._manager:
+            return {}
+        device = self._manager.device_map.get(device_id) if hasattr(self._manager, "device_map") else None
+        if not device or not getattr(device, "local_strategy", None):
+            return {}
+        result: dict[int, DPCodec] = {}
+        for dp_id, entry in device.local_strategy.items():
+            config_item = entry.get("config_item") if isinstance(entry, dict) else getattr(entry, "config_item", None)
+            if isinstance(config_item, dict) and config_item.get("valueType"):
+                result[int(dp_id)] = compile_codec(config_item["valueType"], config_item.get("valueDesc"))
+        return result
+
     async def async_send_dp_commands(self, device_id: str, dps: dict[str, Any]) -> bool:
         """Send DP (Data Point) commands to a device via SmartLife cloud.
 
@@ -1171,7 +1312,8 @@ class TuyaSharingClient:
         """Get device specifications via SmartLife API.
 
         Calls the SmartLife specifications endpoint to get device
-        functions, status ranges, and potentially version info.
+        functions, status ranges, and potentially version info. Served from
+        the spec store unless the product or its firmware is new.
 
         Args:
             device_id: The device ID to get specifications for
@@ -1185,6 +1327,22 @@ class TuyaSharingClient:
         if not self._manager:
             await self.async_get_devices()
 
+        from ..spec_store import SPEC_SOURCE_SMARTLIFE
+        from ..spec_store import async_get_spec_store
+
+        device = self._manager.device_map.get(device_id) if hasattr(self._manager, "device_map") else None
+        store = await async_get_spec_store(self.hass)
+        return await store.async_get_spec(
+            SPEC_SOURCE_SMARTLIFE,
+            device_id,
+            getattr(device, "product_id", None),
+            lambda: self._async_fetch_device_specifications(device_id),
+            lambda: self.async_get_firmware_info(device_id),
+        )
+
+    async def _async_fetch_device_specifications(self, device_id: str) -> dict[str, Any] | None:
+        """Fetch device specifications from the SmartLife specifications endpoint."""
+
         def _get_specifications() -> dict[str, Any] | None:
             """Get specifications in executor thread."""
             if not hasattr(self._manager, "customer_api"):
@@ -1337,6 +1495,10 @@ class TuyaSharingClient:
         Should be called when the client is no longer needed to
         properly cleanup the SDK Manager.
         """
+        if self._snapshot_task is not None and not self._snapshot_task.done():
+            self._snapshot_task.cancel()
+        self._snapshot_task = None
+
         if self._manager:
             try:
                 # Manager might have an unload method
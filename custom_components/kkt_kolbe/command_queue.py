@@ -0,0 +1,161 @@
+"""Per-device write queue that coalesces zone bitfield updates.
+
+Cooktop zone entities share RAW bitfield DPs (162 levels, 161/163/164 zone
+switches, ...). Changing one zone means reading the whole bitfield, changing
+one byte or bit and sending the full value back, so zones changed within
+milliseconds of each other (an automation setting three zones,
+``bulk_power_off``) raced: each write was based on the same stale bitfield and
+the last one won, at the cost of one round-trip per zone.
+
+``ZoneWriteQueue`` collects writes for a short debounce window, merges all
+zone changes of a DP into one bitfield and sends everything, independent DPs
+included, as one multi-DP command through ``async_set_data_points``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
+
+from .bitfield_utils import BITFIELD_CONFIG
+from .bitfield_utils import apply_zone_updates
+from .const import ZONE_WRITE_DEBOUNCE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ZoneWriteQueue:
+    """Debounced, merging write queue for one device's coordinator."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: Any, delay: float = ZONE_WRITE_DEBOUNCE) -> None:
+        """Initialize the queue.
+
+        Args:
+            hass: Home Assistant instance
+            coordinator: Coordinator providing ``data`` and ``async_set_data_points``
+            delay: Debounce window in seconds
+        """
+        self.hass = hass
+        self._coordinator = coordinator
+        self._delay = delay
+
+        # Pending batch: zone changes per bitfield DP and whole-DP values
+        self._zone_updates: dict[int, dict[int, int | bool]] = {}
+        self._dp_updates: dict[int, Any] = {}
+        self._batch: asyncio.Future[None] | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        # Batches are sent one at a time so each one builds on the last
+        self._send_lock = asyncio.Lock()
+        # DP -> (coordinator value the write was based on, value written).
+        # Until the coordinator publishes a new value for the DP, the next
+        # batch merges into what we wrote instead of the stale reading.
+        self._written: dict[int, tuple[Any, Any]] = {}
+
+        self.stats: dict[str, int] = {"batches": 0, "writes": 0}
+
+    async def async_set_zone(self, dp_id: int, zone: int, value: int | bool) -> None:
+        """Queue a single zone change of a bitfield DP and wait until it is sent.
+
+        Raises:
+            Whatever the coordinator's ``async_set_data_points`` raised for the batch.
+        """
+        config = BITFIELD_CONFIG.get(dp_id)
+        if not config:
+            _LOGGER.warning("No bitfield configuration for DP %s", dp_id)
+            return
+        zone_value = bool(value) if config["type"] == "bit" else int(value)
+        self._zone_updates.setdefault(dp_id, {})[zone] = zone_value
+        await self._async_enqueue()
+
+    async def async_set(self, dp_id: int, value: Any) -> None:
+        """Queue a whole-DP write; it replaces pending zone changes of the same DP."""
+        self._zone_updates.pop(dp_id, None)
+        self._dp_updates[dp_id] = value
+        await self._async_enqueue()
+
+    async def _async_enqueue(self) -> None:
+        """Join the pending batch (starting the debounce window) and wait for it."""
+        self.stats["writes"] += 1
+        if self._batch is None:
+            self._batch = self.hass.loop.create_future()
+            self._flush_handle = self.hass.loop.call_later(self._delay, self._async_schedule_flush)
+        # Shielded: one cancelled caller must not cancel the shared batch
+        await asyncio.shield(self._batch)
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Send the pending batch once the debounce window has passed."""
+        self._flush_handle = None
+        self.hass.async_create_task(self._async_flush(), f"{__name__} flush")
+
+    async def _async_flush(self) -> None:
+        """Merge and send the pending batch as one multi-DP command."""
+        batch, self._batch = self._batch, None
+        zone_updates, self._zone_updates = self._zone_updates, {}
+        dp_updates, self._dp_updates = self._dp_updates, {}
+        if batch is None:
+            return
+
+        async with self._send_lock:
+            bases: dict[int, Any] = {}
+            dps: dict[int, Any] = {}
+            try:
+                for dp_id, value in dp_updates.items():
+                    bases[dp_id] = self._current_raw(dp_id)
+                    dps[dp_id] = value
+                for dp_id, zones in zone_updates.items():
+                    bases[dp_id] = self._current_raw(dp_id)
+                    dps[dp_id] = apply_zone_updates(self._merge_base(dp_id), zones, BITFIELD_CONFIG[dp_id]["type"])
+
+                _LOGGER.debug("Sending coalesced write batch: %s", dps)
+                await self._coordinator.async_set_data_points(dps)
+            except Exception as err:
+                if not batch.done():
+                    batch.set_exception(err)
+                return
+
+            self.stats["batches"] += 1
+            for dp_id, value in dps.items():
+                if dp_id in BITFIELD_CONFIG:
+                    self._written[dp_id] = (bases[dp_id], value)
+            if not batch.done():
+                batch.set_result(None)
+
+    def _current_raw(self, dp_id: int) -> Any:
+        """Return the coordinator's current raw value of a DP (None if unknown)."""
+        data = self._coordinator.data
+        if not data:
+            return None
+        dps_data = data.get("dps", data)
+        value = dps_data.get(str(dp_id))
+        return dps_data.get(dp_id) if value is None else value
+
+    def _merge_base(self, dp_id: int) -> Any:
+        """Return the bitfield to apply zone changes to.
+
+        That is our last written value while the coordinator still shows the
+        value it was based on, else the coordinator's value.
+        """
+        current = self._current_raw(dp_id)
+        written = self._written.get(dp_id)
+        if written is not None and written[0] == current:
+            return written[1]
+        self._written.pop(dp_id, None)
+        return "" if current is None else current
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending batch (coordinator shutdown)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._batch is not None and not self._batch.done():
+            self._batch.cancel()
+        self._batch = None
+        self._zone_updates.clear()
+        self._dp_updates.clear()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import ipaddress
 import logging
+from typing import TYPE_CHECKING
 from typing import Any
 
 import voluptuous as vol
@@ -48,6 +49,9 @@ from .smart_discovery import SmartDiscoveryResult
 from .smart_discovery import async_get_configured_device_ids
 from .tuya_device import KKTKolbeTuyaDevice
 
+if TYPE_CHECKING:
+    from .api import TuyaCloudClient
+
 _LOGGER = logging.getLogger(__name__)
 
 # Reusable description_placeholders dict for steps with URL references
@@ -182,6 +186,38 @@ def _detect_device_type_from_api(device: dict[str, Any]) -> tuple[str, str]:
     return ("auto", api_product_name)
 
 
+async def _async_detect_device_type(
+    hass: HomeAssistant, api_client: TuyaCloudClient | None, device: dict[str, Any]
+) -> tuple[str, str]:
+    """Detect device type from Tuya API response, falling back to the device's cloud spec.
+
+    Devices ``_detect_device_type_from_api`` cannot place are analyzed from
+    their Things Data Model. The model is read through the spec store, so
+    setting up another device of the same product and firmware (or the same
+    device again) does not fetch it from the cloud.
+
+    Returns:
+        Tuple of (device_type, internal_product_name), as ``_detect_device_type_from_api``
+    """
+    detected = _detect_device_type_from_api(device)
+    if detected[0] != "auto" or api_client is None or not device.get("id"):
+        return detected
+
+    from .api.dynamic_device_factory import DynamicDeviceFactory
+
+    try:
+        device_config = await DynamicDeviceFactory().async_analyze_device(hass, api_client, device)
+    except Exception as err:
+        _LOGGER.debug(f"Spec analysis failed for {device['id'][:8]}: {err}")
+        return detected
+
+    if device_config.device_type == "hood":
+        return ("default_hood", "default_hood")
+    if device_config.device_type == "cooktop":
+        return ("ind7705hc_cooktop", "p8volecsgzdyun29")
+    return detected
+
+
 def _detect_device_type_from_device_id(device_id: str) -> tuple[str, str, str]:
     """Detect device type from device_id only (for discovery without API).
 
@@ -566,6 +602,8 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
         self._advanced_settings: dict[str, Any] = {}
         self._smart_discovery_results: dict[str, SmartDiscoveryResult] = {}
         self._zeroconf_pending: bool = False
+        # Cloud device details per device id, kept while the user retries API steps
+        self._api_device_details: dict[str, dict[str, Any]] = {}
 
         # SmartLife/Tuya Sharing attributes
         self._smartlife_client: Any | None = None
@@ -944,6 +982,7 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                         client_id=client_id,
                         client_secret=client_secret,
                         endpoint=endpoint,
+                        hass=self.hass,
                     )
                     async with api_client:
                         if await api_client.test_connection():
@@ -2098,6 +2137,7 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                         client_secret=user_input["api_client_secret"],
                         endpoint=user_input.get("api_endpoint", "https://openapi.tuyaeu.com"),
                         session=session,
+                        hass=self.hass,
                     )
 
                     async with client:
@@ -2548,6 +2588,7 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                             client_id=client_id,
                             client_secret=client_secret,
                             endpoint=endpoint,
+                            hass=self.hass,
                         )
                         async with api_client:
                             if await api_client.test_connection():
@@ -2668,6 +2709,7 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                                 client_id=client_id,
                                 client_secret=client_secret,
                                 endpoint=endpoint,
+                                hass=self.hass,
                             )
                             async with api_client:
                                 if await api_client.test_connection():
@@ -2898,12 +2940,14 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                 try:
                     from .api import TuyaCloudClient
 
-                    api_client = TuyaCloudClient(client_id=client_id, client_secret=client_secret, endpoint=endpoint)
+                    api_client = TuyaCloudClient(
+                        client_id=client_id, client_secret=client_secret, endpoint=endpoint, hass=self.hass
+                    )
 
                     # Test connection and get device list with full details (local_key, product_id)
                     async with api_client:
                         if await api_client.test_connection():
-                            devices = await api_client.get_device_list_with_details()
+                            devices = await api_client.get_device_list_with_details(self._api_device_details)
 
                             # Filter for KKT Kolbe devices
                             kkt_devices = []
@@ -2934,7 +2978,9 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                                 }
                                 self._discovered_devices = {}
                                 for device in kkt_devices:
-                                    device_type, internal_product_name = _detect_device_type_from_api(device)
+                                    device_type, internal_product_name = await _async_detect_device_type(
+                                        self.hass, api_client, device
+                                    )
 
                                     # Get friendly_type from KNOWN_DEVICES
                                     from .device_types import KNOWN_DEVICES
@@ -3074,8 +3120,23 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                             self._api_info = creds
 
                         self._discovered_devices = {}
+                        from .api import TuyaCloudClient
+
+                        # Unknown models are analyzed from their (stored) cloud spec
+                        api_client = (
+                            TuyaCloudClient(
+                                client_id=creds["client_id"],
+                                client_secret=creds["client_secret"],
+                                endpoint=creds["endpoint"],
+                                hass=self.hass,
+                            )
+                            if creds
+                            else None
+                        )
                         for device in kkt_devices:
-                            device_type, internal_product_name = _detect_device_type_from_api(device)
+                            device_type, internal_product_name = await _async_detect_device_type(
+                                self.hass, api_client, device
+                            )
 
                             # Get friendly_type from KNOWN_DEVICES
                             from .device_types import KNOWN_DEVICES
@@ -3149,12 +3210,14 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                 try:
                     from .api import TuyaCloudClient
 
-                    api_client = TuyaCloudClient(client_id=client_id, client_secret=client_secret, endpoint=endpoint)
+                    api_client = TuyaCloudClient(
+                        client_id=client_id, client_secret=client_secret, endpoint=endpoint, hass=self.hass
+                    )
 
                     # Test connection and get device list with full details (including local_key)
                     async with api_client:
                         if await api_client.test_connection():
-                            devices = await api_client.get_device_list_with_details()
+                            devices = await api_client.get_device_list_with_details(self._api_device_details)
 
                             # Filter for KKT Kolbe devices
                             kkt_devices = []
@@ -3179,7 +3242,9 @@ class KKTKolbeConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                                 }
                                 self._discovered_devices = {}
                                 for device in kkt_devices:
-                                    device_type, internal_product_name = _detect_device_type_from_api(device)
+                                    device_type, internal_product_name = await _async_detect_device_type(
+                                        self.hass, api_client, device
+                                    )
 
                                     # Get friendly_type from KNOWN_DEVICES
                                     from .device_types import KNOWN_DEVICES
@@ -145,6 +145,7 @@ class KKTKolbeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     client_id=client_id,
                     client_secret=client_secret,
                     endpoint=endpoint,
+                    hass=self.hass,
                 ) as client:
                     if await client.test_connection():
                         self.api_client = client
@@ -272,22 +273,10 @@ class KKTKolbeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._abort_if_unique_id_configured()
 
         try:
-            # Get device properties from API
+            # Analyze the device from its spec, fetched only for a new product/firmware
             _LOGGER.info(f"Analyzing device {device_id}")
-            properties = await self.api_client.get_device_properties(device_id)
-
-            # Use dynamic factory to analyze device
             factory = DynamicDeviceFactory()
-            device_config = await factory.analyze_device_properties(
-                {
-                    "result": {
-                        "device_id": device_id,
-                        "model_id": self.selected_device.get("model", "unknown"),
-                        "name": self.selected_device.get("name", "KKT Kolbe Device"),
-                        "model": properties.get("model", "{}"),
-                    }
-                }
-            )
+            device_config = await factory.async_analyze_device(self.hass, self.api_client, self.selected_device)
 
             # For hybrid mode, we still need manual local connection details
             if self.integration_mode == MODE_HYBRID:
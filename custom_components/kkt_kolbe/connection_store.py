@@ -0,0 +1,90 @@
+"""Persistent "last known good" local connection fingerprints.
+
+Protocol auto-detection tries up to five protocol versions per key variant.
+The result only lived in memory, so every Home Assistant restart repeated the
+sweep for every appliance. This store remembers, per device, which protocol
+version and key variant last worked so the next connect can try exactly that
+combination first and fall back to detection only when it fails.
+
+The local key itself is never written here, only the name of the key variant
+(see ``KKTKolbeTuyaDevice._get_key_variants``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import CONNECTION_FINGERPRINT_SAVE_DELAY
+from .const import CONNECTION_FINGERPRINT_STORE_KEY
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Persistent storage version
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.connection_fingerprints"
+
+
+class ConnectionFingerprintStore:
+    """Per-device cache of the protocol version and key variant that last connected."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fingerprint store (call async_load before use)."""
+        self.hass = hass
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._fingerprints: dict[str, dict[str, Any]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load fingerprints from storage once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                data = await self._store.async_load()
+                if isinstance(data, dict):
+                    self._fingerprints = {k: v for k, v in data.items() if isinstance(v, dict)}
+                    _LOGGER.debug("Loaded %d connection fingerprint(s)", len(self._fingerprints))
+            except Exception as err:
+                _LOGGER.warning("Failed to load connection fingerprints: %s", err)
+            self._loaded = True
+
+    def get(self, device_id: str) -> dict[str, Any] | None:
+        """Return the stored fingerprint for a device, if any."""
+        return self._fingerprints.get(device_id)
+
+    def async_remember(self, device_id: str, version: str, key_variant: str, ip_address: str) -> None:
+        """Record a successful connection and schedule a (coalesced) save."""
+        self._fingerprints[device_id] = {
+            "version": version,
+            "key_variant": key_variant,
+            "ip_address": ip_address,
+            "last_success": datetime.now().isoformat(),
+        }
+        self._store.async_delay_save(self._data_to_save, CONNECTION_FINGERPRINT_SAVE_DELAY)
+
+    def async_forget(self, device_id: str) -> None:
+        """Drop a fingerprint that no longer works (e.g. device re-paired)."""
+        if self._fingerprints.pop(device_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, CONNECTION_FINGERPRINT_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the data to persist."""
+        return dict(self._fingerprints)
+
+
+async def async_get_fingerprint_store(hass: HomeAssistant) -> ConnectionFingerprintStore:
+    """Return the shared, loaded fingerprint store for this HA instance."""
+    store: ConnectionFingerprintStore | None = hass.data.get(CONNECTION_FINGERPRINT_STORE_KEY)
+    if store is None:
+        store = ConnectionFingerprintStore(hass)
+        hass.data[CONNECTION_FINGERPRINT_STORE_KEY] = store
+    await store.async_load()
+    return store
@@ -39,6 +39,30 @@ DEFAULT_STATUS_TIMEOUT: Final = 10.0  # seconds
 DEFAULT_SET_DP_TIMEOUT: Final = 8.0  # seconds
 DEFAULT_PROTOCOL_TIMEOUT: Final = 3.0  # seconds
 DEFAULT_RECONNECT_TEST_TIMEOUT: Final = 5.0  # seconds
+AUTO_DETECT_MAX_CONCURRENCY: Final = 3  # parallel (version, key) handshakes during auto-detection
+ZONE_WRITE_DEBOUNCE: Final = 0.2  # seconds zone writes are collected into one bitfield command
+
+# Seconds to wait after a device write before refreshing the coordinator.
+# Tuya cloud propagation typically completes within 1-3s; reading sooner
+# returns the stale pre-write value and overwrites entity optimistic state.
+CLOUD_PROPAGATION_DELAY_SECONDS: Final = 3.0
+
+# Seconds to wait for a push (MQTT / local status frame) to confirm a write
+# before polling instead. Pushes normally arrive well within a second.
+WRITE_CONFIRM_TIMEOUT_SECONDS: Final = 2.0
+
+# Adaptive polling of the hybrid coordinator while MQTT pushes arrive
+# (see poll_scheduler.py). Polls then only reconcile missed pushes.
+PUSH_HEARTBEAT_INTERVAL_SECONDS: Final = 300  # poll interval while pushes are healthy
+PUSH_HEALTHY_WINDOW_SECONDS: Final = 600  # a push within this window counts as healthy
+
+# Activity-aware poll cadence (see activity.py). The normal cadence is the
+# coordinator's online interval; these apply while cooking / switched off /
+# right after a user command.
+POLL_INTERVAL_ACTIVE_SECONDS: Final = 10  # zones, fan or a timer running
+POLL_INTERVAL_IDLE_SECONDS: Final = 120  # device switched off
+POLL_INTERVAL_BURST_SECONDS: Final = 5  # after a user command ...
+POLL_BURST_DURATION_SECONDS: Final = 30  # ... for this long
 
 # === RECONNECTION CONFIGURATION ===
 DEFAULT_BASE_BACKOFF: Final = 5  # seconds
@@ -57,6 +81,14 @@ CIRCUIT_BREAKER_MAX_SLEEP_RETRIES: Final = 3  # Max retries per sleep cycle
 # === ERROR TRACKING ===
 MAX_ERROR_HISTORY: Final = 50  # Max number of errors to keep in history
 
+# === LOCAL TRANSPORT ===
+# "tinytuya": blocking tinytuya calls in the HA executor (default)
+# "asyncio": persistent asyncio socket per device (3.3/3.4/3.5 only, push-capable)
+LOCAL_TRANSPORT_TINYTUYA: Final = "tinytuya"
+LOCAL_TRANSPORT_ASYNCIO: Final = "asyncio"
+CONF_ENABLE_ASYNC_TRANSPORT: Final = "enable_async_transport"
+TUYA_LOCAL_PORT: Final = 6668  # TCP port of the Tuya LAN protocol
+
 # === TCP KEEP-ALIVE CONFIGURATION ===
 TCP_KEEPALIVE_IDLE: Final = 60  # seconds before sending keepalive probes
 TCP_KEEPALIVE_INTERVAL: Final = 10  # seconds between keepalive probes
@@ -64,6 +96,20 @@ TCP_KEEPALIVE_COUNT: Final = 5  # number of failed probes before declaring dead
 
 # === GLOBAL STORAGE ===
 GLOBAL_API_STORAGE_KEY: Final = f"{DOMAIN}_global_api"
+SMARTLIFE_SHARED_CLIENTS_KEY: Final = f"{DOMAIN}_smartlife_clients"
+CONNECTION_FINGERPRINT_STORE_KEY: Final = f"{DOMAIN}_connection_fingerprints"
+RATE_LIMITERS_KEY: Final = f"{DOMAIN}_rate_limiters"
+CLOUD_SESSION_KEY: Final = f"{DOMAIN}_cloud_session"
+CLOUD_TOKEN_CACHE_KEY: Final = f"{DOMAIN}_cloud_tokens"
+
+# Last-known-good protocol/key per device, written at most once per delay window
+CONNECTION_FINGERPRINT_SAVE_DELAY: Final = 10  # seconds
+
+# Cloud device specs (Things Data Model) per product and firmware version
+DEVICE_SPEC_STORE_KEY: Final = f"{DOMAIN}_device_specs"
+DEVICE_SPEC_SAVE_DELAY: Final = 10  # seconds
+# Specs of devices whose firmware version is unknown are refetched after this age
+DEVICE_SPEC_UNVERSIONED_MAX_AGE: Final = 7 * 24 * 3600  # seconds
 
 # === API CONFIGURATION KEYS ===
 CONF_API_CLIENT_ID: Final = "api_client_id"
@@ -170,6 +216,10 @@ QR_CODE_FORMAT: Final = "tuyaSmart--qrLogin?token={token}"
 QR_LOGIN_POLL_INTERVAL: Final = 2  # seconds
 QR_LOGIN_TIMEOUT: Final = 120  # seconds (2 minutes)
 
+# Account snapshot: one Manager.update_device_cache() is shared by all devices
+# of an account within this window instead of one full refresh per device poll.
+SMARTLIFE_SNAPSHOT_TTL: Final = 20  # seconds
+
 # SmartLife Config Keys
 CONF_SMARTLIFE_USER_CODE: Final = "smartlife_user_code"
 CONF_SMARTLIFE_TOKEN_INFO: Final = "smartlife_token_info"
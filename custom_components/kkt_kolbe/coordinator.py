@@ -6,6 +6,7 @@ Coordinator pattern based on https://github.com/ludeeus/integration_blueprint
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from datetime import datetime
 from datetime import timedelta
 from enum import Enum
@@ -13,25 +14,28 @@ from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
+from .activity import ActivityCadence
+from .command_queue import ZoneWriteQueue
 from .const import CIRCUIT_BREAKER_MAX_SLEEP_RETRIES
 from .const import CIRCUIT_BREAKER_SLEEP_INTERVAL
+from .const import CLOUD_PROPAGATION_DELAY_SECONDS
 from .const import DEFAULT_BASE_BACKOFF
 from .const import DEFAULT_CONSECUTIVE_FAILURES_THRESHOLD
 from .const import DEFAULT_MAX_BACKOFF
 from .const import DEFAULT_MAX_RECONNECT_ATTEMPTS
 from .const import DOMAIN
 from .const import MAX_ERROR_HISTORY
+from .dp_dispatch import DPDispatchMixin
+from .dp_index import GENERIC_DP_MAPPING
+from .dps_snapshot import DPSChangeTracker
 from .tuya_device import KKTKolbeTuyaDevice
-
-# Seconds to wait after a device write before refreshing the coordinator.
-# Tuya cloud propagation typically completes within 1-3s; reading sooner
-# returns the stale pre-write value and overwrites entity optimistic state.
-CLOUD_PROPAGATION_DELAY_SECONDS = 3.0
+from .write_tracker import WriteTracker
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,7 +55,7 @@ class DeviceState(Enum):
     UNREACHABLE = "unreachable"  # Circuit breaker tripped - no more retries until reset
 
 
-class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
+class KKTKolbeUpdateCoordinator(DPDispatchMixin, DataUpdateCoordinator):
     """Class to manage fetching KKT Kolbe data from the device."""
 
     def __init__(
@@ -75,6 +79,10 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
         # Tuya devices often send delta/partial updates (only changed DPs)
         # This cache accumulates all DPs seen so far
         self._dps_cache: dict[str, Any] = {}
+        # Read-only snapshot of _dps_cache published to entities + last change set
+        self._dps_changes = DPSChangeTracker()
+        # Coalesces zone bitfield writes into multi-DP commands
+        self.write_queue = ZoneWriteQueue(hass, self)
 
         # Error history for diagnostics
         self._error_history: list[dict[str, Any]] = []
@@ -97,6 +105,10 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
         # Pending deferred-refresh handle. Tracked so we can cancel it on
         # shutdown / destroy and avoid lingering timers in tests.
         self._pending_refresh_handle: Any = None
+        # Written values; a report confirming all of them cancels the refresh
+        self._write_tracker = WriteTracker()
+        # Online poll interval follows the device activity (see activity.py)
+        self._cadence = ActivityCadence(self, self._known_data_points(), timedelta(seconds=POLL_INTERVAL_ONLINE))
 
         # Update every 30 seconds for real-time control
         super().__init__(
@@ -110,6 +122,13 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
             always_update=False,
         )
 
+    def _known_data_points(self) -> Mapping[int, str]:
+        """Return the DP -> code mapping of the configured device type."""
+        from .device_types import KNOWN_DEVICES
+
+        device_config = KNOWN_DEVICES.get(self.entry.data.get("device_type") or "", {})
+        return device_config.get("data_points") or GENERIC_DP_MAPPING
+
     @property
     def device_state(self) -> DeviceState:
         """Get current device state."""
@@ -139,17 +158,71 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
     def async_mark_destroyed(self) -> None:
         """Mark the coordinator as torn down and cancel pending deferred work."""
         self._destroyed = True
+        self.write_queue.async_cancel()
         if self._pending_refresh_handle is not None:
             self._pending_refresh_handle.cancel()
             self._pending_refresh_handle = None
+        self._unregister_push()
 
     async def async_shutdown(self) -> None:
         """Shut down coordinator and cancel any pending deferred refresh."""
+        self.write_queue.async_cancel()
         if self._pending_refresh_handle is not None:
             self._pending_refresh_handle.cancel()
             self._pending_refresh_handle = None
+        self._unregister_push()
         await super().async_shutdown()
 
+    async def async_register_push(self) -> None:
+        """Receive unsolicited status frames from the local device.
+
+        Called by __init__.py during entry setup. Only the asyncio transport
+        pushes; with tinytuya the callback is simply never invoked.
+        """
+        if hasattr(self.device, "register_push_callback"):
+            self.device.register_push_callback(self._handle_local_push_update)
+
+    def _unregister_push(self) -> None:
+        """Stop receiving local status frames."""
+        if hasattr(self.device, "unregister_push_callback"):
+            self.device.unregister_push_callback(self._handle_local_push_update)
+
+    @callback
+    def _handle_local_push_update(self, updated_dps: dict[str, Any], _origin: str) -> None:
+        """Merge a status frame the device sent on its own and fan it out."""
+        if self._destroyed:
+            return
+        self._dps_cache.update({str(k): v for k, v in updated_dps.items()})
+        self._confirm_writes(updated_dps)
+        # Set before fan-out: async_set_updated_data reschedules the next poll
+        self._adjust_poll_interval()
+        self.async_set_updated_data(
+            {
+                "dps": self._dps_changes.publish(self._dps_cache),
+                "changed_dps": self._dps_changes.changed,
+                "source": "local_push",
+                "timestamp": datetime.now().isoformat(),
+                "available": True,
+            }
+        )
+
+    def _confirm_writes(self, reported: dict[str, Any]) -> None:
+        """Cancel the deferred refresh once a report confirmed every written value."""
+        if self._write_tracker.confirm(reported) and self._pending_refresh_handle is not None:
+            self._pending_refresh_handle.cancel()
+            self._pending_refresh_handle = None
+            _LOGGER.debug("Device %s confirmed the write, skipping refresh", self.device.device_id[:8])
+
+    @property
+    def changed_dps(self) -> frozenset[str]:
+        """Return the DP ids whose value changed in the most recent update."""
+        return self._dps_changes.changed
+
+    @property
+    def dps_version(self) -> int:
+        """Return the version of the currently published DPS snapshot."""
+        return self._dps_changes.version
+
     @property
     def last_successful_update(self) -> datetime | None:
         """Get timestamp of last successful update."""
@@ -167,6 +240,7 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
             "current_backoff": self._current_backoff,
             "circuit_breaker_retries": self._circuit_breaker_retries,
             "circuit_breaker_next_retry": self._circuit_breaker_next_retry,
+            "activity": self._cadence.activity.value,
         }
 
     def _record_error(self, error_type: str, message: str, recoverable: bool = True) -> None:
@@ -188,7 +262,8 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
     def _adjust_poll_interval(self) -> None:
         """Adjust polling interval based on device state."""
         if self._device_state == DeviceState.ONLINE:
-            new_interval = timedelta(seconds=POLL_INTERVAL_ONLINE)
+            # Fast while cooking, slow while off, burst after commands
+            new_interval = self._cadence.interval(self._dps_cache)
         elif self._device_state == DeviceState.RECONNECTING:
             new_interval = timedelta(seconds=POLL_INTERVAL_RECONNECTING)
         elif self._device_state == DeviceState.UNREACHABLE:
@@ -200,7 +275,8 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
         current_interval = self.update_interval  # type: ignore[has-type]
         if current_interval != new_interval:
             _LOGGER.debug(
-                f"Device {self.device.device_id[:8]}: Adjusting poll interval to {new_interval.total_seconds()}s (state: {self._device_state.value})"
+                f"Device {self.device.device_id[:8]}: Adjusting poll interval to {new_interval.total_seconds()}s "
+                f"(state: {self._device_state.value}, activity: {self._cadence.activity.value})"
             )
             self.update_interval = new_interval
 
@@ -279,7 +355,8 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
         """
         if self._dps_cache:
             return {
-                "dps": self._dps_cache.copy(),
+                "dps": self._dps_changes.publish(self._dps_cache),
+                "changed_dps": self._dps_changes.changed,
                 "source": "cached",
                 "timestamp": self._last_successful_update.isoformat() if self._last_successful_update else None,
                 "available": False,  # Mark as cached/stale data
@@ -324,6 +401,7 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
             # This ensures we keep all DPs seen across multiple updates
             partial_count = len(partial_status)
             self._dps_cache.update(partial_status)
+            self._confirm_writes(partial_status)
 
             # Log if we're merging partial updates
             if partial_count < len(self._dps_cache):
@@ -340,7 +418,8 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
 
             # Return merged cache with proper structure
             merged_data = {
-                "dps": self._dps_cache.copy(),
+                "dps": self._dps_changes.publish(self._dps_cache),
+                "changed_dps": self._dps_changes.changed,
                 "source": "merged_cache",
                 "timestamp": datetime.now().isoformat(),
                 "available": True,
@@ -466,7 +545,8 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
         Tuya cloud takes ~1-3s to propagate writes. An immediate refresh would
         read the OLD value back and clobber any optimistic state in entities,
         causing UI snap-back (Issue #6). We defer the refresh by
-        ``CLOUD_PROPAGATION_DELAY_SECONDS`` so the read sees the fresh value.
+        ``CLOUD_PROPAGATION_DELAY_SECONDS`` so the read sees the fresh value,
+        and skip it entirely if a status frame reports the written value first.
 
         During the delay, entities use their optimistic lock (see
         ``KKTBaseEntity._set_optimistic``) to keep showing the new value.
@@ -477,6 +557,30 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error(f"Failed to set DP {dp} to {value}: {err}")
             raise UpdateFailed(f"Failed to set DP {dp}: {err}") from err
 
+        self._note_command()
+        self._schedule_deferred_refresh({dp: value})
+
+    async def async_set_data_points(self, dps: dict[int, Any]) -> None:
+        """Set several data points with one multi-DP command, then one deferred refresh."""
+        try:
+            await self.device.async_set_dps(dps)
+        except Exception as err:
+            _LOGGER.error(f"Failed to set DPs {dps}: {err}")
+            raise UpdateFailed(f"Failed to set DPs {list(dps)}: {err}") from err
+
+        self._note_command()
+        self._schedule_deferred_refresh(dps)
+
+    def _note_command(self) -> None:
+        """Poll in bursts after a command, unless the device pushes its status."""
+        if getattr(self.device, "pushes_status", False) is True:
+            return
+        self._cadence.note_command()
+        self._adjust_poll_interval()
+
+    def _schedule_deferred_refresh(self, dps: dict[int, Any]) -> None:
+        """Refresh once Tuya cloud has propagated the last write (see async_set_data_point)."""
+        self._write_tracker.expect(dps)
         # Schedule a refresh after Tuya cloud has propagated the write. We use
         # call_later (sync API) because we don't want to block the caller.
         # The destroyed-flag check avoids firing on a torn-down coordinator
@@ -488,6 +592,7 @@ class KKTKolbeUpdateCoordinator(DataUpdateCoordinator):
 
         def _trigger_refresh() -> None:
             self._pending_refresh_handle = None
+            self._write_tracker.expire()
             if self._destroyed:
                 return
             self.hass.async_create_task(self.async_refresh())
@@ -0,0 +1,117 @@
+"""Lookup index over the known device database.
+
+Discovery packets, config flows and entity setup resolve devices by Tuya
+product ID, device ID or category, which used to mean a linear scan over
+``KNOWN_DEVICES`` (with a nested loop over the ``device_id_patterns``) per
+call. ``DeviceIndex`` is built once from the database and answers each of
+these in a dict lookup, or one walk over the device ID for the prefix
+patterns.
+
+Lookups resolve to device keys. When several devices match, the one listed
+first in the database wins, as it did with the scans.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+
+class _PatternTrie:
+    """Prefix trie over device ID patterns, one character per level."""
+
+    __slots__ = ("children", "key")
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.children: dict[str, _PatternTrie] = {}
+        # Device key of the first device with a pattern ending at this node
+        self.key: str | None = None
+
+    def insert(self, pattern: str, key: str) -> None:
+        """Add a pattern; an earlier device keeps a pattern shared with a later one."""
+        node = self
+        for char in pattern:
+            node = node.children.setdefault(char, _PatternTrie())
+        if node.key is None:
+            node.key = key
+
+    def matches(self, device_id: str) -> list[str]:
+        """Return the keys of all patterns that are a prefix of ``device_id``."""
+        keys = [self.key] if self.key is not None else []
+        node = self
+        for char in device_id:
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            if node.key is not None:
+                keys.append(node.key)
+        return keys
+
+
+@dataclass(frozen=True)
+class DeviceIndex:
+    """Immutable lookup tables from product names, device IDs and categories to device keys.
+
+    Attributes:
+        order: Device key → position in the database (lower wins)
+        by_product_name: Tuya product ID / product name → device key
+        by_device_id: Exact device ID → device key
+        platforms_by_category: Category → platforms of its first device
+    """
+
+    order: Mapping[str, int]
+    by_product_name: Mapping[str, str]
+    by_device_id: Mapping[str, str]
+    platforms_by_category: Mapping[str, tuple[str, ...]]
+    _patterns: _PatternTrie
+
+    @classmethod
+    def build(cls, devices: Mapping[str, Mapping[str, Any]]) -> DeviceIndex:
+        """Build the index from a device key → device info mapping.
+
+        Args:
+            devices: The device database (``KNOWN_DEVICES``)
+
+        Returns:
+            A new immutable index.
+        """
+        order: dict[str, int] = {}
+        by_product_name: dict[str, str] = {}
+        by_device_id: dict[str, str] = {}
+        platforms_by_category: dict[str, tuple[str, ...]] = {}
+        patterns = _PatternTrie()
+
+        for position, (key, info) in enumerate(devices.items()):
+            order[key] = position
+            for product_name in info.get("product_names", []):
+                by_product_name.setdefault(product_name, key)
+            for device_id in info.get("device_ids", []):
+                by_device_id.setdefault(device_id, key)
+            for pattern in info.get("device_id_patterns", []):
+                if isinstance(pattern, str):
+                    patterns.insert(pattern, key)
+            platforms = info.get("platforms")
+            if isinstance(platforms, list):
+                platforms_by_category.setdefault(info.get("category", ""), tuple(platforms))
+
+        return cls(
+            order=MappingProxyType(order),
+            by_product_name=MappingProxyType(by_product_name),
+            by_device_id=MappingProxyType(by_device_id),
+            platforms_by_category=MappingProxyType(platforms_by_category),
+            _patterns=patterns,
+        )
+
+    def key_for_device_id(self, device_id: str) -> str | None:
+        """Return the key of the device matching ``device_id`` exactly or by pattern prefix."""
+        candidates = self._patterns.matches(device_id)
+        exact = self.by_device_id.get(device_id)
+        if exact is not None:
+            candidates.append(exact)
+        if not candidates:
+            return None
+        return min(candidates, key=self.order.__getitem__)
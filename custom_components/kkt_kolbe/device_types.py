@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from homeassistant.const import UnitOfTemperature
-from homeassistant.const import UnitOfTime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
 
 from .const import CATEGORY_COOKTOP
 from .const import CATEGORY_HOOD
 from .const import CATEGORY_OVEN
+from .device_index import DeviceIndex
+from .devices import LazyDeviceEntry
 
 # Hood (Dunstabzugshaube) Data Points
 HOOD_DPS = {
@@ -100,8 +103,8 @@ QUICK_LEVELS = [
 ]
 
 # CENTRAL DEVICE DATABASE - Single source of truth for all devices
-# Add new devices only here!
-KNOWN_DEVICES = {
+# Add new devices here, with their data_points/entities in devices/<device key>.py
+_DEVICE_MANIFEST: dict[str, dict[str, Any]] = {
     # HERMES & STYLE Hood - Corrected based on actual data model
     "hermes_style_hood": {
         "model_id": "e1k6i0zo",
@@ -111,163 +114,6 @@ KNOWN_DEVICES = {
         "device_ids": ["bf735dfe2ad64fba7cpyhn"],
         "device_id_patterns": ["bf735dfe2ad64fba7c"],
         "platforms": ["fan", "light", "switch", "sensor", "select", "number", "scene"],
-        "data_points": {
-            # Active DPs (verified working)
-            1: "switch",  # Main power
-            4: "light",  # Light on/off
-            6: "switch_lamp",  # Filter cleaning reminder
-            10: "fan_speed_enum",  # Fan speed
-            13: "countdown",  # Timer
-            101: "RGB",  # RGB lighting modes
-            # Experimental DPs (from API v2.0 Things Data Model, disabled by default)
-            2: "delay_switch",  # Delayed shutdown (afterrun)
-            5: "light_brightness",  # Light brightness (0-255)
-            14: "filter_hours",  # Filter usage hours
-            15: "filter_reset",  # Reset filter counter
-            17: "eco_mode",  # Eco mode
-            102: "rgb_brightness",  # RGB brightness (0-255)
-            103: "color_temp",  # Color temperature
-        },
-        "entities": {
-            "fan": {
-                "dp": 10,  # fan_speed_enum - used for HomeKit/Siri integration
-                "speeds": ["off", "low", "middle", "high", "strong"],
-            },
-            "light": [
-                # Main light with RGB color effects and brightness for HomeKit/Siri
-                {
-                    "dp": 4,
-                    "name": "Light",
-                    "icon": "mdi:lightbulb",
-                    "brightness_dp": 5,
-                    "max_brightness": 255,
-                    "effect_dp": 101,
-                    "effect_numeric": True,
-                    "effect_offset": 1,  # Device uses 0=off, 1=Weiß, 2=Rot, etc.
-                    "effects": ["Weiß", "Rot", "Grün", "Blau", "Gelb", "Lila", "Orange", "Cyan", "Grasgrün"],
-                }
-            ],
-            "switch": [
-                {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
-                {
-                    "dp": 6,
-                    "name": "Filter Cleaning Reminder",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 15,
-                    "name": "Filter Reset",
-                    "icon": "mdi:air-filter-off",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 2,
-                    "name": "Delayed Shutdown",
-                    "icon": "mdi:timer-off",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {"dp": 17, "name": "Eco Mode", "icon": "mdi:leaf", "advanced": True, "entity_category": "config"},
-            ],
-            "number": [
-                # RGB Mode as number (backup, advanced) - use Light effects instead
-                {
-                    "dp": 101,
-                    "name": "RGB Mode",
-                    "min": 0,
-                    "max": 9,
-                    "step": 1,
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 13,
-                    "name": "Timer",
-                    "min": 0,
-                    "max": 60,
-                    "unit": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer",
-                },
-                {
-                    "dp": 5,
-                    "name": "Light Brightness",
-                    "min": 0,
-                    "max": 255,
-                    "step": 1,
-                    "icon": "mdi:brightness-6",
-                    "advanced": True,
-                },
-                {
-                    "dp": 102,
-                    "name": "RGB Brightness",
-                    "min": 0,
-                    "max": 255,
-                    "step": 1,
-                    "icon": "mdi:brightness-5",
-                    "advanced": True,
-                },
-            ],
-            "sensor": [
-                {
-                    "dp": 6,
-                    "name": "Filter Status",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 14,
-                    "name": "Filter Hours",
-                    "unit": "h",
-                    "device_class": "duration",
-                    "icon": "mdi:clock-outline",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-            ],
-            "select": [
-                # RGB Mode select - maps numeric values 0-9 to color names
-                {
-                    "dp": 101,
-                    "name": "RGB Mode",
-                    "options": ["Aus", "Weiß", "Rot", "Grün", "Blau", "Gelb", "Lila", "Orange", "Cyan", "Grasgrün"],
-                    "options_map": {
-                        "Aus": 0,
-                        "Weiß": 1,
-                        "Rot": 2,
-                        "Grün": 3,
-                        "Blau": 4,
-                        "Gelb": 5,
-                        "Lila": 6,
-                        "Orange": 7,
-                        "Cyan": 8,
-                        "Grasgrün": 9,
-                    },
-                    "icon": "mdi:palette",
-                },
-                # Fan Speed select marked as advanced to avoid HomeKit showing both fan and select
-                {
-                    "dp": 10,
-                    "name": "Fan Speed",
-                    "options": ["off", "low", "middle", "high", "strong"],
-                    "icon": "mdi:fan",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 103,
-                    "name": "Color Temperature",
-                    "options": ["warm", "neutral", "cold"],
-                    "icon": "mdi:thermometer",
-                    "advanced": True,
-                },
-            ],
-        },
     },
     # KKT Kolbe FLAT Hood - Simplified version without RGB lighting
     "flat_hood": {
@@ -278,63 +124,6 @@ KNOWN_DEVICES = {
         "device_ids": ["bff904d332b57484da1twc"],
         "device_id_patterns": ["bff904d332b57484da"],
         "platforms": ["fan", "light", "switch", "sensor", "select", "number", "scene"],
-        "data_points": {
-            1: "switch",  # Main power
-            4: "light",  # Light on/off (no RGB)
-            6: "switch_lamp",  # Filter cleaning reminder
-            10: "fan_speed_enum",  # Fan speed
-            13: "countdown",  # Timer
-        },
-        "entities": {
-            "fan": {
-                "dp": 10,  # fan_speed_enum includes "off" state
-                "speeds": ["off", "low", "middle", "high", "strong"],
-            },
-            "light": [
-                # Main light as light entity for HomeKit/Siri
-                {"dp": 4, "name": "Light", "icon": "mdi:lightbulb"}
-            ],
-            "switch": [
-                {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
-                {
-                    "dp": 6,
-                    "name": "Filter Cleaning Reminder",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-            ],
-            "number": [
-                {
-                    "dp": 13,
-                    "name": "Timer",
-                    "min": 0,
-                    "max": 60,
-                    "unit": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer",
-                }
-            ],
-            "select": [
-                # Fan Speed select marked as advanced to avoid HomeKit showing both fan and select
-                {
-                    "dp": 10,
-                    "name": "Fan Speed",
-                    "options": ["off", "low", "middle", "high", "strong"],
-                    "advanced": True,
-                    "entity_category": "config",
-                }
-            ],
-            "sensor": [
-                {
-                    "dp": 6,
-                    "name": "Filter Status",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                }
-            ],
-        },
     },
     # KKT HERMES Hood (Schwestermodell ohne "& Style")
     "hermes_hood": {
@@ -345,147 +134,6 @@ KNOWN_DEVICES = {
         "device_ids": [],  # Will be filled when users report
         "device_id_patterns": [],
         "platforms": ["fan", "light", "switch", "sensor", "select", "number", "scene"],
-        "data_points": HOOD_DPS,
-        "entities": {
-            "fan": {
-                "dp": 10,  # fan_speed_enum
-                "speeds": ["off", "low", "middle", "high", "strong"],
-            },
-            "light": [
-                # Main light with RGB color effects and brightness for HomeKit/Siri
-                {
-                    "dp": 4,
-                    "name": "Light",
-                    "icon": "mdi:lightbulb",
-                    "brightness_dp": 5,
-                    "max_brightness": 255,
-                    "effect_dp": 101,
-                    "effect_numeric": True,
-                    "effect_offset": 1,  # Device uses 0=off, 1=Weiß, 2=Rot, etc.
-                    "effects": ["Weiß", "Rot", "Grün", "Blau", "Gelb", "Lila", "Orange", "Cyan", "Grasgrün"],
-                }
-            ],
-            "switch": [
-                {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
-                {
-                    "dp": 6,
-                    "name": "Filter Cleaning Reminder",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 15,
-                    "name": "Filter Reset",
-                    "icon": "mdi:air-filter-off",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 2,
-                    "name": "Delayed Shutdown",
-                    "icon": "mdi:timer-off",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {"dp": 17, "name": "Eco Mode", "icon": "mdi:leaf", "advanced": True, "entity_category": "config"},
-            ],
-            "select": [
-                # RGB Mode select - maps numeric values 0-9 to color names
-                {
-                    "dp": 101,
-                    "name": "RGB Mode",
-                    "options": ["Aus", "Weiß", "Rot", "Grün", "Blau", "Gelb", "Lila", "Orange", "Cyan", "Grasgrün"],
-                    "options_map": {
-                        "Aus": 0,
-                        "Weiß": 1,
-                        "Rot": 2,
-                        "Grün": 3,
-                        "Blau": 4,
-                        "Gelb": 5,
-                        "Lila": 6,
-                        "Orange": 7,
-                        "Cyan": 8,
-                        "Grasgrün": 9,
-                    },
-                    "icon": "mdi:palette",
-                },
-                # Fan Speed select marked as advanced to avoid HomeKit showing both fan and select
-                {
-                    "dp": 10,
-                    "name": "Fan Speed",
-                    "options": ["off", "low", "middle", "high", "strong"],
-                    "icon": "mdi:fan",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 103,
-                    "name": "Color Temperature",
-                    "options": ["warm", "neutral", "cold"],
-                    "icon": "mdi:thermometer",
-                    "advanced": True,
-                },
-            ],
-            "number": [
-                # RGB Mode as number (backup, advanced) - use Light effects instead
-                {
-                    "dp": 101,
-                    "name": "RGB Mode",
-                    "min": 0,
-                    "max": 9,
-                    "step": 1,
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 13,
-                    "name": "Timer",
-                    "min": 0,
-                    "max": 60,
-                    "unit": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer",
-                },
-                {
-                    "dp": 5,
-                    "name": "Light Brightness",
-                    "min": 0,
-                    "max": 255,
-                    "step": 1,
-                    "icon": "mdi:brightness-6",
-                    "advanced": True,
-                },
-                {
-                    "dp": 102,
-                    "name": "RGB Brightness",
-                    "min": 0,
-                    "max": 255,
-                    "step": 1,
-                    "icon": "mdi:brightness-5",
-                    "advanced": True,
-                },
-            ],
-            "sensor": [
-                {
-                    "dp": 6,
-                    "name": "Filter Status",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 14,
-                    "name": "Filter Hours",
-                    "unit": "h",
-                    "device_class": "duration",
-                    "icon": "mdi:clock-outline",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-            ],
-        },
     },
     # KKT Kolbe SOLO HCM Hood - Based on ECCO HCM structure (verified via Things Data Model)
     # Model ID: edjszs (similar to ECCO HCM edjsx0)
@@ -499,137 +147,6 @@ KNOWN_DEVICES = {
         "device_ids": ["bf34515c4ab6ec7f9axqy8"],
         "device_id_patterns": ["bf34515c4ab6ec7f9a"],
         "platforms": ["fan", "light", "switch", "sensor", "select", "number", "scene"],
-        "data_points": {
-            1: "switch",  # Main power (ON/OFF)
-            4: "light",  # Main light on/off
-            6: "switch_lamp",  # RGB switch trigger
-            7: "switch_wash",  # Setting/Wash mode
-            102: "fan_speed",  # Fan speed (0-9)
-            103: "day",  # Carbon filter days remaining (0-250)
-            104: "switch_led_1",  # LED light (alternative to DP 4)
-            105: "countdown_1",  # Countdown timer (0-60 min)
-            106: "switch_led",  # Confirm
-            107: "colour_data",  # RGB color data (string, max 255)
-            108: "work_mode",  # RGB work mode (white/colour/scene/music)
-            109: "day_1",  # Metal filter days remaining (0-40)
-        },
-        "entities": {
-            "fan": {
-                "dp": 102,  # fan_speed numeric (0-9) - for HomeKit/Siri
-                "speeds": ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"],
-                "numeric": True,  # Use numeric mode instead of enum
-                "min": 0,
-                "max": 9,
-            },
-            "light": [
-                # Main light with RGB mode effects for HomeKit/Siri
-                # Auto-Work-Mode: Sets work_mode to "white" before turning on light
-                {
-                    "dp": 4,
-                    "name": "Light",
-                    "icon": "mdi:lightbulb",
-                    "effect_dp": 108,
-                    "effect_numeric": False,
-                    "effects": ["white", "colour", "scene", "music"],
-                    "work_mode_dp": 108,
-                    "work_mode_default": "white",
-                },
-                # LED Light as alternative (some SOLO HCM units respond to DP 104 instead of DP 4)
-                # Auto-Work-Mode: Sets work_mode to "white" before turning on light
-                {
-                    "dp": 104,
-                    "name": "LED Light",
-                    "icon": "mdi:led-strip",
-                    "work_mode_dp": 108,
-                    "work_mode_default": "white",
-                },
-            ],
-            "switch": [
-                {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
-                {
-                    "dp": 6,
-                    "name": "RGB Light",
-                    "device_class": "switch",
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 7,
-                    "name": "Wash Mode",
-                    "device_class": "switch",
-                    "icon": "mdi:spray-bottle",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 106,
-                    "name": "Side Light",
-                    "device_class": "switch",
-                    "icon": "mdi:wall-sconce-flat",
-                    "advanced": True,
-                },
-            ],
-            "select": [
-                {
-                    "dp": 108,
-                    "name": "RGB Mode",
-                    "options": ["white", "colour", "scene", "music"],
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                }
-            ],
-            "number": [
-                {
-                    "dp": 102,
-                    "name": "Fan Speed",
-                    "min": 0,
-                    "max": 9,
-                    "step": 1,
-                    "icon": "mdi:fan",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 105,
-                    "name": "Timer",
-                    "min": 0,
-                    "max": 60,
-                    "unit": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer",
-                },
-                {
-                    "dp": 103,
-                    "name": "Carbon Filter Remaining",
-                    "min": 0,
-                    "max": 250,
-                    "unit": "days",
-                    "icon": "mdi:air-filter",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 109,
-                    "name": "Metal Filter Remaining",
-                    "min": 0,
-                    "max": 40,
-                    "unit": "days",
-                    "icon": "mdi:air-filter",
-                    "entity_category": "diagnostic",
-                },
-            ],
-            "sensor": [
-                # colour_data (DP 107) - RGB color data string, shows current color when work_mode="colour"
-                {
-                    "dp": 107,
-                    "name": "RGB Color Data",
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                }
-            ],
-        },
     },
     # KKT Kolbe ECCO HCM Hood
     "ecco_hcm_hood": {
@@ -640,143 +157,6 @@ KNOWN_DEVICES = {
         "device_ids": ["bfd0c94cb36bf4f28epxcf"],
         "device_id_patterns": ["bfd0c94cb36bf4f28e"],
         "platforms": ["fan", "light", "switch", "sensor", "select", "number", "scene"],
-        "data_points": {
-            1: "switch",  # Main power
-            4: "light",  # Main light on/off
-            6: "switch_lamp",  # RGB switch trigger
-            7: "switch_wash",  # Setting/Wash mode
-            102: "fan_speed",  # Fan speed (0-9)
-            103: "day",  # Carbon filter days (0-250)
-            104: "switch_led_1",  # LED light
-            105: "countdown_1",  # Countdown timer (0-60 min)
-            106: "switch_led",  # Confirm
-            107: "colour_data",  # RGB color data (string)
-            108: "work_mode",  # RGB work mode (white/colour/scene/music)
-            109: "day_1",  # Metal filter days (0-40)
-        },
-        "entities": {
-            "fan": {
-                "dp": 102,  # fan_speed numeric (0-9) - for HomeKit/Siri
-                "speeds": ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"],
-                "numeric": True,  # Use numeric mode instead of enum
-                "min": 0,
-                "max": 9,
-            },
-            "light": [
-                # Main light with RGB mode effects for HomeKit/Siri
-                # Auto-Work-Mode: Sets work_mode to "white" before turning on light
-                {
-                    "dp": 4,
-                    "name": "Light",
-                    "icon": "mdi:lightbulb",
-                    "effect_dp": 108,
-                    "effect_numeric": False,
-                    "effects": ["white", "colour", "scene", "music"],
-                    "work_mode_dp": 108,
-                    "work_mode_default": "white",
-                },
-                # LED Light as alternative (some units respond to DP 104 instead of DP 4)
-                # Auto-Work-Mode: Sets work_mode to "white" before turning on light
-                {
-                    "dp": 104,
-                    "name": "LED Light",
-                    "icon": "mdi:led-strip",
-                    "work_mode_dp": 108,
-                    "work_mode_default": "white",
-                },
-            ],
-            "switch": [
-                {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
-                # RGB light as switch (use main Light entity for Siri)
-                {
-                    "dp": 6,
-                    "name": "RGB Light",
-                    "device_class": "switch",
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 7,
-                    "name": "Wash Mode",
-                    "device_class": "switch",
-                    "icon": "mdi:spray-bottle",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                # Note: Tuya calls this "Confirm" but it's actually a side light (red) on some units
-                {
-                    "dp": 106,
-                    "name": "Side Light",
-                    "device_class": "switch",
-                    "icon": "mdi:wall-sconce-flat",
-                    "advanced": True,
-                },
-            ],
-            "select": [
-                # RGB Mode as select (backup, advanced) - use Light effects instead
-                {
-                    "dp": 108,
-                    "name": "RGB Mode",
-                    "options": ["white", "colour", "scene", "music"],
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                }
-            ],
-            "number": [
-                # Fan Speed number marked as advanced to avoid HomeKit showing both fan and number
-                {
-                    "dp": 102,
-                    "name": "Fan Speed",
-                    "min": 0,
-                    "max": 9,
-                    "step": 1,
-                    "icon": "mdi:fan",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 105,
-                    "name": "Timer",
-                    "min": 0,
-                    "max": 60,
-                    "unit": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer",
-                },
-                {
-                    "dp": 103,
-                    "name": "Carbon Filter Remaining",
-                    "min": 0,
-                    "max": 250,
-                    "unit": "days",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 109,
-                    "name": "Metal Filter Remaining",
-                    "min": 0,
-                    "max": 40,
-                    "unit": "days",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-            ],
-            "sensor": [
-                # colour_data (DP 107) - RGB color data string, shows current color when work_mode="colour"
-                {
-                    "dp": 107,
-                    "name": "RGB Color Data",
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                }
-            ],
-        },
     },
     # KKT Kolbe EASY / PLOOM Hood
     # EASY: EASY9005SM (90cm), EASY909SHCM (90cm), EASY609SHCM (60cm) - Issue #5
@@ -799,120 +179,6 @@ KNOWN_DEVICES = {
         "device_ids": [],
         "device_id_patterns": [],
         "platforms": ["fan", "light", "switch", "sensor", "select", "number", "scene"],
-        "data_points": {
-            1: "switch",  # Main power on/off
-            4: "light",  # Light on/off
-            10: "fan_speed_enum",  # Fan speed (enum: off/one/two/.../nine)
-            13: "countdown",  # Timer 0-100 min
-            101: "l",  # Filter cleaning reminder
-            102: "r",  # RGB light mode 0-9
-        },
-        "entities": {
-            "fan": {
-                "dp": 10,
-                "speeds": ["off", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"],
-            },
-            "light": [
-                {
-                    "dp": 4,
-                    "name": "Light",
-                    "icon": "mdi:lightbulb",
-                    "effect_dp": 102,
-                    "effect_numeric": True,
-                    "effect_offset": 1,  # Device uses 0=off, 1=Weiss, 2=Rot, etc.
-                    "effects": [
-                        "Weiss",
-                        "Rot",
-                        "Gruen",
-                        "Blau",
-                        "Gelb",
-                        "Lila",
-                        "Orange",
-                        "Cyan",
-                        "Gruen hell",
-                    ],
-                }
-            ],
-            "switch": [
-                {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
-                {
-                    "dp": 101,
-                    "name": "Filter Cleaning Reminder",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-            ],
-            "select": [
-                {
-                    "dp": 102,
-                    "name": "RGB Mode",
-                    "options": [
-                        "Aus",
-                        "Weiss",
-                        "Rot",
-                        "Gruen",
-                        "Blau",
-                        "Gelb",
-                        "Lila",
-                        "Orange",
-                        "Cyan",
-                        "Gruen hell",
-                    ],
-                    "options_map": {
-                        "Aus": 0,
-                        "Weiss": 1,
-                        "Rot": 2,
-                        "Gruen": 3,
-                        "Blau": 4,
-                        "Gelb": 5,
-                        "Lila": 6,
-                        "Orange": 7,
-                        "Cyan": 8,
-                        "Gruen hell": 9,
-                    },
-                    "icon": "mdi:palette",
-                },
-                {
-                    "dp": 10,
-                    "name": "Fan Speed",
-                    "options": ["off", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"],
-                    "icon": "mdi:fan",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-            ],
-            "number": [
-                {
-                    "dp": 102,
-                    "name": "RGB Mode",
-                    "min": 0,
-                    "max": 9,
-                    "step": 1,
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 13,
-                    "name": "Timer",
-                    "min": 0,
-                    "max": 100,
-                    "unit": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer",
-                },
-            ],
-            "sensor": [
-                {
-                    "dp": 101,
-                    "name": "Filter Status",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                }
-            ],
-        },
     },
     # DEFAULT HOOD HERMES - Based on HERMES family for manual selection
     # Uses HERMES DPs with enum fan speed (off/low/middle/high/strong)
@@ -924,157 +190,6 @@ KNOWN_DEVICES = {
         "device_ids": [],
         "device_id_patterns": [],
         "platforms": ["fan", "light", "switch", "sensor", "select", "number", "scene"],
-        "data_points": {
-            1: "switch",  # Main power
-            4: "light",  # Light on/off
-            5: "light_brightness",  # Light brightness (0-255)
-            6: "switch_lamp",  # Filter cleaning reminder
-            10: "fan_speed_enum",  # Fan speed (enum)
-            13: "countdown",  # Timer
-            14: "filter_hours",  # Filter usage hours
-            15: "filter_reset",  # Reset filter counter
-            17: "eco_mode",  # Eco mode
-            2: "delay_switch",  # Delayed shutdown
-            101: "RGB",  # RGB lighting modes (0-9)
-            102: "rgb_brightness",  # RGB brightness (0-255)
-            103: "color_temp",  # Color temperature
-        },
-        "entities": {
-            "fan": {
-                "dp": 10,  # fan_speed_enum
-                "speeds": ["off", "low", "middle", "high", "strong"],
-            },
-            "light": [
-                {
-                    "dp": 4,
-                    "name": "Light",
-                    "icon": "mdi:lightbulb",
-                    "brightness_dp": 5,
-                    "max_brightness": 255,
-                    "effect_dp": 101,
-                    "effect_numeric": True,
-                    "effect_offset": 1,  # Device uses 0=off, 1=Weiß, 2=Rot, etc.
-                    "effects": ["Weiß", "Rot", "Grün", "Blau", "Gelb", "Lila", "Orange", "Cyan", "Grasgrün"],
-                }
-            ],
-            "switch": [
-                {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
-                {
-                    "dp": 6,
-                    "name": "Filter Cleaning Reminder",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 15,
-                    "name": "Filter Reset",
-                    "icon": "mdi:air-filter-off",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 2,
-                    "name": "Delayed Shutdown",
-                    "icon": "mdi:timer-off",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {"dp": 17, "name": "Eco Mode", "icon": "mdi:leaf", "advanced": True, "entity_category": "config"},
-            ],
-            "number": [
-                {
-                    "dp": 101,
-                    "name": "RGB Mode",
-                    "min": 0,
-                    "max": 9,
-                    "step": 1,
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 13,
-                    "name": "Timer",
-                    "min": 0,
-                    "max": 60,
-                    "unit": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer",
-                },
-                {
-                    "dp": 5,
-                    "name": "Light Brightness",
-                    "min": 0,
-                    "max": 255,
-                    "step": 1,
-                    "icon": "mdi:brightness-6",
-                    "advanced": True,
-                },
-                {
-                    "dp": 102,
-                    "name": "RGB Brightness",
-                    "min": 0,
-                    "max": 255,
-                    "step": 1,
-                    "icon": "mdi:brightness-5",
-                    "advanced": True,
-                },
-            ],
-            "sensor": [
-                {
-                    "dp": 6,
-                    "name": "Filter Status",
-                    "icon": "mdi:air-filter",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 14,
-                    "name": "Filter Hours",
-                    "unit": "h",
-                    "device_class": "duration",
-                    "icon": "mdi:clock-outline",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-            ],
-            "select": [
-                {
-                    "dp": 101,
-                    "name": "RGB Mode",
-                    "options": ["Aus", "Weiß", "Rot", "Grün", "Blau", "Gelb", "Lila", "Orange", "Cyan", "Grasgrün"],
-                    "options_map": {
-                        "Aus": 0,
-                        "Weiß": 1,
-                        "Rot": 2,
-                        "Grün": 3,
-                        "Blau": 4,
-                        "Gelb": 5,
-                        "Lila": 6,
-                        "Orange": 7,
-                        "Cyan": 8,
-                        "Grasgrün": 9,
-                    },
-                    "icon": "mdi:palette",
-                },
-                {
-                    "dp": 10,
-                    "name": "Fan Speed",
-                    "options": ["off", "low", "middle", "high", "strong"],
-                    "icon": "mdi:fan",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 103,
-                    "name": "Color Temperature",
-                    "options": ["warm", "neutral", "cold"],
-                    "icon": "mdi:thermometer",
-                    "advanced": True,
-                },
-            ],
-        },
     },
     # DEFAULT HOOD HCM - Based on HCM family (SOLO/ECCO) as fallback
     # Uses HCM DPs which are the most complete configuration
@@ -1086,135 +201,6 @@ KNOWN_DEVICES = {
         "device_ids": [],  # Matches any device when selected manually
         "device_id_patterns": [],
         "platforms": ["fan", "light", "switch", "sensor", "select", "number", "scene"],
-        "data_points": {
-            1: "switch",  # Main power (ON/OFF)
-            4: "light",  # Main light on/off
-            6: "switch_lamp",  # RGB switch trigger
-            7: "switch_wash",  # Setting/Wash mode
-            102: "fan_speed",  # Fan speed (0-9)
-            103: "day",  # Carbon filter days remaining (0-250)
-            104: "switch_led_1",  # LED light
-            105: "countdown_1",  # Countdown timer (0-60 min)
-            106: "switch_led",  # Confirm
-            107: "colour_data",  # RGB color data (string, max 255)
-            108: "work_mode",  # RGB work mode (white/colour/scene/music)
-            109: "day_1",  # Metal filter days remaining (0-40)
-        },
-        "entities": {
-            "fan": {
-                "dp": 102,  # fan_speed numeric (0-9) - for HomeKit/Siri
-                "speeds": ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"],
-                "numeric": True,  # Use numeric mode instead of enum
-                "min": 0,
-                "max": 9,
-            },
-            "light": [
-                # Main light with RGB mode effects for HomeKit/Siri
-                {
-                    "dp": 4,
-                    "name": "Light",
-                    "icon": "mdi:lightbulb",
-                    "effect_dp": 108,
-                    "effect_numeric": False,
-                    "effects": ["white", "colour", "scene", "music"],
-                    "work_mode_dp": 108,
-                    "work_mode_default": "white",
-                }
-            ],
-            "switch": [
-                {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
-                {
-                    "dp": 6,
-                    "name": "RGB Light",
-                    "device_class": "switch",
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 7,
-                    "name": "Wash Mode",
-                    "device_class": "switch",
-                    "icon": "mdi:spray-bottle",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 104,
-                    "name": "LED Light",
-                    "device_class": "switch",
-                    "icon": "mdi:led-strip",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 106,
-                    "name": "Confirm",
-                    "device_class": "switch",
-                    "icon": "mdi:check",
-                    "entity_category": "config",
-                    "advanced": True,
-                },
-            ],
-            "select": [
-                {
-                    "dp": 108,
-                    "name": "RGB Mode",
-                    "options": ["white", "colour", "scene", "music"],
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "config",
-                }
-            ],
-            "number": [
-                {
-                    "dp": 102,
-                    "name": "Fan Speed",
-                    "min": 0,
-                    "max": 9,
-                    "step": 1,
-                    "icon": "mdi:fan",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-                {
-                    "dp": 105,
-                    "name": "Timer",
-                    "min": 0,
-                    "max": 60,
-                    "unit": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer",
-                },
-                {
-                    "dp": 103,
-                    "name": "Carbon Filter Remaining",
-                    "min": 0,
-                    "max": 250,
-                    "unit": "days",
-                    "icon": "mdi:air-filter",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 109,
-                    "name": "Metal Filter Remaining",
-                    "min": 0,
-                    "max": 40,
-                    "unit": "days",
-                    "icon": "mdi:air-filter",
-                    "entity_category": "diagnostic",
-                },
-            ],
-            "sensor": [
-                {
-                    "dp": 107,
-                    "name": "RGB Color Data",
-                    "icon": "mdi:palette",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                }
-            ],
-        },
     },
     # IND7705HC Induction Cooktop - Complete configuration with bitfield decoding
     "ind7705hc_cooktop": {
@@ -1225,489 +211,6 @@ KNOWN_DEVICES = {
         "device_ids": ["bf5592b47738c5b46evzff"],
         "device_id_patterns": ["bf5592b47738c5b46e"],
         "platforms": ["switch", "number", "sensor", "binary_sensor", "select"],
-        "data_points": COOKTOP_DPS,
-        "entities": {
-            "switch": [
-                {"dp": 101, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
-                {"dp": 102, "name": "Pause", "device_class": "switch", "icon": "mdi:pause"},
-                {
-                    "dp": 103,
-                    "name": "Child Lock",
-                    "device_class": "switch",
-                    "icon": "mdi:lock",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 145,
-                    "name": "Senior Mode",
-                    "device_class": "switch",
-                    "icon": "mdi:account-supervisor",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 108,
-                    "name": "Confirm Action",
-                    "device_class": "switch",
-                    "entity_category": "config",
-                    "icon": "mdi:check",
-                },
-            ],
-            "number": [
-                # Global controls
-                {"dp": 104, "name": "Max Power Level", "min": 0, "max": 25, "mode": "slider", "icon": "mdi:flash"},
-                {
-                    "dp": 134,
-                    "name": "General Timer",
-                    "min": 0,
-                    "max": 99,
-                    "unit_of_measurement": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "mode": "slider",
-                    "icon": "mdi:timer",
-                },
-                # Zone-specific controls (bitfield-decoded)
-                {
-                    "dp": 162,
-                    "name": "Zone 1: Power Level",
-                    "min": 0,
-                    "max": 25,
-                    "zone": 1,
-                    "mode": "slider",
-                    "icon": "mdi:numeric-1-circle",
-                },
-                {
-                    "dp": 162,
-                    "name": "Zone 2: Power Level",
-                    "min": 0,
-                    "max": 25,
-                    "zone": 2,
-                    "mode": "slider",
-                    "icon": "mdi:numeric-2-circle",
-                },
-                {
-                    "dp": 162,
-                    "name": "Zone 3: Power Level",
-                    "min": 0,
-                    "max": 25,
-                    "zone": 3,
-                    "mode": "slider",
-                    "icon": "mdi:numeric-3-circle",
-                },
-                {
-                    "dp": 162,
-                    "name": "Zone 4: Power Level",
-                    "min": 0,
-                    "max": 25,
-                    "zone": 4,
-                    "mode": "slider",
-                    "icon": "mdi:numeric-4-circle",
-                },
-                {
-                    "dp": 162,
-                    "name": "Zone 5: Power Level",
-                    "min": 0,
-                    "max": 25,
-                    "zone": 5,
-                    "mode": "slider",
-                    "icon": "mdi:numeric-5-circle",
-                },
-                {
-                    "dp": 167,
-                    "name": "Zone 1: Timer",
-                    "min": 0,
-                    "max": 255,
-                    "unit_of_measurement": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "zone": 1,
-                    "mode": "slider",
-                    "icon": "mdi:timer-outline",
-                    "advanced": True,
-                },
-                {
-                    "dp": 167,
-                    "name": "Zone 2: Timer",
-                    "min": 0,
-                    "max": 255,
-                    "unit_of_measurement": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "zone": 2,
-                    "mode": "slider",
-                    "icon": "mdi:timer-outline",
-                    "advanced": True,
-                },
-                {
-                    "dp": 167,
-                    "name": "Zone 3: Timer",
-                    "min": 0,
-                    "max": 255,
-                    "unit_of_measurement": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "zone": 3,
-                    "mode": "slider",
-                    "icon": "mdi:timer-outline",
-                    "advanced": True,
-                },
-                {
-                    "dp": 167,
-                    "name": "Zone 4: Timer",
-                    "min": 0,
-                    "max": 255,
-                    "unit_of_measurement": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "zone": 4,
-                    "mode": "slider",
-                    "icon": "mdi:timer-outline",
-                    "advanced": True,
-                },
-                {
-                    "dp": 167,
-                    "name": "Zone 5: Timer",
-                    "min": 0,
-                    "max": 255,
-                    "unit_of_measurement": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "zone": 5,
-                    "mode": "slider",
-                    "icon": "mdi:timer-outline",
-                    "advanced": True,
-                },
-                # Core Temperature Probe (optional accessory - only works when probe is connected)
-                # Note: DP 168/169 are NOT zone temperatures but for the meat probe accessory
-                {
-                    "dp": 168,
-                    "name": "Core Probe: Target Temp",
-                    "min": 0,
-                    "max": 300,
-                    "unit_of_measurement": UnitOfTemperature.CELSIUS,
-                    "device_class": "temperature",
-                    "mode": "slider",
-                    "icon": "mdi:thermometer-probe",
-                    "advanced": True,
-                    "entity_category": "config",
-                },
-            ],
-            "select": [
-                {
-                    "dp": 148,
-                    "name": "Zone 1: Quick Level",
-                    "options": QUICK_LEVELS,
-                    "icon": "mdi:numeric-1-circle-outline",
-                    "advanced": True,
-                },
-                {
-                    "dp": 149,
-                    "name": "Zone 2: Quick Level",
-                    "options": QUICK_LEVELS,
-                    "icon": "mdi:numeric-2-circle-outline",
-                    "advanced": True,
-                },
-                {
-                    "dp": 150,
-                    "name": "Zone 3: Quick Level",
-                    "options": QUICK_LEVELS,
-                    "icon": "mdi:numeric-3-circle-outline",
-                    "advanced": True,
-                },
-                {
-                    "dp": 151,
-                    "name": "Zone 4: Quick Level",
-                    "options": QUICK_LEVELS,
-                    "icon": "mdi:numeric-4-circle-outline",
-                    "advanced": True,
-                },
-                {
-                    "dp": 152,
-                    "name": "Zone 5: Quick Level",
-                    "options": QUICK_LEVELS,
-                    "icon": "mdi:numeric-5-circle-outline",
-                    "advanced": True,
-                },
-                {
-                    "dp": 153,
-                    "name": "Save Zone Level",
-                    "options": ["save_hob1", "save_hob2", "save_hob3", "save_hob4", "save_hob5"],
-                    "entity_category": "config",
-                    "icon": "mdi:content-save",
-                },
-                {
-                    "dp": 154,
-                    "name": "Set Zone Level",
-                    "options": ["set_hob1", "set_hob2", "set_hob3", "set_hob4", "set_hob5"],
-                    "entity_category": "config",
-                    "icon": "mdi:cog",
-                },
-                {
-                    "dp": 155,
-                    "name": "Power Limit",
-                    "options": ["power_limit_1", "power_limit_2", "power_limit_3", "power_limit_4", "power_limit_5"],
-                    "icon": "mdi:flash-triangle",
-                },
-            ],
-            "sensor": [
-                # === CALCULATED SENSORS (für Automationen) ===
-                # Geschätzter Stromverbrauch basierend auf Zonen-Levels (~100W pro Level)
-                {
-                    "dp": 162,
-                    "name": "Estimated Power",
-                    "sensor_type": "calculated_power",
-                    "zones_dp": 162,
-                    "num_zones": 5,
-                    "watts_per_level": 100,
-                    "icon": "mdi:lightning-bolt",
-                },
-                # Summe aller Zonen-Levels (0-125)
-                {
-                    "dp": 162,
-                    "name": "Total Power Level",
-                    "sensor_type": "total_level",
-                    "zones_dp": 162,
-                    "num_zones": 5,
-                    "icon": "mdi:gauge",
-                },
-                # Anzahl aktiver Zonen (0-5)
-                {
-                    "dp": 162,
-                    "name": "Active Zones",
-                    "sensor_type": "active_zones",
-                    "zones_dp": 162,
-                    "num_zones": 5,
-                    "icon": "mdi:stove",
-                },
-                # === CORE TEMPERATURE PROBE (optional accessory) ===
-                # Note: DP 169 is NOT zone temperature but the meat probe reading
-                # This sensor only shows data when a core temperature probe is connected
-                {
-                    "dp": 169,
-                    "name": "Core Probe: Temperature",
-                    "unit_of_measurement": UnitOfTemperature.CELSIUS,
-                    "device_class": "temperature",
-                    "icon": "mdi:thermometer-probe",
-                    "advanced": True,
-                },
-                # === CHEF FUNCTION LEVELS (DP 106 bitfield, 8 bits per zone) ===
-                {
-                    "dp": 106,
-                    "name": "Zone 1: Chef Level",
-                    "zone": 1,
-                    "icon": "mdi:chef-hat",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 106,
-                    "name": "Zone 2: Chef Level",
-                    "zone": 2,
-                    "icon": "mdi:chef-hat",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 106,
-                    "name": "Zone 3: Chef Level",
-                    "zone": 3,
-                    "icon": "mdi:chef-hat",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 106,
-                    "name": "Zone 4: Chef Level",
-                    "zone": 4,
-                    "icon": "mdi:chef-hat",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 106,
-                    "name": "Zone 5: Chef Level",
-                    "zone": 5,
-                    "icon": "mdi:chef-hat",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                # === BBQ TIMER (DP 107 bitfield, 8 bits per zone - Left/Right) ===
-                {
-                    "dp": 107,
-                    "name": "BBQ Timer Left",
-                    "zone": 1,
-                    "unit_of_measurement": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:grill",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 107,
-                    "name": "BBQ Timer Right",
-                    "zone": 2,
-                    "unit_of_measurement": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:grill",
-                    "advanced": True,
-                    "entity_category": "diagnostic",
-                },
-            ],
-            "binary_sensor": [
-                # Zone error status (bitfield-decoded) - Diagnostic
-                {
-                    "dp": 105,
-                    "name": "Zone 1: Error",
-                    "device_class": "problem",
-                    "zone": 1,
-                    "icon": "mdi:alert-circle",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 105,
-                    "name": "Zone 2: Error",
-                    "device_class": "problem",
-                    "zone": 2,
-                    "icon": "mdi:alert-circle",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 105,
-                    "name": "Zone 3: Error",
-                    "device_class": "problem",
-                    "zone": 3,
-                    "icon": "mdi:alert-circle",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 105,
-                    "name": "Zone 4: Error",
-                    "device_class": "problem",
-                    "zone": 4,
-                    "icon": "mdi:alert-circle",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 105,
-                    "name": "Zone 5: Error",
-                    "device_class": "problem",
-                    "zone": 5,
-                    "icon": "mdi:alert-circle",
-                    "entity_category": "diagnostic",
-                },
-                # Zone selection status (bitfield-decoded) - Diagnostic
-                {
-                    "dp": 161,
-                    "name": "Zone 1: Selected",
-                    "device_class": "running",
-                    "zone": 1,
-                    "icon": "mdi:radiobox-marked",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 161,
-                    "name": "Zone 2: Selected",
-                    "device_class": "running",
-                    "zone": 2,
-                    "icon": "mdi:radiobox-marked",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 161,
-                    "name": "Zone 3: Selected",
-                    "device_class": "running",
-                    "zone": 3,
-                    "icon": "mdi:radiobox-marked",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 161,
-                    "name": "Zone 4: Selected",
-                    "device_class": "running",
-                    "zone": 4,
-                    "icon": "mdi:radiobox-marked",
-                    "entity_category": "diagnostic",
-                },
-                {
-                    "dp": 161,
-                    "name": "Zone 5: Selected",
-                    "device_class": "running",
-                    "zone": 5,
-                    "icon": "mdi:radiobox-marked",
-                    "entity_category": "diagnostic",
-                },
-                # Zone boost status (bitfield-decoded)
-                {"dp": 163, "name": "Zone 1: Boost Active", "device_class": "running", "zone": 1, "icon": "mdi:flash"},
-                {"dp": 163, "name": "Zone 2: Boost Active", "device_class": "running", "zone": 2, "icon": "mdi:flash"},
-                {"dp": 163, "name": "Zone 3: Boost Active", "device_class": "running", "zone": 3, "icon": "mdi:flash"},
-                {"dp": 163, "name": "Zone 4: Boost Active", "device_class": "running", "zone": 4, "icon": "mdi:flash"},
-                {"dp": 163, "name": "Zone 5: Boost Active", "device_class": "running", "zone": 5, "icon": "mdi:flash"},
-                # Zone keep warm status (bitfield-decoded)
-                {
-                    "dp": 164,
-                    "name": "Zone 1: Keep Warm",
-                    "device_class": "running",
-                    "zone": 1,
-                    "icon": "mdi:thermometer-low",
-                },
-                {
-                    "dp": 164,
-                    "name": "Zone 2: Keep Warm",
-                    "device_class": "running",
-                    "zone": 2,
-                    "icon": "mdi:thermometer-low",
-                },
-                {
-                    "dp": 164,
-                    "name": "Zone 3: Keep Warm",
-                    "device_class": "running",
-                    "zone": 3,
-                    "icon": "mdi:thermometer-low",
-                },
-                {
-                    "dp": 164,
-                    "name": "Zone 4: Keep Warm",
-                    "device_class": "running",
-                    "zone": 4,
-                    "icon": "mdi:thermometer-low",
-                },
-                {
-                    "dp": 164,
-                    "name": "Zone 5: Keep Warm",
-                    "device_class": "running",
-                    "zone": 5,
-                    "icon": "mdi:thermometer-low",
-                },
-                # Flex zone controls (special zones) - Advanced
-                {
-                    "dp": 165,
-                    "name": "Flex Zone Left",
-                    "device_class": "running",
-                    "zone": 1,
-                    "icon": "mdi:arrow-expand-horizontal",
-                    "advanced": True,
-                },
-                {
-                    "dp": 165,
-                    "name": "Flex Zone Right",
-                    "device_class": "running",
-                    "zone": 2,
-                    "icon": "mdi:arrow-expand-horizontal",
-                    "advanced": True,
-                },
-                # BBQ mode controls (special zones) - Advanced
-                {
-                    "dp": 166,
-                    "name": "BBQ Mode Left",
-                    "device_class": "running",
-                    "zone": 1,
-                    "icon": "mdi:grill",
-                    "advanced": True,
-                },
-                {
-                    "dp": 166,
-                    "name": "BBQ Mode Right",
-                    "device_class": "running",
-                    "zone": 2,
-                    "icon": "mdi:grill",
-                    "advanced": True,
-                },
-            ],
-        },
     },
     # === OVEN (Backofen) - DPs from real device via Issue #6 (@Lucky-ESA) ===
     # KKT Kolbe EB8313HC - Product key: be8ooigdvjvy1q4a, Protocol: 3.4
@@ -1721,127 +224,47 @@ KNOWN_DEVICES = {
         "device_ids": [],
         "device_id_patterns": ["deca12d3eb98d446"],
         "platforms": ["switch", "number", "sensor", "select", "binary_sensor"],
-        "data_points": OVEN_DPS,
-        "entities": {
-            "switch": [
-                {"dp": 105, "name": "Start", "device_class": "switch", "icon": "mdi:stove"},
-                {
-                    "dp": 106,
-                    "name": "Pause",
-                    "device_class": "switch",
-                    "icon": "mdi:pause-circle",
-                    "advanced": True,
-                },
-            ],
-            "number": [
-                {
-                    "dp": 102,
-                    "name": "Temperature",
-                    "min": 35,
-                    "max": 250,
-                    "step": 5,
-                    "unit": UnitOfTemperature.CELSIUS,
-                    "device_class": "temperature",
-                    "icon": "mdi:thermometer",
-                },
-                {
-                    "dp": 103,
-                    "name": "Timer",
-                    "min": 0,
-                    "max": 360,
-                    "unit": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer",
-                },
-            ],
-            "sensor": [
-                {
-                    "dp": 104,
-                    "name": "Time Remaining",
-                    "unit_of_measurement": UnitOfTime.MINUTES,
-                    "device_class": "duration",
-                    "icon": "mdi:timer-sand",
-                },
-            ],
-            "binary_sensor": [
-                {
-                    "dp": 107,
-                    "name": "Door",
-                    "device_class": "door",
-                    "icon": "mdi:door-open",
-                },
-            ],
-            "select": [
-                {
-                    "dp": 101,
-                    "name": "Program",
-                    "options": [
-                        "F1 Auftaustufe",
-                        "F2 Großflächengrill",
-                        "F3 Unterhitze",
-                        "F4 Pizzastufe",
-                        "F5 Heißluft",
-                        "F6 Umluft",
-                        "F7 Ober/Unterhitze",
-                        "F8 Grill/Bratsystem",
-                        "F9 Grill",
-                        "F10 Schnell-Aufheizen",
-                        "P1 Aufwärmen",
-                        "P2 Toast",
-                        "P3 Pizza",
-                        "P4 Preset 4",
-                        "P5 Hühnerschenkel",
-                        "P6 Preset 6",
-                        "P7 Kuchen",
-                        "P8 Rind",
-                    ],
-                    "options_map": {
-                        "F1 Auftaustufe": "f1",
-                        "F2 Großflächengrill": "f2",
-                        "F3 Unterhitze": "f3",
-                        "F4 Pizzastufe": "f4",
-                        "F5 Heißluft": "f5",
-                        "F6 Umluft": "f6",
-                        "F7 Ober/Unterhitze": "f7",
-                        "F8 Grill/Bratsystem": "f8",
-                        "F9 Grill": "f9",
-                        "F10 Schnell-Aufheizen": "f10",
-                        "P1 Aufwärmen": "p1",
-                        "P2 Toast": "p2",
-                        "P3 Pizza": "p3",
-                        "P4 Preset 4": "p4",
-                        "P5 Hühnerschenkel": "p5",
-                        "P6 Preset 6": "p6",
-                        "P7 Kuchen": "p7",
-                        "P8 Rind": "p8",
-                    },
-                    "icon": "mdi:chef-hat",
-                },
-            ],
-        },
     },
 }
 
+# Device key -> device info; data_points/entities are imported on first access
+KNOWN_DEVICES: dict[str, LazyDeviceEntry] = {key: LazyDeviceEntry(key, info) for key, info in _DEVICE_MANIFEST.items()}
+
+# Built once from the manifest fields; KNOWN_DEVICES is not modified at runtime
+_DEVICE_INDEX = DeviceIndex.build(KNOWN_DEVICES)
+
+
+async def async_load_device_data(hass: HomeAssistant, device_type: str | None) -> None:
+    """Import the data points and entities of a device type in the executor.
+
+    Call this before the coordinator and platforms of a device are set up, so
+    they don't import the model's module inside the event loop.
+    """
+    device_info = KNOWN_DEVICES.get(device_type or "")
+    if device_info is not None and not device_info.loaded:
+        await hass.async_add_executor_job(device_info.load)
+
+
+def find_device_key_by_product_name(product_name: str) -> str | None:
+    """Find the device key for a Tuya product ID / product name."""
+    return _DEVICE_INDEX.by_product_name.get(product_name)
+
+
+def find_device_key_by_device_id(device_id: str) -> str | None:
+    """Find the device key for a device ID (exact or by device ID pattern)."""
+    return _DEVICE_INDEX.key_for_device_id(device_id)
+
 
 def find_device_by_product_name(product_name: str) -> dict | None:
     """Find device in central database by product name."""
-    for _device_key, device_info in KNOWN_DEVICES.items():
-        if product_name in device_info["product_names"]:
-            return device_info
-    return None
+    device_key = find_device_key_by_product_name(product_name)
+    return KNOWN_DEVICES[device_key] if device_key else None
 
 
 def find_device_by_device_id(device_id: str) -> dict | None:
     """Find device in central database by device ID."""
-    for _device_key, device_info in KNOWN_DEVICES.items():
-        # Exact match
-        if device_id in device_info["device_ids"]:
-            return device_info
-        # Pattern match
-        for pattern in device_info["device_id_patterns"]:
-            if isinstance(pattern, str) and device_id.startswith(pattern):
-                return device_info
-    return None
+    device_key = find_device_key_by_device_id(device_id)
+    return KNOWN_DEVICES[device_key] if device_key else None
 
 
 def get_device_dps(category: str) -> dict:
@@ -1953,11 +376,9 @@ def get_device_info_by_product_name(product_name: str) -> dict:
 def get_device_platforms(category: str) -> list[str]:
     """Get required platforms for device category."""
     # Try to find specific device platforms first
-    for _device_key, device_info in KNOWN_DEVICES.items():
-        if device_info["category"] == category:
-            platforms = device_info["platforms"]
-            if isinstance(platforms, list):
-                return platforms
+    platforms = _DEVICE_INDEX.platforms_by_category.get(category)
+    if platforms is not None:
+        return list(platforms)
 
     # Fallback to category-based platforms
     if category == CATEGORY_HOOD:
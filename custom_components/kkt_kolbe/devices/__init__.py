@@ -0,0 +1,78 @@
+"""Per-model data point and entity definitions, loaded on demand.
+
+Each module in this package is named after its device key and defines the
+model's ``DATA_POINTS`` (DP id → property code) and ``ENTITIES`` (entity
+definitions per platform). These make up nearly all of the device database,
+while a setup only ever needs one model, so ``device_types.KNOWN_DEVICES``
+holds a small manifest (names, product and device IDs, platforms) and a
+``LazyDeviceEntry`` imports the model's module the first time its data
+points or entities are read.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator
+from collections.abc import Mapping
+from typing import Any
+
+# Entry keys whose values live in the model's module
+_DATA_KEYS = ("data_points", "entities")
+
+
+class LazyDeviceEntry(Mapping[str, Any]):
+    """Read-only device database entry; manifest fields plus lazily loaded model data."""
+
+    __slots__ = ("_data", "_manifest", "key")
+
+    def __init__(self, key: str, manifest: Mapping[str, Any]) -> None:
+        """Initialize the entry.
+
+        Args:
+            key: Device key, also the name of the module in this package
+            manifest: Always-loaded fields (model_id, category, name, ...)
+        """
+        self.key = key
+        self._manifest = manifest
+        self._data: dict[str, Any] | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the model's module has been imported."""
+        return self._data is not None
+
+    def load(self) -> dict[str, Any]:
+        """Import the model's module (once) and return its data points and entities.
+
+        Imports are blocking; in the event loop use
+        ``device_types.async_load_device_data`` first.
+        """
+        if self._data is None:
+            module = importlib.import_module(f"{__name__}.{self.key}")
+            self._data = {"data_points": module.DATA_POINTS, "entities": module.ENTITIES}
+        return self._data
+
+    def __getitem__(self, name: str) -> Any:
+        """Return a manifest field, loading the model's module for data points and entities."""
+        if name in self._manifest:
+            return self._manifest[name]
+        if name in _DATA_KEYS:
+            return self.load()[name]
+        raise KeyError(name)
+
+    def __contains__(self, name: object) -> bool:
+        """Return True for every field, without loading the model's module."""
+        return name in self._manifest or name in _DATA_KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the manifest fields, then data points and entities."""
+        yield from self._manifest
+        yield from _DATA_KEYS
+
+    def __len__(self) -> int:
+        """Return the number of fields."""
+        return len(self._manifest) + len(_DATA_KEYS)
+
+    def __repr__(self) -> str:
+        """Return a representation that does not load the model's module."""
+        return f"LazyDeviceEntry({self.key!r}, loaded={self.loaded})"
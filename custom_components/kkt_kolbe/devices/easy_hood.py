@@ -0,0 +1,121 @@
+"""KKT Kolbe EASY / PLOOM Hood: data points and entity definitions."""
+
+from __future__ import annotations
+
+from homeassistant.const import UnitOfTime
+
+DATA_POINTS = {
+    1: "switch",  # Main power on/off
+    4: "light",  # Light on/off
+    10: "fan_speed_enum",  # Fan speed (enum: off/one/two/.../nine)
+    13: "countdown",  # Timer 0-100 min
+    101: "l",  # Filter cleaning reminder
+    102: "r",  # RGB light mode 0-9
+}
+
+ENTITIES = {
+    "fan": {
+        "dp": 10,
+        "speeds": ["off", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"],
+    },
+    "light": [
+        {
+            "dp": 4,
+            "name": "Light",
+            "icon": "mdi:lightbulb",
+            "effect_dp": 102,
+            "effect_numeric": True,
+            "effect_offset": 1,  # Device uses 0=off, 1=Weiss, 2=Rot, etc.
+            "effects": [
+                "Weiss",
+                "Rot",
+                "Gruen",
+                "Blau",
+                "Gelb",
+                "Lila",
+                "Orange",
+                "Cyan",
+                "Gruen hell",
+            ],
+        }
+    ],
+    "switch": [
+        {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
+        {
+            "dp": 101,
+            "name": "Filter Cleaning Reminder",
+            "icon": "mdi:air-filter",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+    ],
+    "select": [
+        {
+            "dp": 102,
+            "name": "RGB Mode",
+            "options": [
+                "Aus",
+                "Weiss",
+                "Rot",
+                "Gruen",
+                "Blau",
+                "Gelb",
+                "Lila",
+                "Orange",
+                "Cyan",
+                "Gruen hell",
+            ],
+            "options_map": {
+                "Aus": 0,
+                "Weiss": 1,
+                "Rot": 2,
+                "Gruen": 3,
+                "Blau": 4,
+                "Gelb": 5,
+                "Lila": 6,
+                "Orange": 7,
+                "Cyan": 8,
+                "Gruen hell": 9,
+            },
+            "icon": "mdi:palette",
+        },
+        {
+            "dp": 10,
+            "name": "Fan Speed",
+            "options": ["off", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"],
+            "icon": "mdi:fan",
+            "advanced": True,
+            "entity_category": "config",
+        },
+    ],
+    "number": [
+        {
+            "dp": 102,
+            "name": "RGB Mode",
+            "min": 0,
+            "max": 9,
+            "step": 1,
+            "icon": "mdi:palette",
+            "advanced": True,
+            "entity_category": "config",
+        },
+        {
+            "dp": 13,
+            "name": "Timer",
+            "min": 0,
+            "max": 100,
+            "unit": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "icon": "mdi:timer",
+        },
+    ],
+    "sensor": [
+        {
+            "dp": 101,
+            "name": "Filter Status",
+            "icon": "mdi:air-filter",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        }
+    ],
+}
@@ -0,0 +1,108 @@
+"""KKT Kolbe EB8313HC Oven: data points and entity definitions."""
+
+from __future__ import annotations
+
+from homeassistant.const import UnitOfTemperature
+from homeassistant.const import UnitOfTime
+
+from ..device_types import OVEN_DPS
+
+DATA_POINTS = OVEN_DPS
+
+ENTITIES = {
+    "switch": [
+        {"dp": 105, "name": "Start", "device_class": "switch", "icon": "mdi:stove"},
+        {
+            "dp": 106,
+            "name": "Pause",
+            "device_class": "switch",
+            "icon": "mdi:pause-circle",
+            "advanced": True,
+        },
+    ],
+    "number": [
+        {
+            "dp": 102,
+            "name": "Temperature",
+            "min": 35,
+            "max": 250,
+            "step": 5,
+            "unit": UnitOfTemperature.CELSIUS,
+            "device_class": "temperature",
+            "icon": "mdi:thermometer",
+        },
+        {
+            "dp": 103,
+            "name": "Timer",
+            "min": 0,
+            "max": 360,
+            "unit": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "icon": "mdi:timer",
+        },
+    ],
+    "sensor": [
+        {
+            "dp": 104,
+            "name": "Time Remaining",
+            "unit_of_measurement": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "icon": "mdi:timer-sand",
+        },
+    ],
+    "binary_sensor": [
+        {
+            "dp": 107,
+            "name": "Door",
+            "device_class": "door",
+            "icon": "mdi:door-open",
+        },
+    ],
+    "select": [
+        {
+            "dp": 101,
+            "name": "Program",
+            "options": [
+                "F1 Auftaustufe",
+                "F2 Großflächengrill",
+                "F3 Unterhitze",
+                "F4 Pizzastufe",
+                "F5 Heißluft",
+                "F6 Umluft",
+                "F7 Ober/Unterhitze",
+                "F8 Grill/Bratsystem",
+                "F9 Grill",
+                "F10 Schnell-Aufheizen",
+                "P1 Aufwärmen",
+                "P2 Toast",
+                "P3 Pizza",
+                "P4 Preset 4",
+                "P5 Hühnerschenkel",
+                "P6 Preset 6",
+                "P7 Kuchen",
+                "P8 Rind",
+            ],
+            "options_map": {
+                "F1 Auftaustufe": "f1",
+                "F2 Großflächengrill": "f2",
+                "F3 Unterhitze": "f3",
+                "F4 Pizzastufe": "f4",
+                "F5 Heißluft": "f5",
+                "F6 Umluft": "f6",
+                "F7 Ober/Unterhitze": "f7",
+                "F8 Grill/Bratsystem": "f8",
+                "F9 Grill": "f9",
+                "F10 Schnell-Aufheizen": "f10",
+                "P1 Aufwärmen": "p1",
+                "P2 Toast": "p2",
+                "P3 Pizza": "p3",
+                "P4 Preset 4": "p4",
+                "P5 Hühnerschenkel": "p5",
+                "P6 Preset 6": "p6",
+                "P7 Kuchen": "p7",
+                "P8 Rind": "p8",
+            },
+            "icon": "mdi:chef-hat",
+        },
+    ],
+}
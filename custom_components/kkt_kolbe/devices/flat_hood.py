@@ -0,0 +1,64 @@
+"""KKT Kolbe FLAT Hood: data points and entity definitions."""
+
+from __future__ import annotations
+
+from homeassistant.const import UnitOfTime
+
+DATA_POINTS = {
+    1: "switch",  # Main power
+    4: "light",  # Light on/off (no RGB)
+    6: "switch_lamp",  # Filter cleaning reminder
+    10: "fan_speed_enum",  # Fan speed
+    13: "countdown",  # Timer
+}
+
+ENTITIES = {
+    "fan": {
+        "dp": 10,  # fan_speed_enum includes "off" state
+        "speeds": ["off", "low", "middle", "high", "strong"],
+    },
+    "light": [
+        # Main light as light entity for HomeKit/Siri
+        {"dp": 4, "name": "Light", "icon": "mdi:lightbulb"}
+    ],
+    "switch": [
+        {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
+        {
+            "dp": 6,
+            "name": "Filter Cleaning Reminder",
+            "icon": "mdi:air-filter",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+    ],
+    "number": [
+        {
+            "dp": 13,
+            "name": "Timer",
+            "min": 0,
+            "max": 60,
+            "unit": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "icon": "mdi:timer",
+        }
+    ],
+    "select": [
+        # Fan Speed select marked as advanced to avoid HomeKit showing both fan and select
+        {
+            "dp": 10,
+            "name": "Fan Speed",
+            "options": ["off", "low", "middle", "high", "strong"],
+            "advanced": True,
+            "entity_category": "config",
+        }
+    ],
+    "sensor": [
+        {
+            "dp": 6,
+            "name": "Filter Status",
+            "icon": "mdi:air-filter",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        }
+    ],
+}
@@ -0,0 +1,164 @@
+"""HERMES & STYLE Hood: data points and entity definitions."""
+
+from __future__ import annotations
+
+from homeassistant.const import UnitOfTime
+
+DATA_POINTS = {
+    # Active DPs (verified working)
+    1: "switch",  # Main power
+    4: "light",  # Light on/off
+    6: "switch_lamp",  # Filter cleaning reminder
+    10: "fan_speed_enum",  # Fan speed
+    13: "countdown",  # Timer
+    101: "RGB",  # RGB lighting modes
+    # Experimental DPs (from API v2.0 Things Data Model, disabled by default)
+    2: "delay_switch",  # Delayed shutdown (afterrun)
+    5: "light_brightness",  # Light brightness (0-255)
+    14: "filter_hours",  # Filter usage hours
+    15: "filter_reset",  # Reset filter counter
+    17: "eco_mode",  # Eco mode
+    102: "rgb_brightness",  # RGB brightness (0-255)
+    103: "color_temp",  # Color temperature
+}
+
+ENTITIES = {
+    "fan": {
+        "dp": 10,  # fan_speed_enum - used for HomeKit/Siri integration
+        "speeds": ["off", "low", "middle", "high", "strong"],
+    },
+    "light": [
+        # Main light with RGB color effects and brightness for HomeKit/Siri
+        {
+            "dp": 4,
+            "name": "Light",
+            "icon": "mdi:lightbulb",
+            "brightness_dp": 5,
+            "max_brightness": 255,
+            "effect_dp": 101,
+            "effect_numeric": True,
+            "effect_offset": 1,  # Device uses 0=off, 1=Weiß, 2=Rot, etc.
+            "effects": ["Weiß", "Rot", "Grün", "Blau", "Gelb", "Lila", "Orange", "Cyan", "Grasgrün"],
+        }
+    ],
+    "switch": [
+        {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
+        {
+            "dp": 6,
+            "name": "Filter Cleaning Reminder",
+            "icon": "mdi:air-filter",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 15,
+            "name": "Filter Reset",
+            "icon": "mdi:air-filter-off",
+            "advanced": True,
+            "entity_category": "config",
+        },
+        {
+            "dp": 2,
+            "name": "Delayed Shutdown",
+            "icon": "mdi:timer-off",
+            "advanced": True,
+            "entity_category": "config",
+        },
+        {"dp": 17, "name": "Eco Mode", "icon": "mdi:leaf", "advanced": True, "entity_category": "config"},
+    ],
+    "number": [
+        # RGB Mode as number (backup, advanced) - use Light effects instead
+        {
+            "dp": 101,
+            "name": "RGB Mode",
+            "min": 0,
+            "max": 9,
+            "step": 1,
+            "icon": "mdi:palette",
+            "advanced": True,
+            "entity_category": "config",
+        },
+        {
+            "dp": 13,
+            "name": "Timer",
+            "min": 0,
+            "max": 60,
+            "unit": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "icon": "mdi:timer",
+        },
+        {
+            "dp": 5,
+            "name": "Light Brightness",
+            "min": 0,
+            "max": 255,
+            "step": 1,
+            "icon": "mdi:brightness-6",
+            "advanced": True,
+        },
+        {
+            "dp": 102,
+            "name": "RGB Brightness",
+            "min": 0,
+            "max": 255,
+            "step": 1,
+            "icon": "mdi:brightness-5",
+            "advanced": True,
+        },
+    ],
+    "sensor": [
+        {
+            "dp": 6,
+            "name": "Filter Status",
+            "icon": "mdi:air-filter",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 14,
+            "name": "Filter Hours",
+            "unit": "h",
+            "device_class": "duration",
+            "icon": "mdi:clock-outline",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+    ],
+    "select": [
+        # RGB Mode select - maps numeric values 0-9 to color names
+        {
+            "dp": 101,
+            "name": "RGB Mode",
+            "options": ["Aus", "Weiß", "Rot", "Grün", "Blau", "Gelb", "Lila", "Orange", "Cyan", "Grasgrün"],
+            "options_map": {
+                "Aus": 0,
+                "Weiß": 1,
+                "Rot": 2,
+                "Grün": 3,
+                "Blau": 4,
+                "Gelb": 5,
+                "Lila": 6,
+                "Orange": 7,
+                "Cyan": 8,
+                "Grasgrün": 9,
+            },
+            "icon": "mdi:palette",
+        },
+        # Fan Speed select marked as advanced to avoid HomeKit showing both fan and select
+        {
+            "dp": 10,
+            "name": "Fan Speed",
+            "options": ["off", "low", "middle", "high", "strong"],
+            "icon": "mdi:fan",
+            "advanced": True,
+            "entity_category": "config",
+        },
+        {
+            "dp": 103,
+            "name": "Color Temperature",
+            "options": ["warm", "neutral", "cold"],
+            "icon": "mdi:thermometer",
+            "advanced": True,
+        },
+    ],
+}
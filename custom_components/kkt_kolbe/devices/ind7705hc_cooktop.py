@@ -0,0 +1,494 @@
+"""IND7705HC Induction Cooktop: data points and entity definitions."""
+
+from __future__ import annotations
+
+from homeassistant.const import UnitOfTemperature
+from homeassistant.const import UnitOfTime
+
+from ..device_types import COOKTOP_DPS
+from ..device_types import QUICK_LEVELS
+
+DATA_POINTS = COOKTOP_DPS
+
+ENTITIES = {
+    "switch": [
+        {"dp": 101, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
+        {"dp": 102, "name": "Pause", "device_class": "switch", "icon": "mdi:pause"},
+        {
+            "dp": 103,
+            "name": "Child Lock",
+            "device_class": "switch",
+            "icon": "mdi:lock",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 145,
+            "name": "Senior Mode",
+            "device_class": "switch",
+            "icon": "mdi:account-supervisor",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 108,
+            "name": "Confirm Action",
+            "device_class": "switch",
+            "entity_category": "config",
+            "icon": "mdi:check",
+        },
+    ],
+    "number": [
+        # Global controls
+        {"dp": 104, "name": "Max Power Level", "min": 0, "max": 25, "mode": "slider", "icon": "mdi:flash"},
+        {
+            "dp": 134,
+            "name": "General Timer",
+            "min": 0,
+            "max": 99,
+            "unit_of_measurement": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "mode": "slider",
+            "icon": "mdi:timer",
+        },
+        # Zone-specific controls (bitfield-decoded)
+        {
+            "dp": 162,
+            "name": "Zone 1: Power Level",
+            "min": 0,
+            "max": 25,
+            "zone": 1,
+            "mode": "slider",
+            "icon": "mdi:numeric-1-circle",
+        },
+        {
+            "dp": 162,
+            "name": "Zone 2: Power Level",
+            "min": 0,
+            "max": 25,
+            "zone": 2,
+            "mode": "slider",
+            "icon": "mdi:numeric-2-circle",
+        },
+        {
+            "dp": 162,
+            "name": "Zone 3: Power Level",
+            "min": 0,
+            "max": 25,
+            "zone": 3,
+            "mode": "slider",
+            "icon": "mdi:numeric-3-circle",
+        },
+        {
+            "dp": 162,
+            "name": "Zone 4: Power Level",
+            "min": 0,
+            "max": 25,
+            "zone": 4,
+            "mode": "slider",
+            "icon": "mdi:numeric-4-circle",
+        },
+        {
+            "dp": 162,
+            "name": "Zone 5: Power Level",
+            "min": 0,
+            "max": 25,
+            "zone": 5,
+            "mode": "slider",
+            "icon": "mdi:numeric-5-circle",
+        },
+        {
+            "dp": 167,
+            "name": "Zone 1: Timer",
+            "min": 0,
+            "max": 255,
+            "unit_of_measurement": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "zone": 1,
+            "mode": "slider",
+            "icon": "mdi:timer-outline",
+            "advanced": True,
+        },
+        {
+            "dp": 167,
+            "name": "Zone 2: Timer",
+            "min": 0,
+            "max": 255,
+            "unit_of_measurement": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "zone": 2,
+            "mode": "slider",
+            "icon": "mdi:timer-outline",
+            "advanced": True,
+        },
+        {
+            "dp": 167,
+            "name": "Zone 3: Timer",
+            "min": 0,
+            "max": 255,
+            "unit_of_measurement": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "zone": 3,
+            "mode": "slider",
+            "icon": "mdi:timer-outline",
+            "advanced": True,
+        },
+        {
+            "dp": 167,
+            "name": "Zone 4: Timer",
+            "min": 0,
+            "max": 255,
+            "unit_of_measurement": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "zone": 4,
+            "mode": "slider",
+            "icon": "mdi:timer-outline",
+            "advanced": True,
+        },
+        {
+            "dp": 167,
+            "name": "Zone 5: Timer",
+            "min": 0,
+            "max": 255,
+            "unit_of_measurement": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "zone": 5,
+            "mode": "slider",
+            "icon": "mdi:timer-outline",
+            "advanced": True,
+        },
+        # Core Temperature Probe (optional accessory - only works when probe is connected)
+        # Note: DP 168/169 are NOT zone temperatures but for the meat probe accessory
+        {
+            "dp": 168,
+            "name": "Core Probe: Target Temp",
+            "min": 0,
+            "max": 300,
+            "unit_of_measurement": UnitOfTemperature.CELSIUS,
+            "device_class": "temperature",
+            "mode": "slider",
+            "icon": "mdi:thermometer-probe",
+            "advanced": True,
+            "entity_category": "config",
+        },
+    ],
+    "select": [
+        {
+            "dp": 148,
+            "name": "Zone 1: Quick Level",
+            "options": QUICK_LEVELS,
+            "icon": "mdi:numeric-1-circle-outline",
+            "advanced": True,
+        },
+        {
+            "dp": 149,
+            "name": "Zone 2: Quick Level",
+            "options": QUICK_LEVELS,
+            "icon": "mdi:numeric-2-circle-outline",
+            "advanced": True,
+        },
+        {
+            "dp": 150,
+            "name": "Zone 3: Quick Level",
+            "options": QUICK_LEVELS,
+            "icon": "mdi:numeric-3-circle-outline",
+            "advanced": True,
+        },
+        {
+            "dp": 151,
+            "name": "Zone 4: Quick Level",
+            "options": QUICK_LEVELS,
+            "icon": "mdi:numeric-4-circle-outline",
+            "advanced": True,
+        },
+        {
+            "dp": 152,
+            "name": "Zone 5: Quick Level",
+            "options": QUICK_LEVELS,
+            "icon": "mdi:numeric-5-circle-outline",
+            "advanced": True,
+        },
+        {
+            "dp": 153,
+            "name": "Save Zone Level",
+            "options": ["save_hob1", "save_hob2", "save_hob3", "save_hob4", "save_hob5"],
+            "entity_category": "config",
+            "icon": "mdi:content-save",
+        },
+        {
+            "dp": 154,
+            "name": "Set Zone Level",
+            "options": ["set_hob1", "set_hob2", "set_hob3", "set_hob4", "set_hob5"],
+            "entity_category": "config",
+            "icon": "mdi:cog",
+        },
+        {
+            "dp": 155,
+            "name": "Power Limit",
+            "options": ["power_limit_1", "power_limit_2", "power_limit_3", "power_limit_4", "power_limit_5"],
+            "icon": "mdi:flash-triangle",
+        },
+    ],
+    "sensor": [
+        # === CALCULATED SENSORS (für Automationen) ===
+        # Geschätzter Stromverbrauch basierend auf Zonen-Levels (~100W pro Level)
+        {
+            "dp": 162,
+            "name": "Estimated Power",
+            "sensor_type": "calculated_power",
+            "zones_dp": 162,
+            "num_zones": 5,
+            "watts_per_level": 100,
+            "icon": "mdi:lightning-bolt",
+        },
+        # Summe aller Zonen-Levels (0-125)
+        {
+            "dp": 162,
+            "name": "Total Power Level",
+            "sensor_type": "total_level",
+            "zones_dp": 162,
+            "num_zones": 5,
+            "icon": "mdi:gauge",
+        },
+        # Anzahl aktiver Zonen (0-5)
+        {
+            "dp": 162,
+            "name": "Active Zones",
+            "sensor_type": "active_zones",
+            "zones_dp": 162,
+            "num_zones": 5,
+            "icon": "mdi:stove",
+        },
+        # === CORE TEMPERATURE PROBE (optional accessory) ===
+        # Note: DP 169 is NOT zone temperature but the meat probe reading
+        # This sensor only shows data when a core temperature probe is connected
+        {
+            "dp": 169,
+            "name": "Core Probe: Temperature",
+            "unit_of_measurement": UnitOfTemperature.CELSIUS,
+            "device_class": "temperature",
+            "icon": "mdi:thermometer-probe",
+            "advanced": True,
+        },
+        # === CHEF FUNCTION LEVELS (DP 106 bitfield, 8 bits per zone) ===
+        {
+            "dp": 106,
+            "name": "Zone 1: Chef Level",
+            "zone": 1,
+            "icon": "mdi:chef-hat",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 106,
+            "name": "Zone 2: Chef Level",
+            "zone": 2,
+            "icon": "mdi:chef-hat",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 106,
+            "name": "Zone 3: Chef Level",
+            "zone": 3,
+            "icon": "mdi:chef-hat",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 106,
+            "name": "Zone 4: Chef Level",
+            "zone": 4,
+            "icon": "mdi:chef-hat",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 106,
+            "name": "Zone 5: Chef Level",
+            "zone": 5,
+            "icon": "mdi:chef-hat",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+        # === BBQ TIMER (DP 107 bitfield, 8 bits per zone - Left/Right) ===
+        {
+            "dp": 107,
+            "name": "BBQ Timer Left",
+            "zone": 1,
+            "unit_of_measurement": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "icon": "mdi:grill",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 107,
+            "name": "BBQ Timer Right",
+            "zone": 2,
+            "unit_of_measurement": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "icon": "mdi:grill",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        },
+    ],
+    "binary_sensor": [
+        # Zone error status (bitfield-decoded) - Diagnostic
+        {
+            "dp": 105,
+            "name": "Zone 1: Error",
+            "device_class": "problem",
+            "zone": 1,
+            "icon": "mdi:alert-circle",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 105,
+            "name": "Zone 2: Error",
+            "device_class": "problem",
+            "zone": 2,
+            "icon": "mdi:alert-circle",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 105,
+            "name": "Zone 3: Error",
+            "device_class": "problem",
+            "zone": 3,
+            "icon": "mdi:alert-circle",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 105,
+            "name": "Zone 4: Error",
+            "device_class": "problem",
+            "zone": 4,
+            "icon": "mdi:alert-circle",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 105,
+            "name": "Zone 5: Error",
+            "device_class": "problem",
+            "zone": 5,
+            "icon": "mdi:alert-circle",
+            "entity_category": "diagnostic",
+        },
+        # Zone selection status (bitfield-decoded) - Diagnostic
+        {
+            "dp": 161,
+            "name": "Zone 1: Selected",
+            "device_class": "running",
+            "zone": 1,
+            "icon": "mdi:radiobox-marked",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 161,
+            "name": "Zone 2: Selected",
+            "device_class": "running",
+            "zone": 2,
+            "icon": "mdi:radiobox-marked",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 161,
+            "name": "Zone 3: Selected",
+            "device_class": "running",
+            "zone": 3,
+            "icon": "mdi:radiobox-marked",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 161,
+            "name": "Zone 4: Selected",
+            "device_class": "running",
+            "zone": 4,
+            "icon": "mdi:radiobox-marked",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 161,
+            "name": "Zone 5: Selected",
+            "device_class": "running",
+            "zone": 5,
+            "icon": "mdi:radiobox-marked",
+            "entity_category": "diagnostic",
+        },
+        # Zone boost status (bitfield-decoded)
+        {"dp": 163, "name": "Zone 1: Boost Active", "device_class": "running", "zone": 1, "icon": "mdi:flash"},
+        {"dp": 163, "name": "Zone 2: Boost Active", "device_class": "running", "zone": 2, "icon": "mdi:flash"},
+        {"dp": 163, "name": "Zone 3: Boost Active", "device_class": "running", "zone": 3, "icon": "mdi:flash"},
+        {"dp": 163, "name": "Zone 4: Boost Active", "device_class": "running", "zone": 4, "icon": "mdi:flash"},
+        {"dp": 163, "name": "Zone 5: Boost Active", "device_class": "running", "zone": 5, "icon": "mdi:flash"},
+        # Zone keep warm status (bitfield-decoded)
+        {
+            "dp": 164,
+            "name": "Zone 1: Keep Warm",
+            "device_class": "running",
+            "zone": 1,
+            "icon": "mdi:thermometer-low",
+        },
+        {
+            "dp": 164,
+            "name": "Zone 2: Keep Warm",
+            "device_class": "running",
+            "zone": 2,
+            "icon": "mdi:thermometer-low",
+        },
+        {
+            "dp": 164,
+            "name": "Zone 3: Keep Warm",
+            "device_class": "running",
+            "zone": 3,
+            "icon": "mdi:thermometer-low",
+        },
+        {
+            "dp": 164,
+            "name": "Zone 4: Keep Warm",
+            "device_class": "running",
+            "zone": 4,
+            "icon": "mdi:thermometer-low",
+        },
+        {
+            "dp": 164,
+            "name": "Zone 5: Keep Warm",
+            "device_class": "running",
+            "zone": 5,
+            "icon": "mdi:thermometer-low",
+        },
+        # Flex zone controls (special zones) - Advanced
+        {
+            "dp": 165,
+            "name": "Flex Zone Left",
+            "device_class": "running",
+            "zone": 1,
+            "icon": "mdi:arrow-expand-horizontal",
+            "advanced": True,
+        },
+        {
+            "dp": 165,
+            "name": "Flex Zone Right",
+            "device_class": "running",
+            "zone": 2,
+            "icon": "mdi:arrow-expand-horizontal",
+            "advanced": True,
+        },
+        # BBQ mode controls (special zones) - Advanced
+        {
+            "dp": 166,
+            "name": "BBQ Mode Left",
+            "device_class": "running",
+            "zone": 1,
+            "icon": "mdi:grill",
+            "advanced": True,
+        },
+        {
+            "dp": 166,
+            "name": "BBQ Mode Right",
+            "device_class": "running",
+            "zone": 2,
+            "icon": "mdi:grill",
+            "advanced": True,
+        },
+    ],
+}
@@ -0,0 +1,138 @@
+"""KKT Kolbe SOLO HCM Hood: data points and entity definitions."""
+
+from __future__ import annotations
+
+from homeassistant.const import UnitOfTime
+
+DATA_POINTS = {
+    1: "switch",  # Main power (ON/OFF)
+    4: "light",  # Main light on/off
+    6: "switch_lamp",  # RGB switch trigger
+    7: "switch_wash",  # Setting/Wash mode
+    102: "fan_speed",  # Fan speed (0-9)
+    103: "day",  # Carbon filter days remaining (0-250)
+    104: "switch_led_1",  # LED light (alternative to DP 4)
+    105: "countdown_1",  # Countdown timer (0-60 min)
+    106: "switch_led",  # Confirm
+    107: "colour_data",  # RGB color data (string, max 255)
+    108: "work_mode",  # RGB work mode (white/colour/scene/music)
+    109: "day_1",  # Metal filter days remaining (0-40)
+}
+
+ENTITIES = {
+    "fan": {
+        "dp": 102,  # fan_speed numeric (0-9) - for HomeKit/Siri
+        "speeds": ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"],
+        "numeric": True,  # Use numeric mode instead of enum
+        "min": 0,
+        "max": 9,
+    },
+    "light": [
+        # Main light with RGB mode effects for HomeKit/Siri
+        # Auto-Work-Mode: Sets work_mode to "white" before turning on light
+        {
+            "dp": 4,
+            "name": "Light",
+            "icon": "mdi:lightbulb",
+            "effect_dp": 108,
+            "effect_numeric": False,
+            "effects": ["white", "colour", "scene", "music"],
+            "work_mode_dp": 108,
+            "work_mode_default": "white",
+        },
+        # LED Light as alternative (some SOLO HCM units respond to DP 104 instead of DP 4)
+        # Auto-Work-Mode: Sets work_mode to "white" before turning on light
+        {
+            "dp": 104,
+            "name": "LED Light",
+            "icon": "mdi:led-strip",
+            "work_mode_dp": 108,
+            "work_mode_default": "white",
+        },
+    ],
+    "switch": [
+        {"dp": 1, "name": "Power", "device_class": "switch", "icon": "mdi:power"},
+        {
+            "dp": 6,
+            "name": "RGB Light",
+            "device_class": "switch",
+            "icon": "mdi:palette",
+            "advanced": True,
+            "entity_category": "config",
+        },
+        {
+            "dp": 7,
+            "name": "Wash Mode",
+            "device_class": "switch",
+            "icon": "mdi:spray-bottle",
+            "advanced": True,
+            "entity_category": "config",
+        },
+        {
+            "dp": 106,
+            "name": "Side Light",
+            "device_class": "switch",
+            "icon": "mdi:wall-sconce-flat",
+            "advanced": True,
+        },
+    ],
+    "select": [
+        {
+            "dp": 108,
+            "name": "RGB Mode",
+            "options": ["white", "colour", "scene", "music"],
+            "icon": "mdi:palette",
+            "advanced": True,
+            "entity_category": "config",
+        }
+    ],
+    "number": [
+        {
+            "dp": 102,
+            "name": "Fan Speed",
+            "min": 0,
+            "max": 9,
+            "step": 1,
+            "icon": "mdi:fan",
+            "advanced": True,
+            "entity_category": "config",
+        },
+        {
+            "dp": 105,
+            "name": "Timer",
+            "min": 0,
+            "max": 60,
+            "unit": UnitOfTime.MINUTES,
+            "device_class": "duration",
+            "icon": "mdi:timer",
+        },
+        {
+            "dp": 103,
+            "name": "Carbon Filter Remaining",
+            "min": 0,
+            "max": 250,
+            "unit": "days",
+            "icon": "mdi:air-filter",
+            "entity_category": "diagnostic",
+        },
+        {
+            "dp": 109,
+            "name": "Metal Filter Remaining",
+            "min": 0,
+            "max": 40,
+            "unit": "days",
+            "icon": "mdi:air-filter",
+            "entity_category": "diagnostic",
+        },
+    ],
+    "sensor": [
+        # colour_data (DP 107) - RGB color data string, shows current color when work_mode="colour"
+        {
+            "dp": 107,
+            "name": "RGB Color Data",
+            "icon": "mdi:palette",
+            "advanced": True,
+            "entity_category": "diagnostic",
+        }
+    ],
+}
@@ -116,6 +116,8 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: KKTKolb
             conn_info = coordinator.connection_info
             diagnostics_data["coordinator"]["connection_state"] = conn_info.get("state", "unknown")
             diagnostics_data["coordinator"]["consecutive_failures"] = conn_info.get("consecutive_failures", 0)
+            if "activity" in conn_info:
+                diagnostics_data["coordinator"]["activity"] = conn_info["activity"]
             diagnostics_data["coordinator"]["last_successful_update"] = (
                 conn_info.get("last_update").isoformat() if conn_info.get("last_update") else None
             )
@@ -132,6 +134,10 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: KKTKolb
                     "adaptive_interval_active": conn_info.get("adaptive_interval_active", False),
                 }
 
+        # Add adaptive polling state (hybrid coordinator)
+        if hasattr(coordinator, "polling_stats"):
+            diagnostics_data["coordinator"]["polling"] = coordinator.polling_stats
+
         # Add device state if available
         if hasattr(coordinator, "device_state"):
             diagnostics_data["coordinator"]["device_state"] = coordinator.device_state.value
@@ -191,12 +197,21 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: KKTKolb
 
     # Add API client diagnostics
     if api_client:
+        from urllib.parse import urlsplit
+
+        from .api.cloud_session import get_traced_cloud_session
+
         diagnostics_data["api"] = {
             "enabled": True,
             "endpoint": entry.data.get("api_endpoint", "unknown"),
             "has_client_id": bool(entry.data.get("api_client_id")),
             "has_client_secret": bool(entry.data.get("api_client_secret")),
         }
+        # Connection reuse of the traced session shared by the short-lived clients
+        endpoint = getattr(api_client, "endpoint", None)
+        if isinstance(endpoint, str):
+            host = urlsplit(endpoint).hostname or ""
+            diagnostics_data["api"]["connection_reuse"] = get_traced_cloud_session(hass).stats.get(host, {})
     else:
         diagnostics_data["api"] = {
             "enabled": False,
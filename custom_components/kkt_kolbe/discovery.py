@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import json
 import logging
 import socket
@@ -39,6 +40,11 @@ UDP_PORTS = [6666, 6667, 7000]
 UDP_KEY = md5(b"yGAdlopoPVldABfn").digest()
 DISCOVERY_TIMEOUT = 6  # seconds
 
+# Unchanged re-broadcasts from the same address within this window are
+# dropped before decryption (devices repeat themselves every few seconds)
+UDP_DEDUP_TTL = 60  # seconds
+UDP_DEDUP_MAX_SIZE = 256  # addresses remembered before expired ones are pruned
+
 # Device cache cleanup settings
 DEVICE_CACHE_MAX_AGE = 3600  # Remove devices not seen for 1 hour
 DEVICE_CACHE_MAX_SIZE = 50  # Maximum number of cached devices
@@ -48,10 +54,12 @@ _last_log_time: dict[str, float] = {}
 LOG_COOLDOWN = 300  # Only log same message every 5 minutes
 
 
-def _get_known_product_ids() -> set[str]:
+@functools.cache
+def _get_known_product_ids() -> frozenset[str]:
     """Build set of known product IDs and model codes from KNOWN_DEVICES.
 
-    Single source of truth — no more hardcoded lists to maintain.
+    Single source of truth — no more hardcoded lists to maintain. Built once:
+    KNOWN_DEVICES is static, and the set is consulted for every broadcast.
     """
     from .device_types import KNOWN_DEVICES
 
@@ -65,7 +73,13 @@ def _get_known_product_ids() -> set[str]:
         for pn in info.get("product_names", []):
             if pn:
                 ids.add(pn.lower())
-    return ids
+    return frozenset(ids)
+
+
+@functools.cache
+def _get_udp_cipher() -> Any:
+    """Return the AES-ECB cipher for the fixed UDP key (ECB keeps no state, so it is reused)."""
+    return AES.new(UDP_KEY, AES.MODE_ECB)
 
 
 def _should_log(key: str) -> bool:
@@ -102,93 +116,68 @@ KKT_PATTERNS = [
 ]
 
 
-class TuyaUDPDiscovery(asyncio.DatagramProtocol):
-    """UDP Discovery Protocol for Tuya devices (based on Local Tuya)."""
+class UDPDiscoveryEngine:
+    """Decrypt, de-duplicate and filter Tuya UDP broadcasts.
 
-    def __init__(
-        self,
-        devices_found_callback: Callable[[dict[str, Any]], None],
-        hass: HomeAssistant | None = None,
-    ) -> None:
-        """Initialize UDP discovery protocol."""
-        self.devices_found_callback = devices_found_callback
-        self.transport: asyncio.DatagramTransport | None = None
-        self.hass = hass
+    One engine is shared by the listeners of all UDP ports of a discovery
+    run. With dozens of Tuya devices broadcasting every few seconds, most
+    datagrams are repeats: those are dropped by payload hash before they
+    are decrypted or parsed.
 
-    def connection_made(self, transport: asyncio.BaseTransport) -> None:
-        """Called when UDP connection is established."""
-        self.transport = transport  # type: ignore[assignment]
-        _LOGGER.debug(f"UDP Discovery listening on {transport.get_extra_info('sockname')}")
+    The gwId is inside the encrypted JSON, so repeats are recognized by the
+    source address, which is one device per IP on a LAN.
+    """
 
-    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
-        """Process received UDP datagram from Tuya device."""
-        try:
-            # Only log raw UDP data at TRACE level equivalent (debug with explicit check)
-            # _LOGGER.debug(f"RAW UDP received from {addr[0]}: length={len(data)}")
+    def __init__(self, dedup_ttl: float = UDP_DEDUP_TTL, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the engine."""
+        self._dedup_ttl = dedup_ttl
+        self._clock = clock
+        # Source IP -> (hash of the encrypted payload, time it was processed)
+        self._last_payload: dict[str, tuple[int, float]] = {}
+        self.stats: dict[str, int] = {"packets_seen": 0, "packets_dropped": 0, "packets_parsed": 0, "kkt_devices": 0}
+
+    def process(self, data: bytes, addr: tuple[str, int]) -> dict[str, Any] | None:
+        """Return the device info of a datagram from a potential KKT device, else None."""
+        self.stats["packets_seen"] += 1
+        if self._is_repeat(data[20:-8], addr[0]):
+            self.stats["packets_dropped"] += 1
+            return None
 
-            # Try to decrypt the message using LocalTuya approach
-            decrypted = self._decrypt_udp_message(data)
-            if decrypted:
-                try:
-                    device_info = json.loads(decrypted.decode())
-                    # Removed frequent debug log - device info logged below if KKT
-
-                    # Add IP address from UDP source
-                    device_info["ip"] = addr[0]
-
-                    # Check if this could be a KKT device
-                    if self._is_potential_kkt_device(device_info):
-                        device_id = device_info.get("gwId", "unknown")
-                        # Rate-limit discovery logs (same device broadcasts frequently)
-                        if _should_log(f"udp_discover_{device_id}"):
-                            _LOGGER.info(f"KKT Device discovered via UDP: {device_id[:8]}... at {device_info['ip']}")
-
-                        # DIRECT FIX: Add device to global discovery instance
-                        global _discovery_instance
-                        if _discovery_instance:
-                            device_id = device_info.get("gwId", "")
-
-                            # Extract product name from UDP data if available
-                            product_key = (
-                                device_info.get("productKey")
-                                or device_info.get("productName")
-                                or device_info.get("product_name")
-                                or ""
-                            )
-
-                            # Detect device type from product key
-                            from .helpers.device_detection import detect_device_type_from_product_key
-
-                            device_type, friendly_name = detect_device_type_from_product_key(product_key, device_id)
-
-                            # LocalTuya approach: Just collect all devices, let config flow filter duplicates
-                            formatted_device = {
-                                "device_id": device_id,
-                                "ip": device_info.get("ip"),  # Use consistent "ip" key
-                                "name": friendly_name or f"KKT Device {device_id[:8]}",
-                                "discovered_via": "UDP",
-                                "product_name": product_key or "auto",
-                                "device_type": device_type,
-                                "friendly_type": friendly_name,
-                            }
-                            _discovery_instance.discovered_devices[device_id] = formatted_device
-                            _discovery_instance._update_device_last_seen(device_id)
-                            # Removed frequent debug log
-
-                        # Also call callback
-                        self.devices_found_callback(device_info)
-                    else:
-                        pass  # Silently ignore non-KKT devices
-
-                except json.JSONDecodeError:
-                    pass  # Silently ignore invalid JSON (common for non-Tuya UDP traffic)
-            else:
-                pass  # Silently ignore unencryptable data (common for non-Tuya UDP traffic)
+        decrypted = self._decrypt_udp_message(data)
+        if not decrypted:
+            return None  # Silently ignore undecryptable data (common for non-Tuya UDP traffic)
+        try:
+            device_info = json.loads(decrypted.decode())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None  # Silently ignore invalid JSON (common for non-Tuya UDP traffic)
+        if not isinstance(device_info, dict):
+            return None
+        self.stats["packets_parsed"] += 1
+
+        # Add IP address from UDP source
+        device_info["ip"] = addr[0]
+        if not self._is_potential_kkt_device(device_info):
+            return None  # Silently ignore non-KKT devices
+        self.stats["kkt_devices"] += 1
+        return device_info
+
+    def _is_repeat(self, payload: bytes, host: str) -> bool:
+        """Return True if ``host`` sent this payload within the dedup window."""
+        now = self._clock()
+        payload_hash = hash(payload)
+        last = self._last_payload.get(host)
+        if last is not None and last[0] == payload_hash and now - last[1] < self._dedup_ttl:
+            return True
 
-        except Exception as e:
-            _LOGGER.error(f"Failed to process UDP message from {addr}: {e}", exc_info=True)
+        if len(self._last_payload) >= UDP_DEDUP_MAX_SIZE and host not in self._last_payload:
+            self._last_payload = {
+                seen_host: entry for seen_host, entry in self._last_payload.items() if now - entry[1] < self._dedup_ttl
+            }
+        self._last_payload[host] = (payload_hash, now)
+        return False
 
-    def _decrypt_udp_message(self, data: bytes) -> bytes | None:
+    @staticmethod
+    def _decrypt_udp_message(data: bytes) -> bytes | None:
         """Decrypt Tuya UDP broadcast message like LocalTuya."""
         try:
             # LocalTuya approach: Strip first 20 and last 8 bytes, then decrypt
@@ -204,8 +193,7 @@ class TuyaUDPDiscovery(asyncio.DatagramProtocol):
                 return None
 
             # Decrypt using Tuya UDP key
-            cipher = AES.new(UDP_KEY, AES.MODE_ECB)
-            decrypted: bytes = cipher.decrypt(encrypted_payload)
+            decrypted: bytes = _get_udp_cipher().decrypt(encrypted_payload)
 
             # Remove PKCS7 padding
             padding_length = decrypted[-1]
@@ -221,15 +209,13 @@ class TuyaUDPDiscovery(asyncio.DatagramProtocol):
 
         return None
 
-    def _is_potential_kkt_device(self, device_info: dict[str, Any]) -> bool:
+    @staticmethod
+    def _is_potential_kkt_device(device_info: dict[str, Any]) -> bool:
         """Check if UDP discovered device could be KKT Kolbe.
 
         IMPORTANT: Device IDs change when re-adding devices to Tuya/SmartLife,
         so we identify KKT devices by product_id/product_key, NOT by device ID.
         """
-        # Build known IDs dynamically from KNOWN_DEVICES (single source of truth)
-        known_product_ids = _get_known_product_ids()
-
         # Check product key/ID first (most reliable)
         product_key = (
             device_info.get("productKey")
@@ -239,7 +225,7 @@ class TuyaUDPDiscovery(asyncio.DatagramProtocol):
             or ""
         )
 
-        if product_key and product_key.lower() in [p.lower() for p in known_product_ids]:
+        if product_key and product_key.lower() in _get_known_product_ids():
             return True
 
         # Check for KKT patterns in product name
@@ -248,6 +234,82 @@ class TuyaUDPDiscovery(asyncio.DatagramProtocol):
         return any(pattern in product_name for pattern in KKT_PATTERNS)
 
 
+class TuyaUDPDiscovery(asyncio.DatagramProtocol):
+    """UDP Discovery Protocol for Tuya devices (based on Local Tuya)."""
+
+    def __init__(
+        self,
+        devices_found_callback: Callable[[dict[str, Any]], None],
+        hass: HomeAssistant | None = None,
+        engine: UDPDiscoveryEngine | None = None,
+    ) -> None:
+        """Initialize UDP discovery protocol.
+
+        Args:
+            devices_found_callback: Called with the info of each potential KKT device
+            hass: Home Assistant instance
+            engine: Engine shared with the listeners on the other ports
+        """
+        self.devices_found_callback = devices_found_callback
+        self.transport: asyncio.DatagramTransport | None = None
+        self.hass = hass
+        self.engine = engine or UDPDiscoveryEngine()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Called when UDP connection is established."""
+        self.transport = transport  # type: ignore[assignment]
+        _LOGGER.debug(f"UDP Discovery listening on {transport.get_extra_info('sockname')}")
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Process received UDP datagram from Tuya device."""
+        try:
+            device_info = self.engine.process(data, addr)
+            if device_info is None:
+                return
+
+            device_id = device_info.get("gwId", "unknown")
+            # Rate-limit discovery logs (same device broadcasts frequently)
+            if _should_log(f"udp_discover_{device_id}"):
+                _LOGGER.info(f"KKT Device discovered via UDP: {device_id[:8]}... at {device_info['ip']}")
+
+            # DIRECT FIX: Add device to global discovery instance
+            global _discovery_instance
+            if _discovery_instance:
+                device_id = device_info.get("gwId", "")
+
+                # Extract product name from UDP data if available
+                product_key = (
+                    device_info.get("productKey")
+                    or device_info.get("productName")
+                    or device_info.get("product_name")
+                    or ""
+                )
+
+                # Detect device type from product key
+                from .helpers.device_detection import detect_device_type_from_product_key
+
+                device_type, friendly_name = detect_device_type_from_product_key(product_key, device_id)
+
+                # LocalTuya approach: Just collect all devices, let config flow filter duplicates
+                formatted_device = {
+                    "device_id": device_id,
+                    "ip": device_info.get("ip"),  # Use consistent "ip" key
+                    "name": friendly_name or f"KKT Device {device_id[:8]}",
+                    "discovered_via": "UDP",
+                    "product_name": product_key or "auto",
+                    "device_type": device_type,
+                    "friendly_type": friendly_name,
+                }
+                _discovery_instance.discovered_devices[device_id] = formatted_device
+                _discovery_instance._update_device_last_seen(device_id)
+
+            # Also call callback
+            self.devices_found_callback(device_info)
+
+        except Exception as e:
+            _LOGGER.error(f"Failed to process UDP message from {addr}: {e}", exc_info=True)
+
+
 class KKTKolbeDiscovery(ServiceListener):
     """Discover KKT Kolbe devices via mDNS and UDP broadcasts."""
 
@@ -259,6 +321,8 @@ class KKTKolbeDiscovery(ServiceListener):
         self._zeroconf: AsyncZeroconf | None = None
         self._browsers: list[ServiceBrowser] = []
         self._udp_listeners: list[tuple[asyncio.DatagramTransport, TuyaUDPDiscovery]] = []
+        # Shared by the listeners of all UDP ports
+        self.udp_engine = UDPDiscoveryEngine()
         self._discovery_callback = self._schedule_discovery_trigger
         self._cleanup_task: asyncio.Task | None = None
 
@@ -368,7 +432,7 @@ class KKTKolbeDiscovery(ServiceListener):
                 try:
                     loop = asyncio.get_running_loop()
                     transport, protocol = await loop.create_datagram_endpoint(
-                        lambda: TuyaUDPDiscovery(self._on_udp_device_found),
+                        lambda: TuyaUDPDiscovery(self._on_udp_device_found, engine=self.udp_engine),
                         local_addr=("0.0.0.0", port),
                         allow_broadcast=True,
                     )
@@ -942,12 +1006,13 @@ async def simple_tuya_discover(timeout: int = 6) -> dict[str, dict[str, Any]]:
     loop = asyncio.get_running_loop()
     listeners: list[tuple[Any, Any]] = []
     probe_task: asyncio.Task | None = None
+    engine = UDPDiscoveryEngine()
 
     try:
         for port in UDP_PORTS:
             try:
                 transport, protocol = await loop.create_datagram_endpoint(
-                    lambda: TuyaUDPDiscovery(device_found), local_addr=("0.0.0.0", port)
+                    lambda: TuyaUDPDiscovery(device_found, engine=engine), local_addr=("0.0.0.0", port)
                 )
                 listeners.append((transport, protocol))
             except Exception as e:
@@ -1133,6 +1198,7 @@ async def debug_scan_network() -> dict[str, Any]:
             results["discovery_status"]["mDNS_browsers"] = len(_discovery_instance._browsers)
             results["discovery_status"]["UDP_listeners"] = len(_discovery_instance._udp_listeners)
             results["discovery_status"]["discovered_devices"] = len(_discovery_instance.discovered_devices)
+            results["discovery_status"]["UDP_packets"] = dict(_discovery_instance.udp_engine.stats)
         else:
             results["discovery_status"]["active"] = False
 
@@ -0,0 +1,330 @@
+"""Precompiled value codecs for data points.
+
+A DP's spec (Tuya type plus its ``values`` JSON: min/max/scale/step or the
+enum range) never changes at runtime, yet every entity read re-interpreted
+it: enum strings were searched in option lists, percentages were recomputed
+from speed lists and the category mapper parsed the same ``values`` JSON
+again for every device. ``compile_codec`` turns a spec into a small,
+immutable codec once; codecs are cached per spec, so the coordinator's
+cloud translation and all entities with the same spec share one object and
+decoding, encoding and validation become dict or tuple lookups.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Mapping
+from collections.abc import Sequence
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.util.percentage import ordered_list_item_to_percentage
+from homeassistant.util.percentage import percentage_to_ordered_list_item
+
+# Tuya value types (SmartLife "valueType", category "type", OpenAPI "typeSpec.type")
+# → codec data type
+DATA_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        "Boolean": "bool",
+        "bool": "bool",
+        "Integer": "value",
+        "value": "value",
+        "Enum": "enum",
+        "enum": "enum",
+        "String": "string",
+        "string": "string",
+        "Json": "string",
+        "Bitmap": "bitmap",
+        "bitmap": "bitmap",
+        "Raw": "raw",
+        "raw": "raw",
+    }
+)
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+class DPCodec:
+    """Pass-through codec for string, bitmap and raw DPs (and unknown types).
+
+    Attributes:
+        data_type: Codec data type ("bool", "value", "enum", "string", ...)
+        spec: The parsed ``values`` spec the codec was compiled from
+    """
+
+    __slots__ = ("data_type", "spec")
+
+    def __init__(self, data_type: str, spec: Mapping[str, Any] = _EMPTY) -> None:
+        """Initialize the codec."""
+        self.data_type = data_type
+        self.spec = spec
+
+    def decode(self, raw: Any) -> Any:
+        """Return the entity value of a raw DP value (None if not decodable)."""
+        return raw
+
+    def encode(self, value: Any) -> Any:
+        """Return the raw DP value to send for an entity value."""
+        return value
+
+    def coerce(self, raw: Any) -> Any:
+        """Return a raw DP value in the spec's type, without rescaling it."""
+        return raw
+
+    def is_valid(self, raw: Any) -> bool:
+        """Return True if ``raw`` is a value the device accepts for this DP."""
+        return raw is not None
+
+    def __repr__(self) -> str:
+        """Return a short description for logs and diagnostics."""
+        return f"{type(self).__name__}({self.data_type})"
+
+
+class BoolCodec(DPCodec):
+    """Codec for Boolean DPs."""
+
+    __slots__ = ()
+
+    def decode(self, raw: Any) -> bool | None:
+        """Return the switch state."""
+        return None if raw is None else bool(raw)
+
+    def encode(self, value: Any) -> bool:
+        """Return the switch state to send."""
+        return bool(value)
+
+    def coerce(self, raw: Any) -> bool:
+        """Return a raw switch state as bool."""
+        return bool(raw)
+
+    def is_valid(self, raw: Any) -> bool:
+        """Return True for real booleans only."""
+        return isinstance(raw, bool)
+
+
+class ValueCodec(DPCodec):
+    """Codec for Integer DPs with a min/max/step range and a decimal scale.
+
+    Raw values are integers; the entity value is ``raw / 10 ** scale``.
+    """
+
+    __slots__ = ("_factor", "max", "min", "scale", "step")
+
+    def __init__(self, spec: Mapping[str, Any] = _EMPTY) -> None:
+        """Compile the range of an Integer spec."""
+        super().__init__("value", spec)
+        self.min = int(spec.get("min", 0))
+        self.max = int(spec.get("max", 100))
+        self.step = max(1, int(spec.get("step", 1)))
+        self.scale = int(spec.get("scale", 0))
+        self._factor = 10**self.scale
+
+    def decode(self, raw: Any) -> float | None:
+        """Return the scaled entity value."""
+        try:
+            return float(raw) / self._factor
+        except (TypeError, ValueError):
+            return None
+
+    def encode(self, value: Any) -> int:
+        """Return the raw value, snapped to the step grid and clamped to the range."""
+        raw = round(float(value) * self._factor)
+        raw = self.min + round((raw - self.min) / self.step) * self.step
+        return min(self.max, max(self.min, raw))
+
+    def coerce(self, raw: Any) -> int:
+        """Return a raw value as integer; it is neither scaled nor clamped."""
+        return round(float(raw))
+
+    def is_valid(self, raw: Any) -> bool:
+        """Return True for an integer on the step grid within the range."""
+        return (
+            isinstance(raw, int)
+            and not isinstance(raw, bool)
+            and self.min <= raw <= self.max
+            and (raw - self.min) % self.step == 0
+        )
+
+    def to_scale(self, raw: Any, top: int) -> int | None:
+        """Return ``raw`` mapped from 0..max onto 0..top (e.g. brightness 0-255)."""
+        try:
+            return int((float(raw) / self.max) * top) if self.max else 0
+        except (TypeError, ValueError):
+            return None
+
+    def from_scale(self, value: float, top: int) -> int:
+        """Return the raw value for ``value`` on a 0..top scale."""
+        return int((value / top) * self.max)
+
+    def level_for_percentage(self, percentage: float) -> int:
+        """Return the lowest non-zero level covering ``percentage`` (fan speeds)."""
+        return max(max(1, self.min), min(self.max, math.ceil(percentage / 100 * self.max)))
+
+
+class EnumCodec(DPCodec):
+    """Codec for Enum DPs: options in device order plus the device values they map to.
+
+    An index is accepted in place of an option when encoding (and via
+    ``option_at`` for devices that report one). Percentage tables (fan
+    speeds) are built on first use.
+    """
+
+    __slots__ = ("_by_percentage", "_percentages", "_to_device", "_to_option", "options")
+
+    def __init__(
+        self,
+        options: Sequence[str],
+        device_values: Mapping[str, Any] | None = None,
+        spec: Mapping[str, Any] = _EMPTY,
+    ) -> None:
+        """Compile the option ↔ device value tables.
+
+        Args:
+            options: Option names in device order
+            device_values: Device value per option where it differs from the name;
+                the first option wins a device value shared by several options
+            spec: The parsed spec, for reference
+        """
+        super().__init__("enum", spec)
+        self.options: tuple[str, ...] = tuple(options)
+        device_values = device_values or {}
+        self._to_device: Mapping[str, Any] = MappingProxyType(
+            {option: device_values.get(option, option) for option in self.options}
+        )
+        to_option: dict[Any, str] = {}
+        for option, device_value in device_values.items():
+            to_option.setdefault(device_value, option)
+        for option in self.options:
+            to_option.setdefault(option, option)
+        self._to_option: Mapping[Any, str] = MappingProxyType(to_option)
+        self._percentages: Mapping[str, int] | None = None
+        self._by_percentage: tuple[str, ...] | None = None
+
+    def decode(self, raw: Any) -> str | None:
+        """Return the option for a device value (None if unknown)."""
+        try:
+            return self._to_option.get(raw)
+        except TypeError:  # unhashable payload
+            return None
+
+    def encode(self, value: Any) -> Any:
+        """Return the device value of an option or option index; unknown values pass as is."""
+        if isinstance(value, str):
+            return self._to_device.get(value, value)
+        if isinstance(value, int) and not isinstance(value, bool) and (option := self.option_at(value)):
+            return self._to_device[option]
+        return value
+
+    def coerce(self, raw: Any) -> Any:
+        """Return the device value of an option or option index; unknown values pass as is."""
+        return self.encode(raw)
+
+    def is_valid(self, raw: Any) -> bool:
+        """Return True if ``raw`` is one of the device values."""
+        try:
+            return raw in self._to_option and self._to_device[self._to_option[raw]] == raw
+        except TypeError:
+            return False
+
+    def option_at(self, index: int) -> str | None:
+        """Return the option at ``index`` in device order."""
+        return self.options[index] if 0 <= index < len(self.options) else None
+
+    def percentage(self, option: str) -> int | None:
+        """Return the percentage of an option in the ordered option list."""
+        if self._percentages is None:
+            self._build_percentage_tables()
+        assert self._percentages is not None
+        return self._percentages.get(option)
+
+    def from_percentage(self, percentage: int) -> str:
+        """Return the option for a 0-100 percentage."""
+        if self._by_percentage is None:
+            self._build_percentage_tables()
+        assert self._by_percentage is not None
+        return self._by_percentage[min(100, max(0, int(percentage)))]
+
+    def _build_percentage_tables(self) -> None:
+        """Precompute option → percentage and percentage → option."""
+        options = list(self.options)
+        self._percentages = MappingProxyType({o: ordered_list_item_to_percentage(options, o) for o in options})
+        self._by_percentage = tuple(percentage_to_ordered_list_item(options, p) for p in range(101))
+
+
+def parse_values(values: str | Mapping[str, Any] | None) -> Mapping[str, Any]:
+    """Return a ``values`` spec as a read-only mapping ({} if missing or invalid)."""
+    if isinstance(values, Mapping):
+        return MappingProxyType(dict(values))
+    if not values:
+        return _EMPTY
+    return _parse_values_json(values)
+
+
+@lru_cache(maxsize=512)
+def _parse_values_json(values: str) -> Mapping[str, Any]:
+    """Parse a ``values`` JSON string once."""
+    try:
+        parsed = json.loads(values)
+    except (TypeError, ValueError):
+        return _EMPTY
+    return MappingProxyType(parsed) if isinstance(parsed, dict) else _EMPTY
+
+
+def compile_codec(value_type: str | None, values: str | Mapping[str, Any] | None = None) -> DPCodec:
+    """Return the shared codec for a DP spec.
+
+    Args:
+        value_type: Tuya value type in any of the ``DATA_TYPES`` spellings
+        values: The ``values`` spec, as JSON string or mapping
+    """
+    data_type = DATA_TYPES.get(value_type or "", value_type or "raw")
+    if isinstance(values, Mapping):
+        return _compile(data_type, _canonical(values))
+    return _compile_json(data_type, values or "")
+
+
+def compile_value_codec(minimum: int, maximum: int, step: int = 1, scale: int = 0) -> ValueCodec:
+    """Return the shared value codec of an entity's range."""
+    codec = compile_codec("value", {"min": minimum, "max": maximum, "step": step, "scale": scale})
+    assert isinstance(codec, ValueCodec)
+    return codec
+
+
+def compile_enum_codec(options: Sequence[str], device_values: Mapping[str, Any] | None = None) -> EnumCodec:
+    """Return the shared enum codec of an entity's options (and their device values)."""
+    # Insertion order matters: the first option owns a shared device value
+    key = json.dumps([list(options), list((device_values or {}).items())], default=str)
+    return _compile_enum(key)
+
+
+def _canonical(spec: Mapping[str, Any]) -> str:
+    """Return the cache key of a parsed spec."""
+    return json.dumps(dict(spec), sort_keys=True, default=str)
+
+
+@lru_cache(maxsize=512)
+def _compile_json(data_type: str, values: str) -> DPCodec:
+    """Return the codec of a JSON spec, skipping the parse for a known string."""
+    return _compile(data_type, _canonical(parse_values(values)))
+
+
+@lru_cache(maxsize=512)
+def _compile(data_type: str, canonical: str) -> DPCodec:
+    """Compile a codec once per normalized spec."""
+    spec = parse_values(canonical)
+    if data_type == "bool":
+        return BoolCodec(data_type, spec)
+    if data_type == "value":
+        return ValueCodec(spec)
+    if data_type == "enum":
+        return EnumCodec([str(option) for option in spec.get("range", ())], spec=spec)
+    return DPCodec(data_type, spec)
+
+
+@lru_cache(maxsize=256)
+def _compile_enum(key: str) -> EnumCodec:
+    """Compile an entity enum codec once per option list."""
+    options, device_values = json.loads(key)
+    return EnumCodec(options, dict(device_values))
@@ -0,0 +1,114 @@
+"""DP-scoped listener dispatch for the coordinators.
+
+``DataUpdateCoordinator.async_update_listeners`` calls every registered
+listener, so one changed DP re-ran ``_handle_coordinator_update`` on every
+entity of the device. Entities now register with a ``DPSubscription`` as
+their coordinator context; ``DPDispatchMixin`` keeps a DP → listener index
+and, when the payload carries ``changed_dps`` (see dps_snapshot.py), only
+calls the listeners subscribed to one of those DPs.
+
+Everyone is still notified when the payload has no change set or when
+availability changed (failed/recovered update, device online/offline), and
+listeners without a subscription (connection/status entities) keep getting
+every update.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE
+from homeassistant.core import callback
+
+
+class DPSubscription(frozenset[str]):
+    """Listener context naming the DP ids (as str) an entity's state depends on."""
+
+    def __new__(cls, dps: Iterable[int | str]) -> DPSubscription:
+        """Create a subscription, normalizing DP ids to the DPS dict's str keys."""
+        return super().__new__(cls, (str(dp) for dp in dps))
+
+
+class DPDispatchMixin:
+    """Coordinator mixin that fans out updates only to the affected DP subscribers.
+
+    Must come before ``DataUpdateCoordinator`` in the class bases.
+    """
+
+    data: Any
+    last_update_success: bool
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the coordinator and the empty listener index."""
+        super().__init__(*args, **kwargs)
+        # DP id -> {remove_listener: update_callback}
+        self._dp_listeners: dict[str, dict[CALLBACK_TYPE, CALLBACK_TYPE]] = {}
+        self._unscoped_listeners: dict[CALLBACK_TYPE, CALLBACK_TYPE] = {}
+        # Scoped listeners that want every update for now (pending optimistic write)
+        self._pinned_listeners: set[CALLBACK_TYPE] = set()
+        self._dispatch_availability: tuple[Any, ...] | None = None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE, context: Any = None) -> CALLBACK_TYPE:
+        """Listen for data updates, indexed by the DPs in a ``DPSubscription`` context."""
+        remove_listener = super().async_add_listener(update_callback, context)  # type: ignore[misc]
+        dps = context if isinstance(context, DPSubscription) else None
+
+        if dps is None:
+            self._unscoped_listeners[remove_listener] = update_callback
+        else:
+            for dp in dps:
+                self._dp_listeners.setdefault(dp, {})[remove_listener] = update_callback
+
+        @callback
+        def remove_indexed_listener() -> None:
+            """Remove the listener from the coordinator and the index."""
+            remove_listener()
+            self._pinned_listeners.discard(update_callback)
+            if dps is None:
+                self._unscoped_listeners.pop(remove_listener, None)
+                return
+            for dp in dps:
+                listeners = self._dp_listeners.get(dp)
+                if listeners is None:
+                    continue
+                listeners.pop(remove_listener, None)
+                if not listeners:
+                    del self._dp_listeners[dp]
+
+        return remove_indexed_listener
+
+    @callback
+    def async_pin_listener(self, update_callback: CALLBACK_TYPE, pinned: bool) -> None:
+        """Deliver every update to a scoped listener until it is unpinned."""
+        if pinned:
+            self._pinned_listeners.add(update_callback)
+        else:
+            self._pinned_listeners.discard(update_callback)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners affected by the latest update."""
+        data = self.data
+        changed = data.get("changed_dps") if isinstance(data, dict) else None
+        availability = (
+            self.last_update_success,
+            data.get("available") if isinstance(data, dict) else None,
+            getattr(self, "is_device_available", None),
+        )
+        if changed is None or availability != self._dispatch_availability:
+            self._dispatch_availability = availability
+            super().async_update_listeners()  # type: ignore[misc]
+            return
+
+        # Insertion-ordered set: unscoped first, then subscribers of changed DPs
+        targets = dict.fromkeys(self._unscoped_listeners.values())
+        for dp in changed:
+            listeners = self._dp_listeners.get(dp)
+            if listeners:
+                targets.update(dict.fromkeys(listeners.values()))
+        targets.update(dict.fromkeys(self._pinned_listeners))
+
+        for update_callback in targets:
+            update_callback()
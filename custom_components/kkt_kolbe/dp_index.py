@@ -0,0 +1,152 @@
+"""Bidirectional DP ↔ property code index for cloud status translation.
+
+Cloud backends (IoT Platform API, SmartLife) report status as a list of
+``{"code": ..., "value": ...}`` items while everything else in the integration
+is keyed by DP number. ``DPIndex`` is built once per device from the
+``device_types.py`` mapping merged with the live SDK spec and then translates
+a whole status list in a single pass. The DPs' compiled value codecs
+(``dp_codec.py``) ride along, so commands are brought into the form the live
+spec expects with one lookup per DP.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from .dp_codec import DPCodec
+
+# Fallback mapping for common KKT Kolbe devices when device_type is unknown
+GENERIC_DP_MAPPING: Mapping[int, str] = MappingProxyType(
+    {
+        # Hood DPs
+        1: "switch",
+        4: "light",
+        6: "switch_lamp",
+        7: "switch_wash",
+        10: "fan_speed_enum",
+        13: "countdown",
+        101: "RGB",
+        102: "fan_speed",
+        103: "day",
+        104: "switch_led_1",
+        105: "countdown_1",
+        106: "switch_led",
+        107: "colour_data",
+        108: "work_mode",
+        109: "day_1",
+        # Cooktop DPs (IND7705HC)
+        134: "general_timer",
+        145: "child_lock",
+        155: "power_limit",
+        161: "zone_power_bitfield",
+        162: "zone_levels_bitfield",
+        163: "zone_boost_bitfield",
+        164: "zone_keep_warm_bitfield",
+        165: "zone_timer_bitfield",
+        166: "zone_temp_bitfield",
+        167: "zone_timer_remaining",
+        168: "zone_target_temp",
+        169: "zone_current_temp",
+    }
+)
+
+
+@dataclass(frozen=True)
+class DPIndex:
+    """Immutable per-device lookup tables between DP ids, codes and value types.
+
+    Attributes:
+        code_to_dp: Property code → DP id
+        dp_to_code: DP id → property code
+        dp_to_type: DP id → Tuya value type ("Boolean", "Enum", ...), live spec only
+        dp_to_codec: DP id → compiled value codec, live spec only
+    """
+
+    code_to_dp: Mapping[str, int]
+    dp_to_code: Mapping[int, str]
+    dp_to_type: Mapping[int, str]
+    dp_to_codec: Mapping[int, DPCodec] = MappingProxyType({})
+
+    @classmethod
+    def build(
+        cls,
+        known: Mapping[int, str],
+        live_codes: Mapping[int, str] | None = None,
+        live_types: Mapping[int, str] | None = None,
+        live_codecs: Mapping[int, DPCodec] | None = None,
+    ) -> DPIndex:
+        """Build an index from the hardcoded mapping and the live SDK spec.
+
+        Live codes win over hardcoded ones for the same DP since they are what
+        the cloud actually reports. When two DPs share a code, the first DP in
+        mapping order keeps it (same result as the previous linear scan).
+
+        Args:
+            known: DP → code mapping from device_types.py (or the generic fallback)
+            live_codes: DP → code mapping from ``device.local_strategy``
+            live_types: DP → value type from ``device.local_strategy``
+            live_codecs: DP → codec compiled from ``device.local_strategy``
+
+        Returns:
+            A new immutable index.
+        """
+        dp_to_code = {int(dp): code for dp, code in known.items()}
+        if live_codes:
+            dp_to_code.update({int(dp): code for dp, code in live_codes.items()})
+
+        code_to_dp: dict[str, int] = {}
+        # Live codes first so they own a code shared with a stale hardcoded DP
+        for dp, code in (live_codes or {}).items():
+            code_to_dp.setdefault(code, int(dp))
+        for dp, code in known.items():
+            code_to_dp.setdefault(code, int(dp))
+
+        return cls(
+            code_to_dp=MappingProxyType(code_to_dp),
+            dp_to_code=MappingProxyType(dp_to_code),
+            dp_to_type=MappingProxyType({int(dp): t for dp, t in (live_types or {}).items()}),
+            dp_to_codec=MappingProxyType({int(dp): c for dp, c in (live_codecs or {}).items()}),
+        )
+
+    def translate_status(self, status_list: Iterable[Any]) -> dict[str, Any]:
+        """Convert cloud ``[{"code", "value"}, ...]`` status into a DPS dict.
+
+        Items that are not dicts, have no value or carry an unknown code are
+        skipped.
+        """
+        code_to_dp = self.code_to_dp
+        dps: dict[str, Any] = {}
+        for item in status_list:
+            if not isinstance(item, dict):
+                continue
+            value = item.get("value")
+            if value is None:
+                continue
+            dp = code_to_dp.get(item.get("code"))  # type: ignore[arg-type]
+            if dp is not None:
+                dps[str(dp)] = value
+        return dps
+
+    def encode_dps(self, dps: Mapping[int, Any]) -> dict[int, Any]:
+        """Return raw ``dps`` in the types of the live spec (for cloud commands).
+
+        Only the type changes: ``45.0`` becomes ``45`` for an Integer DP and an
+        option index the enum option. Values are already raw, so they are not
+        rescaled or clamped; DPs without a codec and values a codec cannot
+        coerce are passed unchanged, so the cloud reports its own error for them.
+        """
+        codecs = self.dp_to_codec
+        encoded = dict(dps)
+        if not codecs:
+            return encoded
+        for dp, value in dps.items():
+            if (codec := codecs.get(dp)) is not None:
+                try:
+                    encoded[dp] = codec.coerce(value)
+                except (TypeError, ValueError):
+                    pass
+        return encoded
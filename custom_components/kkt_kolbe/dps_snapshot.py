@@ -0,0 +1,82 @@
+"""Versioned DPS snapshots and per-update change sets for the coordinators.
+
+Coordinators used to publish a fresh ``_dps_cache.copy()`` on every poll and
+push, and every entity re-rendered even if only one DP (or none) changed.
+``DPSChangeTracker`` publishes a read-only snapshot that is only replaced when
+a value actually changed, together with the set of DP ids that changed, so
+entities can skip updates that do not touch their data points.
+
+``DPSSnapshot`` is a ``dict`` subclass, so existing consumers of
+``coordinator.data["dps"]`` (``.get()``, iteration, ``isinstance(.., dict)``,
+JSON/diagnostics) keep working unchanged.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+from typing import NoReturn
+
+
+class DPSSnapshot(dict[str, Any]):
+    """Read-only DPS dict tagged with the version that produced it."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, data: Mapping[str, Any] | None = None, version: int = 0) -> None:
+        """Initialize the snapshot with a copy of ``data``."""
+        super().__init__(data or {})
+        self.version = version
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("DPS snapshots are read-only; update the coordinator cache instead")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def copy(self) -> dict[str, Any]:
+        """Return a plain, mutable dict copy."""
+        return dict(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # copy/deepcopy/pickle produce a plain dict (the mutators above would
+        # break the default dict-subclass reconstruction)
+        return (dict, (dict(self),))
+
+
+class DPSChangeTracker:
+    """Publish DPS snapshots and remember which DPs changed in the last publish."""
+
+    def __init__(self) -> None:
+        """Initialize with an empty snapshot at version 0."""
+        self.snapshot = DPSSnapshot()
+        self.changed: frozenset[str] = frozenset()
+
+    @property
+    def version(self) -> int:
+        """Return the version of the current snapshot."""
+        return self.snapshot.version
+
+    def publish(self, dps: Mapping[str, Any]) -> DPSSnapshot:
+        """Return a snapshot of ``dps``, reusing the current one if nothing changed.
+
+        Args:
+            dps: The coordinator's merged DPS cache
+
+        Returns:
+            The current snapshot; a new one (version + 1) only if a value was
+            added, changed or removed. ``changed`` holds the affected DP ids.
+        """
+        current = self.snapshot
+        changed = {dp for dp, value in dps.items() if dp not in current or current[dp] != value}
+        changed.update(dp for dp in current if dp not in dps)
+        self.changed = frozenset(changed)
+        if changed:
+            self.snapshot = DPSSnapshot(dps, current.version + 1)
+        return self.snapshot
@@ -18,7 +18,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import math
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -29,11 +28,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.core import callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util.percentage import ordered_list_item_to_percentage
-from homeassistant.util.percentage import percentage_to_ordered_list_item
 
 from .base_entity import KKTBaseEntity
 from .device_types import get_device_entity_config
+from .dp_codec import compile_enum_codec
+from .dp_codec import compile_value_codec
 
 if TYPE_CHECKING:
     from .data import KKTKolbeConfigEntry
@@ -104,6 +103,10 @@ class KKTKolbeFan(KKTBaseEntity, FanEntity):
         self._min_speed = fan_config.get("min", 0)
         self._max_speed = fan_config.get("max", len(self._speed_list) - 1)
 
+        # Speed ↔ percentage tables, shared by all fans with the same speeds
+        self._level_codec = compile_value_codec(self._min_speed, self._max_speed)
+        self._speed_codec = compile_enum_codec(self._speed_list)
+
         # For numeric mode, the "off" speed is 0
         # For enum mode, remember last non-off speed
         self._last_non_off_speed: int | str
@@ -199,7 +202,7 @@ class KKTKolbeFan(KKTBaseEntity, FanEntity):
                     self._cached_percentage = 0
                 else:
                     # Map 1-9 to roughly 11-100%
-                    self._cached_percentage = int((speed_int / self._max_speed) * 100)
+                    self._cached_percentage = self._level_codec.to_scale(speed_int, 100) or 0
                     self._last_non_off_speed = speed_int
             except (ValueError, TypeError):
                 self._cached_state = None
@@ -210,10 +213,11 @@ class KKTKolbeFan(KKTBaseEntity, FanEntity):
                 is_on = speed_value != "off"
                 self._cached_state = is_on
 
-                if speed_value == "off" or speed_value not in self._speed_list:
+                speed_percentage = self._speed_codec.percentage(speed_value)
+                if speed_value == "off" or speed_percentage is None:
                     self._cached_percentage = 0
                 else:
-                    self._cached_percentage = ordered_list_item_to_percentage(self._speed_list, speed_value)
+                    self._cached_percentage = speed_percentage
                     self._last_non_off_speed = speed_value
             elif isinstance(speed_value, (int, float)):
                 # Some devices return index instead of string
@@ -221,16 +225,20 @@ class KKTKolbeFan(KKTBaseEntity, FanEntity):
                 is_on = idx > 0
                 self._cached_state = is_on
 
-                if idx == 0 or idx >= len(self._speed_list):
+                speed_name = self._speed_codec.option_at(idx) if idx > 0 else None
+                if speed_name is None:
                     self._cached_percentage = 0
                 else:
-                    speed_name = self._speed_list[idx]
-                    self._cached_percentage = ordered_list_item_to_percentage(self._speed_list, speed_name)
+                    self._cached_percentage = self._speed_codec.percentage(speed_name) or 0
                     self._last_non_off_speed = speed_name
             else:
                 self._cached_state = None
                 self._cached_percentage = 0
 
+    def _subscribed_dps(self) -> tuple[int, ...]:
+        """Return the fan speed DP and the hood power DP (gates is_on/percentage)."""
+        return (self._dp, HOOD_POWER_DP)
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -348,13 +356,13 @@ class KKTKolbeFan(KKTBaseEntity, FanEntity):
         if self._numeric_mode:
             # Convert percentage to 1-9
             # 1-11% → 1, 12-22% → 2, ..., 90-100% → 9
-            speed_int = max(1, min(self._max_speed, math.ceil(percentage / 100 * self._max_speed)))
+            speed_int = self._level_codec.level_for_percentage(percentage)
             await self._async_set_data_point(self._dp_id, speed_int)
             self._last_non_off_speed = speed_int
             self._log_entity_state("Set Speed", f"Speed: {speed_int} ({percentage}%)")
         else:
             # Convert percentage to speed name
-            speed_name = percentage_to_ordered_list_item(self._speed_list, percentage)
+            speed_name = self._speed_codec.from_percentage(percentage)
             await self._async_set_data_point(self._dp_id, speed_name)
             self._last_non_off_speed = speed_name
             self._log_entity_state("Set Speed", f"Speed: {speed_name} ({percentage}%)")
@@ -209,6 +209,7 @@ class KKTKolbeOptionsFlow(OptionsFlow):
         current_advanced = self.config_entry.options.get("enable_advanced_entities", True)
         current_naming = self.config_entry.options.get("zone_naming_scheme", "zone")
         current_fan_suppress = self.config_entry.options.get("disable_fan_auto_start", True)
+        current_async_transport = self.config_entry.options.get("enable_async_transport", False)
 
         # SmartLife Device schema - NO IoT Platform API fields
         schema = vol.Schema(
@@ -232,6 +233,7 @@ class KKTKolbeOptionsFlow(OptionsFlow):
                     }
                 ),
                 vol.Optional("disable_fan_auto_start", default=current_fan_suppress): bool,
+                vol.Optional("enable_async_transport", default=current_async_transport): bool,
                 vol.Optional("test_connection", default=True): bool,
             }
         )
@@ -262,6 +264,7 @@ class KKTKolbeOptionsFlow(OptionsFlow):
         current_advanced = self.config_entry.options.get("enable_advanced_entities", True)
         current_naming = self.config_entry.options.get("zone_naming_scheme", "zone")
         current_fan_suppress = self.config_entry.options.get("disable_fan_auto_start", True)
+        current_async_transport = self.config_entry.options.get("enable_async_transport", False)
 
         # Get current API settings
         current_api_enabled = self.config_entry.data.get("api_enabled", False)
@@ -278,6 +281,7 @@ class KKTKolbeOptionsFlow(OptionsFlow):
             current_client_id=current_client_id,
             current_endpoint=current_endpoint,
             current_fan_suppress=current_fan_suppress,
+            current_async_transport=current_async_transport,
         )
 
         return self.async_show_form(
@@ -424,6 +428,7 @@ class KKTKolbeOptionsFlow(OptionsFlow):
                 client_id=client_id,
                 client_secret=client_secret,
                 endpoint=options.get("api_endpoint", "https://openapi.tuyaeu.com"),
+                hass=self.hass,
             )
 
             async with api_client:
@@ -27,8 +27,8 @@ def detect_device_type_from_api(device: dict[str, Any]) -> tuple[str, str]:
         - internal_product_name: Product name for matching in KNOWN_DEVICES
     """
     from ..device_types import KNOWN_DEVICES
-    from ..device_types import find_device_by_device_id
-    from ..device_types import find_device_by_product_name
+    from ..device_types import find_device_key_by_device_id
+    from ..device_types import find_device_key_by_product_name
 
     tuya_category = device.get("category", "").lower()
     api_product_name = device.get("product_name", "Unknown Device")
@@ -44,39 +44,19 @@ def detect_device_type_from_api(device: dict[str, Any]) -> tuple[str, str]:
 
     # Method 1: Match by Tuya product_id (most accurate)
     if product_id:
-        device_info = find_device_by_product_name(product_id)
-        if device_info:
-            for device_key, info in KNOWN_DEVICES.items():
-                if product_id in info.get("product_names", []):
-                    _LOGGER.info(f"Detected device by product_id: {device_key} ({product_id})")
-                    return (device_key, product_id)
-
-    # Method 2: Match by device_id pattern
+        device_key = find_device_key_by_product_name(product_id)
+        if device_key:
+            _LOGGER.info(f"Detected device by product_id: {device_key} ({product_id})")
+            return (device_key, product_id)
+
+    # Method 2: Match by device_id (exact or pattern)
     if device_id:
-        device_info = find_device_by_device_id(device_id)
-        if device_info:
-            for device_key, info in KNOWN_DEVICES.items():
-                device_ids = info.get("device_ids", [])
-                product_names = info.get("product_names", [])
-                # Check exact match
-                if isinstance(device_ids, list) and device_id in device_ids:
-                    product_name = (
-                        str(product_names[0]) if isinstance(product_names, list) and product_names else device_key
-                    )
-                    _LOGGER.info(f"Detected device by device_id: {device_key} ({device_id[:12]}...)")
-                    return (device_key, product_name)
-                # Check pattern match
-                patterns = info.get("device_id_patterns", [])
-                if isinstance(patterns, list):
-                    for pattern in patterns:
-                        if isinstance(pattern, str) and device_id.startswith(pattern):
-                            product_name = (
-                                str(product_names[0])
-                                if isinstance(product_names, list) and product_names
-                                else device_key
-                            )
-                            _LOGGER.info(f"Detected device by device_id pattern: {device_key} ({pattern}*)")
-                            return (device_key, product_name)
+        device_key = find_device_key_by_device_id(device_id)
+        if device_key:
+            product_names = KNOWN_DEVICES[device_key].get("product_names", [])
+            product_name = str(product_names[0]) if isinstance(product_names, list) and product_names else device_key
+            _LOGGER.info(f"Detected device by device_id: {device_key} ({device_id[:12]}...)")
+            return (device_key, product_name)
 
     # Method 3: Category-based detection
     search_text = f"{api_product_name} {device_name}".lower()
@@ -129,34 +109,22 @@ def detect_device_type_from_device_id(device_id: str) -> tuple[str, str, str]:
         - friendly_name: Human-readable device name
     """
     from ..device_types import KNOWN_DEVICES
+    from ..device_types import find_device_key_by_device_id
 
     if not device_id:
         return ("auto", "auto", "KKT Kolbe Device")
 
     _LOGGER.debug(f"Detecting device type from device_id: {device_id[:12]}...")
 
-    # Check each known device for matches
-    for device_key, info in KNOWN_DEVICES.items():
-        device_ids = info.get("device_ids", [])
+    # Exact device_id or device_id pattern match
+    device_key = find_device_key_by_device_id(device_id)
+    if device_key:
+        info = KNOWN_DEVICES[device_key]
         product_names = info.get("product_names", [])
         friendly_name = str(info.get("name", device_key))
-
-        # Check exact device_id match
-        if isinstance(device_ids, list) and device_id in device_ids:
-            product_name = str(product_names[0]) if isinstance(product_names, list) and product_names else device_key
-            _LOGGER.info(f"Detected device by exact device_id: {device_key} -> {friendly_name}")
-            return (device_key, product_name, friendly_name)
-
-        # Check device_id pattern match
-        patterns = info.get("device_id_patterns", [])
-        if isinstance(patterns, list):
-            for pattern in patterns:
-                if isinstance(pattern, str) and device_id.startswith(pattern):
-                    product_name = (
-                        str(product_names[0]) if isinstance(product_names, list) and product_names else device_key
-                    )
-                    _LOGGER.info(f"Detected device by pattern {pattern}*: {device_key} -> {friendly_name}")
-                    return (device_key, product_name, friendly_name)
+        product_name = str(product_names[0]) if isinstance(product_names, list) and product_names else device_key
+        _LOGGER.info(f"Detected device by device_id: {device_key} -> {friendly_name}")
+        return (device_key, product_name, friendly_name)
 
     # No match found
     _LOGGER.debug(f"No device_id pattern matched for {device_id[:12]}, using defaults")
@@ -227,6 +195,7 @@ def detect_device_type_from_product_key(product_key: str, device_id: str = "") -
         Tuple of (device_type, friendly_name)
     """
     from ..device_types import KNOWN_DEVICES
+    from ..device_types import find_device_key_by_product_name
 
     if not product_key:
         # Try device_id fallback
@@ -238,12 +207,11 @@ def detect_device_type_from_product_key(product_key: str, device_id: str = "") -
     _LOGGER.debug(f"Detecting device type from product_key: {product_key}")
 
     # Check if product_key matches any known device's product_names
-    for device_key, info in KNOWN_DEVICES.items():
-        product_names = info.get("product_names", [])
-        if isinstance(product_names, list) and product_key in product_names:
-            friendly_name = str(info.get("name", device_key))
-            _LOGGER.info(f"Detected device by product_key: {product_key} -> {friendly_name}")
-            return (device_key, friendly_name)
+    device_key = find_device_key_by_product_name(product_key)
+    if device_key:
+        friendly_name = str(KNOWN_DEVICES[device_key].get("name", device_key))
+        _LOGGER.info(f"Detected device by product_key: {product_key} -> {friendly_name}")
+        return (device_key, friendly_name)
 
     # Try keyword-based detection from product_key
     product_lower = product_key.lower()
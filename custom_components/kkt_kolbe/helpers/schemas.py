@@ -471,6 +471,7 @@ def get_options_schema(
     current_client_id: str = "",
     current_endpoint: str = DEFAULT_API_ENDPOINT,
     current_fan_suppress: bool = False,
+    current_async_transport: bool = False,
 ) -> vol.Schema:
     """Get schema for options flow.
 
@@ -507,6 +508,7 @@ def get_options_schema(
                 }
             ),
             vol.Optional("disable_fan_auto_start", default=current_fan_suppress): bool,
+            vol.Optional("enable_async_transport", default=current_async_transport): bool,
             vol.Optional("test_connection", default=True): bool,
         }
     )
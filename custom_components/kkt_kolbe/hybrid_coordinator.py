@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Mapping
 from datetime import datetime
 from datetime import timedelta
 from typing import TYPE_CHECKING
@@ -19,15 +20,27 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
+from .activity import ActivityCadence
+from .activity import DeviceActivity
 from .api import TuyaAPIError
 from .api import TuyaCloudClient
 from .api import TuyaDeviceNotFoundError
 from .api import TuyaRateLimitError
+from .command_queue import ZoneWriteQueue
+from .const import CLOUD_PROPAGATION_DELAY_SECONDS
+from .const import WRITE_CONFIRM_TIMEOUT_SECONDS
+from .dp_codec import DPCodec
+from .dp_dispatch import DPDispatchMixin
+from .dp_index import GENERIC_DP_MAPPING
+from .dp_index import DPIndex
+from .dps_snapshot import DPSChangeTracker
 from .exceptions import KKTAuthenticationError
 from .exceptions import KKTConnectionError
 from .exceptions import KKTRateLimitError
 from .exceptions import KKTTimeoutError
+from .poll_scheduler import AdaptivePollScheduler
 from .tuya_device import KKTKolbeTuyaDevice
+from .write_tracker import WriteTracker
 
 if TYPE_CHECKING:
     from .clients.tuya_sharing_client import TuyaSharingClient
@@ -70,7 +83,7 @@ def _decode_tuya_error_code(raw_error: str) -> str | None:
     return _TUYA_ERROR_CODES.get(match.group(1))
 
 
-class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
+class KKTKolbeHybridCoordinator(DPDispatchMixin, DataUpdateCoordinator):
     """Hybrid coordinator supporting both local and API communication."""
 
     def __init__(
@@ -132,6 +145,22 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
         # Tuya devices often send delta/partial updates (only changed DPs)
         # This cache accumulates all DPs seen so far
         self._dps_cache: dict[str, Any] = {}
+        # Read-only snapshot of _dps_cache published to entities + last change set
+        self._dps_changes = DPSChangeTracker()
+        # Coalesces zone bitfield writes into multi-DP commands
+        self.write_queue = ZoneWriteQueue(hass, self)
+        # Refresh scheduled after writes unless a push confirms them first
+        # (see _async_refresh_after_write)
+        self._pending_refresh_handle: asyncio.TimerHandle | None = None
+        self._write_tracker = WriteTracker()
+        # Stretches update_interval while pushes arrive (see poll_scheduler.py)
+        self._poll_scheduler = AdaptivePollScheduler(update_interval)
+        # Fast/normal/slow base interval from the device activity (see activity.py)
+        self._cadence = ActivityCadence(self, self._get_known_dp_mapping(), update_interval)
+
+        # DP <-> code index for cloud status translation (see _get_dp_index)
+        self._dp_index: DPIndex | None = None
+        self._dp_index_live_codes: dict[int, str] = {}
 
         # MQTT push state — see docs/superpowers/specs/2026-05-04-mqtt-push-listener-design.md
         self.last_update_was_push: bool = False
@@ -154,6 +183,21 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
         """Return the timestamp of the last successful update."""
         return self._last_update_success_time
 
+    @property
+    def changed_dps(self) -> frozenset[str]:
+        """Return the DP ids whose value changed in the most recent update."""
+        return self._dps_changes.changed
+
+    @property
+    def polling_stats(self) -> dict[str, Any]:
+        """Return push/poll rates and the effective poll interval for diagnostics."""
+        return {**self._poll_scheduler.stats, "activity": self._cadence.activity.value}
+
+    @property
+    def dps_version(self) -> int:
+        """Return the version of the currently published DPS snapshot."""
+        return self._dps_changes.version
+
     @property
     def smartlife_device_online(self) -> bool | None:
         """Return ``device.online`` from the SmartLife SDK cache.
@@ -199,13 +243,34 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
         This callback is synchronous — never await or block here. To trigger
         async work, use self.hass.async_create_task(...).
         """
+        self._apply_push(updated_dps, report_type, "smartlife_push")
+
+    @callback
+    def _handle_local_push_update(self, updated_dps: dict[str, Any], _origin: str) -> None:
+        """Handle an unsolicited status frame from the asyncio local transport.
+
+        Called by KKTKolbeTuyaDevice._handle_local_push on the HA event loop.
+        A frame the device sends on its own is a real device report, so it is
+        fanned out with report_type "report" and releases optimistic locks
+        exactly like an MQTT report.
+        """
+        self._apply_push(updated_dps, "report", "local_push")
+
+    @callback
+    def _apply_push(self, updated_dps: dict[str, Any], report_type: str, source: str) -> None:
+        """Merge pushed DPs into the cache and fan out as a push-originated update."""
         self._dps_cache.update({str(k): v for k, v in updated_dps.items()})
+        self._confirm_writes(updated_dps)
 
         new_data = {
-            "dps": dict(self._dps_cache),
-            "source": "smartlife_push",
+            "dps": self._dps_changes.publish(self._dps_cache),
+            "changed_dps": self._dps_changes.changed,
+            "source": source,
             "timestamp": datetime.now().isoformat(),
         }
+        # Set before fan-out: async_set_updated_data reschedules the next poll
+        self._poll_scheduler.record_push()
+        self._update_poll_interval()
         self.last_update_was_push = True
         self.last_push_report_type = report_type
         try:
@@ -233,6 +298,8 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
         so HA would never invoke it in production — see commit history for
         the v4.7 critical-bug fix.
         """
+        if self.local_device is not None and hasattr(self.local_device, "register_push_callback"):
+            self.local_device.register_push_callback(self._handle_local_push_update)
         if self.smartlife_client is None or self._push_callback_registered:
             return
         self.smartlife_client.register_push_callback(self.device_id, self._handle_push_update)
@@ -254,10 +321,7 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
         if not live_codes:
             return
 
-        expected_dps = await self._get_dp_mapping()
-        if not expected_dps:
-            return
-
+        expected_dps = self._get_dp_index().dp_to_code
         local_only_dps = [dp for dp in expected_dps if dp not in live_codes]
         if not local_only_dps:
             _LOGGER.debug("Device %s: cloud-spec covers all expected DPs", self.device_id[:8])
@@ -295,14 +359,35 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("Failed to create local-only-dp repair issue: %s", err)
 
     async def async_shutdown(self) -> None:
-        """Unregister the push callback before tearing down the coordinator."""
+        """Unregister the push callbacks before tearing down the coordinator."""
+        self.write_queue.async_cancel()
+        if self._pending_refresh_handle is not None:
+            self._pending_refresh_handle.cancel()
+            self._pending_refresh_handle = None
+        if self.local_device is not None and hasattr(self.local_device, "unregister_push_callback"):
+            self.local_device.unregister_push_callback(self._handle_local_push_update)
         if self._push_callback_registered and self.smartlife_client is not None:
             self.smartlife_client.unregister_push_callback(self.device_id, self._handle_push_update)
             self._push_callback_registered = False
         await super().async_shutdown()
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Update data using hybrid approach."""
+        """Update data and adapt the poll interval to push health and activity."""
+        data = await self._async_fetch_data()
+        if data is not self.data and data.get("source") not in ("pending", "failed"):
+            # Changes found by a poll are changes the pushes did not deliver
+            self._poll_scheduler.record_poll(bool(data.get("changed_dps")))
+        self._update_poll_interval()
+        return data
+
+    def _update_poll_interval(self) -> None:
+        """Set update_interval from the device activity and the push health."""
+        base_interval = self._cadence.interval(self._dps_cache)
+        active = self._cadence.activity in (DeviceActivity.BURST, DeviceActivity.ACTIVE)
+        self.update_interval = self._poll_scheduler.update(active, base_interval)
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch data using hybrid approach."""
         # Before background connect completes, return empty data immediately
         if not self._initial_connect_done and not self._dps_cache:
             _LOGGER.debug("Device %s: awaiting background connection, skipping update", self.device_id[:8])
@@ -445,6 +530,7 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
             # This ensures we keep all DPs seen across multiple updates
             partial_count = len(partial_status)
             self._dps_cache.update(partial_status)
+            self._confirm_writes(partial_status)
 
             # Log if we're merging partial updates
             if partial_count < len(self._dps_cache):
@@ -460,7 +546,8 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
             return {
                 "source": "local",
                 "timestamp": asyncio.get_running_loop().time(),
-                "dps": self._dps_cache.copy(),
+                "dps": self._dps_changes.publish(self._dps_cache),
+                "changed_dps": self._dps_changes.changed,
                 "available": True,
             }
 
@@ -484,24 +571,8 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
             # Get device status from API
             status_list = await self.api_client.get_device_status(self.device_id)
 
-            # Convert API status format to DPS format
-            api_dps: dict[str, Any] = {}
-            for status_item in status_list:
-                if not isinstance(status_item, dict):
-                    continue
-                code = status_item.get("code")
-                value = status_item.get("value")
-
-                # We need to map property codes back to DP numbers
-                # This would ideally use the device configuration
-                if code and value is not None:
-                    # For now, use a simple mapping - this should be enhanced
-                    # with proper DP mapping from device configuration
-                    dp_mapping = await self._get_dp_mapping()
-                    for dp_id, dp_code in dp_mapping.items():
-                        if dp_code == code:
-                            api_dps[str(dp_id)] = value
-                            break
+            # Convert API status format to DPS format (single pass over the index)
+            api_dps = self._get_dp_index().translate_status(status_list)
 
             # Merge API data into cache as well
             if api_dps:
@@ -510,7 +581,8 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
             return {
                 "source": "api",
                 "timestamp": asyncio.get_running_loop().time(),
-                "dps": self._dps_cache.copy(),
+                "dps": self._dps_changes.publish(self._dps_cache),
+                "changed_dps": self._dps_changes.changed,
                 "available": True,
                 "raw_api_status": status_list,
             }
@@ -552,19 +624,8 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
                         type(item.get("value")).__name__,
                     )
 
-            for status_item in status_list:
-                if not isinstance(status_item, dict):
-                    continue
-                code = status_item.get("code")
-                value = status_item.get("value")
-
-                if code and value is not None:
-                    # Map property codes back to DP numbers
-                    dp_mapping = await self._get_dp_mapping()
-                    for dp_id, dp_code in dp_mapping.items():
-                        if dp_code == code:
-                            smartlife_dps[str(dp_id)] = value
-                            break
+            # Map property codes back to DP numbers
+            smartlife_dps.update(self._get_dp_index().translate_status(status_list))
 
             # Merge SmartLife data into cache
             if smartlife_dps:
@@ -575,9 +636,14 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
             return {
                 "source": "smartlife",
                 "timestamp": asyncio.get_running_loop().time(),
-                "dps": self._dps_cache.copy(),
+                "dps": self._dps_changes.publish(self._dps_cache),
+                "changed_dps": self._dps_changes.changed,
                 "available": True,
                 "raw_smartlife_status": status_list,
+                # Age/staleness of the shared account snapshot this read came from
+                "smartlife_snapshot": self.smartlife_client.get_device_snapshot_info(self.device_id)
+                if hasattr(self.smartlife_client, "get_device_snapshot_info")
+                else None,
             }
 
         except Exception as err:
@@ -654,12 +720,8 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
 
         return merged_data
 
-    async def _get_dp_mapping(self) -> dict[int, str]:
-        """Get DP to property code mapping for the device.
-
-        Tries to load mapping from device_types.py based on device_type,
-        falls back to a generic mapping if not found.
-        """
+    def _get_known_dp_mapping(self) -> Mapping[int, str]:
+        """Return the hardcoded DP mapping from device_types.py (generic fallback if unknown)."""
         # Try to get device-specific mapping from device_types
         if self.device_type:
             from .device_types import KNOWN_DEVICES
@@ -667,42 +729,39 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
             device_config = KNOWN_DEVICES.get(self.device_type, {})
             data_points = device_config.get("data_points", {})
             if data_points:
-                _LOGGER.debug(f"Using device-specific DP mapping for {self.device_type}")
                 return data_points
 
         # Fallback to generic mapping for common KKT Kolbe devices
-        _LOGGER.debug("Using generic DP mapping (no device-specific config found)")
-        return {
-            # Hood DPs
-            1: "switch",
-            4: "light",
-            6: "switch_lamp",
-            7: "switch_wash",
-            10: "fan_speed_enum",
-            13: "countdown",
-            101: "RGB",
-            102: "fan_speed",
-            103: "day",
-            104: "switch_led_1",
-            105: "countdown_1",
-            106: "switch_led",
-            107: "colour_data",
-            108: "work_mode",
-            109: "day_1",
-            # Cooktop DPs (IND7705HC)
-            134: "general_timer",
-            145: "child_lock",
-            155: "power_limit",
-            161: "zone_power_bitfield",
-            162: "zone_levels_bitfield",
-            163: "zone_boost_bitfield",
-            164: "zone_keep_warm_bitfield",
-            165: "zone_timer_bitfield",
-            166: "zone_temp_bitfield",
-            167: "zone_timer_remaining",
-            168: "zone_target_temp",
-            169: "zone_current_temp",
-        }
+        return GENERIC_DP_MAPPING
+
+    def _get_dp_index(self) -> DPIndex:
+        """Return the DP ↔ code index, rebuilding it only when the live spec changed.
+
+        The live SmartLife spec (``device.local_strategy``) only changes when
+        the SDK device cache is refreshed with a different spec, so the cheap
+        ``get_device_codes()`` result is compared against the one the index
+        was built from.
+        """
+        live_codes: dict[int, str] = {}
+        if self.smartlife_client is not None and hasattr(self.smartlife_client, "get_device_codes"):
+            live_codes = self.smartlife_client.get_device_codes(self.device_id)
+
+        if self._dp_index is None or live_codes != self._dp_index_live_codes:
+            live_types: dict[int, str] = {}
+            live_codecs: dict[int, DPCodec] = {}
+            if live_codes and hasattr(self.smartlife_client, "get_device_dp_types"):
+                live_types = self.smartlife_client.get_device_dp_types(self.device_id)
+            if live_codes and hasattr(self.smartlife_client, "get_device_dp_codecs"):
+                live_codecs = self.smartlife_client.get_device_dp_codecs(self.device_id)
+            self._dp_index = DPIndex.build(self._get_known_dp_mapping(), live_codes, live_types, live_codecs)
+            self._dp_index_live_codes = live_codes
+            _LOGGER.debug(
+                "Built DP index for %s: %d codes (%d from live spec)",
+                self.device_id[:8],
+                len(self._dp_index.code_to_dp),
+                len(live_codes),
+            )
+        return self._dp_index
 
     async def async_set_data_point(self, dp: int, value: Any) -> None:
         """Set a data point on the device (compatibility wrapper for async_send_command)."""
@@ -710,42 +769,118 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
         if not success:
             raise HomeAssistantError(f"Failed to set DP {dp} to {value} — {reason}")
 
+    async def async_set_data_points(self, dps: dict[int, Any]) -> None:
+        """Set several data points with one local multi-DP frame or one cloud command list.
+
+        Multi-step actions (scenes, light work mode, zone batches) use this
+        instead of N ``async_set_data_point`` calls; the result is read back
+        with one refresh after ``CLOUD_PROPAGATION_DELAY_SECONDS`` instead of
+        a poll per DP.
+        """
+        success, reason = await self._async_send_commands_with_reason(dps, deferred_refresh=True)
+        if not success:
+            raise HomeAssistantError(f"Failed to set DPs {dps} — {reason}")
+
+    @property
+    def _push_confirms_writes(self) -> bool:
+        """Return True if written values are reported back without polling."""
+        if self._push_callback_registered:
+            return True
+        # `is True`: mocked local devices must not count as push-capable
+        return getattr(self.local_device, "pushes_status", False) is True
+
+    async def _async_refresh_after_write(self, dps: dict[int, Any], deferred: bool) -> None:
+        """Poll for written values unless a push or status frame confirms them first.
+
+        Batched writes wait ``CLOUD_PROPAGATION_DELAY_SECONDS``, single writes
+        ``WRITE_CONFIRM_TIMEOUT_SECONDS`` when a push source is available.
+        Without one, single writes refresh immediately and polling switches
+        to the burst cadence (see activity.py). Timers don't pile up.
+        """
+        if not self._push_confirms_writes:
+            # Nothing reports the command's consequences: poll faster for a while
+            self._cadence.note_command()
+            self._update_poll_interval()
+            if not deferred:
+                await self.async_request_refresh()
+                return
+
+        self._write_tracker.expect(dps)
+        if self._pending_refresh_handle is not None:
+            self._pending_refresh_handle.cancel()
+
+        def _trigger_refresh() -> None:
+            self._pending_refresh_handle = None
+            self._write_tracker.expire()
+            self.hass.async_create_task(self.async_request_refresh())
+
+        delay = CLOUD_PROPAGATION_DELAY_SECONDS if deferred else WRITE_CONFIRM_TIMEOUT_SECONDS
+        self._pending_refresh_handle = self.hass.loop.call_later(delay, _trigger_refresh)
+
+    @callback
+    def _confirm_writes(self, reported: Mapping[str, Any]) -> None:
+        """Cancel the pending refresh once a report confirmed every written value."""
+        if self._write_tracker.confirm(reported) and self._pending_refresh_handle is not None:
+            self._pending_refresh_handle.cancel()
+            self._pending_refresh_handle = None
+            _LOGGER.debug("Device %s confirmed the write, skipping refresh", self.device_id[:8])
+
     async def _async_send_command_with_reason(self, dp_id: int, value: Any) -> tuple[bool, str]:
         """Send command and return (success, reason). Wrapper around async_send_command
         that captures the underlying failure reason for error messages."""
+        return await self._async_send_commands_with_reason({dp_id: value})
+
+    async def _async_send_commands_with_reason(
+        self, dps: dict[int, Any], deferred_refresh: bool = False
+    ) -> tuple[bool, str]:
+        """Send one or more DPs in a single command and return (success, reason).
+
+        Same local → API → SmartLife fallback as ``async_send_command``; all
+        DPs go out together on whichever path succeeds first.
+        """
         # We re-implement the dispatch here so we can capture the actual error message.
         # See async_send_command for the original behavior.
-        _LOGGER.debug(f"Sending command to DP {dp_id}: {value}")
+        dp_label = ", ".join(str(dp) for dp in dps)
+        _LOGGER.debug(f"Sending command to DP {dp_label}: {dps}")
         last_error: str = "no communication method available"
 
         if self.local_available and self.local_device and (self.prefer_local or self.current_mode == "local"):
             try:
-                result = await self.local_device.async_set_dp(dp_id, value)
+                if len(dps) == 1:
+                    ((dp_id, value),) = dps.items()
+                    result = await self.local_device.async_set_dp(dp_id, value)
+                else:
+                    result = await self.local_device.async_set_dps(dps)
                 if result:
-                    await self.async_request_refresh()
+                    await self._async_refresh_after_write(dps, deferred_refresh)
                     return True, "local"
                 last_error = "local: device returned failure"
             except Exception as err:
                 last_error = f"local: {err}"
-                _LOGGER.warning("Local command failed for DP %d: %s", dp_id, err)
+                _LOGGER.warning("Local command failed for DP %s: %s", dp_label, err)
+
+        if (self.api_available and self.api_client) or (self.smartlife_available and self.smartlife_client):
+            # Cloud backends validate values against the spec; encode them with its codecs
+            dps = self._get_dp_index().encode_dps(dps)
 
         if self.api_available and self.api_client:
             try:
-                dp_mapping = await self._get_dp_mapping()
-                property_code = dp_mapping.get(dp_id)
-                if property_code:
-                    commands = [{"code": property_code, "value": value}]
+                dp_mapping = self._get_dp_index().dp_to_code
+                commands = [{"code": dp_mapping[dp], "value": value} for dp, value in dps.items() if dp in dp_mapping]
+                unmapped = {str(dp): value for dp, value in dps.items() if dp not in dp_mapping}
+                result = True
+                if commands:
                     result = await self.api_client.send_commands(self.device_id, commands)
-                else:
-                    result = await self.api_client.send_dp_commands(self.device_id, {str(dp_id): value})
+                if result and unmapped:
+                    result = await self.api_client.send_dp_commands(self.device_id, unmapped)
                 if result:
-                    await self.async_request_refresh()
+                    await self._async_refresh_after_write(dps, deferred_refresh)
                     return True, "api"
-                last_error = f"api: command returned failure for DP {dp_id}"
+                last_error = f"api: command returned failure for DP {dp_label}"
                 _LOGGER.warning(last_error)
             except Exception as err:
                 last_error = f"api: {err}"
-                _LOGGER.warning("API command failed for DP %d: %s", dp_id, err)
+                _LOGGER.warning("API command failed for DP %s: %s", dp_label, err)
 
         if self.smartlife_available and self.smartlife_client:
             # Cloud-spec gate: KKT hoods expose RGB / brightness / scene_data
@@ -755,20 +890,21 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
             # a clear "set local IP" message instead. (Confirmed pattern from
             # Issue #5 + Issue #2 + APK reverse engineering. See memory file
             # project_kkt_rgb_local_only.md for the full history.)
-            if self._is_dp_local_only(dp_id):
-                last_error = self._format_local_only_dp_message(dp_id)
+            local_only = [dp for dp in dps if self._is_dp_local_only(dp)]
+            if local_only:
+                last_error = self._format_local_only_dp_message(local_only[0])
                 _LOGGER.warning(
                     "DP %d is local-only on this device — skipping SmartLife (would fail with 2008)",
-                    dp_id,
+                    local_only[0],
                 )
             else:
-                success, smartlife_error = await self._async_send_via_smartlife(dp_id, value)
+                success, smartlife_error = await self._async_send_via_smartlife(dps)
                 if success:
-                    await self.async_request_refresh()
+                    await self._async_refresh_after_write(dps, deferred_refresh)
                     return True, "smartlife"
                 last_error = smartlife_error
 
-        _LOGGER.error("All command sending methods failed for DP %d = %s (%s)", dp_id, value, last_error)
+        _LOGGER.error("All command sending methods failed for DP %s = %s (%s)", dp_label, dps, last_error)
         return False, last_error
 
     def _is_dp_local_only(self, dp_id: int) -> bool:
@@ -812,12 +948,13 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
         success, _ = await self._async_send_command_with_reason(dp_id, value)
         return success
 
-    async def _async_send_via_smartlife(self, dp_id: int, value: Any) -> tuple[bool, str]:
+    async def _async_send_via_smartlife(self, dps: dict[int, Any]) -> tuple[bool, str]:
         """Send a command via SmartLife.
 
         Builds commands using live ``device.local_strategy[dp].status_code``
         (cloud's ground truth), falling back to the hardcoded mapping in
-        ``device_types.py`` if the live spec is unavailable.
+        ``device_types.py`` if the live spec is unavailable. Several DPs go
+        out as one ``send_commands`` list.
 
         We do NOT auto-refresh the SDK device cache on failure: the SDK's
         ``Manager.update_device_cache()`` clears ``device_map`` before
@@ -835,33 +972,44 @@ class KKTKolbeHybridCoordinator(DataUpdateCoordinator):
         Returns ``(success, error_reason)``.
         """
         live_codes: dict[int, str] = {}
-        property_code: str | None = None
+        property_codes: dict[int, str] = {}
+        dp_label = ", ".join(str(dp) for dp in dps)
         try:
             if hasattr(self.smartlife_client, "get_device_codes"):
                 live_codes = self.smartlife_client.get_device_codes(self.device_id)
-            property_code = live_codes.get(dp_id)
-            if not property_code:
-                dp_mapping = await self._get_dp_mapping()
+            # Live codes where the SDK has them, hardcoded ones otherwise
+            dp_mapping = self._get_dp_index().dp_to_code
+            for dp_id in dps:
                 property_code = dp_mapping.get(dp_id)
-                if property_code:
+                if property_code and dp_id not in live_codes:
                     _LOGGER.debug(
                         "Falling back to hardcoded code %s for DP %d (live mapping missing)",
                         property_code,
                         dp_id,
                     )
-            if property_code:
-                commands = [{"code": property_code, "value": value}]
+                if property_code:
+                    property_codes[dp_id] = property_code
+
+            commands = [
+                {"code": property_codes[dp], "value": value} for dp, value in dps.items() if dp in property_codes
+            ]
+            unmapped = {str(dp): value for dp, value in dps.items() if dp not in property_codes}
+            result = True
+            if commands:
                 result = await self.smartlife_client.async_send_commands(self.device_id, commands)
-            else:
-                result = await self.smartlife_client.async_send_dp_commands(self.device_id, {str(dp_id): value})
+            if result and unmapped:
+                result = await self.smartlife_client.async_send_dp_commands(self.device_id, unmapped)
             if result:
                 return True, "smartlife"
-            last_error = f"smartlife: command returned failure for DP {dp_id}"
+            last_error = f"smartlife: command returned failure for DP {dp_label}"
             _LOGGER.warning(last_error)
             return False, last_error
         except Exception as err:
-            last_error = self._format_smartlife_error(err, dp_id, property_code, live_codes)
-            _LOGGER.warning("SmartLife command failed for DP %d: %s", dp_id, last_error)
+            # Report the first DP whose code the device doesn't advertise, if any
+            known = set(live_codes.values())
+            dp_id = next((dp for dp in dps if property_codes.get(dp) not in known), next(iter(dps)))
+            last_error = self._format_smartlife_error(err, dp_id, property_codes.get(dp_id), live_codes)
+            _LOGGER.warning("SmartLife command failed for DP %s: %s", dp_label, last_error)
             return False, last_error
 
     @staticmethod
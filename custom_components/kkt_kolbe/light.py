@@ -35,6 +35,8 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .base_entity import KKTBaseEntity
 from .device_types import get_device_entities
+from .dp_codec import compile_enum_codec
+from .dp_codec import compile_value_codec
 
 if TYPE_CHECKING:
     from .data import KKTKolbeConfigEntry
@@ -111,6 +113,15 @@ class KKTKolbeLight(KKTBaseEntity, LightEntity):
         # Offset for numeric effects (e.g., 1 if device uses 0=off, 1=first effect)
         self._effect_offset = light_config.get("effect_offset", 0)
 
+        # Brightness scaling and effect ↔ device value tables, shared per configuration
+        self._brightness_codec = compile_value_codec(0, self._max_brightness)
+        self._effect_codec = compile_enum_codec(
+            self._effect_list,
+            {effect: idx + self._effect_offset for idx, effect in enumerate(self._effect_list)}
+            if self._effect_numeric
+            else None,
+        )
+
         # Auto-Work-Mode configuration (for devices that need work_mode set before light works)
         self._work_mode_dp = light_config.get("work_mode_dp")
         self._work_mode_default = light_config.get("work_mode_default", "white")
@@ -181,7 +192,7 @@ class KKTKolbeLight(KKTBaseEntity, LightEntity):
             return True
         return False
 
-    async def _async_ensure_work_mode(self) -> None:
+    async def _async_ensure_work_mode(self, extra_dps: dict[int, Any] | None = None) -> None:
         """Ensure work_mode is set to default before turning on light.
 
         For devices like SOLO HCM, the work_mode (e.g., DP 108) must be set
@@ -190,25 +201,33 @@ class KKTKolbeLight(KKTBaseEntity, LightEntity):
 
         Auto-Work-Mode Feature: Automatically sets work_mode to default
         (typically "white") when turning on the light.
+
+        Args:
+            extra_dps: Other pre-light writes (fan auto-start suppression) to
+                send in the same command as the work_mode
         """
-        if not self._work_mode_dp:
-            return
+        dps = dict(extra_dps or {})
 
         # Check current work_mode
         current_mode = None
-        if self.coordinator.data:
+        if self._work_mode_dp and self.coordinator.data:
             dps_data = self.coordinator.data.get("dps", self.coordinator.data)
             current_mode = dps_data.get(str(self._work_mode_dp))
 
         # Only set if not already set to a valid mode
-        if current_mode is None or current_mode == "":
+        set_work_mode = bool(self._work_mode_dp) and (current_mode is None or current_mode == "")
+        if set_work_mode:
             _LOGGER.info(
                 "KKTKolbeLight [%s]: Setting work_mode (DP %d) to '%s' before turning on light",
                 self._name,
                 self._work_mode_dp,
                 self._work_mode_default,
             )
-            await self._async_set_data_point(self._work_mode_dp, self._work_mode_default)
+            dps[self._work_mode_dp] = self._work_mode_default
+
+        if dps:
+            await self._async_set_data_points(dps)
+        if set_work_mode:
             # Wait for work_mode to be applied before setting light
             await asyncio.sleep(WORK_MODE_DELAY)
 
@@ -246,7 +265,7 @@ class KKTKolbeLight(KKTBaseEntity, LightEntity):
             brightness_value = dps_data.get(str(self._brightness_dp))
             if brightness_value is not None:
                 # Scale from device range to 0-255
-                return int((brightness_value / self._max_brightness) * 255)
+                return self._brightness_codec.to_scale(brightness_value, 255)
         return None
 
     @property
@@ -266,20 +285,18 @@ class KKTKolbeLight(KKTBaseEntity, LightEntity):
             dps_data = self.coordinator.data.get("dps", self.coordinator.data)
             effect_value = dps_data.get(str(self._effect_dp))
             if effect_value is not None:
-                if self._effect_numeric:
-                    # Numeric mode: value is index (with offset)
-                    try:
-                        idx = int(effect_value) - self._effect_offset
-                        if 0 <= idx < len(self._effect_list):
-                            return self._effect_list[idx]
-                    except (ValueError, TypeError):
-                        pass
-                else:
-                    # String mode: value is effect name
-                    if str(effect_value) in self._effect_list:
-                        return str(effect_value)
+                # Numeric mode: value is index (with offset); string mode: value is effect name
+                try:
+                    return self._effect_codec.decode(int(effect_value) if self._effect_numeric else str(effect_value))
+                except (ValueError, TypeError):
+                    pass
         return None
 
+    def _subscribed_dps(self) -> tuple[int, ...]:
+        """Return the light DP, hood power DP and configured brightness/effect/work mode DPs."""
+        extra_dps = (self._brightness_dp, self._effect_dp, self._work_mode_dp)
+        return (self._dp, HOOD_POWER_DP, *(dp for dp in extra_dps if dp is not None))
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -308,30 +325,34 @@ class KKTKolbeLight(KKTBaseEntity, LightEntity):
             )
             hood_was_off = False
 
-        # Suppress fan auto-start if hood was just turned on
-        if hood_was_off:
-            await self._async_suppress_fan_auto_start()
-
-        # Ensure work_mode is set (Auto-Work-Mode feature for SOLO HCM etc.)
-        await self._async_ensure_work_mode()
+        # Suppress fan auto-start if hood was just turned on; sent together
+        # with the work_mode (Auto-Work-Mode feature for SOLO HCM etc.)
+        suppression = self._fan_auto_start_suppression() if hood_was_off else None
+        await self._async_ensure_work_mode(dict([suppression]) if suppression else None)
 
         # Turn on the light FIRST (required before setting effect/brightness)
         await self._async_set_data_point(self._dp_id, True)
         self._log_entity_state("Turn On", f"DP {self._dp_id} set to True")
 
-        # Handle effect AFTER light is on
+        # Effect and brightness AFTER light is on, in one command
+        after_on: dict[int, Any] = {}
         if ATTR_EFFECT in kwargs and self._effect_dp:
             effect = kwargs[ATTR_EFFECT]
-            await self._set_effect(effect)
+            effect_value = self._effect_value(effect)
+            if effect_value is not None:
+                after_on[self._effect_dp] = effect_value
+                self._log_entity_state("Set Effect", f"Effect: {effect} (value {effect_value})")
 
-        # Handle brightness AFTER light is on
         if ATTR_BRIGHTNESS in kwargs and self._brightness_dp:
             brightness = kwargs[ATTR_BRIGHTNESS]
             # Scale from 0-255 to device range
-            device_brightness = int((brightness / 255) * self._max_brightness)
-            await self._async_set_data_point(self._brightness_dp, device_brightness)
+            device_brightness = self._brightness_codec.from_scale(brightness, 255)
+            after_on[self._brightness_dp] = device_brightness
             self._log_entity_state("Set Brightness", f"Brightness: {device_brightness}")
 
+        if after_on:
+            await self._async_set_data_points(after_on)
+
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
         await self._async_set_data_point(self._dp_id, False)
@@ -339,15 +360,17 @@ class KKTKolbeLight(KKTBaseEntity, LightEntity):
 
     async def _set_effect(self, effect: str) -> None:
         """Set the light effect."""
-        if not self._effect_dp or effect not in self._effect_list:
+        effect_value = self._effect_value(effect)
+        if effect_value is None:
             return
 
-        if self._effect_numeric:
-            # Numeric mode: send index with offset
-            idx = self._effect_list.index(effect) + self._effect_offset
-            await self._async_set_data_point(self._effect_dp, idx)
-            self._log_entity_state("Set Effect", f"Effect: {effect} (value {idx})")
-        else:
-            # String mode: send effect name
-            await self._async_set_data_point(self._effect_dp, effect)
-            self._log_entity_state("Set Effect", f"Effect: {effect}")
+        await self._async_set_data_point(self._effect_dp, effect_value)
+        self._log_entity_state("Set Effect", f"Effect: {effect} (value {effect_value})")
+
+    def _effect_value(self, effect: str) -> int | str | None:
+        """Return the device value for an effect name (None if unsupported)."""
+        if not self._effect_dp or effect not in self._effect_list:
+            return None
+        # Numeric mode: index with offset; string mode: effect name
+        device_value: int | str = self._effect_codec.encode(effect)
+        return device_value
@@ -18,6 +18,7 @@ from .bitfield_utils import BITFIELD_CONFIG
 from .bitfield_utils import get_zone_value_from_coordinator
 from .bitfield_utils import set_zone_value_in_coordinator
 from .device_types import get_device_entities
+from .dp_codec import compile_value_codec
 
 if TYPE_CHECKING:
     from .data import KKTKolbeConfigEntry
@@ -80,6 +81,10 @@ class KKTKolbeNumber(KKTBaseEntity, NumberEntity):
         self._attr_native_unit_of_measurement = config.get("unit", config.get("unit_of_measurement"))
         self._attr_icon = self._get_icon()
         self._cached_value: float | None = None
+        # Device values are unscaled; the codec is shared by all numbers with the same range
+        self._codec = compile_value_codec(
+            self._attr_native_min_value, self._attr_native_max_value, self._attr_native_step
+        )
 
         # Set display precision based on entity type (HA 2025.1+)
         # Timers, filter days, power levels, fan speeds: no decimals
@@ -118,7 +123,7 @@ class KKTKolbeNumber(KKTBaseEntity, NumberEntity):
     def _update_cached_state(self) -> None:
         """Update the cached state from coordinator data."""
         value = self._get_data_point_value()
-        self._cached_value = float(value) if value is not None else None
+        self._cached_value = self._codec.decode(value) if value is not None else None
 
     @property
     def native_value(self) -> float | None:
@@ -127,12 +132,12 @@ class KKTKolbeNumber(KKTBaseEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the number value."""
-        int_value = int(value)
+        int_value = self._codec.encode(value)
 
         # Optimistic write: lock the DP at int_value so subsequent coordinator
         # polls cannot overwrite us with stale Tuya cloud reads (Issue #6).
         self._set_optimistic(int_value)
-        self._cached_value = float(int_value)
+        self._cached_value = self._codec.decode(int_value)
         if self.hass:
             self.async_write_ha_state()
 
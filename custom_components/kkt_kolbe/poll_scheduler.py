@@ -0,0 +1,111 @@
+"""Push-aware poll interval for the hybrid coordinator.
+
+With the SmartLife MQTT listener (or a pushing local transport) active,
+state changes arrive as pushes, yet the hybrid coordinator kept polling
+every 30s on top of them. ``AdaptivePollScheduler`` stretches the interval
+to a heartbeat while pushes arrive and keeps the base interval when
+
+* no push was seen within ``PUSH_HEALTHY_WINDOW_SECONDS``,
+* a poll found changes the pushes did not deliver (until the next push), or
+* the device is active (cooking, right after a command), where a lost push
+  matters most.
+
+The base interval itself follows the device activity (see activity.py).
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+from .const import PUSH_HEALTHY_WINDOW_SECONDS
+from .const import PUSH_HEARTBEAT_INTERVAL_SECONDS
+
+
+class AdaptivePollScheduler:
+    """Derive the poll interval from push arrivals and device activity."""
+
+    def __init__(
+        self,
+        base_interval: timedelta,
+        heartbeat_interval: timedelta = timedelta(seconds=PUSH_HEARTBEAT_INTERVAL_SECONDS),
+        healthy_window: float = PUSH_HEALTHY_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            base_interval: Interval without (healthy) pushes, or while active
+            heartbeat_interval: Interval while pushes arrive regularly
+            healthy_window: Seconds after the last push that pushes count as healthy
+            clock: Monotonic time source
+        """
+        self.base_interval = base_interval
+        self.heartbeat_interval = max(heartbeat_interval, base_interval)
+        self._window = healthy_window
+        self._clock = clock
+
+        # Arrival times within the window, for the rate diagnostics
+        self._pushes: deque[float] = deque()
+        self._polls: deque[float] = deque()
+        # A poll found changes no push delivered; cleared by the next push
+        self._push_missed = False
+        self._active = False
+        self.interval = base_interval
+
+    def record_push(self) -> None:
+        """Note a push update."""
+        self._pushes.append(self._clock())
+        self._push_missed = False
+
+    def record_poll(self, changed: bool) -> None:
+        """Note a poll; ``changed`` if it returned values the pushes had not."""
+        if changed and self.push_healthy:
+            self._push_missed = True
+        self._polls.append(self._clock())
+
+    @property
+    def push_healthy(self) -> bool:
+        """Return True if a push arrived within the healthy window."""
+        return bool(self._pushes) and self._clock() - self._pushes[-1] <= self._window
+
+    def update(self, active: bool, base_interval: timedelta | None = None) -> timedelta:
+        """Recompute and return the poll interval.
+
+        Args:
+            active: Whether the device is currently doing something
+                (cooking zones on) that warrants the base interval
+            base_interval: Interval to use instead of the heartbeat, if not
+                the one given at construction (activity-dependent cadence)
+        """
+        base = base_interval or self.base_interval
+        self._active = active
+        if active or self._push_missed or not self.push_healthy:
+            self.interval = base
+        else:
+            self.interval = max(self.heartbeat_interval, base)
+        return self.interval
+
+    def _rate(self, arrivals: deque[float]) -> float:
+        """Return arrivals per minute within the window (expired ones are dropped)."""
+        cutoff = self._clock() - self._window
+        while arrivals and arrivals[0] < cutoff:
+            arrivals.popleft()
+        return round(len(arrivals) * 60 / self._window, 2)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return push/poll rates and the effective interval for diagnostics."""
+        last_push = round(self._clock() - self._pushes[-1], 1) if self._pushes else None
+        return {
+            "push_rate_per_min": self._rate(self._pushes),
+            "poll_rate_per_min": self._rate(self._polls),
+            "effective_interval_s": self.interval.total_seconds(),
+            "push_healthy": self.push_healthy,
+            "push_missed_update": self._push_missed,
+            "device_active": self._active,
+            "seconds_since_last_push": last_push,
+        }
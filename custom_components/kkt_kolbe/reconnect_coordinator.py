@@ -450,3 +450,28 @@ class ReconnectCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error(f"Unexpected error setting DP {dp}: {err}")
             raise UpdateFailed(f"Failed to set DP {dp}: {err}") from err
+
+    async def async_set_data_points(self, dps: dict[int, Any]) -> None:
+        """Set several data points with one multi-DP command and a single refresh."""
+        if not self.is_device_available:
+            _LOGGER.warning(
+                f"Cannot set DPs {list(dps)} - device {self.device.device_id[:8]} is {self._device_state.value}"
+            )
+            raise UpdateFailed(f"Device is {self._device_state.value}")
+
+        try:
+            await self.device.async_set_dps(dps)
+            await self.async_request_refresh()
+
+        except (KKTTimeoutError, KKTConnectionError) as err:
+            _LOGGER.error(f"Failed to set DPs {list(dps)}: {err}")
+
+            # Mark offline and start reconnection
+            await self._async_mark_offline()
+            await self._async_start_reconnection()
+
+            raise UpdateFailed(f"Device communication failed: {err}") from err
+
+        except Exception as err:
+            _LOGGER.error(f"Unexpected error setting DPs {list(dps)}: {err}")
+            raise UpdateFailed(f"Failed to set DPs {list(dps)}: {err}") from err
@@ -330,30 +330,40 @@ class DeviceIdChangedRepairFlow(KKTRepairFlow):
                 _LOGGER.warning(f"Parent config entry {parent_entry_id} not found")
                 return None
 
-            # Get SmartLife client from coordinator
-            from .clients.tuya_sharing_client import TuyaSharingClient
-
-            token_info = parent_entry.data.get("smartlife_token_info", {})
-            if not token_info:
-                _LOGGER.warning("No smartlife_token_info in parent entry")
-                return None
+            # Borrow the account's shared SmartLife client (already logged in,
+            # with an open SDK session) before creating a throwaway one
+            from .const import SMARTLIFE_SHARED_CLIENTS_KEY
+
+            client = self.hass.data.get(SMARTLIFE_SHARED_CLIENTS_KEY, {}).get(parent_entry_id)
+            owns_client = client is None
+            if owns_client:
+                from .clients.tuya_sharing_client import TuyaSharingClient
+
+                token_info = parent_entry.data.get("smartlife_token_info", {})
+                if not token_info:
+                    _LOGGER.warning("No smartlife_token_info in parent entry")
+                    return None
 
-            _LOGGER.info(f"Creating TuyaSharingClient to fetch local_key for {device_id}")
+                _LOGGER.info(f"Creating TuyaSharingClient to fetch local_key for {device_id}")
 
-            # Add user_code to token_info if missing (needed for restoration)
-            full_token_info = dict(token_info)
-            if "user_code" not in full_token_info:
-                user_code = parent_entry.data.get("smartlife_user_code")
-                if user_code:
-                    full_token_info["user_code"] = user_code
-                else:
-                    _LOGGER.warning("No user_code available for SmartLife client")
-                    return None
+                # Add user_code to token_info if missing (needed for restoration)
+                full_token_info = dict(token_info)
+                if "user_code" not in full_token_info:
+                    user_code = parent_entry.data.get("smartlife_user_code")
+                    if user_code:
+                        full_token_info["user_code"] = user_code
+                    else:
+                        _LOGGER.warning("No user_code available for SmartLife client")
+                        return None
 
-            client = await TuyaSharingClient.async_from_stored_tokens(self.hass, full_token_info)
+                client = await TuyaSharingClient.async_from_stored_tokens(self.hass, full_token_info)
 
             # Get device info including local_key
-            devices = await client.async_get_devices()
+            try:
+                devices = await client.async_get_devices()
+            finally:
+                if owns_client:
+                    await client.async_close()
 
             # Log all available devices for debugging (TuyaSharingDevice objects)
             device_ids = [d.device_id for d in devices]
@@ -210,6 +210,10 @@ class KKTKolbeHoodScene(KKTBaseEntity, Scene):
         self._light_dp = light_dp
         self._attr_icon = scene_def.get("icon", "mdi:palette")
 
+    def _subscribed_dps(self) -> tuple[int, ...]:
+        """Return no DPs: scene state is the last activation, only availability matters."""
+        return ()
+
     def _is_hood_on(self) -> bool:
         """Check if hood main power (DP 1) is on."""
         value = self._get_data_point_value(1)
@@ -218,50 +222,85 @@ class KKTKolbeHoodScene(KKTBaseEntity, Scene):
         return bool(value)
 
     async def async_activate(self, **kwargs: Any) -> None:
-        """Activate the scene by executing the action sequence."""
+        """Activate the scene by executing the action sequence.
+
+        Consecutive DP writes are collected and sent as one multi-DP command;
+        only powering on the hood is sent on its own, because the device needs
+        POWER_ON_DELAY before it accepts further commands.
+        """
         _LOGGER.debug("Activating scene '%s' with %d actions", self._name, len(self._actions))
 
         hood_was_off = False
+        # Coordinator data is not updated until the device reports back
+        hood_on = self._is_hood_on()
         errors: list[str] = []
+        batch: dict[int, Any] = {}
+
+        async def flush() -> None:
+            """Send the collected writes as one command."""
+            if not batch:
+                return
+            dps = dict(batch)
+            batch.clear()
+            try:
+                await self._async_set_data_points(dps)
+            except Exception as err:
+                error_msg = f"Writing DPs {sorted(dps)} failed: {err}"
+                _LOGGER.warning("Scene '%s': %s", self._name, error_msg)
+                errors.append(error_msg)
+
+        async def power_on() -> None:
+            """Power on the hood and wait until it accepts commands."""
+            nonlocal hood_was_off, hood_on
+            await flush()
+            hood_was_off = True
+            await self._async_set_data_point(1, True)
+            hood_on = True
+            await asyncio.sleep(POWER_ON_DELAY)
+
+        def suppress_fan() -> None:
+            """Add the fan-off write for hoods that auto-start the fan."""
+            suppression = self._fan_auto_start_suppression()
+            if suppression:
+                batch[suppression[0]] = suppression[1]
 
         for action in self._actions:
             cmd = action[0]
 
             try:
                 if cmd == "power_on":
-                    if not self._is_hood_on():
-                        hood_was_off = True
-                        await self._async_set_data_point(1, True)
-                        await asyncio.sleep(POWER_ON_DELAY)
+                    if not hood_on:
+                        await power_on()
 
                 elif cmd == "power_off":
-                    await self._async_set_data_point(1, False)
+                    batch[1] = False
+                    hood_on = False
 
                 elif cmd == "suppress_fan":
                     if hood_was_off:
-                        await self._async_suppress_fan_auto_start()
+                        suppress_fan()
 
                 elif cmd == "light_on":
-                    await self._async_set_data_point(self._light_dp, True)
+                    batch[self._light_dp] = True
 
                 elif cmd == "light_off":
-                    await self._async_set_data_point(self._light_dp, False)
+                    batch[self._light_dp] = False
 
                 elif cmd == "dp":
                     dp_id = action[1]
                     value = action[2]
-                    if not self._is_hood_on():
-                        hood_was_off = True
-                        await self._async_set_data_point(1, True)
-                        await asyncio.sleep(POWER_ON_DELAY)
-                        await self._async_suppress_fan_auto_start()
-                    await self._async_set_data_point(dp_id, value)
+                    if not hood_on:
+                        await power_on()
+                        suppress_fan()
+                    batch[dp_id] = value
 
             except Exception as err:
                 error_msg = f"Action '{cmd}' failed: {err}"
                 _LOGGER.warning("Scene '%s': %s", self._name, error_msg)
                 errors.append(error_msg)
 
+        await flush()
+
         if errors:
             _LOGGER.error(
                 "Scene '%s' completed with %d error(s): %s",
@@ -14,6 +14,7 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .base_entity import KKTBaseEntity
 from .device_types import get_device_entities
+from .dp_codec import compile_enum_codec
 
 if TYPE_CHECKING:
     from .data import KKTKolbeConfigEntry
@@ -69,6 +70,8 @@ class KKTKolbeSelect(KKTBaseEntity, SelectEntity):
         # Set select-specific attributes
         self._attr_options = config.get("options", [])
         self._options_map = config.get("options_map", {})
+        # Device value ↔ option tables, shared by all selects with the same options
+        self._codec = compile_enum_codec(self._attr_options, self._options_map)
         self._attr_icon = self._get_icon()
         self._cached_option: str | None = None
 
@@ -93,17 +96,8 @@ class KKTKolbeSelect(KKTBaseEntity, SelectEntity):
             self._cached_option = None
             return
 
-        # Map device value to option string
-        for option, device_value in self._options_map.items():
-            if device_value == value:
-                self._cached_option = option
-                return
-
-        # If no mapping found, try to use value directly if it's in options
-        if isinstance(value, str) and value in self._attr_options:
-            self._cached_option = value
-        else:
-            self._cached_option = None
+        # Mapped device value, or the option itself if it is reported by name
+        self._cached_option = self._codec.decode(value)
 
     @property
     def current_option(self) -> str | None:
@@ -117,7 +111,7 @@ class KKTKolbeSelect(KKTBaseEntity, SelectEntity):
             return
 
         # Map option to device value
-        device_value = self._options_map.get(option, option)
+        device_value = self._codec.encode(option)
 
         # Optimistic write: lock the DP at the chosen device_value so subsequent
         # coordinator polls cannot overwrite us with stale Tuya cloud reads
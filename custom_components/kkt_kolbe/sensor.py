@@ -290,6 +290,10 @@ class KKTKolbeCalculatedPowerSensor(KKTBaseEntity, SensorEntity):
 
         self._update_cached_state()
 
+    def _subscribed_dps(self) -> tuple[int, ...]:
+        """Return the zone levels DP the power estimate is computed from."""
+        return (self._zones_dp,)
+
     def _update_cached_state(self) -> None:
         """Calculate estimated power from all zone levels."""
         total_power = 0
@@ -331,6 +335,10 @@ class KKTKolbeTotalLevelSensor(KKTBaseEntity, SensorEntity):
 
         self._update_cached_state()
 
+    def _subscribed_dps(self) -> tuple[int, ...]:
+        """Return the zone levels DP the total is summed from."""
+        return (self._zones_dp,)
+
     def _update_cached_state(self) -> None:
         """Calculate total power level from all zones."""
         total_level = 0
@@ -370,6 +378,10 @@ class KKTKolbeActiveZonesSensor(KKTBaseEntity, SensorEntity):
 
         self._update_cached_state()
 
+    def _subscribed_dps(self) -> tuple[int, ...]:
+        """Return the zone levels DP used to count active zones."""
+        return (self._zones_dp,)
+
     def _update_cached_state(self) -> None:
         """Count zones with power level > 0."""
         active_count = 0
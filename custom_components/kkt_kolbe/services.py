@@ -521,14 +521,28 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 ):
                     state = hass.states.get(entity_id)
                     if state and state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                        if entity_id.startswith("switch."):
-                            await hass.services.async_call("switch", "turn_off", {ATTR_ENTITY_ID: entity_id})
-                        elif entity_id.startswith("number."):
-                            await hass.services.async_call(
-                                "number", "set_value", {ATTR_ENTITY_ID: entity_id, "value": 0}
-                            )
                         stopped_entities.append(entity_id)
 
+            # Issue all stops at once: writes to the same device are combined
+            # (zone bitfields through the device's write queue) instead of one
+            # round-trip per entity
+            calls = []
+            for entity_id in stopped_entities:
+                if entity_id.startswith("switch."):
+                    calls.append(
+                        hass.services.async_call("switch", "turn_off", {ATTR_ENTITY_ID: entity_id}, blocking=True)
+                    )
+                else:
+                    calls.append(
+                        hass.services.async_call(
+                            "number", "set_value", {ATTR_ENTITY_ID: entity_id, "value": 0}, blocking=True
+                        )
+                    )
+            results = await asyncio.gather(*calls, return_exceptions=True)
+            for entity_id, result in zip(stopped_entities, results, strict=True):
+                if isinstance(result, Exception):
+                    _LOGGER.error("Emergency stop failed for %s: %s", entity_id, result)
+
             _LOGGER.warning("EMERGENCY STOP executed - stopped %d cooking operations", len(stopped_entities))
 
             if send_notification:
@@ -123,25 +123,15 @@ class SmartDiscovery:
             # Use device_id pattern matching to identify device
             if device_id:
                 from .device_types import KNOWN_DEVICES
-                from .device_types import find_device_by_device_id
+                from .device_types import find_device_key_by_device_id
 
-                detected_info = find_device_by_device_id(device_id)
-                if detected_info:
+                device_key = find_device_key_by_device_id(device_id)
+                if device_key:
+                    detected_info = KNOWN_DEVICES[device_key]
                     friendly_type = detected_info.get("name")
                     if detected_info.get("product_names"):
                         product_name = detected_info["product_names"][0]
-                    # Find the device key
-                    for key, info in KNOWN_DEVICES.items():
-                        device_ids = info.get("device_ids", [])
-                        if isinstance(device_ids, list) and device_id in device_ids:
-                            device_type = key
-                            break
-                        patterns = info.get("device_id_patterns", [])
-                        if isinstance(patterns, list):
-                            for pattern in patterns:
-                                if isinstance(pattern, str) and device_id.startswith(pattern):
-                                    device_type = key
-                                    break
+                    device_type = device_key
                     _LOGGER.info(f"Smart Discovery: Detected {friendly_type} from device_id pattern")
 
             self._discovered_devices[device_id] = SmartDiscoveryResult(
@@ -293,8 +283,8 @@ class SmartDiscovery:
             Tuple of (device_type, product_name, friendly_type)
         """
         from .device_types import KNOWN_DEVICES
-        from .device_types import find_device_by_device_id
-        from .device_types import find_device_by_product_name
+        from .device_types import find_device_key_by_device_id
+        from .device_types import find_device_key_by_product_name
 
         tuya_category = api_device.get("category", "").lower()
         api_product_name = api_device.get("product_name", "Unknown Device")
@@ -309,44 +299,22 @@ class SmartDiscovery:
 
         # Method 1: Try to match by Tuya product_id (most accurate)
         if product_id:
-            device_info = find_device_by_product_name(product_id)
-            if device_info:
-                for device_key, info in KNOWN_DEVICES.items():
-                    product_names = info.get("product_names", [])
-                    if isinstance(product_names, list) and product_id in product_names:
-                        friendly_type = str(info.get("name", device_key))
-                        _LOGGER.info(f"Smart Discovery: Detected {friendly_type} by product_id")
-                        return (device_key, product_id, friendly_type)
-
-        # Method 2: Try to match by device_id pattern
+            device_key = find_device_key_by_product_name(product_id)
+            if device_key:
+                friendly_type = str(KNOWN_DEVICES[device_key].get("name", device_key))
+                _LOGGER.info(f"Smart Discovery: Detected {friendly_type} by product_id")
+                return (device_key, product_id, friendly_type)
+
+        # Method 2: Try to match by device_id (exact or pattern)
         if device_id:
-            device_info = find_device_by_device_id(device_id)
-            if device_info:
-                for device_key, info in KNOWN_DEVICES.items():
-                    # Check exact match
-                    device_ids = info.get("device_ids", [])
-                    if isinstance(device_ids, list) and device_id in device_ids:
-                        friendly_type = str(info.get("name", device_key))
-                        product_names = info.get("product_names", [])
-                        prod_name = (
-                            str(product_names[0]) if isinstance(product_names, list) and product_names else device_key
-                        )
-                        _LOGGER.info(f"Smart Discovery: Detected {friendly_type} by device_id")
-                        return (device_key, prod_name, friendly_type)
-                    # Check pattern match
-                    patterns = info.get("device_id_patterns", [])
-                    if isinstance(patterns, list):
-                        for pattern in patterns:
-                            if isinstance(pattern, str) and device_id.startswith(pattern):
-                                friendly_type = str(info.get("name", device_key))
-                                product_names = info.get("product_names", [])
-                                prod_name = (
-                                    str(product_names[0])
-                                    if isinstance(product_names, list) and product_names
-                                    else device_key
-                                )
-                                _LOGGER.info(f"Smart Discovery: Detected {friendly_type} by device_id pattern")
-                                return (device_key, prod_name, friendly_type)
+            device_key = find_device_key_by_device_id(device_id)
+            if device_key:
+                info = KNOWN_DEVICES[device_key]
+                friendly_type = str(info.get("name", device_key))
+                product_names = info.get("product_names", [])
+                prod_name = str(product_names[0]) if isinstance(product_names, list) and product_names else device_key
+                _LOGGER.info(f"Smart Discovery: Detected {friendly_type} by device_id")
+                return (device_key, prod_name, friendly_type)
 
         # Method 3: Category-based detection with keyword matching
         search_text = f"{api_product_name} {device_name}".lower()
@@ -0,0 +1,168 @@
+"""Persistent cache of cloud device specifications.
+
+The Things Data Model (``/v2.0/cloud/thing/{id}/model``, with up to two
+fallback endpoints) and the SmartLife specifications were fetched and parsed
+again by every caller, although a device's spec only changes with a firmware
+update. This store keeps each spec per product ID and firmware version, so a
+device is looked up with at most one firmware info request per Home
+Assistant run and its spec is only fetched again after a firmware update.
+
+Devices whose firmware version cannot be read (e.g. a SmartLife token without
+IoT platform scope) are cached per product ID only, and refetched after
+``DEVICE_SPEC_UNVERSIONED_MAX_AGE``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DEVICE_SPEC_SAVE_DELAY
+from .const import DEVICE_SPEC_STORE_KEY
+from .const import DEVICE_SPEC_UNVERSIONED_MAX_AGE
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Persistent storage version
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.device_specs"
+
+# Cached firmware versions per product and source; older ones are dropped
+MAX_VERSIONS_PER_PRODUCT = 3
+
+# Spec formats, cached separately
+SPEC_SOURCE_OPENAPI = "openapi"  # TuyaCloudClient.get_device_properties
+SPEC_SOURCE_SMARTLIFE = "smartlife"  # TuyaSharingClient specifications
+
+
+def firmware_version_from_info(modules: list[dict[str, Any]] | None) -> str | None:
+    """Return one version string for all firmware modules, e.g. ``"0:1.2.0,9:2.0.1"``."""
+    if not modules:
+        return None
+    versions = sorted(
+        f"{module.get('module_type', module.get('type', ''))}:{module['current_version']}"
+        for module in modules
+        if isinstance(module, dict) and module.get("current_version")
+    )
+    return ",".join(versions) or None
+
+
+class DeviceSpecStore:
+    """Cloud device specs per source, product ID and firmware version."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the spec store (call async_load before use)."""
+        self.hass = hass
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._specs: dict[str, dict[str, Any]] = {}
+        # Firmware version per device, read once per run (None: not readable)
+        self._firmware: dict[str, str | None] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load specs from storage once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                data = await self._store.async_load()
+                if isinstance(data, dict):
+                    self._specs = {k: v for k, v in data.items() if isinstance(v, dict) and "spec" in v}
+                    _LOGGER.debug("Loaded %d device spec(s)", len(self._specs))
+            except Exception as err:
+                _LOGGER.warning("Failed to load device specs: %s", err)
+            self._loaded = True
+
+    def get(self, source: str, product_id: str, firmware_version: str | None) -> dict[str, Any] | None:
+        """Return the stored spec of a product and firmware version, if still valid."""
+        entry = self._specs.get(_spec_key(source, product_id, firmware_version))
+        if entry is None:
+            return None
+        if firmware_version is None and time.time() - entry.get("fetched_at", 0) > DEVICE_SPEC_UNVERSIONED_MAX_AGE:
+            return None
+        spec: dict[str, Any] = entry["spec"]
+        return spec
+
+    def async_remember(self, source: str, product_id: str, firmware_version: str | None, spec: dict[str, Any]) -> None:
+        """Store a freshly fetched spec and schedule a (coalesced) save."""
+        self._specs[_spec_key(source, product_id, firmware_version)] = {
+            "source": source,
+            "product_id": product_id,
+            "firmware_version": firmware_version,
+            "fetched_at": time.time(),
+            "spec": spec,
+        }
+        versions = sorted(
+            (
+                key
+                for key, entry in self._specs.items()
+                if entry.get("source") == source and entry.get("product_id") == product_id
+            ),
+            key=lambda key: self._specs[key].get("fetched_at", 0),
+        )
+        for key in versions[:-MAX_VERSIONS_PER_PRODUCT]:
+            del self._specs[key]
+        self._store.async_delay_save(self._data_to_save, DEVICE_SPEC_SAVE_DELAY)
+
+    async def async_get_spec(
+        self,
+        source: str,
+        device_id: str,
+        product_id: str | None,
+        fetch_spec: Callable[[], Awaitable[dict[str, Any] | None]],
+        fetch_firmware_info: Callable[[], Awaitable[list[dict[str, Any]] | None]],
+    ) -> dict[str, Any] | None:
+        """Return the spec of a device, fetching it only for an unknown product or firmware.
+
+        Args:
+            source: Spec format, ``SPEC_SOURCE_OPENAPI`` or ``SPEC_SOURCE_SMARTLIFE``
+            device_id: Device the spec is for
+            product_id: Its product ID; specs are cached per device without it
+            fetch_spec: Fetches the spec from the cloud
+            fetch_firmware_info: Fetches the firmware modules, as ``async_get_firmware_info``
+        """
+        if device_id not in self._firmware:
+            try:
+                self._firmware[device_id] = firmware_version_from_info(await fetch_firmware_info())
+            except Exception as err:
+                _LOGGER.debug("Firmware info unavailable for %s: %s", device_id[:8], err)
+                self._firmware[device_id] = None
+        firmware_version = self._firmware[device_id]
+        spec_product = product_id or f"device:{device_id}"
+
+        if (spec := self.get(source, spec_product, firmware_version)) is not None:
+            _LOGGER.debug("Using stored spec for %s (firmware %s)", device_id[:8], firmware_version or "unknown")
+            return spec
+
+        spec = await fetch_spec()
+        if spec:
+            self.async_remember(source, spec_product, firmware_version, spec)
+        return spec
+
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the data to persist."""
+        return dict(self._specs)
+
+
+def _spec_key(source: str, product_id: str, firmware_version: str | None) -> str:
+    """Return the storage key of a spec."""
+    return f"{source}:{product_id}@{firmware_version or ''}"
+
+
+async def async_get_spec_store(hass: HomeAssistant) -> DeviceSpecStore:
+    """Return the shared, loaded spec store for this HA instance."""
+    store: DeviceSpecStore | None = hass.data.get(DEVICE_SPEC_STORE_KEY)
+    if store is None:
+        store = DeviceSpecStore(hass)
+        hass.data[DEVICE_SPEC_STORE_KEY] = store
+    await store.async_load()
+    return store
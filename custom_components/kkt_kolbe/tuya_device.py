@@ -7,6 +7,7 @@ import contextlib
 import logging
 import random
 import socket
+import time
 from collections.abc import Callable
 from collections.abc import Coroutine
 from typing import Any
@@ -14,10 +15,15 @@ from typing import Any
 import tinytuya
 from homeassistant.core import HomeAssistant
 
+from .const import AUTO_DETECT_MAX_CONCURRENCY
 from .const import DEFAULT_CONNECTION_TIMEOUT
+from .const import DEFAULT_PROTOCOL_TIMEOUT
+from .const import LOCAL_TRANSPORT_ASYNCIO
+from .const import LOCAL_TRANSPORT_TINYTUYA
 from .const import TCP_KEEPALIVE_COUNT
 from .const import TCP_KEEPALIVE_IDLE
 from .const import TCP_KEEPALIVE_INTERVAL
+from .const import TUYA_LOCAL_PORT
 from .exceptions import KKTAuthenticationError
 from .exceptions import KKTConnectionError
 from .exceptions import KKTDataPointError
@@ -30,7 +36,14 @@ class KKTKolbeTuyaDevice:
     """Handle communication with KKT Kolbe device via Tuya protocol."""
 
     def __init__(
-        self, device_id: str, ip_address: str, local_key: str, version: str = "auto", hass: HomeAssistant | None = None
+        self,
+        device_id: str,
+        ip_address: str,
+        local_key: str,
+        version: str = "auto",
+        hass: HomeAssistant | None = None,
+        transport: str = LOCAL_TRANSPORT_TINYTUYA,
+        port: int = TUYA_LOCAL_PORT,
     ) -> None:
         """Initialize the Tuya device connection.
 
@@ -40,9 +53,13 @@ class KKTKolbeTuyaDevice:
             local_key: Local encryption key
             version: Protocol version ("auto" or specific version like "3.3")
             hass: Home Assistant instance (optional, for executor job scheduling)
+            transport: "tinytuya" (executor-based) or "asyncio" (persistent
+                       event-loop socket with push, protocol 3.3-3.5 only)
+            port: Tuya LAN port (only differs from 6668 for emulated devices)
         """
         self.device_id = device_id
         self.ip_address = ip_address
+        self.port = port
         self.local_key = local_key
         self._local_key_bytes: bytes | None = None  # Cached latin1-encoded key
         self.version = version
@@ -53,6 +70,11 @@ class KKTKolbeTuyaDevice:
         self._status: dict[str, Any] = {}
         self._connected = False
         self._hass = hass
+        self._transport = transport
+        # Name of the _get_key_variants() entry that last connected
+        self._key_variant = "original"
+        # Receivers of unsolicited status frames (asyncio transport only)
+        self._push_callbacks: list[Callable[[dict[str, Any], str], None]] = []
 
         # Connection statistics for diagnostics
         self._connection_stats: dict[str, Any] = {
@@ -64,6 +86,10 @@ class KKTKolbeTuyaDevice:
             "last_connect_time": None,
             "last_disconnect_time": None,
             "protocol_version_detected": None,
+            "last_detection_duration": None,
+            "last_detection_candidates": None,
+            "fingerprint_hits": 0,
+            "fingerprint_misses": 0,
         }
         # Don't connect in __init__ - will be done async
 
@@ -166,7 +192,7 @@ class KKTKolbeTuyaDevice:
             raise KKTConnectionError(
                 operation="quick_check",
                 device_id=self.device_id[:8],
-                reason="Device not reachable on port 6668 - check if device is online",
+                reason=f"Device not reachable on port {self.port} - check if device is online",
             )
 
         for attempt in range(max_retries):
@@ -307,11 +333,22 @@ class KKTKolbeTuyaDevice:
 
         Returns (device, status) tuple. Device is None if connection failed.
         """
+        if self._transport == LOCAL_TRANSPORT_ASYNCIO:
+            from .tuya_transport import SUPPORTED_VERSIONS
+
+            # The asyncio transport does not implement 3.1/3.2; those stay on tinytuya
+            if version in SUPPORTED_VERSIONS:
+                return await self._try_connect_async_transport(local_key, version)
+
         test_device = None
         try:
             test_device = await self._run_executor_job(
                 lambda: tinytuya.Device(
-                    dev_id=self.device_id, address=self.ip_address, local_key=local_key, version=version
+                    dev_id=self.device_id,
+                    address=self.ip_address,
+                    local_key=local_key,
+                    version=version,
+                    port=self.port,
                 )
             )
 
@@ -332,136 +369,342 @@ class KKTKolbeTuyaDevice:
                     test_device.close()
             return None, None
 
-        except Exception:
+        except BaseException:
+            # Also on cancellation, e.g. when a parallel detection attempt won
             if test_device:
                 with contextlib.suppress(Exception):
                     test_device.close()
             raise
 
-    async def _perform_connection(self) -> None:
-        """Perform the actual connection logic."""
-        # Get key variants to try (for encoding issues)
-        key_variants = self._get_key_variants()
-        error_914_count = 0
+    async def _try_connect_async_transport(self, local_key: str, version: float) -> tuple[Any, dict | None]:
+        """Try a key/version with the asyncio transport.
 
-        # LocalTuya-inspired authentication with enhanced protocol detection
-        if self.version == "auto":
-            _LOGGER.info(f"Auto-detecting Tuya protocol version for {self.ip_address}")
+        Returns (connection, status) like _try_connect_with_key. Rejected
+        session key negotiations are reported as Error 914 so they count
+        towards the stale-key diagnosis.
+        """
+        from .tuya_transport import ERROR_914_STATUS
+        from .tuya_transport import TuyaLocalConnection
+
+        connection = TuyaLocalConnection(
+            self.device_id,
+            self.ip_address,
+            local_key,
+            version,
+            port=self.port,
+            on_push=self._handle_local_push,
+            on_lost=self._handle_connection_lost,
+        )
+        try:
+            await connection.async_connect(timeout=DEFAULT_PROTOCOL_TIMEOUT)
+            status = await connection.async_status(timeout=DEFAULT_PROTOCOL_TIMEOUT)
+            return connection, status
+        except KKTTimeoutError:
+            connection.close()
+            return None, None
+        except KKTAuthenticationError:
+            connection.close()
+            return None, dict(ERROR_914_STATUS)
+        except BaseException:
+            connection.close()
+            raise
 
-            # Try each version with each key variant. Order roughly by frequency
-            # in the wild: 3.3/3.4 are most common KKT firmwares, 3.5 is the
-            # newest (PLOOM and other 2024+ models, Issue #8), 3.1/3.2 legacy.
-            for test_version in [3.3, 3.4, 3.5, 3.1, 3.2]:
-                for key_variant, key_desc in key_variants:
-                    _LOGGER.debug(f"Testing version {test_version} with {key_desc} key for device {self.device_id[:8]}")
-                    test_device = None
+    def _uses_async_transport(self) -> bool:
+        """Return True if the connected device runs on the asyncio transport.
 
-                    try:
-                        test_device, test_status = await self._try_connect_with_key(key_variant, float(test_version))
-
-                        if test_status is None:
-                            _LOGGER.debug(f"Version {test_version} ({key_desc}) timeout")
-                            continue
-
-                        # Check for Error 914
-                        if self._is_error_914(test_status):
-                            error_914_count += 1
-                            _LOGGER.debug(
-                                f"Error 914 with version {test_version} ({key_desc} key) - "
-                                f"device key/version check failed"
-                            )
-                            if test_device:
-                                with contextlib.suppress(Exception):
-                                    test_device.close()
-                            continue
-
-                        # Check for valid DPS response
-                        if (
-                            test_status
-                            and isinstance(test_status, dict)
-                            and "dps" in test_status
-                            and test_status["dps"]
-                            and len(test_status["dps"]) > 0
-                        ):
-                            self.version = str(test_version)
-                            self._connection_stats["protocol_version_detected"] = str(test_version)
-
-                            # If we used a variant key, update local_key
-                            if key_variant != self.local_key:
-                                _LOGGER.warning(
-                                    f"Connection successful with {key_desc} key variant! "
-                                    f"Original key had encoding issues."
-                                )
-                                self.local_key = key_variant
-
-                            _LOGGER.info(f"Detected Tuya protocol version: {test_version}")
-                            self._device = test_device
-                            self._connected = True
-                            return
-                        else:
-                            # Invalid response, cleanup and try next
-                            if test_device:
-                                with contextlib.suppress(Exception):
-                                    test_device.close()
-
-                    except asyncio.CancelledError:
-                        if test_device:
-                            with contextlib.suppress(Exception):
-                                test_device.close()
-                        _LOGGER.warning(f"Protocol detection cancelled for version {test_version}")
-                        raise
+        Devices on protocol 3.1/3.2 use tinytuya even with the asyncio transport selected.
+        """
+        from .tuya_transport import TuyaLocalConnection
 
-                    except Exception as e:
-                        if test_device:
-                            with contextlib.suppress(Exception):
-                                test_device.close()
+        return isinstance(self._device, TuyaLocalConnection)
+
+    async def _async_device_status(self) -> Any:
+        """Request full status from the connected device via the active transport."""
+        if self._uses_async_transport():
+            return await self._device.async_status()
+        return await self._run_executor_job(self._device.status)
+
+    async def _async_device_set_value(self, dp: int, value: Any) -> Any:
+        """Write a single DP via the active transport."""
+        if self._uses_async_transport():
+            return await self._device.async_set_dps({str(dp): value})
+        return await self._run_executor_job(self._device.set_value, dp, value)
 
-                        # Check if this is an authentication error
+    async def _async_device_set_values(self, dps: dict[int, Any]) -> Any:
+        """Write several DPs in one CONTROL frame via the active transport."""
+        if self._uses_async_transport():
+            return await self._device.async_set_dps({str(dp): value for dp, value in dps.items()})
+        return await self._run_executor_job(self._device.set_multiple_values, dps)
+
+    def register_push_callback(self, callback: Callable[[dict[str, Any], str], None]) -> None:
+        """Register a receiver for unsolicited local status frames.
+
+        Only the asyncio transport produces pushes. The callback runs on the
+        event loop with (updated_dps, "local") and must not block.
+        """
+        if callback not in self._push_callbacks:
+            self._push_callbacks.append(callback)
+
+    def unregister_push_callback(self, callback: Callable[[dict[str, Any], str], None]) -> None:
+        """Remove a previously registered push receiver."""
+        with contextlib.suppress(ValueError):
+            self._push_callbacks.remove(callback)
+
+    def _handle_local_push(self, dps: dict[str, Any]) -> None:
+        """Merge a pushed status frame and fan it out to push receivers."""
+        self._status.setdefault("dps", {}).update(dps)
+        for callback in list(self._push_callbacks):
+            try:
+                callback(dps, "local")
+            except Exception:
+                _LOGGER.exception("Local push callback raised for device %s", self.device_id[:8])
+
+    def _handle_connection_lost(self, connection: Any) -> None:
+        """Mark the device disconnected when its persistent socket drops."""
+        if self._device is connection:
+            _LOGGER.debug("Persistent connection to device %s lost", self.device_id[:8])
+            self._device = None
+            self._connected = False
+
+    async def _async_get_fingerprint_store(self) -> Any:
+        """Return the shared connection fingerprint store, or None without hass."""
+        if self._hass is None:
+            return None
+        from .connection_store import async_get_fingerprint_store
+
+        try:
+            return await async_get_fingerprint_store(self._hass)
+        except Exception as e:
+            _LOGGER.debug(f"Connection fingerprint store unavailable: {e}")
+            return None
+
+    async def _async_connect_from_fingerprint(self, key_variants: list[tuple[str, str]]) -> bool:
+        """Try the persisted last-known-good version/key before auto-detection.
+
+        Returns True when connected. A fingerprint rejected with Error 914 is
+        dropped; on timeouts it is kept since the device may just be offline.
+        """
+        store = await self._async_get_fingerprint_store()
+        fingerprint = store.get(self.device_id) if store is not None else None
+        if not fingerprint:
+            return False
+
+        version = fingerprint.get("version")
+        key_desc = fingerprint.get("key_variant", "original")
+        key_variant = next((key for key, desc in key_variants if desc == key_desc), None)
+        if not version or key_variant is None:
+            return False
+
+        _LOGGER.debug(f"Trying stored fingerprint for device {self.device_id[:8]}: version {version} ({key_desc} key)")
+        try:
+            test_device, test_status = await self._try_connect_with_key(key_variant, float(version))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOGGER.debug(f"Stored fingerprint failed for device {self.device_id[:8]}: {type(e).__name__}")
+            self._connection_stats["fingerprint_misses"] += 1
+            return False
+
+        if self._has_valid_dps(test_status):
+            self.version = str(version)
+            self.local_key = key_variant
+            self._key_variant = key_desc
+            self._device = test_device
+            self._connected = True
+            self._connection_stats["protocol_version_detected"] = str(version)
+            self._connection_stats["fingerprint_hits"] += 1
+            store.async_remember(self.device_id, self.version, key_desc, self.ip_address)
+            _LOGGER.info(f"Connected to device at {self.ip_address} using stored protocol version {version}")
+            return True
+
+        if test_device:
+            with contextlib.suppress(Exception):
+                test_device.close()
+        if self._is_error_914(test_status):
+            store.async_forget(self.device_id)
+        self._connection_stats["fingerprint_misses"] += 1
+        _LOGGER.debug(f"Stored fingerprint for device {self.device_id[:8]} no longer works, running auto-detection")
+        return False
+
+    @staticmethod
+    def _has_valid_dps(status: Any) -> bool:
+        """Check if a status response carries at least one DP."""
+        return bool(isinstance(status, dict) and status.get("dps"))
+
+    async def _async_detect_protocol(self, key_variants: list[tuple[str, str]], versions: list[float]) -> None:
+        """Race (version, key) handshakes and keep the first valid DPS response.
+
+        Candidates are started in priority order with at most
+        AUTO_DETECT_MAX_CONCURRENCY handshakes in flight. As soon as one returns
+        DPS, the rest are cancelled and their sockets closed. Some firmwares only
+        accept one local client at a time, so candidates that failed without a
+        clear verdict (no timeout, no Error 914) are retried one by one before
+        giving up.
+        """
+        _LOGGER.info(f"Auto-detecting Tuya protocol version for {self.ip_address}")
+        started = time.monotonic()
+
+        candidates = [
+            (test_version, key_variant, key_desc) for test_version in versions for key_variant, key_desc in key_variants
+        ]
+        error_914_count = 0
+        auth_error: Exception | None = None
+        inconclusive: list[tuple[float, str, str]] = []
+        semaphore = asyncio.Semaphore(AUTO_DETECT_MAX_CONCURRENCY)
+
+        async def _attempt(test_version: float, key_variant: str, key_desc: str) -> tuple[Any, Any]:
+            async with semaphore:
+                _LOGGER.debug(f"Testing version {test_version} with {key_desc} key for device {self.device_id[:8]}")
+                return await self._try_connect_with_key(key_variant, test_version)
+
+        tasks = {asyncio.ensure_future(_attempt(*candidate)): candidate for candidate in candidates}
+        winner: tuple[float, str, str, Any] | None = None
+        try:
+            pending = set(tasks)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    test_version, key_variant, key_desc = tasks[task]
+                    try:
+                        test_device, test_status = task.result()
+                    except Exception as e:
                         error_msg = str(e).lower()
                         if any(keyword in error_msg for keyword in ["decrypt", "encrypt", "hmac", "key", "auth"]):
-                            _LOGGER.error(f"Authentication error detected: {e}")
-                            raise KKTAuthenticationError(
-                                device_id=self.device_id, message=f"Authentication failed - invalid local key: {e}"
-                            ) from e
-
+                            auth_error = auth_error or e
+                        else:
+                            inconclusive.append(tasks[task])
                         _LOGGER.debug(f"Version {test_version} ({key_desc}) failed: {type(e).__name__}")
                         continue
 
-            # If we reach here, auto-detection failed
-            if error_914_count > 0:
-                _LOGGER.error(
-                    f"Protocol auto-detection failed for device at {self.ip_address}\n"
-                    f"Got Error 914 {error_914_count} times - this indicates:\n"
-                    f"  - Local key is incorrect or has encoding issues\n"
-                    f"  - Device may have been re-paired (key changed)\n"
-                    f"  - Try using tinytuya wizard to get fresh key\n"
-                    f"Key variants tried: {[desc for _, desc in key_variants]}"
-                )
-                raise KKTAuthenticationError(
-                    device_id=self.device_id,
-                    message=(
-                        f"Device at {self.ip_address} rejected all key variants with Error 914 "
-                        f"({error_914_count}x) across protocol versions 3.1-3.5 — local_key is stale "
-                        f"or device was re-paired."
-                    ),
-                )
+                    if test_status is None:
+                        _LOGGER.debug(f"Version {test_version} ({key_desc}) timeout")
+                    elif self._is_error_914(test_status):
+                        error_914_count += 1
+                        _LOGGER.debug(
+                            f"Error 914 with version {test_version} ({key_desc} key) - device key/version check failed"
+                        )
+                    elif winner is None and self._has_valid_dps(test_status):
+                        winner = (test_version, key_variant, key_desc, test_device)
+                        continue
+                    else:
+                        inconclusive.append(tasks[task])
+
+                    if test_device:
+                        with contextlib.suppress(Exception):
+                            test_device.close()
+        finally:
+            await self._async_cancel_detection_tasks(tasks, winner[3] if winner else None)
+
+        if winner is None:
+            # Retry candidates that may have been refused because of the
+            # concurrent sockets, strictly one at a time
+            for test_version, key_variant, key_desc in sorted(inconclusive, key=candidates.index):
+                try:
+                    test_device, test_status = await self._try_connect_with_key(key_variant, test_version)
+                except Exception as e:
+                    _LOGGER.debug(f"Version {test_version} ({key_desc}) retry failed: {type(e).__name__}")
+                    continue
+                if self._has_valid_dps(test_status):
+                    winner = (test_version, key_variant, key_desc, test_device)
+                    break
+                if self._is_error_914(test_status):
+                    error_914_count += 1
+                if test_device:
+                    with contextlib.suppress(Exception):
+                        test_device.close()
+
+        self._connection_stats["last_detection_duration"] = round(time.monotonic() - started, 3)
+        self._connection_stats["last_detection_candidates"] = len(candidates)
+
+        if winner is not None:
+            test_version, key_variant, key_desc, test_device = winner
+            self.version = str(test_version)
+            self._key_variant = key_desc
+            self._connection_stats["protocol_version_detected"] = str(test_version)
+
+            # If we used a variant key, update local_key
+            if key_variant != self.local_key:
+                _LOGGER.warning(f"Connection successful with {key_desc} key variant! Original key had encoding issues.")
+                self.local_key = key_variant
+
+            _LOGGER.info(
+                f"Detected Tuya protocol version: {test_version} "
+                f"(in {self._connection_stats['last_detection_duration']}s)"
+            )
+            self._device = test_device
+            self._connected = True
+            return
 
+        if auth_error is not None:
+            _LOGGER.error(f"Authentication error detected: {auth_error}")
+            raise KKTAuthenticationError(
+                device_id=self.device_id, message=f"Authentication failed - invalid local key: {auth_error}"
+            ) from auth_error
+
+        # If we reach here, auto-detection failed
+        if error_914_count > 0:
             _LOGGER.error(
                 f"Protocol auto-detection failed for device at {self.ip_address}\n"
-                f"Tested versions: 3.3, 3.4, 3.5, 3.1, 3.2\n"
-                f"Common causes:\n"
-                f"  1. Device is offline or unreachable\n"
-                f"  2. Incorrect local key (check Tuya IoT Platform)\n"
-                f"  3. Device uses unsupported protocol version\n"
-                f"  4. Firewall blocking connection on port 6668\n"
-                f"Recommendation: Verify device is online and local key is correct"
+                f"Got Error 914 {error_914_count} times - this indicates:\n"
+                f"  - Local key is incorrect or has encoding issues\n"
+                f"  - Device may have been re-paired (key changed)\n"
+                f"  - Try using tinytuya wizard to get fresh key\n"
+                f"Key variants tried: {[desc for _, desc in key_variants]}"
             )
-            raise KKTConnectionError(
-                operation="auto_detect",
-                device_id=self.device_id[:8],
-                reason=f"Device not responding to any Tuya protocol version (3.1-3.5). "
-                f"Error 914 count: {error_914_count}. Check device connectivity and local key.",
+            raise KKTAuthenticationError(
+                device_id=self.device_id,
+                message=(
+                    f"Device at {self.ip_address} rejected all key variants with Error 914 "
+                    f"({error_914_count}x) across protocol versions 3.1-3.5 — local_key is stale "
+                    f"or device was re-paired."
+                ),
             )
+
+        _LOGGER.error(
+            f"Protocol auto-detection failed for device at {self.ip_address}\n"
+            f"Tested versions: 3.3, 3.4, 3.5, 3.1, 3.2\n"
+            f"Common causes:\n"
+            f"  1. Device is offline or unreachable\n"
+            f"  2. Incorrect local key (check Tuya IoT Platform)\n"
+            f"  3. Device uses unsupported protocol version\n"
+            f"  4. Firewall blocking connection on port 6668\n"
+            f"Recommendation: Verify device is online and local key is correct"
+        )
+        raise KKTConnectionError(
+            operation="auto_detect",
+            device_id=self.device_id[:8],
+            reason=f"Device not responding to any Tuya protocol version (3.1-3.5). "
+            f"Error 914 count: {error_914_count}. Check device connectivity and local key.",
+        )
+
+    async def _async_cancel_detection_tasks(self, tasks: dict[asyncio.Future, Any], keep: Any) -> None:
+        """Cancel unfinished detection attempts and close every socket except ``keep``."""
+        for task in tasks:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, tuple) and result[0] is not None and result[0] is not keep:
+                with contextlib.suppress(Exception):
+                    result[0].close()
+
+    async def _perform_connection(self) -> None:
+        """Perform the actual connection logic."""
+        # Get key variants to try (for encoding issues)
+        key_variants = self._get_key_variants()
+
+        # LocalTuya-inspired authentication with enhanced protocol detection
+        if self.version == "auto":
+            # Order roughly by frequency in the wild: 3.3/3.4 are most common KKT
+            # firmwares, 3.5 is the newest (PLOOM and other 2024+ models, Issue #8),
+            # 3.1/3.2 legacy.
+            if await self._async_connect_from_fingerprint(key_variants):
+                return
+            await self._async_detect_protocol(key_variants, [3.3, 3.4, 3.5, 3.1, 3.2])
+            store = await self._async_get_fingerprint_store()
+            if store is not None:
+                store.async_remember(self.device_id, self.version, self._key_variant, self.ip_address)
+            return
+
         # Use specified version with key variants for encoding issues
         version_float = float(self.version) if self.version != "auto" else 3.3
         error_914_seen = False
@@ -550,6 +793,11 @@ class KKTKolbeTuyaDevice:
         """Return True if device is connected."""
         return self._connected and self._device is not None
 
+    @property
+    def pushes_status(self) -> bool:
+        """Return True if the transport delivers unsolicited status frames."""
+        return self._uses_async_transport()
+
     async def async_test_connection(self) -> bool:
         """Test connection to device without throwing exceptions (for config flow)."""
         try:
@@ -596,7 +844,7 @@ class KKTKolbeTuyaDevice:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.settimeout(timeout)
                 try:
-                    result = sock.connect_ex((self.ip_address, 6668))
+                    result = sock.connect_ex((self.ip_address, self.port))
                     return result == 0
                 except (TimeoutError, OSError):
                     return False
@@ -608,7 +856,7 @@ class KKTKolbeTuyaDevice:
             )
 
             if not is_reachable:
-                _LOGGER.debug(f"Quick check: Device {self.ip_address} not reachable on port 6668")
+                _LOGGER.debug(f"Quick check: Device {self.ip_address} not reachable on port {self.port}")
             return is_reachable
 
         except TimeoutError:
@@ -627,6 +875,7 @@ class KKTKolbeTuyaDevice:
             "device_id": self.device_id[:8] + "...",
             "ip_address": self.ip_address,
             "protocol_version": self.version,
+            "transport": self._transport,
         }
 
     def _configure_socket_keepalive(self, device: Any) -> None:
@@ -684,7 +933,7 @@ class KKTKolbeTuyaDevice:
             # Explicit status() call with timeout protection
             # This triggers a status request and tinytuya internally merges
             # the response with any cached data
-            status = await asyncio.wait_for(self._run_executor_job(self._device.status), timeout=10.0)
+            status = await asyncio.wait_for(self._async_device_status(), timeout=10.0)
 
             # Enhanced validation and error handling
             if not status:
@@ -745,12 +994,18 @@ class KKTKolbeTuyaDevice:
 
         except asyncio.CancelledError:
             # Handle cancellation - cleanup but re-raise
+            if self._device:
+                with contextlib.suppress(Exception):
+                    self._device.close()
             self._connected = False
             self._device = None
             _LOGGER.debug(f"get_status cancelled for device at {self.ip_address}")
             raise
 
         except TimeoutError as timeout_err:
+            if self._device:
+                with contextlib.suppress(Exception):
+                    self._device.close()
             self._connected = False
             self._device = None
             raise KKTTimeoutError(operation="get_status", device_id=self.device_id[:8], timeout=10.0) from timeout_err
@@ -774,7 +1029,7 @@ class KKTKolbeTuyaDevice:
 
         try:
             # Explicit status() call with timeout protection
-            status = await asyncio.wait_for(self._run_executor_job(self._device.status), timeout=10.0)
+            status = await asyncio.wait_for(self._async_device_status(), timeout=10.0)
 
             if status and isinstance(status, dict):
                 self._status = status
@@ -784,12 +1039,18 @@ class KKTKolbeTuyaDevice:
 
         except asyncio.CancelledError:
             # Handle cancellation - cleanup but re-raise
+            if self._device:
+                with contextlib.suppress(Exception):
+                    self._device.close()
             self._connected = False
             self._device = None
             _LOGGER.debug(f"update_status cancelled for device at {self.ip_address}")
             raise
 
         except TimeoutError as timeout_err:
+            if self._device:
+                with contextlib.suppress(Exception):
+                    self._device.close()
             self._connected = False
             self._device = None
             raise KKTTimeoutError(
@@ -816,7 +1077,7 @@ class KKTKolbeTuyaDevice:
 
         try:
             # Explicit set_value() call with timeout protection
-            result = await asyncio.wait_for(self._run_executor_job(self._device.set_value, dp, value), timeout=8.0)
+            result = await asyncio.wait_for(self._async_device_set_value(dp, value), timeout=8.0)
 
             # Validate the result
             if result is None:
@@ -827,12 +1088,18 @@ class KKTKolbeTuyaDevice:
 
         except asyncio.CancelledError:
             # Handle cancellation - cleanup but re-raise
+            if self._device:
+                with contextlib.suppress(Exception):
+                    self._device.close()
             self._connected = False
             self._device = None
             _LOGGER.debug(f"set_dp cancelled for DP {dp} on device at {self.ip_address}")
             raise
 
         except TimeoutError as timeout_err:
+            if self._device:
+                with contextlib.suppress(Exception):
+                    self._device.close()
             self._connected = False
             self._device = None
             raise KKTTimeoutError(
@@ -852,6 +1119,55 @@ class KKTKolbeTuyaDevice:
                 operation="set_dp", device_id=self.device_id[:8], data_point=dp, reason=str(e)
             ) from e
 
+    async def async_set_dps(self, dps: dict[int, Any]) -> bool:
+        """Set several data points with a single multi-DP command.
+
+        Same connection handling as ``async_set_dp``; a single DP is sent via
+        ``async_set_dp`` so the device sees exactly what it did before.
+        """
+        if len(dps) == 1:
+            ((dp, value),) = dps.items()
+            return await self.async_set_dp(dp, value)
+
+        await self.async_ensure_connected()
+
+        if not self._device:
+            raise KKTConnectionError(operation="set_dps", device_id=self.device_id[:8], reason="Device not connected")
+
+        try:
+            result = await asyncio.wait_for(self._async_device_set_values(dps), timeout=8.0)
+            if result is None:
+                _LOGGER.warning(f"set_multiple_values returned None for DPs {dps}")
+            _LOGGER.debug(f"Successfully set DPs {dps}")
+            return True
+
+        except asyncio.CancelledError:
+            if self._device:
+                with contextlib.suppress(Exception):
+                    self._device.close()
+            self._connected = False
+            self._device = None
+            _LOGGER.debug(f"set_dps cancelled for DPs {list(dps)} on device at {self.ip_address}")
+            raise
+
+        except TimeoutError as timeout_err:
+            if self._device:
+                with contextlib.suppress(Exception):
+                    self._device.close()
+            self._connected = False
+            self._device = None
+            raise KKTTimeoutError(operation="set_dps", device_id=self.device_id[:8], timeout=8.0) from timeout_err
+        except Exception as e:
+            _LOGGER.error(f"Failed to set DPs {dps}: {e}")
+            if self._device:
+                try:
+                    self._device.close()
+                except Exception:
+                    pass  # Ignore errors during cleanup
+            self._connected = False
+            self._device = None
+            raise KKTDataPointError(operation="set_dps", device_id=self.device_id[:8], value=dps, reason=str(e)) from e
+
     def turn_on(self) -> None:
         """Turn device on (DP 1 = True). DEPRECATED: Use coordinator.async_set_data_point() instead."""
         _LOGGER.warning("turn_on() is deprecated. Use coordinator.async_set_data_point() instead.")
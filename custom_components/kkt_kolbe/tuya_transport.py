@@ -0,0 +1,590 @@
+"""Asyncio-native Tuya LAN transport for protocol versions 3.3, 3.4 and 3.5.
+
+Alternative to tinytuya's blocking socket calls, which ``KKTKolbeTuyaDevice``
+otherwise runs in the HA executor (one thread per appliance for up to 10s per
+call). Here each device gets one long-lived TCP connection driven by an
+``asyncio.Protocol``:
+
+- Framing, AES and HMAC run on the event loop (payloads are a few hundred
+  bytes, so this is cheaper than an executor round-trip).
+- Requests are correlated with responses by sequence number.
+- Unsolicited STATUS frames are delivered to a push callback.
+- A heartbeat keeps the socket open (devices drop idle clients after ~30s).
+
+Only what KKT Kolbe devices need is implemented: DP query, control, heartbeat
+and the 3.4/3.5 session key negotiation. Frame layouts follow tinytuya.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import contextlib
+import hmac
+import json
+import logging
+import os
+import socket
+import struct
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Any
+
+from Crypto.Cipher import AES
+
+from .const import TCP_KEEPALIVE_COUNT
+from .const import TCP_KEEPALIVE_IDLE
+from .const import TCP_KEEPALIVE_INTERVAL
+from .const import TUYA_LOCAL_PORT
+from .exceptions import KKTAuthenticationError
+from .exceptions import KKTConnectionError
+from .exceptions import KKTTimeoutError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frame markers
+PREFIX_55AA = 0x000055AA  # 3.1 - 3.4
+SUFFIX_55AA = 0x0000AA55
+PREFIX_6699 = 0x00006699  # 3.5
+SUFFIX_6699 = 0x00009966
+_PREFIX_55AA_BYTES = struct.pack(">I", PREFIX_55AA)
+_PREFIX_6699_BYTES = struct.pack(">I", PREFIX_6699)
+_HEADER_55AA = struct.Struct(">4I")  # prefix, seqno, cmd, length
+_HEADER_6699 = struct.Struct(">IHIII")  # prefix, reserved, seqno, cmd, length
+
+# Command codes
+SESS_KEY_NEG_START = 3
+SESS_KEY_NEG_RESP = 4
+SESS_KEY_NEG_FINISH = 5
+CONTROL = 7
+STATUS = 8
+HEART_BEAT = 9
+DP_QUERY = 10
+CONTROL_NEW = 13
+DP_QUERY_NEW = 16
+UPDATEDPS = 18
+
+# Commands whose payload is sent without the "3.x" + 12 zero bytes version header
+NO_PROTOCOL_HEADER_CMDS = frozenset(
+    {DP_QUERY, DP_QUERY_NEW, UPDATEDPS, HEART_BEAT, SESS_KEY_NEG_START, SESS_KEY_NEG_RESP, SESS_KEY_NEG_FINISH}
+)
+
+SUPPORTED_VERSIONS = (3.3, 3.4, 3.5)
+DEFAULT_REQUEST_TIMEOUT = 5.0  # seconds
+HEARTBEAT_INTERVAL = 10.0  # seconds
+
+# Status shape returned for undecodable responses; mirrors tinytuya so
+# KKTKolbeTuyaDevice._is_error_914 works unchanged for both transports.
+ERROR_914_STATUS: dict[str, Any] = {"Error": "Check device key or version", "Err": "914", "Payload": None}
+
+# Pseudo command code used to resolve requests whose response failed decryption
+_UNDECODABLE = -1
+
+PushHandler = Callable[[dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class TuyaMessage:
+    """A decoded Tuya LAN frame."""
+
+    seqno: int
+    cmd: int
+    retcode: int
+    payload: bytes
+
+
+def _pad(data: bytes) -> bytes:
+    """PKCS#7-pad data to the AES block size."""
+    pad_len = 16 - len(data) % 16
+    return data + bytes([pad_len]) * pad_len
+
+
+def _unpad(data: bytes) -> bytes:
+    """Strip PKCS#7 padding, raising ValueError on garbage (wrong key)."""
+    if not data:
+        return data
+    pad_len = data[-1]
+    if pad_len < 1 or pad_len > 16 or data[-pad_len:] != bytes([pad_len]) * pad_len:
+        raise ValueError("invalid padding")
+    return data[:-pad_len]
+
+
+def _split_retcode(body: bytes) -> tuple[int, bytes]:
+    """Split the optional 4-byte return code off a device frame body.
+
+    Device responses carry a small return code before the payload, but some
+    unsolicited frames do not. Payloads themselves start with ``{``, the
+    ``3.x`` version header or ciphertext, none of which decode to a value
+    below 256, so a small leading word is taken as the return code.
+    """
+    if len(body) >= 4:
+        retcode = int.from_bytes(body[:4], "big")
+        if retcode & 0xFFFFFF00 == 0:
+            return retcode, body[4:]
+    return 0, body
+
+
+class TuyaFrameCodec:
+    """Encode and decode Tuya LAN frames for one connection.
+
+    ``key`` starts out as the device local_key and is replaced by the
+    negotiated session key for protocol 3.4/3.5.
+    """
+
+    def __init__(self, version: float, local_key: bytes) -> None:
+        """Initialize the codec.
+
+        Args:
+            version: Protocol version (3.3, 3.4 or 3.5)
+            local_key: 16-byte device local key
+        """
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported Tuya protocol version {version}")
+        self.version = version
+        self.local_key = local_key
+        self.key = local_key
+        self._version_header = f"{version:.1f}".encode() + b"\0" * 12
+
+    def encode(self, seqno: int, cmd: int, payload: bytes) -> bytes:
+        """Encrypt a payload and wrap it in a frame.
+
+        Args:
+            seqno: Sequence number for response correlation
+            cmd: Tuya command code
+            payload: Plain payload (usually compact JSON)
+
+        Returns:
+            Frame bytes ready to write to the socket
+        """
+        if self.version == 3.5:
+            if cmd not in NO_PROTOCOL_HEADER_CMDS:
+                payload = self._version_header + payload
+            iv = os.urandom(12)
+            header = _HEADER_6699.pack(PREFIX_6699, 0, seqno, cmd, len(payload) + 28)
+            cipher = AES.new(self.key, AES.MODE_GCM, nonce=iv)
+            cipher.update(header[4:])
+            encrypted, tag = cipher.encrypt_and_digest(payload)
+            return header + iv + encrypted + tag + struct.pack(">I", SUFFIX_6699)
+
+        if self.version == 3.4:
+            if cmd not in NO_PROTOCOL_HEADER_CMDS:
+                payload = self._version_header + payload
+            body = AES.new(self.key, AES.MODE_ECB).encrypt(_pad(payload))
+            header = _HEADER_55AA.pack(PREFIX_55AA, seqno, cmd, len(body) + 36)
+            integrity = hmac.new(self.key, header + body, sha256).digest()
+        else:
+            body = AES.new(self.key, AES.MODE_ECB).encrypt(_pad(payload))
+            if cmd not in NO_PROTOCOL_HEADER_CMDS:
+                body = self._version_header + body
+            header = _HEADER_55AA.pack(PREFIX_55AA, seqno, cmd, len(body) + 8)
+            integrity = struct.pack(">I", binascii.crc32(header + body) & 0xFFFFFFFF)
+
+        return header + body + integrity + struct.pack(">I", SUFFIX_55AA)
+
+    def decode(self, buffer: bytearray) -> list[TuyaMessage]:
+        """Consume all complete frames from the front of a receive buffer.
+
+        Incomplete trailing data stays in the buffer. Bytes before the next
+        frame prefix are discarded so a corrupted stream resynchronises.
+        Frames that fail their integrity check or decryption (typically a
+        wrong key) are returned with the ``_UNDECODABLE`` command code.
+        """
+        messages: list[TuyaMessage] = []
+        prefix = _PREFIX_6699_BYTES if self.version == 3.5 else _PREFIX_55AA_BYTES
+        header_size = _HEADER_6699.size if self.version == 3.5 else _HEADER_55AA.size
+
+        while True:
+            start = buffer.find(prefix)
+            if start < 0:
+                # Keep a possible partial prefix at the end
+                del buffer[: max(0, len(buffer) - 3)]
+                return messages
+            if start:
+                del buffer[:start]
+            if len(buffer) < header_size:
+                return messages
+
+            if self.version == 3.5:
+                _, _, seqno, cmd, length = _HEADER_6699.unpack_from(buffer)
+                total = header_size + length + 4
+            else:
+                _, seqno, cmd, length = _HEADER_55AA.unpack_from(buffer)
+                total = header_size + length
+            if len(buffer) < total:
+                return messages
+
+            frame = bytes(buffer[:total])
+            del buffer[:total]
+            try:
+                messages.append(self._decode_frame(frame, seqno, cmd, header_size))
+            except ValueError as err:
+                # Wrong key/version: surface as undecodable so the waiting
+                # request resolves instead of timing out
+                _LOGGER.debug("Undecodable frame (cmd=%d, seqno=%d): %s", cmd, seqno, err)
+                messages.append(TuyaMessage(seqno, _UNDECODABLE, 0, b""))
+
+    def _decode_frame(self, frame: bytes, seqno: int, cmd: int, header_size: int) -> TuyaMessage:
+        """Verify and decrypt a single complete frame."""
+        if self.version == 3.5:
+            iv = frame[header_size : header_size + 12]
+            tag = frame[-20:-4]
+            cipher = AES.new(self.key, AES.MODE_GCM, nonce=iv)
+            cipher.update(frame[4:header_size])
+            plain = cipher.decrypt_and_verify(frame[header_size + 12 : -20], tag)
+            retcode, payload = _split_retcode(plain)
+            if payload.startswith(self._version_header[:3]):
+                payload = payload[15:]
+            return TuyaMessage(seqno, cmd, retcode, payload)
+
+        if self.version == 3.4:
+            signed, integrity = frame[:-36], frame[-36:-4]
+            if not hmac.compare_digest(hmac.new(self.key, signed, sha256).digest(), integrity):
+                raise ValueError("HMAC mismatch")
+            retcode, body = _split_retcode(signed[header_size:])
+            payload = _unpad(AES.new(self.key, AES.MODE_ECB).decrypt(body)) if body else b""
+            if payload.startswith(self._version_header[:3]):
+                payload = payload[15:]
+            return TuyaMessage(seqno, cmd, retcode, payload)
+
+        signed, integrity = frame[:-8], frame[-8:-4]
+        if struct.unpack(">I", integrity)[0] != binascii.crc32(signed) & 0xFFFFFFFF:
+            raise ValueError("CRC mismatch")
+        retcode, body = _split_retcode(signed[header_size:])
+        if body.startswith(self._version_header[:3]):
+            body = body[15:]
+        if body and not body.startswith(b"{") and len(body) % 16 == 0:
+            body = _unpad(AES.new(self.key, AES.MODE_ECB).decrypt(body))
+        return TuyaMessage(seqno, cmd, retcode, body)
+
+
+def derive_session_key(version: float, local_key: bytes, local_nonce: bytes, remote_nonce: bytes) -> bytes:
+    """Derive the 3.4/3.5 session key from both negotiation nonces."""
+    xored = bytes(a ^ b for a, b in zip(local_nonce, remote_nonce, strict=True))
+    if version == 3.4:
+        return AES.new(local_key, AES.MODE_ECB).encrypt(xored)
+    cipher = AES.new(local_key, AES.MODE_GCM, nonce=local_nonce[:12])
+    return cipher.encrypt(xored)
+
+
+def extract_dps(payload: bytes) -> dict[str, Any] | None:
+    """Extract the DP dict from a decoded JSON payload.
+
+    3.3 devices send ``{"dps": {...}}``; 3.4/3.5 nest it as
+    ``{"protocol": 4, "data": {"dps": {...}}}``.
+    """
+    if not payload:
+        return None
+    try:
+        data = json.loads(payload.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    dps = data.get("dps")
+    if dps is None and isinstance(data.get("data"), dict):
+        dps = data["data"].get("dps")
+    return {str(k): v for k, v in dps.items()} if isinstance(dps, dict) else None
+
+
+class _TuyaLocalProtocol(asyncio.Protocol):
+    """asyncio Protocol that feeds frames to its owning TuyaLocalConnection."""
+
+    def __init__(self, connection: TuyaLocalConnection) -> None:
+        self._connection = connection
+        self._buffer = bytearray()
+        self.transport: asyncio.Transport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Store the transport once TCP is established."""
+        self.transport = transport  # type: ignore[assignment]
+
+    def data_received(self, data: bytes) -> None:
+        """Decode complete frames and route them to the connection."""
+        self._buffer.extend(data)
+        for message in self._connection.codec.decode(self._buffer):
+            self._connection._handle_message(message)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Propagate socket loss to the connection."""
+        self.transport = None
+        self._connection._handle_connection_lost(exc)
+
+
+class TuyaLocalConnection:
+    """One persistent asyncio connection to a Tuya device.
+
+    Exposes the subset of the tinytuya ``Device`` surface that
+    ``KKTKolbeTuyaDevice`` relies on (``dps_cache`` and a synchronous
+    ``close()``) plus async request methods.
+    """
+
+    def __init__(
+        self,
+        device_id: str,
+        host: str,
+        local_key: str,
+        version: float,
+        port: int = TUYA_LOCAL_PORT,
+        on_push: PushHandler | None = None,
+        on_lost: Callable[[TuyaLocalConnection], None] | None = None,
+    ) -> None:
+        """Initialize the connection (does not connect).
+
+        Args:
+            device_id: Tuya device ID
+            host: Device IP address
+            local_key: Device local key (16 characters)
+            version: Protocol version (3.3, 3.4 or 3.5)
+            port: Tuya LAN port
+            on_push: Called on the event loop with DP-id-keyed dicts from
+                     unsolicited STATUS frames
+            on_lost: Called once when the socket closes unexpectedly
+        """
+        self.device_id = device_id
+        self.host = host
+        self.port = port
+        self.version = version
+        self.codec = TuyaFrameCodec(version, local_key.encode("latin1"))
+        self.dps_cache: dict[str, Any] = {}
+        self._on_push = on_push
+        self._on_lost = on_lost
+        self._protocol: _TuyaLocalProtocol | None = None
+        self._seqno = 0
+        self._pending: dict[int, tuple[frozenset[int], asyncio.Future[TuyaMessage]]] = {}
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        self._closing = False
+        self.stats: dict[str, int] = {"requests": 0, "pushes": 0, "decode_errors": 0}
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the socket is open."""
+        return self._protocol is not None and self._protocol.transport is not None
+
+    @property
+    def socket(self) -> Any:
+        """Return the underlying socket (for keep-alive tuning)."""
+        if self._protocol is None or self._protocol.transport is None:
+            return None
+        return self._protocol.transport.get_extra_info("socket")
+
+    async def async_connect(self, timeout: float = DEFAULT_REQUEST_TIMEOUT) -> None:
+        """Open the socket, negotiate a session key (3.4/3.5) and start heartbeats.
+
+        Raises:
+            KKTTimeoutError: Connect or negotiation timed out
+            KKTConnectionError: Socket could not be opened
+            KKTAuthenticationError: Session key negotiation was rejected
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            _, protocol = await asyncio.wait_for(
+                loop.create_connection(lambda: _TuyaLocalProtocol(self), self.host, self.port),
+                timeout=timeout,
+            )
+        except TimeoutError as err:
+            raise KKTTimeoutError(operation="connect", device_id=self.device_id[:8], timeout=timeout) from err
+        except OSError as err:
+            raise KKTConnectionError(operation="connect", device_id=self.device_id[:8], reason=str(err)) from err
+
+        self._protocol = protocol
+        self._configure_socket()
+
+        try:
+            if self.version >= 3.4:
+                await self._async_negotiate_session_key(timeout)
+        except BaseException:
+            self.close()
+            raise
+
+        self._heartbeat_task = loop.create_task(self._async_heartbeat_loop())
+
+    def _configure_socket(self) -> None:
+        """Disable Nagle and enable TCP keep-alive on the connection socket."""
+        sock = self.socket
+        if sock is None:
+            return
+        with contextlib.suppress(OSError, AttributeError):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, TCP_KEEPALIVE_COUNT)
+
+    async def _async_negotiate_session_key(self, timeout: float) -> None:
+        """Run the 3.4/3.5 three-way session key exchange."""
+        local_key = self.codec.local_key
+        local_nonce = os.urandom(16)
+        response = await self._async_request(
+            SESS_KEY_NEG_START, local_nonce, expect=frozenset({SESS_KEY_NEG_RESP}), timeout=timeout
+        )
+        payload = response.payload
+        if len(payload) < 48:
+            raise KKTAuthenticationError(
+                device_id=self.device_id, message="Session key negotiation failed - short response"
+            )
+        remote_nonce, remote_hmac = payload[:16], payload[16:48]
+        if not hmac.compare_digest(hmac.new(local_key, local_nonce, sha256).digest(), remote_hmac):
+            raise KKTAuthenticationError(
+                device_id=self.device_id, message="Session key negotiation failed - invalid local key"
+            )
+
+        self._send(SESS_KEY_NEG_FINISH, hmac.new(local_key, remote_nonce, sha256).digest())
+        self.codec.key = derive_session_key(self.version, local_key, local_nonce, remote_nonce)
+        _LOGGER.debug("Session key negotiated with device %s (protocol %s)", self.device_id[:8], self.version)
+
+    def _next_seqno(self) -> int:
+        self._seqno = (self._seqno + 1) & 0xFFFFFFFF or 1
+        return self._seqno
+
+    def _send(self, cmd: int, payload: bytes) -> int:
+        """Write a frame without waiting for a response; returns its seqno."""
+        if self._protocol is None or self._protocol.transport is None:
+            raise KKTConnectionError(operation="send", device_id=self.device_id[:8], reason="Not connected")
+        seqno = self._next_seqno()
+        self._protocol.transport.write(self.codec.encode(seqno, cmd, payload))
+        return seqno
+
+    async def _async_request(
+        self,
+        cmd: int,
+        payload: bytes,
+        expect: frozenset[int] | None = None,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ) -> TuyaMessage:
+        """Send a frame and wait for the response carrying the same seqno.
+
+        Args:
+            cmd: Command code to send
+            payload: Plain payload
+            expect: Response command codes accepted for this request
+                    (defaults to the request command)
+            timeout: Seconds to wait for the response
+        """
+        future: asyncio.Future[TuyaMessage] = asyncio.get_running_loop().create_future()
+        seqno = self._send(cmd, payload)
+        self._pending[seqno] = (expect or frozenset({cmd}), future)
+        self.stats["requests"] += 1
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except TimeoutError as err:
+            raise KKTTimeoutError(operation=f"command_{cmd}", device_id=self.device_id[:8], timeout=timeout) from err
+        finally:
+            self._pending.pop(seqno, None)
+
+    def _build_payload(self, dps: dict[str, Any] | None = None, query: bool = False) -> bytes:
+        """Build the compact JSON payload for a query or control command."""
+        now = int(time.time())
+        data: dict[str, Any]
+        if query:
+            data = {"gwId": self.device_id, "devId": self.device_id, "uid": self.device_id, "t": str(now)}
+        elif self.version >= 3.4:
+            data = {"protocol": 5, "t": now, "data": {"dps": dps}}
+        else:
+            data = {"devId": self.device_id, "uid": self.device_id, "t": str(now), "dps": dps}
+        return json.dumps(data, separators=(",", ":"), default=_json_default).encode()
+
+    async def async_status(self, timeout: float = DEFAULT_REQUEST_TIMEOUT) -> dict[str, Any]:
+        """Query all DPs.
+
+        Returns:
+            ``{"dps": {...}}`` on success (merged into ``dps_cache``), or the
+            tinytuya-style Error 914 dict if the response could not be decoded.
+        """
+        cmd = DP_QUERY_NEW if self.version >= 3.4 else DP_QUERY
+        # 3.3 firmwares occasionally answer a query with a STATUS frame
+        response = await self._async_request(
+            cmd, self._build_payload(query=True), expect=frozenset({cmd, STATUS}), timeout=timeout
+        )
+        if response.cmd == _UNDECODABLE:
+            return dict(ERROR_914_STATUS)
+        dps = extract_dps(response.payload) or {}
+        self.dps_cache.update(dps)
+        return {"dps": dps}
+
+    async def async_set_dps(self, dps: dict[str, Any], timeout: float = DEFAULT_REQUEST_TIMEOUT) -> TuyaMessage:
+        """Write one or more DPs in a single control frame and wait for the ack."""
+        cmd = CONTROL_NEW if self.version >= 3.4 else CONTROL
+        response = await self._async_request(cmd, self._build_payload(dps=dps), timeout=timeout)
+        if response.cmd == _UNDECODABLE:
+            raise KKTAuthenticationError(
+                device_id=self.device_id, message="Device response could not be decrypted - check local key"
+            )
+        return response
+
+    async def _async_heartbeat_loop(self) -> None:
+        """Keep the socket alive; close it when the device stops answering."""
+        payload = json.dumps({"gwId": self.device_id, "devId": self.device_id}, separators=(",", ":")).encode()
+        while self.connected:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            try:
+                await self._async_request(HEART_BEAT, payload)
+            except (KKTTimeoutError, KKTConnectionError) as err:
+                _LOGGER.debug("Heartbeat failed for device %s: %s", self.device_id[:8], err)
+                if self._protocol is not None and self._protocol.transport is not None:
+                    self._protocol.transport.close()
+                return
+
+    def _handle_message(self, message: TuyaMessage) -> None:
+        """Resolve the matching pending request or dispatch a push."""
+        pending = self._pending.get(message.seqno)
+        if message.cmd == _UNDECODABLE:
+            self.stats["decode_errors"] += 1
+        if pending is not None and (message.cmd in pending[0] or message.cmd == _UNDECODABLE):
+            _, future = self._pending.pop(message.seqno)
+            if not future.done():
+                future.set_result(message)
+            return
+
+        if message.cmd in (STATUS, UPDATEDPS):
+            dps = extract_dps(message.payload)
+            if dps:
+                self.dps_cache.update(dps)
+                self.stats["pushes"] += 1
+                if self._on_push is not None:
+                    try:
+                        self._on_push(dps)
+                    except Exception:
+                        _LOGGER.exception("Push handler raised for device %s", self.device_id[:8])
+            return
+
+        _LOGGER.debug(
+            "Unmatched frame from device %s (cmd=%d, seqno=%d)", self.device_id[:8], message.cmd, message.seqno
+        )
+
+    def _handle_connection_lost(self, exc: Exception | None) -> None:
+        """Fail all pending requests and notify the owner."""
+        for _, future in self._pending.values():
+            if not future.done():
+                future.set_exception(
+                    KKTConnectionError(
+                        operation="receive",
+                        device_id=self.device_id[:8],
+                        reason=str(exc) if exc else "Connection closed by device",
+                    )
+                )
+        self._pending.clear()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if not self._closing and self._on_lost is not None:
+            self._on_lost(self)
+
+    def close(self) -> None:
+        """Close the socket (synchronous, like tinytuya ``Device.close``)."""
+        self._closing = True
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self._protocol is not None and self._protocol.transport is not None:
+            self._protocol.transport.close()
+        self._protocol = None
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize RAW DP values (bytes) the way Tuya expects them: base64."""
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(bytes(value)).decode()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,84 @@
+"""Expected-value tracking for DP writes awaiting device confirmation.
+
+Every write used to be followed by a refresh (immediate on the hybrid
+coordinator, deferred by ``CLOUD_PROPAGATION_DELAY_SECONDS`` on the plain
+one), even when the SmartLife MQTT push or a local status frame had already
+reported the written values. ``WriteTracker`` remembers what was written;
+the coordinators feed every report into ``confirm`` and cancel their pending
+refresh once nothing is outstanding, so they only poll when no confirmation
+arrived before the deadline.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .bitfield_utils import decode_raw_data_to_bytes
+from .bitfield_utils import is_base64_string
+from .bitfield_utils import is_hex_string
+
+
+def values_match(expected: Any, reported: Any) -> bool:
+    """Return True if a reported DP value confirms the written one.
+
+    Cloud and local reports differ in representation: numbers may come back
+    as strings and RAW bitfields as Base64 instead of hex.
+    """
+    if expected == reported:
+        return True
+    if isinstance(expected, bool) or isinstance(reported, bool):
+        return False
+    if str(expected) == str(reported):
+        return True
+    if isinstance(expected, str) and isinstance(reported, str):
+        # Same RAW value, hex locally and Base64 from the cloud
+        if (is_hex_string(expected) and is_base64_string(reported)) or (
+            is_base64_string(expected) and is_hex_string(reported)
+        ):
+            return decode_raw_data_to_bytes(expected) == decode_raw_data_to_bytes(reported)
+    return False
+
+
+class WriteTracker:
+    """Written DP values that no report has confirmed yet."""
+
+    def __init__(self) -> None:
+        """Initialize an empty tracker."""
+        # DP id (str, like the DPS dict) -> value written
+        self._expected: dict[str, Any] = {}
+        self.stats: dict[str, int] = {"writes": 0, "confirmed": 0, "unconfirmed": 0}
+
+    @property
+    def pending(self) -> bool:
+        """Return True while written values are unconfirmed."""
+        return bool(self._expected)
+
+    def expect(self, dps: Mapping[int | str, Any]) -> None:
+        """Register the values of a successful write."""
+        self.stats["writes"] += 1
+        self._expected.update({str(dp): value for dp, value in dps.items()})
+
+    def confirm(self, reported: Mapping[int | str, Any]) -> bool:
+        """Drop the expectations a report confirms.
+
+        Returns:
+            True if this report confirmed the last outstanding value, i.e. the
+            refresh scheduled for the writes is no longer needed.
+        """
+        if not self._expected:
+            return False
+        for dp, value in reported.items():
+            key = str(dp)
+            if key in self._expected and values_match(self._expected[key], value):
+                del self._expected[key]
+        if self._expected:
+            return False
+        self.stats["confirmed"] += 1
+        return True
+
+    def expire(self) -> None:
+        """Give up on the outstanding values (the deadline refresh is running)."""
+        if self._expected:
+            self.stats["unconfirmed"] += 1
+            self._expected.clear()
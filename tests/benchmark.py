@@ -0,0 +1,156 @@
+"""Benchmark recording and comparison for the KKT Kolbe integration.
+
+The timings are taken by ``tests/test_benchmarks.py``, which runs as part of
+the normal test suite. To keep them, point ``KKT_BENCHMARK_OUTPUT`` at a file:
+
+    KKT_BENCHMARK_OUTPUT=bench/$(git rev-parse --short HEAD).json \\
+        python -m pytest tests/test_benchmarks.py
+
+``KKT_BENCHMARK_ROUNDS`` sets the number of samples per benchmark (default 3,
+use more for numbers you want to compare). Two result files are compared with
+
+    python -m tests.benchmark bench/old.json bench/new.json --threshold 10
+
+which prints the change of every median and exits with 1 if one of them got
+slower by more than the threshold (in percent).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+BENCHMARK_OUTPUT_ENV = "KKT_BENCHMARK_OUTPUT"
+BENCHMARK_ROUNDS_ENV = "KKT_BENCHMARK_ROUNDS"
+DEFAULT_ROUNDS = 3
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def benchmark_rounds() -> int:
+    """Return the number of samples to take per benchmark."""
+    return max(1, int(os.environ.get(BENCHMARK_ROUNDS_ENV, DEFAULT_ROUNDS)))
+
+
+def summarize(samples_ms: list[float]) -> dict[str, Any]:
+    """Return the statistics stored for one benchmark (milliseconds)."""
+    return {
+        "unit": "ms",
+        "rounds": len(samples_ms),
+        "min": round(min(samples_ms), 3),
+        "median": round(statistics.median(samples_ms), 3),
+        "mean": round(statistics.fmean(samples_ms), 3),
+        "max": round(max(samples_ms), 3),
+    }
+
+
+class BenchmarkRecorder:
+    """Collect samples by benchmark name and write them as JSON."""
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.samples: dict[str, list[float]] = {}
+
+    def add(self, name: str, elapsed_ms: float) -> None:
+        """Record one sample of a benchmark."""
+        self.samples.setdefault(name, []).append(elapsed_ms)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Record the wall time of the ``with`` block as one sample."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def results(self) -> dict[str, dict[str, Any]]:
+        """Return the summary of every benchmark, sorted by name."""
+        return {name: summarize(samples) for name, samples in sorted(self.samples.items())}
+
+    def write(self, path: str | Path) -> None:
+        """Write the results with the commit and environment they were taken on."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"meta": _environment(), "results": self.results()}
+        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def _environment() -> dict[str, Any]:
+    """Return the metadata stored alongside the results."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        from homeassistant.const import __version__ as ha_version
+    except ImportError:
+        ha_version = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "homeassistant": ha_version,
+        "machine": platform.machine(),
+    }
+
+
+def compare(old: dict[str, Any], new: dict[str, Any], threshold: float) -> tuple[list[str], bool]:
+    """Compare the medians of two result files.
+
+    Returns:
+        The report lines, and whether any benchmark regressed by more than
+        ``threshold`` percent.
+    """
+    old_results = old.get("results", {})
+    new_results = new.get("results", {})
+    lines = [f"{'benchmark':<48} {'old ms':>10} {'new ms':>10} {'change':>9}"]
+    regressed = False
+    for name in sorted(old_results.keys() | new_results.keys()):
+        before = old_results.get(name, {}).get("median")
+        after = new_results.get(name, {}).get("median")
+        if before is None or after is None:
+            missing = ["-" if value is None else f"{value:.3f}" for value in (before, after)]
+            lines.append(f"{name:<48} {missing[0]:>10} {missing[1]:>10} {'n/a':>9}")
+            continue
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+        if change > threshold:
+            regressed = True
+            flag = "  <-- slower"
+        lines.append(f"{name:<48} {before:>10.3f} {after:>10.3f} {change:>+8.1f}%{flag}")
+    return lines, regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Compare two benchmark result files from the command line."""
+    parser = argparse.ArgumentParser(description="Compare KKT Kolbe benchmark results")
+    parser.add_argument("old", type=Path, help="Baseline results (JSON)")
+    parser.add_argument("new", type=Path, help="Results to check (JSON)")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent (default 10)")
+    args = parser.parse_args(argv)
+
+    old = json.loads(args.old.read_text(encoding="utf-8"))
+    new = json.loads(args.new.read_text(encoding="utf-8"))
+    lines, regressed = compare(old, new, args.threshold)
+    sys.stdout.write(f"{old['meta'].get('commit')} -> {new['meta'].get('commit')}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
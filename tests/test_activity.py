@@ -0,0 +1,85 @@
+"""Tests for the activity-aware poll cadence."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.activity import ActivityCadence
+from custom_components.kkt_kolbe.activity import DeviceActivity
+from custom_components.kkt_kolbe.device_types import COOKTOP_DPS
+from custom_components.kkt_kolbe.device_types import HOOD_DPS
+
+NORMAL = timedelta(seconds=30)
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cooktop_cadence_follows_power_and_zones() -> None:
+    """DP 101 is the cooktop's power; any zone level makes it active."""
+    cadence = ActivityCadence(object(), COOKTOP_DPS, NORMAL)
+
+    assert cadence.interval({"101": False, "162": "0000000000"}) == timedelta(seconds=120)
+    assert cadence.activity is DeviceActivity.IDLE
+    assert cadence.interval({"101": True, "162": "0000000000"}) == NORMAL
+    assert cadence.interval({"101": True, "162": "0000090000"}) == timedelta(seconds=10)
+    assert cadence.interval({"101": True, "162": "AAAACQA="}) == timedelta(seconds=10)
+    assert cadence.interval({"101": True, "134": 15}) == timedelta(seconds=10)
+
+
+def test_hood_cadence_uses_fan_and_ignores_rgb_mode() -> None:
+    """On a hood DP 101 is the RGB mode, not power; the fan counts as activity."""
+    cadence = ActivityCadence(object(), HOOD_DPS, NORMAL)
+
+    assert cadence.classify({"1": True, "10": "off", "101": 3}) is DeviceActivity.ON
+    assert cadence.classify({"1": True, "10": "high"}) is DeviceActivity.ACTIVE
+    assert cadence.classify({"1": False, "10": "high", "13": 5}) is DeviceActivity.IDLE
+    assert cadence.classify({}) is DeviceActivity.ON
+
+
+def test_burst_after_command_expires() -> None:
+    """A command polls in bursts for a while, then the activity decides again."""
+    clock = _Clock()
+    cadence = ActivityCadence(object(), HOOD_DPS, NORMAL, clock=clock)
+
+    cadence.note_command()
+    assert cadence.interval({"1": False}) == timedelta(seconds=5)
+
+    clock.now += 31
+    assert cadence.interval({"1": False}) == timedelta(seconds=120)
+
+
+@pytest.mark.asyncio
+async def test_plain_coordinator_polls_by_activity(hass: HomeAssistant, mock_config_entry) -> None:
+    """The online interval of the local coordinator follows the cached DPs."""
+    from custom_components.kkt_kolbe.coordinator import DeviceState
+    from custom_components.kkt_kolbe.coordinator import KKTKolbeUpdateCoordinator
+
+    mock_config_entry.add_to_hass(hass)
+    device = MagicMock()
+    device.device_id = "test_device_123"
+    device.is_connected = True
+    device.async_get_status = AsyncMock(return_value={"1": False, "10": "off"})
+    coordinator = KKTKolbeUpdateCoordinator(hass=hass, entry=mock_config_entry, device=device)
+    coordinator.mark_initial_connect_done()
+
+    await coordinator._async_update_data()
+    assert coordinator.device_state is DeviceState.ONLINE
+    assert coordinator.update_interval == timedelta(seconds=120)
+
+    device.async_get_status.return_value = {"1": True, "10": "middle"}
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=10)
+    assert coordinator.connection_info["activity"] == "active"
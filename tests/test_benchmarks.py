@@ -0,0 +1,327 @@
+"""Import, setup and config flow benchmarks.
+
+The benchmarks run with the regular suite (with few rounds) so the harness
+keeps working; see tests/benchmark.py for recording and comparing results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.kkt_kolbe.api.rate_limiter import AccountRateLimiter
+from custom_components.kkt_kolbe.api.tuya_cloud_client import TuyaCloudClient
+from custom_components.kkt_kolbe.clients.tuya_sharing_client import TuyaSharingClient
+from custom_components.kkt_kolbe.const import DOMAIN
+from custom_components.kkt_kolbe.const import LOCAL_TRANSPORT_ASYNCIO
+from custom_components.kkt_kolbe.const import LOCAL_TRANSPORT_TINYTUYA
+from custom_components.kkt_kolbe.const import RATE_LIMITERS_KEY
+from custom_components.kkt_kolbe.tuya_device import KKTKolbeTuyaDevice
+
+from .benchmark import BENCHMARK_OUTPUT_ENV
+from .benchmark import REPO_ROOT
+from .benchmark import BenchmarkRecorder
+from .benchmark import benchmark_rounds
+from .tuya_cloud_emulator import emulated_cloud
+from .tuya_emulator import EmulatedTuyaDevice
+from .tuya_emulator import emulated_devices
+
+# Runs in a fresh interpreter per round. Home Assistant itself is imported
+# first since it is always loaded before the integration.
+_IMPORT_SCRIPT = """
+import json, time
+import homeassistant.config_entries, homeassistant.helpers.config_validation, homeassistant.helpers.entity_platform
+timings = {}
+for name in MODULES:
+    start = time.perf_counter()
+    __import__(name)
+    timings[name] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+"""
+
+_PACKAGE = "custom_components.kkt_kolbe"
+_IMPORTED_MODULES = {
+    "import.package": _PACKAGE,
+    "import.config_flow": f"{_PACKAGE}.config_flow",
+    "import.coordinator": f"{_PACKAGE}.coordinator",
+    "import.hybrid_coordinator": f"{_PACKAGE}.hybrid_coordinator",
+    **{f"import.platform.{name}": f"{_PACKAGE}.{name}" for name in ("fan", "light", "switch", "sensor", "number")},
+}
+
+# Appliances polled at once, and the LAN round trip they answer with
+_EMULATED_APPLIANCES = 10
+_EMULATED_LATENCY = 0.002
+
+# Devices of the emulated cloud account, and the OpenAPI round trip they answer with
+_EMULATED_CLOUD_DEVICES = 4
+_EMULATED_CLOUD_LATENCY = 0.01
+
+# Status of the HERMES & STYLE hood reported by the fake tinytuya device
+_HOOD_STATUS = {"1": True, "4": False, "6": False, "10": "low", "13": 0, "101": 0}
+
+
+@pytest.fixture(scope="module")
+def benchmark() -> Generator[BenchmarkRecorder, None, None]:
+    """Collect this module's timings; written as JSON if KKT_BENCHMARK_OUTPUT is set."""
+    recorder = BenchmarkRecorder()
+    yield recorder
+    if output := os.environ.get(BENCHMARK_OUTPUT_ENV):
+        recorder.write(output)
+
+
+class FakeTinyTuyaDevice:
+    """Stand-in for ``tinytuya.Device`` answering every protocol version with a fixed status."""
+
+    def __init__(self, dev_id: str, address: str, local_key: str, version: float, port: int = 6668) -> None:
+        """Initialize the fake device."""
+        self.id = dev_id
+        self.address = address
+        self.version = version
+        self.dps = dict(_HOOD_STATUS)
+
+    def set_socketPersistent(self, persist: bool) -> None:
+        """Ignore socket settings."""
+
+    def set_socketNODELAY(self, nodelay: bool) -> None:
+        """Ignore socket settings."""
+
+    def set_socketTimeout(self, timeout: float) -> None:
+        """Ignore socket settings."""
+
+    def set_socketRetryLimit(self, limit: int) -> None:
+        """Ignore socket settings."""
+
+    def status(self) -> dict[str, Any]:
+        """Return the full status."""
+        return {"devId": self.id, "dps": dict(self.dps)}
+
+    def set_value(self, dp: int, value: Any) -> dict[str, Any]:
+        """Apply a single DP write."""
+        self.dps[str(dp)] = value
+        return {"dps": {str(dp): value}}
+
+    def set_multiple_values(self, dps: dict[int, Any]) -> dict[str, Any]:
+        """Apply a multi-DP write."""
+        self.dps.update({str(dp): value for dp, value in dps.items()})
+        return {"dps": {str(dp): value for dp, value in dps.items()}}
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+@pytest.fixture
+def fake_tinytuya() -> Generator[None, None, None]:
+    """Let the real device class talk to the fake tinytuya device."""
+    with (
+        patch("custom_components.kkt_kolbe.tuya_device.tinytuya.Device", FakeTinyTuyaDevice),
+        patch(
+            "custom_components.kkt_kolbe.tuya_device.KKTKolbeTuyaDevice.async_quick_check",
+            AsyncMock(return_value=True),
+        ),
+        patch("custom_components.kkt_kolbe.services.async_setup_services", AsyncMock()),
+    ):
+        yield
+
+
+def test_import_time(benchmark: BenchmarkRecorder) -> None:
+    """Import cost of the package, config flow, coordinators and platforms in a fresh interpreter."""
+    script = f"MODULES = {list(_IMPORTED_MODULES.values())!r}\n{_IMPORT_SCRIPT}"
+    for _ in range(benchmark_rounds()):
+        output = subprocess.run(
+            [sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        timings = json.loads(output.splitlines()[-1])
+        for name, module in _IMPORTED_MODULES.items():
+            benchmark.add(name, timings[module])
+
+    assert set(_IMPORTED_MODULES) <= benchmark.samples.keys()
+
+
+async def test_device_setup_to_first_state(
+    hass: HomeAssistant, benchmark: BenchmarkRecorder, fake_tinytuya: None
+) -> None:
+    """Device entry setup, per-platform forwarding and time until the first entity reports a state."""
+    forward_entry_setups = hass.config_entries.async_forward_entry_setups
+
+    async def forward_one_by_one(entry: config_entries.ConfigEntry, platforms: list[str]) -> None:
+        # One platform at a time so each can be timed
+        for platform in platforms:
+            with benchmark.measure(f"setup.forward_platform.{platform}"):
+                await forward_entry_setups(entry, [platform])
+
+    for _ in range(benchmark_rounds()):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Benchmark Hood",
+            data={
+                "device_id": "bf735dfe2ad64fba7cpyhn",
+                "ip_address": "192.0.2.10",
+                "local_key": "1234567890abcdef",
+                "integration_mode": "manual",
+                "product_name": "hermes_style_hood",
+                "device_type": "hermes_style_hood",
+            },
+            unique_id="bf735dfe2ad64fba7cpyhn",
+        )
+        entry.add_to_hass(hass)
+
+        start = time.perf_counter()
+        with patch.object(hass.config_entries, "async_forward_entry_setups", forward_one_by_one):
+            assert await hass.config_entries.async_setup(entry.entry_id)
+        benchmark.add("setup.device_entry", (time.perf_counter() - start) * 1000)
+
+        entity_ids = [
+            entity.entity_id for entity in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        ]
+        assert entity_ids
+        async with asyncio.timeout(10):
+            while not any(
+                (state := hass.states.get(entity_id)) is not None and state.state not in ("unavailable", "unknown")
+                for entity_id in entity_ids
+            ):
+                await asyncio.sleep(0.001)
+        benchmark.add("setup.first_entity_state", (time.perf_counter() - start) * 1000)
+
+        assert await hass.config_entries.async_remove(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_config_flow_step_latency(
+    hass: HomeAssistant, benchmark: BenchmarkRecorder, mock_setup_entry: AsyncMock
+) -> None:
+    """Latency of each step of the manual config flow."""
+    steps: list[tuple[str, dict[str, Any]]] = [
+        ("manual", {"setup_method": "manual"}),
+        (
+            "authentication",
+            {"ip_address": "192.0.2.10", "device_id": "bf735dfe2ad64fba7cpyhn", "device_type": "hermes_style_hood"},
+        ),
+        ("settings", {"local_key": "1234567890abcdef", "test_connection": False}),
+        ("confirmation", {"update_interval": 30, "enable_debug_logging": False, "enable_advanced_entities": True}),
+    ]
+
+    for _ in range(benchmark_rounds()):
+        with benchmark.measure("config_flow.user"):
+            result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
+        for step_id, user_input in steps:
+            with benchmark.measure(f"config_flow.{step_id}"):
+                result = await hass.config_entries.flow.async_configure(result["flow_id"], user_input=user_input)
+            assert result["step_id"] == step_id
+        with benchmark.measure("config_flow.create_entry"):
+            result = await hass.config_entries.flow.async_configure(result["flow_id"], user_input={"confirm": True})
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+
+        await hass.config_entries.async_remove(result["result"].entry_id)
+        await hass.async_block_till_done()
+
+
+def _lan_client(hass: HomeAssistant, emulated: EmulatedTuyaDevice, transport: str) -> KKTKolbeTuyaDevice:
+    """Return the real device class pointed at an emulated appliance."""
+    return KKTKolbeTuyaDevice(
+        emulated.device_id,
+        emulated.host,
+        emulated.local_key,
+        version=f"{emulated.version:.1f}",
+        hass=hass,
+        transport=transport,
+        port=emulated.port,
+    )
+
+
+@pytest.mark.usefixtures("socket_enabled")
+@pytest.mark.parametrize("transport", [LOCAL_TRANSPORT_TINYTUYA, LOCAL_TRANSPORT_ASYNCIO])
+async def test_lan_connect_poll_and_reconnect(
+    hass: HomeAssistant, benchmark: BenchmarkRecorder, transport: str
+) -> None:
+    """Connect time, poll throughput and reconnect storms of the real LAN path against emulated appliances."""
+    for version in (3.3, 3.4, 3.5):
+        async with emulated_devices(1, version=version, latency=_EMULATED_LATENCY) as (emulated,):
+            for _ in range(benchmark_rounds()):
+                device = _lan_client(hass, emulated, transport)
+                with benchmark.measure(f"lan.{transport}.connect.{version}"):
+                    await device.async_connect()
+                await device.async_disconnect()
+
+    async with emulated_devices(_EMULATED_APPLIANCES, version=3.4, latency=_EMULATED_LATENCY) as appliances:
+        devices = [_lan_client(hass, emulated, transport) for emulated in appliances]
+        await asyncio.gather(*(device.async_connect() for device in devices))
+
+        for _ in range(benchmark_rounds()):
+            with benchmark.measure(f"lan.{transport}.poll_{_EMULATED_APPLIANCES}_devices"):
+                statuses = await asyncio.gather(*(device.async_get_status() for device in devices))
+            assert all(statuses)
+
+        for _ in range(benchmark_rounds()):
+            # Every appliance drops its client at once, as after a router restart
+            for emulated in appliances:
+                emulated.drop_connections()
+            for device in devices:
+                await device.async_disconnect()
+            with benchmark.measure(f"lan.{transport}.reconnect_{_EMULATED_APPLIANCES}_devices"):
+                statuses = await asyncio.gather(*(device.async_get_status() for device in devices))
+            assert all(statuses)
+
+        for device in devices:
+            await device.async_disconnect()
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_cloud_poll_and_push(hass: HomeAssistant, benchmark: BenchmarkRecorder) -> None:
+    """Cloud polling with one client per device and one shared client, and SmartLife push latency."""
+    async with (
+        emulated_cloud(_EMULATED_CLOUD_DEVICES, latency=_EMULATED_CLOUD_LATENCY) as cloud,
+        aiohttp.ClientSession() as session,
+    ):
+        device_ids = [device.device_id for device in cloud.devices]
+        # Measure the request path rather than the project's 15 requests per minute
+        hass.data[RATE_LIMITERS_KEY] = {cloud.client_id: AccountRateLimiter(requests_per_minute=60000, burst=1000)}
+        # One client per device entry, as the IoT Platform mode sets them up
+        clients = [
+            TuyaCloudClient(cloud.client_id, cloud.client_secret, cloud.endpoint, session, hass) for _ in device_ids
+        ]
+        shared = TuyaCloudClient(cloud.client_id, cloud.client_secret, cloud.endpoint, session, hass)
+        # Steady-state polling: log in first, outside the measurements
+        await asyncio.gather(*(client.authenticate() for client in (*clients, shared)))
+
+        for _ in range(benchmark_rounds()):
+            with benchmark.measure(f"cloud.poll_{_EMULATED_CLOUD_DEVICES}_devices"):
+                statuses = await asyncio.gather(
+                    *(client.get_device_status(device_id) for client, device_id in zip(clients, device_ids))
+                )
+            assert all(statuses)
+
+            with benchmark.measure(f"cloud.poll_{_EMULATED_CLOUD_DEVICES}_devices_shared_client"):
+                statuses = await asyncio.gather(*(shared.get_device_status(device_id) for device_id in device_ids))
+            assert all(statuses)
+
+        client = await TuyaSharingClient.async_from_stored_tokens(
+            hass, {"user_code": "EU12345678", "access_token": "a", "refresh_token": "r", "expire_time": 0}
+        )
+        with patch("tuya_sharing.Manager", cloud.sharing_manager):
+            await client.async_get_devices()
+        pushed = asyncio.Event()
+        client.register_push_callback(device_ids[0], lambda dps, report_type: pushed.set())
+
+        for index in range(benchmark_rounds()):
+            pushed.clear()
+            with benchmark.measure("cloud.smartlife_push"):
+                cloud.set_status(device_ids[0], {"countdown": index + 1})
+                await asyncio.wait_for(pushed.wait(), 1)
+
+        await client.async_close()
@@ -0,0 +1,53 @@
+"""Tests for the shared decoded bitfield views."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from custom_components.kkt_kolbe import bitfield_utils
+from custom_components.kkt_kolbe.bitfield_utils import DecodedBitfield
+from custom_components.kkt_kolbe.bitfield_utils import get_zone_value_from_coordinator
+
+
+def _coordinator(dps: dict) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.data = {"dps": dps}
+    return coordinator
+
+
+def test_view_decodes_hex_and_base64_alike() -> None:
+    """Local hex and cloud Base64 encodings of the same bytes give the same zones."""
+    hex_view = DecodedBitfield("0000001900")
+    b64_view = DecodedBitfield("AAAAGQA=")
+
+    assert [hex_view.zone_value(z) for z in range(1, 6)] == [0, 0, 0, 25, 0]
+    assert [b64_view.zone_value(z) for z in range(1, 6)] == [0, 0, 0, 25, 0]
+    assert hex_view.zone_value(9) == 0
+    assert DecodedBitfield("15").zone_bit(1) is True
+    assert DecodedBitfield("15").zone_bit(2) is False
+
+
+def test_raw_dp_is_decoded_once_per_value() -> None:
+    """All zones read from the same raw value share one decode."""
+    raw = "0102030405"
+    coordinator = _coordinator({"162": raw, "161": "05"})
+
+    with patch.object(bitfield_utils, "decode_raw_data_to_bytes", wraps=bitfield_utils.decode_raw_data_to_bytes) as dec:
+        levels = [get_zone_value_from_coordinator(coordinator, 162, zone) for zone in range(1, 6)]
+        levels += [get_zone_value_from_coordinator(coordinator, 162, zone) for zone in range(1, 6)]
+        assert dec.call_count == 1
+
+        assert get_zone_value_from_coordinator(coordinator, 161, 3) is True
+        assert dec.call_count == 2
+
+        coordinator.data = {"dps": {"162": "0900000000", "161": "05"}}
+        assert get_zone_value_from_coordinator(coordinator, 162, 1) == 9
+        assert dec.call_count == 3
+
+        # A refresh rebuilding an unchanged value is not decoded again
+        coordinator.data = {"dps": {"162": "".join(["09", "00000000"]), "161": "05"}}
+        assert get_zone_value_from_coordinator(coordinator, 162, 1) == 9
+        assert dec.call_count == 3
+
+    assert levels == [1, 2, 3, 4, 5] * 2
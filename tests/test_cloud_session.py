@@ -0,0 +1,61 @@
+"""Tests for the traced Tuya OpenAPI session."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.api.cloud_session import get_traced_cloud_session
+from custom_components.kkt_kolbe.api.tuya_cloud_client import TuyaCloudClient
+
+from .tuya_cloud_emulator import emulated_cloud
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+async def test_clients_borrow_the_traced_session(hass: HomeAssistant) -> None:
+    """Clients without a session share the traced one, and leaving a client keeps it open."""
+    async with emulated_cloud() as cloud:
+        async with TuyaCloudClient(cloud.client_id, cloud.client_secret, cloud.endpoint, hass=hass) as first:
+            await first.authenticate()
+        second = TuyaCloudClient(cloud.client_id, cloud.client_secret, cloud.endpoint + "/", hass=hass)
+        await second.authenticate()
+
+        assert first.session is second.session
+        assert first.session is not None and not first.session.closed
+        assert get_traced_cloud_session(hass).get_session() is first.session
+
+
+async def test_connections_are_reused(hass: HomeAssistant) -> None:
+    """Sequential requests of throwaway clients run over one kept-alive connection."""
+    async with emulated_cloud() as cloud:
+        for _ in range(3):
+            async with TuyaCloudClient(cloud.client_id, cloud.client_secret, cloud.endpoint, hass=hass) as client:
+                await client.authenticate()
+
+        stats = get_traced_cloud_session(hass).stats[cloud.host]
+        assert stats["requests"] == 3
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+
+
+async def test_detached_session_is_replaced(hass: HomeAssistant) -> None:
+    """Once Home Assistant detaches the session, the next client gets a fresh one."""
+    async with emulated_cloud() as cloud:
+        session = get_traced_cloud_session(hass).get_session()
+        session.detach()
+
+        client = TuyaCloudClient(cloud.client_id, cloud.client_secret, cloud.endpoint, hass=hass)
+        await client.authenticate()
+
+        assert session.closed
+        assert client.session is not session
+
+
+async def test_client_without_hass_closes_its_own_session() -> None:
+    """Without hass there is no shared session; the client's private session ends with it."""
+    async with emulated_cloud() as cloud:
+        async with TuyaCloudClient(cloud.client_id, cloud.client_secret, cloud.endpoint) as client:
+            await client.authenticate()
+
+        assert client.session is not None and client.session.closed
@@ -0,0 +1,82 @@
+"""Tests for the coalescing zone write queue."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.bitfield_utils import set_zone_value_in_coordinator
+from custom_components.kkt_kolbe.command_queue import ZoneWriteQueue
+
+
+def _coordinator(hass: HomeAssistant, dps: dict[str, Any]) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.data = {"dps": dps}
+    coordinator.async_set_data_points = AsyncMock()
+    coordinator.write_queue = ZoneWriteQueue(hass, coordinator, delay=0.01)
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_concurrent_zone_writes_become_one_command(hass: HomeAssistant) -> None:
+    """Zones set together are merged per DP and sent in a single multi-DP call."""
+    coordinator = _coordinator(hass, {"162": "0000000000", "163": "00"})
+
+    await asyncio.gather(
+        set_zone_value_in_coordinator(coordinator, 162, 1, 5),
+        set_zone_value_in_coordinator(coordinator, 162, 3, 9),
+        set_zone_value_in_coordinator(coordinator, 162, 5, 2),
+        set_zone_value_in_coordinator(coordinator, 163, 2, True),
+    )
+
+    coordinator.async_set_data_points.assert_awaited_once_with({162: "0500090002", 163: "02"})
+    assert coordinator.write_queue.stats == {"batches": 1, "writes": 4}
+
+
+@pytest.mark.asyncio
+async def test_next_batch_builds_on_unconfirmed_write(hass: HomeAssistant) -> None:
+    """Until the coordinator reports back, later batches merge into what was written."""
+    coordinator = _coordinator(hass, {"162": "0000000000"})
+    queue: ZoneWriteQueue = coordinator.write_queue
+
+    await queue.async_set_zone(162, 1, 5)
+    await queue.async_set_zone(162, 2, 7)
+    assert coordinator.async_set_data_points.await_args_list[-1].args == ({162: "0507000000"},)
+
+    # Device reported a new value; it is the base again
+    coordinator.data = {"dps": {"162": "0000000001"}}
+    await queue.async_set_zone(162, 2, 3)
+    assert coordinator.async_set_data_points.await_args_list[-1].args == ({162: "0003000001"},)
+
+
+@pytest.mark.asyncio
+async def test_unconfirmed_write_survives_rebuilt_snapshot(hass: HomeAssistant) -> None:
+    """A refresh that rebuilds the unchanged value as a new object keeps the written base."""
+    coordinator = _coordinator(hass, {"162": "0000000000"})
+    queue: ZoneWriteQueue = coordinator.write_queue
+
+    await queue.async_set_zone(162, 1, 5)
+    coordinator.data = {"dps": {"162": "".join(["00000", "00000"])}}
+    await queue.async_set_zone(162, 2, 7)
+
+    assert coordinator.async_set_data_points.await_args_list[-1].args == ({162: "0507000000"},)
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller(hass: HomeAssistant) -> None:
+    """Each writer of a failed batch sees the error."""
+    coordinator = _coordinator(hass, {"162": "0000000000"})
+    coordinator.async_set_data_points.side_effect = RuntimeError("offline")
+    queue: ZoneWriteQueue = coordinator.write_queue
+
+    results = await asyncio.gather(
+        queue.async_set_zone(162, 1, 5), queue.async_set_zone(162, 2, 5), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    coordinator.async_set_data_points.assert_awaited_once()
@@ -0,0 +1,124 @@
+"""Tests for persisted local connection fingerprints."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.connection_store import STORAGE_KEY
+from custom_components.kkt_kolbe.connection_store import async_get_fingerprint_store
+from custom_components.kkt_kolbe.tuya_device import KKTKolbeTuyaDevice
+
+DEVICE_ID = "bf735dfe2ad64fba7cpyhn"
+
+
+class _FakeDevice:
+    """Stand-in for a tinytuya.Device."""
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _stored(version: str = "3.4") -> dict[str, Any]:
+    return {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            DEVICE_ID: {
+                "version": version,
+                "key_variant": "original",
+                "ip_address": "192.168.1.10",
+                "last_success": "2026-01-01T00:00:00",
+            }
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_store_is_shared_and_loaded_once(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """All devices share one loaded store instance."""
+    hass_storage[STORAGE_KEY] = _stored()
+
+    first = await async_get_fingerprint_store(hass)
+    second = await async_get_fingerprint_store(hass)
+
+    assert first is second
+    assert first.get(DEVICE_ID)["version"] == "3.4"
+
+
+@pytest.mark.asyncio
+async def test_connect_uses_fingerprint_with_single_attempt(
+    hass: HomeAssistant, hass_storage: dict[str, Any], monkeypatch
+) -> None:
+    """A working fingerprint connects with exactly one handshake."""
+    hass_storage[STORAGE_KEY] = _stored("3.5")
+    device = KKTKolbeTuyaDevice(DEVICE_ID, "192.168.1.10", "0123456789abcdef", hass=hass)
+    calls = []
+
+    async def fake_try(key, version):
+        calls.append(version)
+        return _FakeDevice(), {"dps": {"1": True}}
+
+    monkeypatch.setattr(device, "_try_connect_with_key", fake_try)
+
+    await device._perform_connection()
+
+    assert calls == [3.5]
+    assert device.version == "3.5"
+    assert device.connection_stats["fingerprint_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_fingerprint_falls_back_and_is_replaced(
+    hass: HomeAssistant, hass_storage: dict[str, Any], monkeypatch
+) -> None:
+    """Error 914 on the fingerprint triggers detection and stores the new result."""
+    hass_storage[STORAGE_KEY] = _stored("3.5")
+    device = KKTKolbeTuyaDevice(DEVICE_ID, "192.168.1.10", "0123456789abcdef", hass=hass)
+    rejected = _FakeDevice()
+
+    async def fake_try(key, version):
+        if version == 3.5:
+            return rejected, {"Err": "914", "Error": "Check device key or version"}
+        if version == 3.3:
+            return _FakeDevice(), {"dps": {"1": True}}
+        return None, None
+
+    monkeypatch.setattr(device, "_try_connect_with_key", fake_try)
+
+    await device._perform_connection()
+
+    store = await async_get_fingerprint_store(hass)
+    assert rejected.closed
+    assert device.version == "3.3"
+    assert device.connection_stats["fingerprint_misses"] == 1
+    assert store.get(DEVICE_ID)["version"] == "3.3"
+
+
+@pytest.mark.asyncio
+async def test_detection_result_is_persisted(hass: HomeAssistant, hass_storage: dict[str, Any], monkeypatch) -> None:
+    """A successful auto-detection is written to storage without the key."""
+    device = KKTKolbeTuyaDevice(DEVICE_ID, "192.168.1.10", "0123456789abcdef", hass=hass)
+
+    async def fake_try(key, version):
+        if version == 3.4:
+            return _FakeDevice(), {"dps": {"1": True}}
+        return None, None
+
+    monkeypatch.setattr(device, "_try_connect_with_key", fake_try)
+
+    await device._perform_connection()
+    store = await async_get_fingerprint_store(hass)
+    await store._store._async_handle_write_data()
+
+    saved = hass_storage[STORAGE_KEY]["data"][DEVICE_ID]
+    assert saved["version"] == "3.4"
+    assert saved["key_variant"] == "original"
+    assert saved["ip_address"] == "192.168.1.10"
+    assert "0123456789abcdef" not in str(hass_storage[STORAGE_KEY])
@@ -260,6 +260,35 @@ async def test_coordinator_deferred_refresh_skips_when_marked_destroyed(
         assert mock_refresh.call_count == 0
 
 
+@pytest.mark.asyncio
+async def test_coordinator_set_data_points_sends_one_command(
+    hass: HomeAssistant,
+    mock_device,
+    mock_config_entry,
+) -> None:
+    """Several DPs are written with one device call and refreshed once."""
+    from custom_components.kkt_kolbe.coordinator import KKTKolbeUpdateCoordinator
+
+    mock_device.async_set_dps = AsyncMock(return_value=True)
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = KKTKolbeUpdateCoordinator(
+        hass=hass,
+        entry=mock_config_entry,
+        device=mock_device,
+    )
+
+    with patch.object(coordinator, "async_refresh", new=AsyncMock()) as mock_refresh:
+        await coordinator.async_set_data_points({1: True, 10: "off"})
+
+        mock_device.async_set_dps.assert_awaited_once_with({1: True, 10: "off"})
+        mock_device.async_set_dp.assert_not_awaited()
+        assert coordinator._pending_refresh_handle is not None
+        assert mock_refresh.call_count == 0
+
+        coordinator.async_mark_destroyed()
+
+
 @pytest.mark.asyncio
 async def test_coordinator_returns_pending_before_initial_connect(
     hass: HomeAssistant,
@@ -0,0 +1,87 @@
+"""Tests for the device database lookup index and lazy model loading."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.device_index import DeviceIndex
+from custom_components.kkt_kolbe.device_types import KNOWN_DEVICES
+from custom_components.kkt_kolbe.device_types import async_load_device_data
+from custom_components.kkt_kolbe.device_types import find_device_by_device_id
+from custom_components.kkt_kolbe.device_types import find_device_by_product_name
+from custom_components.kkt_kolbe.device_types import get_device_platforms
+from custom_components.kkt_kolbe.devices import LazyDeviceEntry
+
+
+def _device(category: str, product_names=(), device_ids=(), patterns=(), platforms=None) -> dict:
+    return {
+        "category": category,
+        "product_names": list(product_names),
+        "device_ids": list(device_ids),
+        "device_id_patterns": list(patterns),
+        "platforms": platforms,
+    }
+
+
+def test_first_listed_device_wins() -> None:
+    """Exact IDs, nested patterns and shared names resolve to the earliest device, like the old scans."""
+    index = DeviceIndex.build(
+        {
+            "short": _device("yyj", product_names=["p1"], patterns=["bf12"], platforms=["fan"]),
+            "long": _device("yyj", product_names=["p1", "p2"], patterns=["bf1234"], platforms=["light"]),
+            "exact": _device("dcl", device_ids=["bf1234aa"], patterns=["bf12"]),
+        }
+    )
+
+    assert index.key_for_device_id("bf1234aa") == "short"
+    assert index.key_for_device_id("bf99") is None
+    assert index.by_product_name["p1"] == "short"
+    assert index.by_product_name["p2"] == "long"
+    assert index.platforms_by_category["yyj"] == ("fan",)
+    assert "dcl" not in index.platforms_by_category
+
+
+def test_wrappers_match_known_devices() -> None:
+    """Every product name, device ID and pattern of the database resolves to its own device."""
+    for info in KNOWN_DEVICES.values():
+        for product_name in info["product_names"]:
+            assert find_device_by_product_name(product_name) is info
+        for device_id in info["device_ids"]:
+            assert find_device_by_device_id(device_id) is info
+        for pattern in info["device_id_patterns"]:
+            assert find_device_by_device_id(f"{pattern}xyz") is info
+
+    assert find_device_by_product_name("not_a_product") is None
+    assert find_device_by_device_id("unknown_device_id") is None
+    assert get_device_platforms("dcl") == KNOWN_DEVICES["ind7705hc_cooktop"]["platforms"]
+
+
+def test_device_entry_loads_model_data_on_demand() -> None:
+    """Manifest fields and membership checks don't import the model's module."""
+    manifest = dict(KNOWN_DEVICES["flat_hood"].items())
+    entry = LazyDeviceEntry("flat_hood", {key: manifest[key] for key in ("model_id", "name", "platforms")})
+
+    assert entry["name"] == "KKT Kolbe FLAT Hood"
+    assert "entities" in entry
+    assert entry.get("category") is None
+    assert not entry.loaded
+
+    assert entry["entities"] == manifest["entities"]
+    assert entry.loaded
+    assert list(entry) == ["model_id", "name", "platforms", "data_points", "entities"]
+
+
+@pytest.mark.asyncio
+async def test_async_load_device_data(hass: HomeAssistant) -> None:
+    """Preloading imports the model's definitions; unknown types are ignored."""
+    entry = LazyDeviceEntry("eb8313hc_oven", {})
+
+    with patch.dict(KNOWN_DEVICES, {"eb8313hc_oven": entry}):
+        await async_load_device_data(hass, "eb8313hc_oven")
+        await async_load_device_data(hass, "auto")
+        await async_load_device_data(hass, None)
+
+    assert entry.loaded
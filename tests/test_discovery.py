@@ -1,13 +1,19 @@
 """Test the KKT Kolbe discovery module."""
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from Crypto.Cipher import AES
+
 import pytest
 from homeassistant.core import HomeAssistant
 
 from custom_components.kkt_kolbe.discovery import (
+    UDP_KEY,
     KKTKolbeDiscovery,
+    UDPDiscoveryEngine,
+    _get_known_product_ids,
     simple_tuya_discover,
 )
 
@@ -177,3 +183,60 @@ async def test_discovery_refresh(
     assert len(discovery.discovered_devices) == 2
     assert "bf1234567890abcd1234" in discovery.discovered_devices
     assert "bf9999999999999999" in discovery.discovered_devices
+
+
+def _udp_packet(payload: dict) -> bytes:
+    """Build a Tuya UDP broadcast: 20-byte header, AES-ECB JSON, 8-byte trailer."""
+    plain = json.dumps(payload).encode()
+    padding = 16 - len(plain) % 16
+    plain += bytes([padding]) * padding
+    return b"\x00" * 20 + AES.new(UDP_KEY, AES.MODE_ECB).encrypt(plain) + b"\x00" * 8
+
+
+def test_udp_engine_drops_repeated_broadcasts() -> None:
+    """Unchanged re-broadcasts are dropped before parsing; changes and the TTL let them through."""
+    now = [0.0]
+    engine = UDPDiscoveryEngine(dedup_ttl=60, clock=lambda: now[0])
+    packet = _udp_packet({"gwId": "bf1234567890abcd1234", "productKey": "ypaixllljc2dcpae"})
+
+    info = engine.process(packet, ("192.168.1.100", 6667))
+    assert info is not None and info["ip"] == "192.168.1.100"
+    assert engine.process(packet, ("192.168.1.100", 6667)) is None
+    # Same payload from another device is not a repeat
+    assert engine.process(packet, ("192.168.1.101", 6667)) is not None
+
+    now[0] = 61.0
+    assert engine.process(packet, ("192.168.1.100", 6667)) is not None
+    changed = _udp_packet({"gwId": "bf1234567890abcd1234", "productKey": "ypaixllljc2dcpae", "active": 2})
+    assert engine.process(changed, ("192.168.1.100", 6667)) is not None
+
+    assert engine.stats == {"packets_seen": 5, "packets_dropped": 1, "packets_parsed": 4, "kkt_devices": 4}
+
+
+def test_udp_engine_counts_foreign_traffic() -> None:
+    """Non-KKT devices are parsed but not reported, garbage is neither."""
+    engine = UDPDiscoveryEngine()
+
+    assert engine.process(_udp_packet({"gwId": "other", "productKey": "notakkt"}), ("10.0.0.2", 6667)) is None
+    assert engine.process(b"\x01" * 40, ("10.0.0.3", 6667)) is None
+
+    assert engine.stats == {"packets_seen": 2, "packets_dropped": 0, "packets_parsed": 1, "kkt_devices": 0}
+    assert _get_known_product_ids() is _get_known_product_ids()
+
+
+@pytest.mark.asyncio
+async def test_discovery_listeners_share_engine(hass: HomeAssistant) -> None:
+    """All UDP port listeners of a discovery run feed one engine."""
+    discovery = KKTKolbeDiscovery(hass)
+    factories = []
+
+    async def fake_endpoint(factory, **kwargs):
+        factories.append(factory)
+        return MagicMock(), factory()
+
+    with patch.object(hass.loop, "create_datagram_endpoint", side_effect=fake_endpoint):
+        await discovery._start_udp_discovery()
+
+    protocols = [factory() for factory in factories]
+    assert len(protocols) > 1
+    assert all(protocol.engine is discovery.udp_engine for protocol in protocols)
@@ -0,0 +1,85 @@
+"""Tests for the precompiled DP value codecs."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.util.percentage import ordered_list_item_to_percentage
+from homeassistant.util.percentage import percentage_to_ordered_list_item
+
+from custom_components.kkt_kolbe.dp_codec import BoolCodec
+from custom_components.kkt_kolbe.dp_codec import EnumCodec
+from custom_components.kkt_kolbe.dp_codec import ValueCodec
+from custom_components.kkt_kolbe.dp_codec import compile_codec
+from custom_components.kkt_kolbe.dp_codec import compile_enum_codec
+from custom_components.kkt_kolbe.dp_codec import compile_value_codec
+
+
+def test_codecs_are_shared_per_spec() -> None:
+    """Equal specs compile to one codec, whatever their spelling."""
+    values = '{"min":0,"max":500,"scale":1,"step":5}'
+
+    codec = compile_codec("Integer", values)
+
+    assert isinstance(codec, ValueCodec)
+    assert compile_codec("Integer", values) is codec
+    assert compile_codec("value", {"step": 5, "scale": 1, "max": 500, "min": 0}) is codec
+    assert compile_value_codec(0, 500, step=5, scale=1) is codec
+    assert isinstance(compile_codec("Boolean"), BoolCodec)
+    assert compile_codec("String", "garbage").spec == {}
+
+
+def test_value_codec_scales_snaps_and_clamps() -> None:
+    """Raw integers are scaled on decode; encoding snaps to the step and range."""
+    codec = compile_codec("Integer", '{"min":0,"max":500,"scale":1,"step":5}')
+
+    assert codec.decode(235) == 23.5
+    assert codec.decode("bad") is None
+    assert codec.encode(23.4) == 235
+    assert codec.encode(80) == 500
+    assert codec.encode(-1) == 0
+    assert codec.coerce(4500.2) == 4500  # raw values are not rescaled or clamped
+    assert codec.is_valid(235)
+    assert not codec.is_valid(236)
+    assert not codec.is_valid(True)
+
+
+def test_enum_codec_maps_device_values() -> None:
+    """Device values map to options and back; the first option owns a shared value."""
+    codec = compile_enum_codec(["Auto", "Manual", "Eco"], {"Auto": 0, "Manual": 1, "Eco": 1})
+
+    assert codec.decode(0) == "Auto"
+    assert codec.decode(1) == "Manual"
+    assert codec.decode("Eco") == "Eco"
+    assert codec.decode(7) is None
+    assert codec.decode(["unhashable"]) is None
+    assert codec.encode("Eco") == 1
+    assert codec.encode(2) == 1  # option index
+    assert codec.encode("unknown") == "unknown"
+    assert codec.is_valid(1)
+    assert not codec.is_valid("Auto")
+
+
+@pytest.mark.parametrize("speeds", [["off", "low", "middle", "high", "strong"], ["off", "1", "2", "3", "4"]])
+def test_enum_percentages_match_home_assistant(speeds: list[str]) -> None:
+    """The precomputed tables give the same results as HA's percentage helpers."""
+    codec = EnumCodec(speeds)
+
+    for speed in speeds:
+        assert codec.percentage(speed) == ordered_list_item_to_percentage(speeds, speed)
+    for percentage in range(101):
+        assert codec.from_percentage(percentage) == percentage_to_ordered_list_item(speeds, percentage)
+    assert codec.percentage("turbo") is None
+
+
+def test_value_codec_percentage_levels() -> None:
+    """Numeric fan levels and brightness map onto their scales."""
+    levels = compile_value_codec(0, 9)
+
+    assert levels.to_scale(9, 100) == 100
+    assert levels.level_for_percentage(1) == 1
+    assert levels.level_for_percentage(50) == 5
+    assert levels.level_for_percentage(100) == 9
+
+    brightness = compile_value_codec(0, 100)
+    assert brightness.to_scale(50, 255) == 127
+    assert brightness.from_scale(255, 255) == 100
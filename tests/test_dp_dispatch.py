@@ -0,0 +1,112 @@
+"""Tests for DP-scoped coordinator listener dispatch."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.kkt_kolbe.const import DOMAIN
+from custom_components.kkt_kolbe.dp_dispatch import DPDispatchMixin
+from custom_components.kkt_kolbe.dp_dispatch import DPSubscription
+
+
+class _Coordinator(DPDispatchMixin, DataUpdateCoordinator):
+    """Bare coordinator with DP dispatch."""
+
+
+def _coordinator(hass: HomeAssistant) -> _Coordinator:
+    coordinator = _Coordinator(hass, logging.getLogger(__name__), name="test", config_entry=None)
+    coordinator.data = {"dps": {}, "changed_dps": frozenset(), "available": True}
+    return coordinator
+
+
+def _publish(coordinator: _Coordinator, *changed: str, available: bool = True) -> None:
+    coordinator.data = {"dps": {}, "changed_dps": frozenset(changed), "available": available}
+    coordinator.async_update_listeners()
+
+
+@pytest.mark.asyncio
+async def test_only_subscribers_of_changed_dps_are_notified(hass: HomeAssistant) -> None:
+    """Scoped listeners run only for their DPs, unscoped ones always run."""
+    coordinator = _coordinator(hass)
+    power, light, status = MagicMock(), MagicMock(), MagicMock()
+    coordinator.async_add_listener(power, DPSubscription([1]))
+    coordinator.async_add_listener(light, DPSubscription([4, 1]))
+    coordinator.async_add_listener(status)
+
+    _publish(coordinator, "4")  # first dispatch: availability baseline, everyone
+    _publish(coordinator, "4")
+
+    assert power.call_count == 1
+    assert light.call_count == 2
+    assert status.call_count == 2
+
+    _publish(coordinator, "1")
+    assert power.call_count == 2
+    assert light.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_everyone_is_notified_without_change_set_or_on_availability_change(hass: HomeAssistant) -> None:
+    """Payloads without changed_dps and availability flips reach every listener."""
+    coordinator = _coordinator(hass)
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, DPSubscription([1]))
+    _publish(coordinator)
+    listener.reset_mock()
+
+    _publish(coordinator, "10", available=False)
+    assert listener.call_count == 1
+
+    coordinator.data = {"dps": {}}
+    coordinator.async_update_listeners()
+    assert listener.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_removed_listener_leaves_index_and_pin_forces_updates(hass: HomeAssistant) -> None:
+    """Removing cleans the index; a pinned listener gets unrelated updates."""
+    coordinator = _coordinator(hass)
+    removed, pinned = MagicMock(), MagicMock()
+    remove = coordinator.async_add_listener(removed, DPSubscription([1]))
+    coordinator.async_add_listener(pinned, DPSubscription([5]))
+    _publish(coordinator)
+    removed.reset_mock()
+    pinned.reset_mock()
+
+    remove()
+    coordinator.async_pin_listener(pinned, True)
+    _publish(coordinator, "1")
+
+    assert removed.call_count == 0
+    assert pinned.call_count == 1
+    assert "1" not in coordinator._dp_listeners
+
+    coordinator.async_pin_listener(pinned, False)
+    _publish(coordinator, "1")
+    assert pinned.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_light_subscribes_to_power_and_configured_dps(hass: HomeAssistant) -> None:
+    """The light declares its own, the hood power and its brightness/effect DPs."""
+    from custom_components.kkt_kolbe.light import KKTKolbeLight
+
+    coordinator = MagicMock()
+    coordinator.data = {"dps": {}}
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Hood",
+        data={"device_id": "bf735dfe2ad64fba7cpyhn", "device_type": "hermes_style_hood"},
+        unique_id="bf735dfe2ad64fba7cpyhn_dispatch",
+    )
+    entry.add_to_hass(hass)
+
+    light = KKTKolbeLight(coordinator, entry, {"dp": 4, "name": "Light", "brightness_dp": 5, "effect_dp": 101})
+
+    assert DPSubscription(light._subscribed_dps()) == {"4", "1", "5", "101"}
@@ -0,0 +1,112 @@
+"""Tests for the DP ↔ code index used by cloud status translation."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.dp_codec import compile_codec
+from custom_components.kkt_kolbe.dp_index import GENERIC_DP_MAPPING
+from custom_components.kkt_kolbe.dp_index import DPIndex
+
+
+def test_translate_status_single_pass() -> None:
+    """Known codes map to DP ids; junk and unknown codes are skipped."""
+    index = DPIndex.build({1: "switch", 4: "light", 10: "fan_speed_enum"})
+
+    dps = index.translate_status(
+        [
+            {"code": "switch", "value": True},
+            {"code": "fan_speed_enum", "value": "high"},
+            {"code": "unknown", "value": 1},
+            {"code": "light", "value": None},
+            "garbage",
+        ]
+    )
+
+    assert dps == {"1": True, "10": "high"}
+
+
+def test_live_spec_overrides_and_extends_known_mapping() -> None:
+    """Live codes win for the same DP and add DPs the hardcoded map lacks."""
+    index = DPIndex.build(
+        {1: "switch", 10: "fan_speed_enum"},
+        live_codes={10: "fan_speed", 102: "rgb_brightness"},
+        live_types={10: "Enum"},
+    )
+
+    assert index.dp_to_code[10] == "fan_speed"
+    assert index.code_to_dp["fan_speed"] == 10
+    assert index.code_to_dp["rgb_brightness"] == 102
+    # Stale hardcoded code still resolves for cloud payloads that use it
+    assert index.code_to_dp["fan_speed_enum"] == 10
+    assert index.dp_to_type == {10: "Enum"}
+
+
+def test_encode_dps_with_live_codecs() -> None:
+    """Commands are brought into the live spec's form; DPs without a codec pass as is."""
+    index = DPIndex.build(
+        {1: "switch", 10: "fan_speed_enum", 13: "countdown"},
+        live_codes={1: "switch", 10: "fan_speed_enum", 13: "countdown"},
+        live_codecs={
+            1: compile_codec("Boolean"),
+            10: compile_codec("Enum", '{"range":["off","low","middle","high"]}'),
+            13: compile_codec("Integer", '{"min":0,"max":60,"scale":0,"step":1}'),
+        },
+    )
+
+    assert index.encode_dps({1: 1, 10: 2, 13: 45.0, 104: "x"}) == {1: True, 10: "middle", 13: 45, 104: "x"}
+    assert index.encode_dps({13: "bad"}) == {13: "bad"}
+
+
+def test_encode_dps_keeps_raw_values_of_scaled_dps() -> None:
+    """Raw values of a scaled DP are only made integers, never rescaled or clamped."""
+    index = DPIndex.build(
+        {102: "temp_set"},
+        live_codes={102: "temp_set"},
+        live_codecs={102: compile_codec("Integer", '{"min":0,"max":1000,"scale":1,"step":5}')},
+    )
+
+    assert index.encode_dps({102: 450}) == {102: 450}
+    assert index.encode_dps({102: 450.0}) == {102: 450}
+    assert index.encode_dps({102: 1234}) == {102: 1234}
+
+
+def test_index_is_immutable() -> None:
+    """Lookup tables cannot be mutated by callers."""
+    index = DPIndex.build(GENERIC_DP_MAPPING)
+
+    with pytest.raises(TypeError):
+        index.code_to_dp["switch"] = 99  # type: ignore[index]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_rebuilds_index_only_on_spec_change(hass: HomeAssistant, mock_config_entry) -> None:
+    """The hybrid coordinator reuses its index until the live spec changes."""
+    from custom_components.kkt_kolbe.hybrid_coordinator import KKTKolbeHybridCoordinator
+
+    client = MagicMock()
+    client.get_device_codes = MagicMock(return_value={1: "switch"})
+    client.get_device_dp_types = MagicMock(return_value={1: "Boolean"})
+    mock_config_entry.add_to_hass(hass)
+    coord = KKTKolbeHybridCoordinator(
+        hass=hass,
+        device_id="bf735dfe2ad64fba7cpyhn",
+        smartlife_client=client,
+        update_interval=timedelta(seconds=30),
+        entry=mock_config_entry,
+        device_type="hermes_style_hood",
+    )
+
+    first = coord._get_dp_index()
+    assert coord._get_dp_index() is first
+    assert client.get_device_dp_types.call_count == 1
+
+    client.get_device_codes.return_value = {1: "switch", 4: "light_v2"}
+    second = coord._get_dp_index()
+
+    assert second is not first
+    assert second.code_to_dp["light_v2"] == 4
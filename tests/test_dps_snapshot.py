@@ -0,0 +1,107 @@
+"""Tests for versioned DPS snapshots and delta fan-out to entities."""
+
+from __future__ import annotations
+
+import copy
+import json
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.kkt_kolbe.const import DOMAIN
+from custom_components.kkt_kolbe.dps_snapshot import DPSChangeTracker
+from custom_components.kkt_kolbe.dps_snapshot import DPSSnapshot
+
+
+def test_publish_reuses_snapshot_when_nothing_changed() -> None:
+    """Unchanged caches keep the same snapshot object and version."""
+    tracker = DPSChangeTracker()
+    cache = {"1": True, "10": "low"}
+
+    first = tracker.publish(cache)
+    assert first.version == 1
+    assert tracker.changed == frozenset({"1", "10"})
+
+    second = tracker.publish(cache)
+    assert second is first
+    assert tracker.changed == frozenset()
+
+
+def test_publish_reports_only_changed_dps() -> None:
+    """Only added, changed or removed DPs are in the change set."""
+    tracker = DPSChangeTracker()
+    cache = {"1": True, "10": "low"}
+    tracker.publish(cache)
+
+    cache["10"] = "high"
+    cache["4"] = False
+    snapshot = tracker.publish(cache)
+
+    assert snapshot.version == 2
+    assert tracker.changed == frozenset({"10", "4"})
+    assert snapshot == {"1": True, "10": "high", "4": False}
+
+    del cache["4"]
+    tracker.publish(cache)
+    assert tracker.changed == frozenset({"4"})
+
+
+def test_snapshot_is_read_only_but_dict_compatible() -> None:
+    """Consumers can read, copy and serialize, but not mutate, a snapshot."""
+    snapshot = DPSSnapshot({"1": True}, version=3)
+
+    with pytest.raises(TypeError):
+        snapshot["1"] = False
+    with pytest.raises(TypeError):
+        snapshot.update({"2": 1})
+
+    assert isinstance(snapshot, dict)
+    assert snapshot.get("1") is True
+    assert json.loads(json.dumps(snapshot)) == {"1": True}
+    mutable = copy.deepcopy(snapshot)
+    mutable["2"] = 1
+    assert snapshot.copy() == {"1": True}
+
+
+@pytest.mark.asyncio
+async def test_entity_skips_update_when_its_dp_did_not_change(hass: HomeAssistant) -> None:
+    """A switch is only re-rendered when its own DP is in the change set."""
+    from custom_components.kkt_kolbe.switch import KKTKolbeSwitch
+
+    tracker = DPSChangeTracker()
+    cache = {"1": True, "4": False}
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.async_set_data_point = AsyncMock()
+    coordinator.last_update_was_push = False
+    coordinator.last_push_report_type = ""
+    coordinator.data = {"dps": tracker.publish(cache), "changed_dps": tracker.changed}
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Hood",
+        data={"device_id": "bf735dfe2ad64fba7cpyhn", "device_type": "hermes_style_hood"},
+        unique_id="bf735dfe2ad64fba7cpyhn_delta",
+    )
+    entry.add_to_hass(hass)
+    switch = KKTKolbeSwitch(coordinator, entry, {"dp": 1, "name": "Power", "device_class": "switch"})
+    switch.hass = hass
+    switch.entity_id = "switch.test_power_delta"
+    switch.async_write_ha_state = MagicMock(side_effect=lambda: switch.is_on)
+
+    switch._handle_coordinator_update()
+    assert switch.async_write_ha_state.call_count == 1
+
+    cache["4"] = True
+    coordinator.data = {"dps": tracker.publish(cache), "changed_dps": tracker.changed}
+    switch._handle_coordinator_update()
+    assert switch.async_write_ha_state.call_count == 1
+
+    cache["1"] = False
+    coordinator.data = {"dps": tracker.publish(cache), "changed_dps": tracker.changed}
+    switch._handle_coordinator_update()
+    assert switch.async_write_ha_state.call_count == 2
+    assert switch.is_on is False
@@ -247,3 +247,88 @@ async def test_full_chain_client_dispatch_to_coordinator(
     # Cleanup: shutdown should unregister
     await coord.async_shutdown()
     assert "bf735dfe2ad64fba7cpyhn" not in client._push_callbacks
+
+
+@pytest.mark.asyncio
+async def test_local_push_fans_out_as_device_report(
+    hass: HomeAssistant,
+    mock_config_entry,
+) -> None:
+    """Asyncio-transport pushes are tagged local_push and count as reports."""
+    coord = _make_coord(hass, mock_config_entry)
+    coord._dps_cache = {"1": True}
+    seen: dict = {}
+
+    def fake_set_updated_data(data):
+        seen["data"] = data
+        seen["report_type"] = coord.last_push_report_type
+
+    coord.async_set_updated_data = fake_set_updated_data  # type: ignore[assignment]
+
+    coord._handle_local_push_update({"4": True}, "local")
+
+    assert seen["data"]["source"] == "local_push"
+    assert seen["data"]["dps"] == {"1": True, "4": True}
+    assert seen["report_type"] == "report"
+    assert coord.last_update_was_push is False
+
+
+@pytest.mark.asyncio
+async def test_set_data_points_sends_one_smartlife_command_list(
+    hass: HomeAssistant,
+    mock_config_entry,
+    mock_smartlife_client: MagicMock,
+) -> None:
+    """Several DPs go out as one send_commands list."""
+    mock_smartlife_client.get_device_codes = MagicMock(return_value={1: "switch", 4: "light"})
+    coord = _make_coord(hass, mock_config_entry, smartlife_client=mock_smartlife_client)
+    coord.async_request_refresh = AsyncMock()
+
+    await coord.async_set_data_points({1: True, 4: False})
+
+    mock_smartlife_client.async_send_commands.assert_awaited_once_with(
+        "bf735dfe2ad64fba7cpyhn", [{"code": "switch", "value": True}, {"code": "light", "value": False}]
+    )
+    mock_smartlife_client.async_send_dp_commands.assert_not_awaited()
+
+    await coord.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_set_data_points_defers_one_refresh(
+    hass: HomeAssistant,
+    mock_config_entry,
+) -> None:
+    """A local multi-DP write is one frame followed by one deferred refresh."""
+    coord = _make_coord(hass, mock_config_entry)
+    coord.local_device = MagicMock()
+    coord.local_device.async_set_dps = AsyncMock(return_value=True)
+    coord.local_available = True
+    coord.async_request_refresh = AsyncMock()
+
+    await coord.async_set_data_points({1: True, 10: "off", 4: True})
+    await coord.async_set_data_points({4: False, 5: 200})
+
+    assert coord.local_device.async_set_dps.await_count == 2
+    coord.async_request_refresh.assert_not_awaited()
+    assert coord._pending_refresh_handle is not None
+
+    await coord.async_shutdown()
+    assert coord._pending_refresh_handle is None
+
+
+@pytest.mark.asyncio
+async def test_push_stretches_poll_interval_until_zones_are_active(
+    hass: HomeAssistant,
+    mock_config_entry,
+) -> None:
+    """Pushes move polling to the heartbeat interval; active zones poll fast again."""
+    coord = _make_coord(hass, mock_config_entry)
+
+    coord._handle_push_update({"1": True, "162": "0000000000"}, "report")
+    assert coord.update_interval == timedelta(seconds=300)
+
+    coord._handle_push_update({"162": "0005000000"}, "report")
+    assert coord.update_interval == timedelta(seconds=10)
+    assert coord.polling_stats["device_active"] is True
+    assert coord.polling_stats["activity"] == "active"
@@ -381,3 +381,56 @@ async def test_light_turn_on_fan_suppress_not_when_hood_already_on(
     assert call(4, True) in calls, f"Expected light-on call, got: {calls}"
     assert call(1, True) not in calls, f"Should NOT power-on (already on), got: {calls}"
     assert call(10, "off") not in calls, f"Should NOT send fan-off (hood was already on), got: {calls}"
+
+
+@pytest.mark.asyncio
+async def test_light_turn_on_batches_work_mode_and_settings(
+    hass: HomeAssistant,
+) -> None:
+    """Pre-light and post-light writes go out as multi-DP commands.
+
+    Hood OFF: work_mode and fan suppress are sent together, the light on its
+    own, then effect and brightness together.
+    """
+    from custom_components.kkt_kolbe.light import KKTKolbeLight
+
+    class BatchingCoordinator(MagicMock):
+        async_set_data_points = AsyncMock()
+
+    coordinator = BatchingCoordinator()
+    coordinator.data = {"dps": {"1": False, "4": False}}
+    coordinator.last_update_success = True
+    coordinator.async_set_data_point = AsyncMock()
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Hood",
+        data={
+            "device_id": "bf735dfe2ad64fba7cpyhn",
+            "product_name": "hermes_style_hood",
+            "device_type": "hermes_style_hood",
+        },
+        options={"disable_fan_auto_start": True},
+        unique_id="bf735dfe2ad64fba7cpyhn",
+    )
+    entry.add_to_hass(hass)
+
+    config = {
+        "dp": 4,
+        "name": "Light",
+        "brightness_dp": 5,
+        "max_brightness": 255,
+        "effect_dp": 101,
+        "effects": ["Off", "Rainbow", "Pulse"],
+        "effect_numeric": True,
+        "work_mode_dp": 108,
+    }
+    light = KKTKolbeLight(coordinator, entry, config)
+
+    await light.async_turn_on(**{ATTR_EFFECT: "Rainbow", ATTR_BRIGHTNESS: 255})
+
+    assert coordinator.async_set_data_point.call_args_list == [call(1, True), call(4, True)]
+    assert coordinator.async_set_data_points.call_args_list == [
+        call({10: "off", 108: "white"}),
+        call({101: 1, 5: 255}),
+    ]
@@ -0,0 +1,73 @@
+"""Tests for the push-aware adaptive poll interval."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from custom_components.kkt_kolbe.poll_scheduler import AdaptivePollScheduler
+
+BASE = timedelta(seconds=30)
+HEARTBEAT = timedelta(seconds=300)
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scheduler(clock: _Clock) -> AdaptivePollScheduler:
+    return AdaptivePollScheduler(BASE, heartbeat_interval=HEARTBEAT, healthy_window=600, clock=clock)
+
+
+def test_interval_stretches_while_pushes_arrive() -> None:
+    """Pushes stretch the interval; it tightens when they stop."""
+    clock = _Clock()
+    scheduler = _scheduler(clock)
+    assert scheduler.update(active=False) == BASE
+
+    scheduler.record_push()
+    assert scheduler.update(active=False) == HEARTBEAT
+
+    clock.now += 601
+    assert scheduler.update(active=False) == BASE
+
+
+def test_activity_and_missed_pushes_keep_base_interval() -> None:
+    """Cooking and polls that find unpushed changes fall back to the base interval."""
+    clock = _Clock()
+    scheduler = _scheduler(clock)
+    scheduler.record_push()
+
+    assert scheduler.update(active=True) == BASE
+    assert scheduler.update(active=False) == HEARTBEAT
+
+    scheduler.record_poll(changed=True)
+    assert scheduler.update(active=False) == BASE
+
+    scheduler.record_push()
+    assert scheduler.update(active=False) == HEARTBEAT
+
+
+def test_stats_report_rates_within_window() -> None:
+    """Rates count arrivals of the last window, per minute."""
+    clock = _Clock()
+    scheduler = _scheduler(clock)
+    for _ in range(10):
+        scheduler.record_push()
+        clock.now += 30
+    scheduler.record_poll(changed=False)
+    scheduler.update(active=False)
+
+    stats = scheduler.stats
+    assert stats["push_rate_per_min"] == 1.0
+    assert stats["poll_rate_per_min"] == 0.1
+    assert stats["effective_interval_s"] == 300.0
+    assert stats["seconds_since_last_push"] == 30.0
+
+    clock.now += 1200
+    assert scheduler.stats["push_rate_per_min"] == 0.0
@@ -0,0 +1,99 @@
+"""Tests for the account-wide Tuya OpenAPI rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.api.rate_limiter import PRIORITY_COMMAND
+from custom_components.kkt_kolbe.api.rate_limiter import PRIORITY_POLL
+from custom_components.kkt_kolbe.api.rate_limiter import RATE_LIMIT_BACKOFF_BASE
+from custom_components.kkt_kolbe.api.rate_limiter import AccountRateLimiter
+from custom_components.kkt_kolbe.api.rate_limiter import get_account_rate_limiter
+from custom_components.kkt_kolbe.api.tuya_cloud_client import TuyaCloudClient
+
+
+async def test_burst_runs_without_waiting() -> None:
+    """Requests within the bucket capacity are granted immediately."""
+    limiter = AccountRateLimiter(requests_per_minute=60, burst=3)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limiter.async_acquire() for _ in range(3)))
+
+    assert time.perf_counter() - start < 0.05
+    assert limiter.stats == {"requests": 3, "waited": 0, "rate_limited": 0}
+
+
+async def test_refill_rate_throttles() -> None:
+    """Beyond the burst, requests wait for the bucket to refill."""
+    limiter = AccountRateLimiter(requests_per_minute=1200, burst=1)  # one token per 50 ms
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limiter.async_acquire() for _ in range(3)))
+
+    assert time.perf_counter() - start >= 0.09
+    assert limiter.stats["waited"] == 2
+
+
+async def test_commands_overtake_queued_polls() -> None:
+    """A command queued after polls is served first."""
+    limiter = AccountRateLimiter(requests_per_minute=1200, burst=1)
+    await limiter.async_acquire()
+    order: list[str] = []
+
+    async def _request(name: str, priority: int) -> None:
+        await limiter.async_acquire(priority)
+        order.append(name)
+
+    polls = [asyncio.create_task(_request(f"poll{index}", PRIORITY_POLL)) for index in range(2)]
+    await asyncio.sleep(0)
+    command = asyncio.create_task(_request("command", PRIORITY_COMMAND))
+    await asyncio.gather(*polls, command)
+
+    assert order == ["command", "poll0", "poll1"]
+
+
+async def test_cancelled_waiter_does_not_block_others() -> None:
+    """A cancelled waiter gives up its place without losing a token."""
+    limiter = AccountRateLimiter(requests_per_minute=1200, burst=1)
+    await limiter.async_acquire()
+
+    cancelled = asyncio.create_task(limiter.async_acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    async with asyncio.timeout(1):
+        await limiter.async_acquire()
+
+
+async def test_backoff_blocks_and_resets() -> None:
+    """A 1011 blocks all requests for the backoff, doubling on repeats until a success."""
+    limiter = AccountRateLimiter()
+
+    assert limiter.report_rate_limited() == RATE_LIMIT_BACKOFF_BASE
+    assert limiter.report_rate_limited() == RATE_LIMIT_BACKOFF_BASE * 2
+    assert limiter.backoff_remaining > RATE_LIMIT_BACKOFF_BASE
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.05):
+            await limiter.async_acquire(PRIORITY_COMMAND)
+
+    limiter.report_success()
+    assert limiter.report_rate_limited() == RATE_LIMIT_BACKOFF_BASE
+
+
+async def test_clients_of_one_project_share_a_limiter(hass: HomeAssistant) -> None:
+    """Clients with the same client_id share the limiter; other projects get their own."""
+    first = TuyaCloudClient("project_a", "secret", hass=hass)
+    second = TuyaCloudClient("project_a", "other_secret", hass=hass)
+    other = TuyaCloudClient("project_b", "secret", hass=hass)
+
+    assert first._rate_limiter is second._rate_limiter is get_account_rate_limiter(hass, "project_a")
+    assert other._rate_limiter is not first._rate_limiter
+    # Without hass there is nothing to share the limiter through
+    assert TuyaCloudClient("project_a", "secret")._rate_limiter is not first._rate_limiter
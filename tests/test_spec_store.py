@@ -0,0 +1,170 @@
+"""Tests for the persisted cloud device specs."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import aiohttp
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.api.dynamic_device_factory import DynamicDeviceFactory
+from custom_components.kkt_kolbe.api.tuya_cloud_client import TuyaCloudClient
+from custom_components.kkt_kolbe.api_manager import GlobalAPIManager
+from custom_components.kkt_kolbe.config_flow import KKTKolbeConfigFlow
+from custom_components.kkt_kolbe.const import DEVICE_SPEC_UNVERSIONED_MAX_AGE
+from custom_components.kkt_kolbe.spec_store import MAX_VERSIONS_PER_PRODUCT
+from custom_components.kkt_kolbe.spec_store import SPEC_SOURCE_OPENAPI
+from custom_components.kkt_kolbe.spec_store import SPEC_SOURCE_SMARTLIFE
+from custom_components.kkt_kolbe.spec_store import STORAGE_KEY
+from custom_components.kkt_kolbe.spec_store import async_get_spec_store
+from custom_components.kkt_kolbe.spec_store import firmware_version_from_info
+
+from .tuya_cloud_emulator import EmulatedCloudDevice
+from .tuya_cloud_emulator import emulated_cloud
+
+PRODUCT_ID = "ypaixllljc2dcpae"
+SPEC = {"category": "yyj", "functions": [{"code": "switch", "dp_id": 1}]}
+
+
+def test_firmware_version_combines_modules() -> None:
+    """All module versions make up the version, independent of their order."""
+    modules = [
+        {"module_type": 9, "current_version": "2.0.1"},
+        {"module_type": 0, "current_version": "1.2.0"},
+    ]
+
+    assert firmware_version_from_info(modules) == "0:1.2.0,9:2.0.1"
+    assert firmware_version_from_info(list(reversed(modules))) == "0:1.2.0,9:2.0.1"
+    assert firmware_version_from_info(None) is None
+    assert firmware_version_from_info([{"module_type": 9}]) is None
+
+
+async def test_specs_are_keyed_by_source_product_and_firmware(hass: HomeAssistant) -> None:
+    """A spec is only returned for its own source, product and firmware version."""
+    store = await async_get_spec_store(hass)
+    store.async_remember(SPEC_SOURCE_OPENAPI, PRODUCT_ID, "9:1.0.5", SPEC)
+
+    assert store.get(SPEC_SOURCE_OPENAPI, PRODUCT_ID, "9:1.0.5") == SPEC
+    assert store.get(SPEC_SOURCE_OPENAPI, PRODUCT_ID, "9:1.0.6") is None
+    assert store.get(SPEC_SOURCE_SMARTLIFE, PRODUCT_ID, "9:1.0.5") is None
+    assert store.get(SPEC_SOURCE_OPENAPI, "otherproduct", "9:1.0.5") is None
+
+
+async def test_unversioned_specs_expire(hass: HomeAssistant) -> None:
+    """Specs without a firmware version are only used up to their maximum age."""
+    store = await async_get_spec_store(hass)
+    store.async_remember(SPEC_SOURCE_SMARTLIFE, PRODUCT_ID, None, SPEC)
+    assert store.get(SPEC_SOURCE_SMARTLIFE, PRODUCT_ID, None) == SPEC
+
+    store._specs[f"{SPEC_SOURCE_SMARTLIFE}:{PRODUCT_ID}@"]["fetched_at"] -= DEVICE_SPEC_UNVERSIONED_MAX_AGE + 1
+    assert store.get(SPEC_SOURCE_SMARTLIFE, PRODUCT_ID, None) is None
+
+
+async def test_old_firmware_versions_are_dropped(hass: HomeAssistant) -> None:
+    """Only the most recent firmware versions of a product are kept."""
+    store = await async_get_spec_store(hass)
+    for patch_level in range(MAX_VERSIONS_PER_PRODUCT + 1):
+        store.async_remember(SPEC_SOURCE_OPENAPI, PRODUCT_ID, f"9:1.0.{patch_level}", SPEC)
+        store._specs[f"{SPEC_SOURCE_OPENAPI}:{PRODUCT_ID}@9:1.0.{patch_level}"]["fetched_at"] = patch_level
+
+    store.async_remember(SPEC_SOURCE_OPENAPI, PRODUCT_ID, "9:1.1.0", SPEC)
+
+    assert len(store._specs) == MAX_VERSIONS_PER_PRODUCT
+    assert store.get(SPEC_SOURCE_OPENAPI, PRODUCT_ID, "9:1.0.1") is None
+    assert store.get(SPEC_SOURCE_OPENAPI, PRODUCT_ID, "9:1.1.0") == SPEC
+
+
+async def test_specs_load_from_storage(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Stored specs are available after a restart."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            f"{SPEC_SOURCE_OPENAPI}:{PRODUCT_ID}@9:1.0.5": {
+                "source": SPEC_SOURCE_OPENAPI,
+                "product_id": PRODUCT_ID,
+                "firmware_version": "9:1.0.5",
+                "fetched_at": time.time(),
+                "spec": SPEC,
+            },
+            "broken": "not a spec",
+        },
+    }
+
+    store = await async_get_spec_store(hass)
+
+    assert store.get(SPEC_SOURCE_OPENAPI, PRODUCT_ID, "9:1.0.5") == SPEC
+    assert "broken" not in store._specs
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_cloud_spec_is_fetched_once_per_product_and_firmware(hass: HomeAssistant) -> None:
+    """Devices of one product share the stored model until a firmware update."""
+    async with emulated_cloud(2) as cloud, aiohttp.ClientSession() as session:
+        client = TuyaCloudClient(cloud.client_id, cloud.client_secret, cloud.endpoint, session=session)
+        store = await async_get_spec_store(hass)
+
+        async def _spec(device_id: str) -> dict[str, Any] | None:
+            return await store.async_get_spec(
+                SPEC_SOURCE_OPENAPI,
+                device_id,
+                PRODUCT_ID,
+                lambda: client.get_device_properties(device_id),
+                lambda: client.get_firmware_info(device_id),
+            )
+
+        first, second = (device.device_id for device in cloud.devices)
+        spec = await _spec(first)
+        assert await _spec(first) == spec
+        assert await _spec(second) == spec
+        assert cloud.route_stats["GET /v2.0/cloud/thing/{device_id}/model"] == 1
+        # Firmware is read once per device and run
+        assert cloud.route_stats["GET /v1.0/iot-03/devices/{device_id}/upgrade-infos"] == 2
+
+        # After a firmware update the next run fetches the model again
+        cloud.devices[0].firmware_version = "1.1.0"
+        store._firmware.clear()
+        await _spec(first)
+        assert cloud.route_stats["GET /v2.0/cloud/thing/{device_id}/model"] == 2
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_second_setup_reads_the_stored_spec(hass: HomeAssistant) -> None:
+    """A second config flow detects an unknown model from the stored spec, not the cloud."""
+    device = EmulatedCloudDevice(
+        "bf00000000000000000000",
+        "emulatedkey00000",
+        name="Air 0",
+        product_id="unknownproduct01",
+        product_name="KKT Kolbe Air",
+        category="xfj",
+    )
+    async with emulated_cloud() as cloud:
+        cloud.devices[:] = [device]
+        GlobalAPIManager(hass).store_api_credentials(cloud.client_id, cloud.client_secret, cloud.endpoint)
+
+        for _ in range(2):
+            flow = KKTKolbeConfigFlow()
+            flow.hass = hass
+            await flow.async_step_api_choice({"use_stored_api": True})
+
+            assert flow._discovered_devices[device.device_id]["device_type"] == "default_hood"
+
+        assert cloud.route_stats["GET /v2.0/cloud/thing/{device_id}/model"] == 1
+
+
+async def test_factory_uses_stored_model() -> None:
+    """The parsed model of a stored spec is analyzed without parsing it again."""
+    model = {
+        "modelId": PRODUCT_ID,
+        "services": [{"properties": [{"abilityId": 1, "code": "switch", "typeSpec": {"type": "bool"}}]}],
+    }
+
+    config = await DynamicDeviceFactory().analyze_device_properties(
+        {"result": {"device_id": "device", "model_id": PRODUCT_ID, "name": "Hood", "model": model}}
+    )
+
+    assert [entity.property_code for entity in config.entities] == ["switch"]
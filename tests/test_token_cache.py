@@ -0,0 +1,155 @@
+"""Tests for the shared Tuya OpenAPI access tokens."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.kkt_kolbe.api.token_cache import STORAGE_KEY
+from custom_components.kkt_kolbe.api.token_cache import TOKEN_SAVE_DELAY
+from custom_components.kkt_kolbe.api.token_cache import async_load_token_store
+from custom_components.kkt_kolbe.api.token_cache import get_account_token
+from custom_components.kkt_kolbe.api.tuya_cloud_client import TuyaCloudClient
+
+
+class _Login:
+    """Login callback handing out numbered tokens valid for ``ttl`` seconds."""
+
+    def __init__(
+        self, ttl: float = 7200, delay: float = 0, error: Exception | None = None, prefix: str = "token"
+    ) -> None:
+        self.ttl = ttl
+        self.prefix = prefix
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> tuple[str, float]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return f"{self.prefix}{self.calls}", time.time() + self.ttl
+
+
+async def test_concurrent_logins_are_single_flight(hass: HomeAssistant) -> None:
+    """Callers without a token wait for one shared login."""
+    token = get_account_token(hass, "project", "https://openapi.tuyaeu.com")
+    login = _Login(delay=0.01)
+
+    results = await asyncio.gather(*(token.async_get(login) for _ in range(5)))
+
+    assert results == ["token1"] * 5
+    assert login.calls == 1
+    assert token.stats["coalesced"] == 4
+
+
+async def test_valid_token_is_reused(hass: HomeAssistant) -> None:
+    """A token far from expiry is returned without logging in."""
+    token = get_account_token(hass, "project", "https://openapi.tuyaeu.com")
+    login = _Login()
+
+    await token.async_get(login)
+    assert await token.async_get(login) == "token1"
+    assert login.calls == 1
+
+
+async def test_proactive_refresh_does_not_block(hass: HomeAssistant) -> None:
+    """Close to expiry the current token is returned while a new one is fetched."""
+    token = get_account_token(hass, "project", "https://openapi.tuyaeu.com")
+    await token.async_get(_Login(ttl=600))
+    login = _Login(delay=0.01, prefix="fresh")
+
+    assert await token.async_get(login) == "token1"
+    assert await token.async_get(login) == "token1"  # no second refresh
+    await asyncio.sleep(0.02)
+
+    assert login.calls == 1
+    assert token.access_token == "fresh1"
+    assert token.expires_at is not None and token.expires_at > time.time() + 7000
+    assert token.stats["proactive_refreshes"] == 1
+
+
+async def test_failed_proactive_refresh_keeps_token(hass: HomeAssistant) -> None:
+    """A failing background refresh leaves the current token in use."""
+    token = get_account_token(hass, "project", "https://openapi.tuyaeu.com")
+    await token.async_get(_Login(ttl=600))
+    login = _Login(error=RuntimeError("offline"))
+
+    assert await token.async_get(login) == "token1"
+    await asyncio.sleep(0)
+
+    assert login.calls == 1
+    assert token.is_valid()
+
+
+async def test_cancelled_caller_does_not_cancel_login(hass: HomeAssistant) -> None:
+    """Other waiters still get the token when one of them is cancelled."""
+    token = get_account_token(hass, "project", "https://openapi.tuyaeu.com")
+    login = _Login(delay=0.02)
+
+    cancelled = asyncio.create_task(token.async_get(login))
+    waiting = asyncio.create_task(token.async_get(login))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await waiting == "token1"
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+
+async def test_invalidate_only_forgets_the_rejected_token(hass: HomeAssistant) -> None:
+    """A stale rejection does not drop a token that was refreshed meanwhile."""
+    token = get_account_token(hass, "project", "https://openapi.tuyaeu.com")
+    await token.async_get(_Login())
+
+    token.invalidate("older_token")
+    assert token.access_token == "token1"
+
+    token.invalidate("token1")
+    assert token.access_token is None
+
+
+async def test_clients_share_token_per_project_and_endpoint(hass: HomeAssistant) -> None:
+    """Clients share the token of their project on the same endpoint only."""
+    first = TuyaCloudClient("project", "secret", "https://openapi.tuyaeu.com/", hass=hass)
+    second = TuyaCloudClient("project", "secret", "https://openapi.tuyaeu.com", hass=hass)
+    other = TuyaCloudClient("project", "secret", "https://openapi.tuyaus.com", hass=hass)
+
+    assert first._token is second._token
+    assert other._token is not first._token
+    assert TuyaCloudClient("project", "secret", "https://openapi.tuyaeu.com")._token is not first._token
+
+
+async def test_tokens_persist_until_expiry(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Unexpired tokens are restored from storage and new ones are saved."""
+    now = time.time()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "project@https://openapi.tuyaeu.com": {"access_token": "stored", "expires_at": now + 3600},
+            "project@https://openapi.tuyaus.com": {"access_token": "expired", "expires_at": now - 10},
+        },
+    }
+
+    await async_load_token_store(hass)
+    restored = get_account_token(hass, "project", "https://openapi.tuyaeu.com")
+    assert await restored.async_get(_Login()) == "stored"
+    assert not get_account_token(hass, "project", "https://openapi.tuyaus.com").is_valid()
+
+    await get_account_token(hass, "other", "https://openapi.tuyaeu.com").async_login(_Login())
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=TOKEN_SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+
+    assert set(hass_storage[STORAGE_KEY]["data"]) == {
+        "project@https://openapi.tuyaeu.com",
+        "other@https://openapi.tuyaeu.com",
+    }
@@ -0,0 +1,250 @@
+"""Tests for the real cloud client paths against the emulated Tuya OpenAPI and SmartLife MQTT."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.api.api_exceptions import TuyaAuthenticationError
+from custom_components.kkt_kolbe.api.api_exceptions import TuyaRateLimitError
+from custom_components.kkt_kolbe.api.tuya_cloud_client import TuyaCloudClient
+from custom_components.kkt_kolbe.clients.tuya_sharing_client import TuyaSharingClient
+
+from .tuya_cloud_emulator import CODE_RATE_LIMIT
+from .tuya_cloud_emulator import CODE_SIGN_INVALID
+from .tuya_cloud_emulator import HOOD_STATUS
+from .tuya_cloud_emulator import EmulatedTuyaCloud
+from .tuya_cloud_emulator import emulated_cloud
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """Return a plain client session for talking to the emulated cloud."""
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+def _client(cloud: EmulatedTuyaCloud, session: aiohttp.ClientSession, **kwargs) -> TuyaCloudClient:
+    """Return the IoT Platform client pointed at the emulated cloud."""
+    kwargs.setdefault("client_secret", cloud.client_secret)
+    return TuyaCloudClient(cloud.client_id, endpoint=cloud.endpoint, session=session, **kwargs)
+
+
+async def _wait_for(condition, timeout: float = 1) -> None:
+    """Wait until ``condition()`` holds."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+async def test_device_list_model_status_and_commands(session: aiohttp.ClientSession) -> None:
+    """The client reads devices, model and status and sends commands through signed requests."""
+    async with emulated_cloud(2) as cloud:
+        client = _client(cloud, session)
+        device_id = cloud.devices[0].device_id
+
+        devices = await client.get_device_list_with_details()
+        assert [device["id"] for device in devices] == [device.device_id for device in cloud.devices]
+        assert devices[0]["local_key"] == cloud.devices[0].local_key
+
+        properties = await client.get_device_properties(device_id)
+        assert {function["code"]: function["dp_id"] for function in properties["functions"]}["fan_speed_enum"] == 10
+
+        status = await client.get_device_status(device_id)
+        assert {item["code"]: item["value"] for item in status} == HOOD_STATUS
+
+        assert await client.send_dp_commands(device_id, {"10": "high"})
+        assert await client.send_commands(device_id, [{"code": "light", "value": True}])
+        assert cloud.devices[0].status["fan_speed_enum"] == "high"
+        assert cloud.devices[0].status["light"] is True
+        assert cloud.stats["tokens"] == 1
+
+
+async def test_device_details_use_batch_endpoint(session: aiohttp.ClientSession) -> None:
+    """All devices are enriched by one batch request, and a details cache skips it next time."""
+    async with emulated_cloud(5) as cloud:
+        client = _client(cloud, session)
+        cache: dict[str, dict] = {}
+
+        devices = await client.get_device_list_with_details(cache)
+        assert [device["local_key"] for device in devices] == [device.local_key for device in cloud.devices]
+        assert cloud.route_stats["GET /v2.0/cloud/thing/batch"] == 1
+        assert set(cache) == {device.device_id for device in cloud.devices}
+
+        await client.get_device_list_with_details(cache)
+        assert cloud.route_stats["GET /v2.0/cloud/thing/batch"] == 1
+
+
+async def test_device_details_fall_back_to_concurrent_requests(session: aiohttp.ClientSession) -> None:
+    """Without the batch endpoint, details are fetched in parallel."""
+    async with emulated_cloud(6, latency=0.05, batch_details=False) as cloud:
+        client = _client(cloud, session)
+        await client.authenticate()
+
+        start = time.perf_counter()
+        devices = await client.get_device_list_with_details()
+
+        assert {device["id"]: device["local_key"] for device in devices} == {
+            device.device_id: device.local_key for device in cloud.devices
+        }
+        assert cloud.route_stats["GET /v1.0/devices/{device_id}"] == 6
+        assert 1 < cloud.stats["max_in_flight"] <= 4
+        # list + failed batch + two rounds of details instead of six
+        assert time.perf_counter() - start < 0.05 * 8
+
+
+async def test_wrong_secret_fails_signature_check(session: aiohttp.ClientSession) -> None:
+    """Requests signed with another secret are rejected with code 1004."""
+    async with emulated_cloud() as cloud:
+        client = _client(cloud, session, client_secret="wrongsecret")
+
+        with pytest.raises(TuyaAuthenticationError) as err:
+            await client.authenticate()
+
+        assert err.value.error_code == CODE_SIGN_INVALID
+        assert cloud.stats["sign_failures"] == 1
+
+
+async def test_injected_rate_limit_sets_backoff(session: aiohttp.ClientSession) -> None:
+    """An injected 1011 reaches the client as a rate limit error with backoff."""
+    async with emulated_cloud() as cloud:
+        client = _client(cloud, session)
+        await client.authenticate()
+
+        cloud.fail_next(1, CODE_RATE_LIMIT)
+        with pytest.raises(TuyaRateLimitError) as err:
+            await client._make_request("GET", "/v1.0/devices")
+
+        assert err.value.retry_after > 0
+        assert client._rate_limiter.backoff_remaining > 0
+        assert cloud.stats["rate_limited"] == 1
+
+
+async def test_quota_per_minute(session: aiohttp.ClientSession) -> None:
+    """Requests beyond the per-minute quota are answered with 1011."""
+    async with emulated_cloud(quota_per_minute=2) as cloud:
+        client = _client(cloud, session)
+        await client.authenticate()
+        await client._make_request("GET", "/v1.0/devices")
+
+        with pytest.raises(TuyaRateLimitError):
+            await client._make_request("GET", "/v1.0/devices")
+
+
+async def test_rejected_token_is_replaced(session: aiohttp.ClientSession) -> None:
+    """A request with an invalidated token (1010) is retried once after a fresh login."""
+    async with emulated_cloud() as cloud:
+        client = _client(cloud, session)
+        await client.authenticate()
+        rejected = client._access_token
+
+        cloud.expire_tokens()
+        await client._make_request("GET", "/v1.0/devices")
+
+        assert cloud.stats["token_failures"] == 1
+        assert cloud.stats["tokens"] == 2
+        assert client._access_token != rejected
+
+
+async def test_concurrent_clients_log_in_once(hass: HomeAssistant, session: aiohttp.ClientSession) -> None:
+    """Clients of one project starting together share a single login."""
+    async with emulated_cloud(6) as cloud:
+        clients = [_client(cloud, session, hass=hass) for _ in cloud.devices]
+
+        await asyncio.gather(
+            *(client.get_device_status(device.device_id) for client, device in zip(clients, cloud.devices))
+        )
+
+        assert cloud.stats["tokens"] == 1
+
+
+async def test_token_is_refreshed_before_expiry(session: aiohttp.ClientSession) -> None:
+    """Close to expiry the token is replaced in the background while requests keep using it."""
+    async with emulated_cloud(token_ttl=600, latency=0.05) as cloud:
+        client = _client(cloud, session)
+        await client._ensure_authenticated()
+        current = client._access_token
+
+        start = time.perf_counter()
+        await client._ensure_authenticated()
+        assert time.perf_counter() - start < 0.05
+        assert client._access_token == current
+
+        await _wait_for(lambda: client._access_token != current)
+        assert cloud.stats["tokens"] == 2
+
+
+async def test_latency_is_added(session: aiohttp.ClientSession) -> None:
+    """Every answer is delayed by the configured latency."""
+    async with emulated_cloud(latency=0.05) as cloud:
+        client = _client(cloud, session)
+
+        start = time.perf_counter()
+        await client.authenticate()
+
+        assert time.perf_counter() - start >= 0.05
+
+
+async def test_sharing_client_receives_mqtt_pushes(hass: HomeAssistant) -> None:
+    """Status changes on the cloud reach SmartLife push callbacks as DP-id keyed updates."""
+    async with emulated_cloud() as cloud:
+        device_id = cloud.devices[0].device_id
+        client = await TuyaSharingClient.async_from_stored_tokens(
+            hass, {"user_code": "EU12345678", "access_token": "a", "refresh_token": "r", "expire_time": 0}
+        )
+        with patch("tuya_sharing.Manager", cloud.sharing_manager):
+            devices = await client.async_get_devices()
+        assert devices[0].local_key == cloud.devices[0].local_key
+
+        received = []
+        client.register_push_callback(device_id, lambda dps, report_type: received.append(dps))
+
+        cloud.set_status(device_id, {"countdown": 30})
+        await _wait_for(lambda: received)
+        assert received == [{"13": 30}]
+
+        # A command comes back as a report, as from the real appliance
+        assert await client.async_send_commands(device_id, [{"code": "light", "value": True}])
+        await _wait_for(lambda: len(received) == 2)
+        assert received[1] == {"4": True}
+        assert {item["code"]: item["value"] for item in await client.async_get_device_status(device_id)}["light"]
+
+        await client.async_close()
+
+
+async def test_rate_limit_backoff_is_project_wide(hass: HomeAssistant, session: aiohttp.ClientSession) -> None:
+    """A 1011 answer to one client backs off every client of the same project."""
+    async with emulated_cloud(2) as cloud:
+        first, second = _client(cloud, session, hass=hass), _client(cloud, session, hass=hass)
+        await first.authenticate()
+
+        cloud.fail_next(1, CODE_RATE_LIMIT)
+        with pytest.raises(TuyaRateLimitError):
+            await first._make_request("GET", "/v1.0/devices")
+
+        assert second._rate_limiter.backoff_remaining > 0
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.1):
+                await second._make_request("GET", "/v1.0/devices")
+        assert cloud.stats["requests"] == 2
+
+
+async def test_clients_share_quota_but_run_concurrently(hass: HomeAssistant, session: aiohttp.ClientSession) -> None:
+    """Requests of one project's clients overlap within the quota."""
+    async with emulated_cloud(3, latency=0.05) as cloud:
+        clients = [_client(cloud, session, hass=hass) for _ in cloud.devices]
+        await clients[0].authenticate()
+
+        await asyncio.gather(
+            *(client.get_device_status(device.device_id) for client, device in zip(clients, cloud.devices))
+        )
+
+        assert cloud.stats["max_in_flight"] == 3
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
 import pytest
 
 from custom_components.kkt_kolbe.tuya_device import KKTKolbeTuyaDevice
@@ -25,3 +28,186 @@ async def test_auto_detect_protocol_includes_3_5():
         "Protocol 3.5 missing from auto-detect list — devices on 3.5 firmware "
         "(e.g. Ploom hoods, some 2024+ models) cannot connect"
     )
+
+
+@pytest.mark.asyncio
+async def test_async_transport_push_updates_status_and_fans_out():
+    """Local pushes from the asyncio transport reach registered receivers."""
+    device = KKTKolbeTuyaDevice("bf735dfe2ad64fba7cpyhn", "192.168.1.10", "0123456789abcdef", transport="asyncio")
+    received = []
+    device.register_push_callback(lambda dps, origin: received.append((dps, origin)))
+
+    device._handle_local_push({"4": True})
+
+    assert device._status["dps"] == {"4": True}
+    assert received == [({"4": True}, "local")]
+
+
+@pytest.mark.asyncio
+async def test_async_transport_ignores_loss_of_stale_connection():
+    """Only the active connection marks the device disconnected when it drops."""
+    device = KKTKolbeTuyaDevice("bf735dfe2ad64fba7cpyhn", "192.168.1.10", "0123456789abcdef", transport="asyncio")
+    active = object()
+    device._device = active
+    device._connected = True
+
+    device._handle_connection_lost(object())
+    assert device._connected is True
+
+    device._handle_connection_lost(active)
+    assert device._connected is False
+    assert device._device is None
+
+
+class _FakeDevice:
+    """Stand-in for a tinytuya.Device returned by a detection attempt."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_auto_detect_races_candidates_and_keeps_first_valid(monkeypatch):
+    """The first valid DPS response wins; slower attempts are cancelled."""
+    import asyncio
+
+    from custom_components.kkt_kolbe import tuya_device
+
+    monkeypatch.setattr(tuya_device, "AUTO_DETECT_MAX_CONCURRENCY", 2)
+    device = KKTKolbeTuyaDevice("bf735dfe2ad64fba7cpyhn", "192.168.1.10", "0123456789abcdef")
+    in_flight = 0
+    max_in_flight = 0
+    cancelled = []
+
+    async def fake_try(key, version):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            if version == 3.4:
+                await asyncio.sleep(0.01)
+                return _FakeDevice("3.4"), {"dps": {"1": True}}
+            await asyncio.sleep(10)
+            return None, None
+        except asyncio.CancelledError:
+            cancelled.append(version)
+            raise
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(device, "_try_connect_with_key", fake_try)
+
+    await device._perform_connection()
+
+    assert device.version == "3.4"
+    assert device._device.name == "3.4"
+    assert device._connected is True
+    assert 3.3 in cancelled
+    assert max_in_flight == 2
+    assert device.connection_stats["last_detection_duration"] < 1
+    assert device.connection_stats["protocol_version_detected"] == "3.4"
+
+
+@pytest.mark.asyncio
+async def test_auto_detect_retries_inconclusive_candidates_sequentially(monkeypatch):
+    """Attempts refused during the race get a second, one-at-a-time chance."""
+    device = KKTKolbeTuyaDevice("bf735dfe2ad64fba7cpyhn", "192.168.1.10", "0123456789abcdef")
+    calls = []
+
+    async def fake_try(key, version):
+        calls.append(version)
+        if version == 3.5 and calls.count(3.5) == 2:
+            return _FakeDevice("3.5"), {"dps": {"1": True}}
+        if version == 3.5:
+            return None, {"Err": "901", "Error": "Network Error: Unable to Connect"}
+        return None, None
+
+    monkeypatch.setattr(device, "_try_connect_with_key", fake_try)
+
+    await device._perform_connection()
+
+    assert device.version == "3.5"
+    assert calls.count(3.5) == 2
+
+
+@pytest.mark.asyncio
+async def test_auto_detect_reports_error_914(monkeypatch):
+    """All candidates rejecting the key still surfaces as an authentication error."""
+    from custom_components.kkt_kolbe.exceptions import KKTAuthenticationError
+
+    device = KKTKolbeTuyaDevice("bf735dfe2ad64fba7cpyhn", "192.168.1.10", "0123456789abcdef")
+    rejected = []
+
+    async def fake_try(key, version):
+        fake = _FakeDevice(str(version))
+        rejected.append(fake)
+        return fake, {"Err": "914", "Error": "Check device key or version"}
+
+    monkeypatch.setattr(device, "_try_connect_with_key", fake_try)
+
+    with pytest.raises(KKTAuthenticationError):
+        await device._perform_connection()
+    assert all(fake.closed for fake in rejected)
+    assert device.connection_stats["last_detection_duration"] is not None
+
+
+@pytest.mark.asyncio
+async def test_set_dps_sends_single_multi_dp_frame():
+    """Several DPs are written with one set_multiple_values call."""
+    device = KKTKolbeTuyaDevice("bf735dfe2ad64fba7cpyhn", "192.168.1.10", "0123456789abcdef")
+    tiny = MagicMock()
+    tiny.set_multiple_values.return_value = {"dps": {"162": "05", "163": "02"}}
+    device._device = tiny
+    device._connected = True
+    device.async_ensure_connected = AsyncMock()
+
+    assert await device.async_set_dps({162: "05", 163: "02"}) is True
+
+    tiny.set_multiple_values.assert_called_once_with({162: "05", 163: "02"})
+    tiny.set_value.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_status_closes_the_connection():
+    """A status request that times out closes the connection before dropping it."""
+    from custom_components.kkt_kolbe.exceptions import KKTTimeoutError
+
+    device = KKTKolbeTuyaDevice("bf735dfe2ad64fba7cpyhn", "192.168.1.10", "0123456789abcdef", transport="asyncio")
+    connection = _FakeDevice("persistent")
+    device._device = connection
+    device._connected = True
+    device.async_ensure_connected = AsyncMock()
+    device._async_device_status = AsyncMock(side_effect=TimeoutError)
+
+    with pytest.raises(KKTTimeoutError):
+        await device.async_get_status()
+
+    assert connection.closed is True
+    assert device._device is None
+
+
+@pytest.mark.asyncio
+async def test_async_transport_connects_legacy_versions_with_tinytuya(monkeypatch):
+    """Protocol 3.1 devices fall back to tinytuya when the asyncio transport is selected."""
+    from custom_components.kkt_kolbe import tuya_device
+
+    tiny = MagicMock()
+    tiny.status.return_value = {"dps": {"1": True}}
+    monkeypatch.setattr(tuya_device.tinytuya, "Device", MagicMock(return_value=tiny))
+    device = KKTKolbeTuyaDevice("bf735dfe2ad64fba7cpyhn", "192.168.1.10", "0123456789abcdef", transport="asyncio")
+
+    connected, status = await device._try_connect_with_key("0123456789abcdef", 3.1)
+
+    assert connected is tiny
+    assert status == {"dps": {"1": True}}
+
+    device._device = connected
+    device._connected = True
+    device.async_ensure_connected = AsyncMock()
+    assert await device.async_set_dp(1, False) is True
+    tiny.set_value.assert_called_once_with(1, False)
+    assert device.pushes_status is False
@@ -0,0 +1,134 @@
+"""Tests for the real KKTKolbeTuyaDevice connection path against emulated appliances."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.kkt_kolbe.const import LOCAL_TRANSPORT_ASYNCIO
+from custom_components.kkt_kolbe.const import LOCAL_TRANSPORT_TINYTUYA
+from custom_components.kkt_kolbe.exceptions import KKTAuthenticationError
+from custom_components.kkt_kolbe.exceptions import KKTTimeoutError
+from custom_components.kkt_kolbe.tuya_device import KKTKolbeTuyaDevice
+from custom_components.kkt_kolbe.tuya_transport import TuyaLocalConnection
+
+from .tuya_emulator import DEFAULT_DPS
+from .tuya_emulator import EmulatedTuyaDevice
+from .tuya_emulator import emulated_devices
+
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+TRANSPORTS = [LOCAL_TRANSPORT_TINYTUYA, LOCAL_TRANSPORT_ASYNCIO]
+
+
+def _client(hass: HomeAssistant, emulated: EmulatedTuyaDevice, transport: str, **kwargs) -> KKTKolbeTuyaDevice:
+    """Return the integration's device class pointed at an emulated appliance."""
+    kwargs.setdefault("local_key", emulated.local_key)
+    return KKTKolbeTuyaDevice(
+        emulated.device_id,
+        emulated.host,
+        version=f"{emulated.version:.1f}",
+        hass=hass,
+        transport=transport,
+        port=emulated.port,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("transport", TRANSPORTS)
+@pytest.mark.parametrize("version", [3.3, 3.4, 3.5])
+async def test_status_and_control(hass: HomeAssistant, version: float, transport: str) -> None:
+    """Both transports read and write DPs on every protocol version."""
+    async with emulated_devices(1, version=version) as (emulated,):
+        device = _client(hass, emulated, transport)
+
+        assert await device.async_get_status() == DEFAULT_DPS
+        assert await device.async_set_dps({4: True, 10: "high"})
+        assert emulated.dps["4"] is True
+        assert emulated.dps["10"] == "high"
+
+        await device.async_disconnect()
+
+
+@pytest.mark.parametrize("transport", TRANSPORTS)
+async def test_rotated_key_is_reported_as_stale(hass: HomeAssistant, transport: str) -> None:
+    """A re-paired device drops its clients and rejects the old key with Error 914."""
+    async with emulated_devices(1, version=3.4) as (emulated,):
+        device = _client(hass, emulated, transport)
+        await device.async_connect()
+        old_key = emulated.local_key
+
+        emulated.rotate_key("fedcba9876543210")
+        await device.async_disconnect()
+
+        with pytest.raises(KKTAuthenticationError):
+            await _client(hass, emulated, transport, local_key=old_key).async_connect()
+        assert emulated.stats["undecodable"] >= 1
+
+        device = _client(hass, emulated, transport)
+        assert await device.async_get_status() == DEFAULT_DPS
+        await device.async_disconnect()
+
+
+async def test_partial_status_is_merged(hass: HomeAssistant) -> None:
+    """Query answers with a few DPs each add up to the full status."""
+    async with emulated_devices(1, version=3.3, partial_status=2) as (emulated,):
+        device = _client(hass, emulated, LOCAL_TRANSPORT_ASYNCIO)
+
+        for _ in range(3):
+            status = await device.async_get_status()
+
+        assert status == DEFAULT_DPS
+        await device.async_disconnect()
+
+
+async def test_appliance_changes_are_pushed(hass: HomeAssistant) -> None:
+    """DPs changed on the appliance arrive as a partial push on the asyncio transport."""
+    async with emulated_devices(1, version=3.5) as (emulated,):
+        device = _client(hass, emulated, LOCAL_TRANSPORT_ASYNCIO)
+        await device.async_connect()
+        received = []
+        device.register_push_callback(lambda dps, origin: received.append(dps))
+
+        emulated.set_dps({"13": 30})
+        async with asyncio.timeout(1):
+            while not received:
+                await asyncio.sleep(0.01)
+
+        assert received == [{"13": 30}]
+        assert device.get_dp_value(13) == 30
+        await device.async_disconnect()
+
+
+async def test_latency_and_packet_loss() -> None:
+    """Responses are delayed by the latency and lost requests time out."""
+    async with EmulatedTuyaDevice("bf0123456789abcdef0123", "0123456789abcdef", 3.3, latency=0.05) as emulated:
+        connection = TuyaLocalConnection(emulated.device_id, emulated.host, emulated.local_key, 3.3, port=emulated.port)
+        await connection.async_connect(timeout=1)
+
+        start = time.perf_counter()
+        await connection.async_status(timeout=1)
+        assert time.perf_counter() - start >= 0.05
+
+        emulated.packet_loss = 1.0
+        with pytest.raises(KKTTimeoutError):
+            await connection.async_status(timeout=0.1)
+        assert emulated.stats["dropped"] == 1
+        connection.close()
+
+
+async def test_many_appliances(hass: HomeAssistant) -> None:
+    """Every emulated appliance gets its own port, ID and key."""
+    async with emulated_devices(5, version=3.4) as emulated:
+        devices = [_client(hass, appliance, LOCAL_TRANSPORT_ASYNCIO) for appliance in emulated]
+
+        for device in devices:
+            assert await device.async_get_status() == DEFAULT_DPS
+
+        assert len({appliance.port for appliance in emulated}) == 5
+        assert all(appliance.connected_clients == 1 for appliance in emulated)
+        for device in devices:
+            await device.async_disconnect()
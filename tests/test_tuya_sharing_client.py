@@ -998,3 +998,99 @@ class TestPushDispatcher:
             {"1": True},
             "report",
         )
+
+
+# === ACCOUNT SNAPSHOT TESTS ===
+
+
+class TestAccountSnapshot:
+    """Tests for the shared account snapshot behind async_get_device_status."""
+
+    @staticmethod
+    def _make_client(hass: HomeAssistant, sample_token_info, ttl: float = 20) -> TuyaSharingClient:
+        client = TuyaSharingClient(hass, "EU12345678", snapshot_ttl=ttl)
+        client._auth_result = TuyaSharingAuthResult(success=True, user_id="user_123456")
+        client._token_info = dict(sample_token_info)
+
+        device_a = MagicMock()
+        device_a.status = {"switch": True}
+        device_b = MagicMock()
+        device_b.status = {"fan_speed_enum": "low"}
+
+        client._manager = MagicMock()
+        client._manager.device_map = {"device_a": device_a, "device_b": device_b}
+        return client
+
+    @pytest.mark.asyncio
+    async def test_devices_share_one_refresh_within_ttl(self, hass: HomeAssistant, sample_token_info):
+        """Polling several devices within the TTL refreshes the account once."""
+        client = self._make_client(hass, sample_token_info)
+
+        status_a = await client.async_get_device_status("device_a")
+        status_b = await client.async_get_device_status("device_b")
+        await client.async_get_device_status("device_a")
+
+        assert status_a == [{"code": "switch", "value": True}]
+        assert status_b == [{"code": "fan_speed_enum", "value": "low"}]
+        assert client._manager.update_device_cache.call_count == 1
+        assert client._snapshot_stats["cache_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_join_inflight_refresh(self, hass: HomeAssistant, sample_token_info):
+        """Concurrent status reads coalesce into a single update_device_cache call."""
+        client = self._make_client(hass, sample_token_info)
+
+        results = await asyncio.gather(
+            client.async_get_device_status("device_a"),
+            client.async_get_device_status("device_b"),
+            client.async_get_device_status("device_a"),
+        )
+
+        assert len(results) == 3
+        assert client._manager.update_device_cache.call_count == 1
+        assert client._snapshot_stats["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_snapshot_refreshes_again(self, hass: HomeAssistant, sample_token_info):
+        """A zero TTL refreshes on every read."""
+        client = self._make_client(hass, sample_token_info, ttl=0)
+
+        await client.async_get_device_status("device_a")
+        await client.async_get_device_status("device_a")
+
+        assert client._manager.update_device_cache.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_error_reaches_all_waiters(self, hass: HomeAssistant, sample_token_info):
+        """A failed shared refresh surfaces as KKTConnectionError to every caller."""
+        client = self._make_client(hass, sample_token_info)
+        client._manager.update_device_cache.side_effect = Exception("cloud down")
+
+        results = await asyncio.gather(
+            client.async_get_device_status("device_a"),
+            client.async_get_device_status("device_b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, KKTConnectionError) for result in results)
+        assert client._manager.update_device_cache.call_count == 1
+        assert client._snapshot_refreshed_at is None
+
+    @pytest.mark.asyncio
+    async def test_device_snapshot_info_tracks_staleness(self, hass: HomeAssistant, sample_token_info):
+        """Per-device metadata reports snapshot presence, push age and staleness."""
+        client = self._make_client(hass, sample_token_info)
+
+        info = client.get_device_snapshot_info("device_a")
+        assert info["stale"] is True
+        assert info["age"] is None
+
+        await client.async_get_device_status("device_a")
+        info = client.get_device_snapshot_info("device_a")
+        assert info["in_snapshot"] is True
+        assert info["stale"] is False
+        assert info["last_push_age"] is None
+
+        client._dispatch_push("device_b", {"1": True}, "report")
+        assert client.get_device_snapshot_info("device_b")["last_push_age"] is not None
+        assert client.get_device_snapshot_info("unknown")["in_snapshot"] is False
@@ -0,0 +1,139 @@
+"""Tests for the asyncio Tuya LAN transport (framing, correlation, push)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.kkt_kolbe.tuya_transport import CONTROL
+from custom_components.kkt_kolbe.tuya_transport import DP_QUERY
+from custom_components.kkt_kolbe.tuya_transport import STATUS
+from custom_components.kkt_kolbe.tuya_transport import TuyaFrameCodec
+from custom_components.kkt_kolbe.tuya_transport import TuyaLocalConnection
+from custom_components.kkt_kolbe.tuya_transport import TuyaMessage
+from custom_components.kkt_kolbe.tuya_transport import derive_session_key
+from custom_components.kkt_kolbe.tuya_transport import extract_dps
+
+LOCAL_KEY = b"0123456789abcdef"
+DEVICE_ID = "bf735dfe2ad64fba7cpyhn"
+
+
+class TestFrameCodec:
+    """Encode/decode roundtrips for every supported protocol version."""
+
+    @pytest.mark.parametrize("version", [3.3, 3.4, 3.5])
+    @pytest.mark.parametrize("cmd", [DP_QUERY, CONTROL])
+    def test_roundtrip(self, version: float, cmd: int) -> None:
+        """A frame encoded with a key decodes back to the same payload."""
+        codec = TuyaFrameCodec(version, LOCAL_KEY)
+        payload = json.dumps({"dps": {"1": True, "10": "high"}}).encode()
+
+        buffer = bytearray(codec.encode(42, cmd, payload))
+        messages = codec.decode(buffer)
+
+        assert len(messages) == 1
+        assert messages[0].seqno == 42
+        assert messages[0].cmd == cmd
+        assert messages[0].payload == payload
+        assert buffer == bytearray()
+
+    @pytest.mark.parametrize("version", [3.3, 3.4, 3.5])
+    def test_wrong_key_is_undecodable(self, version: float) -> None:
+        """Frames sealed with another key surface as undecodable, not as errors."""
+        sender = TuyaFrameCodec(version, LOCAL_KEY)
+        receiver = TuyaFrameCodec(version, b"fedcba9876543210")
+
+        messages = receiver.decode(bytearray(sender.encode(7, CONTROL, b'{"dps":{"1":true}}')))
+
+        assert len(messages) == 1
+        assert messages[0].seqno == 7
+        assert messages[0].cmd < 0
+
+    def test_partial_frames_are_buffered(self) -> None:
+        """Incomplete data stays in the buffer until the rest arrives."""
+        codec = TuyaFrameCodec(3.3, LOCAL_KEY)
+        frame = codec.encode(1, DP_QUERY, b'{"dps":{"1":true}}')
+        buffer = bytearray(frame[:10])
+
+        assert codec.decode(buffer) == []
+
+        buffer.extend(frame[10:])
+        assert len(codec.decode(buffer)) == 1
+
+    def test_resyncs_after_garbage(self) -> None:
+        """Leading bytes before a frame prefix are discarded."""
+        codec = TuyaFrameCodec(3.4, LOCAL_KEY)
+        frames = codec.encode(1, DP_QUERY, b"{}") + codec.encode(2, DP_QUERY, b"{}")
+        buffer = bytearray(b"\x01\x02garbage" + frames)
+
+        assert [m.seqno for m in codec.decode(buffer)] == [1, 2]
+
+    def test_unsupported_version_rejected(self) -> None:
+        """3.1/3.2 stay on tinytuya."""
+        with pytest.raises(ValueError):
+            TuyaFrameCodec(3.1, LOCAL_KEY)
+
+    @pytest.mark.parametrize("version", [3.4, 3.5])
+    def test_session_key_is_symmetric(self, version: float) -> None:
+        """Both sides derive the same 16-byte session key from the nonces."""
+        local_nonce, remote_nonce = b"A" * 16, b"B" * 16
+
+        key = derive_session_key(version, LOCAL_KEY, local_nonce, remote_nonce)
+
+        assert len(key) == 16
+        assert key == derive_session_key(version, LOCAL_KEY, local_nonce, remote_nonce)
+        assert key != LOCAL_KEY
+
+
+def test_extract_dps_handles_flat_and_nested_payloads() -> None:
+    """3.3 sends top-level dps, 3.4/3.5 nest them under data."""
+    assert extract_dps(b'{"dps":{"1":true}}') == {"1": True}
+    assert extract_dps(b'{"protocol":4,"data":{"dps":{"10":"low"}}}') == {"10": "low"}
+    assert extract_dps(b"not json") is None
+    assert extract_dps(b"") is None
+
+
+class TestMessageDispatch:
+    """Sequence-number correlation and push routing."""
+
+    @pytest.mark.asyncio
+    async def test_response_resolves_pending_request_by_seqno(self) -> None:
+        """A response is delivered only to the request with the same seqno."""
+        connection = TuyaLocalConnection(DEVICE_ID, "192.168.1.10", LOCAL_KEY.decode(), 3.3)
+        future = asyncio.get_running_loop().create_future()
+        connection._pending[5] = (frozenset({DP_QUERY}), future)
+
+        connection._handle_message(TuyaMessage(4, DP_QUERY, 0, b"{}"))
+        assert not future.done()
+
+        connection._handle_message(TuyaMessage(5, DP_QUERY, 0, b'{"dps":{"1":true}}'))
+        assert future.result().seqno == 5
+
+    @pytest.mark.asyncio
+    async def test_unsolicited_status_is_pushed(self) -> None:
+        """STATUS frames without a pending request go to the push handler."""
+        on_push = MagicMock()
+        connection = TuyaLocalConnection(DEVICE_ID, "192.168.1.10", LOCAL_KEY.decode(), 3.3, on_push=on_push)
+
+        connection._handle_message(TuyaMessage(0, STATUS, 0, b'{"dps":{"4":true}}'))
+
+        on_push.assert_called_once_with({"4": True})
+        assert connection.dps_cache == {"4": True}
+        assert connection.stats["pushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_lost_fails_pending_and_notifies(self) -> None:
+        """Pending requests fail and the owner learns about the drop."""
+        on_lost = MagicMock()
+        connection = TuyaLocalConnection(DEVICE_ID, "192.168.1.10", LOCAL_KEY.decode(), 3.3, on_lost=on_lost)
+        future = asyncio.get_running_loop().create_future()
+        connection._pending[1] = (frozenset({DP_QUERY}), future)
+
+        connection._handle_connection_lost(None)
+
+        assert future.done()
+        assert isinstance(future.exception(), Exception)
+        on_lost.assert_called_once_with(connection)
@@ -0,0 +1,107 @@
+"""Tests for write confirmation tracking and refresh suppression."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.kkt_kolbe.const import CLOUD_PROPAGATION_DELAY_SECONDS
+from custom_components.kkt_kolbe.write_tracker import WriteTracker
+from custom_components.kkt_kolbe.write_tracker import values_match
+
+
+def test_values_match_across_representations() -> None:
+    """Reports confirm writes despite cloud/local encoding differences."""
+    assert values_match("high", "high")
+    assert values_match(5, "5")
+    assert values_match("00000019", "AAAAGQ==")
+    assert not values_match(True, "true")
+    assert not values_match("0500", "0600")
+    assert not values_match("off", "high")
+
+
+def test_tracker_confirms_only_when_every_value_is_reported() -> None:
+    """A partial or differing report keeps the write outstanding."""
+    tracker = WriteTracker()
+    tracker.expect({1: True, 10: "off"})
+
+    assert tracker.confirm({"1": True}) is False
+    assert tracker.confirm({"10": "high"}) is False
+    assert tracker.pending
+    assert tracker.confirm({"10": "off", "4": True}) is True
+    assert not tracker.pending
+    assert tracker.confirm({"10": "off"}) is False
+
+    tracker.expect({5: 100})
+    tracker.expire()
+    assert tracker.stats == {"writes": 2, "confirmed": 1, "unconfirmed": 1}
+
+
+@pytest.mark.asyncio
+async def test_hybrid_push_confirmation_cancels_refresh(hass: HomeAssistant, mock_config_entry) -> None:
+    """An MQTT report of the written value replaces the post-write poll."""
+    from custom_components.kkt_kolbe.hybrid_coordinator import KKTKolbeHybridCoordinator
+
+    mock_config_entry.add_to_hass(hass)
+    client = MagicMock()
+    client.async_send_commands = AsyncMock(return_value=True)
+    client.get_device_codes = MagicMock(return_value={10: "fan_speed_enum"})
+    coord = KKTKolbeHybridCoordinator(
+        hass=hass,
+        device_id="bf735dfe2ad64fba7cpyhn",
+        smartlife_client=client,
+        update_interval=timedelta(seconds=30),
+        entry=mock_config_entry,
+    )
+    coord._push_callback_registered = True
+    coord.async_request_refresh = AsyncMock()
+
+    await coord.async_set_data_point(10, "off")
+    assert coord._pending_refresh_handle is not None
+    coord.async_request_refresh.assert_not_awaited()
+
+    coord._handle_push_update({"10": "off"}, "report")
+
+    assert coord._pending_refresh_handle is None
+    assert coord._dps_cache["10"] == "off"
+    coord._push_callback_registered = False
+    await coord.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_plain_coordinator_polls_when_write_is_not_confirmed(hass: HomeAssistant, mock_config_entry) -> None:
+    """Without a confirming status frame the deferred refresh still runs."""
+    from custom_components.kkt_kolbe.coordinator import KKTKolbeUpdateCoordinator
+
+    mock_config_entry.add_to_hass(hass)
+    device = MagicMock()
+    device.device_id = "test_device_123"
+    device.async_set_dp = AsyncMock(return_value=True)
+    coordinator = KKTKolbeUpdateCoordinator(hass=hass, entry=mock_config_entry, device=device)
+    await coordinator.async_register_push()
+    push = device.register_push_callback.call_args.args[0]
+
+    with patch.object(coordinator, "async_refresh", new=AsyncMock()) as mock_refresh:
+        await coordinator.async_set_data_point(1, True)
+        push({"1": False}, "local")
+        assert coordinator._pending_refresh_handle is not None
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=CLOUD_PROPAGATION_DELAY_SECONDS + 1))
+        await hass.async_block_till_done()
+        assert mock_refresh.call_count == 1
+
+        await coordinator.async_set_data_point(4, True)
+        push({"4": True}, "local")
+        assert coordinator._pending_refresh_handle is None
+
+    assert coordinator.data["dps"]["4"] is True
+    assert coordinator._write_tracker.stats == {"writes": 2, "confirmed": 1, "unconfirmed": 1}
+    await coordinator.async_shutdown()
+    device.unregister_push_callback.assert_called_with(push)
@@ -0,0 +1,595 @@
+"""Emulated Tuya OpenAPI and SmartLife MQTT for cloud-path tests and benchmarks.
+
+``EmulatedTuyaCloud`` is an aiohttp server on localhost that answers the
+OpenAPI endpoints used by ``TuyaCloudClient``: token, device list and details
+(v1.0, v2.0 and batch), the Things Data Model, shadow properties, status,
+firmware info and commands (standard and iot-03). Requests are signed and
+checked exactly like the real platform does, so the client runs its real
+request path:
+
+    async with EmulatedTuyaCloud(devices=[EmulatedCloudDevice.hood(0)]) as cloud:
+        client = TuyaCloudClient(cloud.client_id, cloud.client_secret, cloud.endpoint, session=session)
+        await client.get_device_status(cloud.devices[0].device_id)
+
+The cloud can be made less cooperative:
+
+- ``latency``: seconds added before each response
+- ``quota_per_minute``: answer with code 1011 once a client exceeds it
+- ``fail_next(count, code)``: answer the next requests with an error code,
+  e.g. 1011 (rate limit) or 1004 (sign invalid)
+- ``token_ttl``: lifetime of issued tokens; requests with an expired token
+  get code 1010
+
+The SmartLife path is covered by ``EmulatedSharingManager``, a stand-in for
+``tuya_sharing.Manager`` that reads the same devices and delivers status
+changes from a background thread like the SDK's ``SharingMQ``. Patch it in
+with ``patch("tuya_sharing.Manager", cloud.sharing_manager)``; every
+``set_status()`` on the cloud (or command sent through either path) is then
+pushed to the registered ``_KKTSharingDeviceListener``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import hmac
+import json
+import queue
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from aiohttp import web
+
+CLIENT_ID = "emulatedclientid0001"
+CLIENT_SECRET = "emulatedclientsecret0000000001"
+
+# Things Data Model of a HERMES & STYLE hood: (dp_id, code, typeSpec)
+HOOD_FUNCTIONS: list[tuple[int, str, dict[str, Any]]] = [
+    (1, "switch", {"type": "bool"}),
+    (4, "light", {"type": "bool"}),
+    (6, "switch_lamp", {"type": "bool"}),
+    (10, "fan_speed_enum", {"type": "enum", "range": ["off", "low", "middle", "high", "strong"]}),
+    (13, "countdown", {"type": "value", "min": 0, "max": 60, "scale": 0, "step": 1, "unit": "min"}),
+    (101, "RGB", {"type": "value", "min": 0, "max": 9, "scale": 0, "step": 1}),
+]
+HOOD_STATUS: dict[str, Any] = {
+    "switch": True,
+    "light": False,
+    "switch_lamp": False,
+    "fan_speed_enum": "low",
+    "countdown": 0,
+    "RGB": 0,
+}
+
+# OpenAPI error codes the client handles specially
+CODE_TOKEN_INVALID = 1010
+CODE_RATE_LIMIT = 1011
+CODE_SIGN_INVALID = 1004
+CODE_DEVICE_NOT_FOUND = 2001
+
+_ERROR_MESSAGES = {
+    CODE_TOKEN_INVALID: "token invalid",
+    CODE_RATE_LIMIT: "request frequency is too high",
+    CODE_SIGN_INVALID: "sign invalid",
+    CODE_DEVICE_NOT_FOUND: "device not found",
+}
+
+Handler = Callable[[web.Request, "EmulatedCloudDevice | None"], Awaitable[Any]]
+
+
+@dataclass
+class EmulatedCloudDevice:
+    """A device registered in the emulated cloud project."""
+
+    device_id: str
+    local_key: str
+    name: str = "HERMES & STYLE Hood"
+    product_id: str = "ypaixllljc2dcpae"
+    product_name: str = "KKT Kolbe HERMES & STYLE"
+    category: str = "yyj"
+    ip: str = "192.0.2.10"
+    online: bool = True
+    firmware_version: str = "1.0.5"
+    functions: list[tuple[int, str, dict[str, Any]]] = field(default_factory=lambda: list(HOOD_FUNCTIONS))
+    status: dict[str, Any] = field(default_factory=lambda: dict(HOOD_STATUS))
+
+    @classmethod
+    def hood(cls, index: int) -> EmulatedCloudDevice:
+        """Return a HERMES & STYLE hood whose device ID and local key derive from ``index``."""
+        return cls(f"bf{index:020x}", f"emulatedkey{index:05d}", name=f"Hood {index}")
+
+    def code_for(self, key: str) -> str | None:
+        """Return the status code for a code or a DP id (as sent to the iot-03 commands endpoint)."""
+        for dp_id, code, _ in self.functions:
+            if key in (code, str(dp_id)):
+                return code
+        return None
+
+    def as_v1(self) -> dict[str, Any]:
+        """Return the device as /v1.0/devices describes it (snake_case)."""
+        return {
+            "id": self.device_id,
+            "name": self.name,
+            "local_key": self.local_key,
+            "product_id": self.product_id,
+            "product_name": self.product_name,
+            "category": self.category,
+            "online": self.online,
+            "ip": self.ip,
+            "model": "",
+            "uuid": self.device_id[-16:],
+            "time_zone": "+01:00",
+            "icon": "smart/icon/emulated.png",
+            "status": [{"code": code, "value": value} for code, value in self.status.items()],
+        }
+
+    def as_v2(self) -> dict[str, Any]:
+        """Return the device as /v2.0/cloud/thing describes it (camelCase)."""
+        return {
+            "id": self.device_id,
+            "name": self.name,
+            "localKey": self.local_key,
+            "productId": self.product_id,
+            "productName": self.product_name,
+            "category": self.category,
+            "isOnline": self.online,
+            "ip": self.ip,
+            "model": "",
+            "uuid": self.device_id[-16:],
+            "timeZone": "+01:00",
+            "icon": "smart/icon/emulated.png",
+        }
+
+
+class EmulatedTuyaCloud:
+    """The Tuya OpenAPI of one cloud project, served on a localhost port."""
+
+    def __init__(
+        self,
+        devices: list[EmulatedCloudDevice] | None = None,
+        *,
+        client_id: str = CLIENT_ID,
+        client_secret: str = CLIENT_SECRET,
+        host: str = "127.0.0.1",
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        quota_per_minute: int | None = None,
+        token_ttl: int = 7200,
+        mqtt_latency: float = 0.0,
+        seed: int | None = None,
+        batch_details: bool = True,
+    ) -> None:
+        """Initialize the cloud (does not listen yet).
+
+        Args:
+            devices: Devices of the project; one hood if omitted
+            client_id: Access ID of the project
+            client_secret: Access secret of the project
+            host: Address to listen on
+            latency: Seconds added before each response
+            latency_jitter: Up to this many seconds added on top, at random
+            quota_per_minute: Requests per client and minute before code 1011
+            token_ttl: Lifetime of issued access tokens in seconds
+            mqtt_latency: Seconds before a status change reaches SmartLife listeners
+            seed: Seed for ``latency_jitter``, for reproducible runs
+            batch_details: Offer ``/v2.0/cloud/thing/batch``; without it the
+                path is taken for a device id, as by projects lacking the API
+        """
+        self.devices = list(devices) if devices is not None else [EmulatedCloudDevice.hood(0)]
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.host = host
+        self.port = 0
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.quota_per_minute = quota_per_minute
+        self.token_ttl = token_ttl
+        self.mqtt_latency = mqtt_latency
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "tokens": 0,
+            "commands": 0,
+            "rate_limited": 0,
+            "sign_failures": 0,
+            "token_failures": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+        }
+        # Request count per route, e.g. "GET /v2.0/cloud/thing/{device_id}/model"
+        self.route_stats: dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._tokens: dict[str, float] = {}  # access_token -> expiry (time.time())
+        self._request_times: dict[str, deque[float]] = {}  # client_id -> request times
+        self._injected: deque[int] = deque()
+        self._managers: list[EmulatedSharingManager] = []
+        self._runner: web.AppRunner | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._routes: list[tuple[str, str, Handler]] = [
+            ("GET", "/v1.0/token", self._handle_token),
+            ("GET", "/v2.0/cloud/thing/device", self._handle_device_list_v2),
+            *([("GET", "/v2.0/cloud/thing/batch", self._handle_details_batch)] if batch_details else []),
+            ("GET", "/v1.0/devices", self._handle_device_list_v1),
+            ("GET", "/v1.0/devices/{device_id}", self._handle_details_v1),
+            ("GET", "/v2.0/cloud/thing/{device_id}", self._handle_details_v2),
+            ("GET", "/v2.0/cloud/thing/{device_id}/model", self._handle_model),
+            ("GET", "/v2.0/cloud/thing/{device_id}/shadow/properties", self._handle_shadow),
+            ("GET", "/v1.0/devices/{device_id}/status", self._handle_status),
+            ("GET", "/v1.0/iot-03/devices/{device_id}/upgrade-infos", self._handle_upgrade_infos),
+            ("GET", "/v1.0/iot-03/devices/{device_id}/functions", self._handle_functions),
+            ("GET", "/v1.0/devices/{device_id}/functions", self._handle_functions),
+            ("POST", "/v1.0/iot-03/devices/{device_id}/commands", self._handle_commands),
+            ("POST", "/v1.0/devices/{device_id}/commands", self._handle_commands),
+        ]
+
+    @property
+    def endpoint(self) -> str:
+        """Return the base URL to pass to ``TuyaCloudClient``."""
+        return f"http://{self.host}:{self.port}"
+
+    def device(self, device_id: str) -> EmulatedCloudDevice | None:
+        """Return the device with ``device_id``, if the project has it."""
+        return next((device for device in self.devices if device.device_id == device_id), None)
+
+    async def async_start(self) -> None:
+        """Listen on a free port of ``host``."""
+        self._loop = asyncio.get_running_loop()
+        app = web.Application()
+        for method, path, handler in self._routes:
+            app.router.add_route(method, path, self._wrap(method, path, handler))
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def async_stop(self) -> None:
+        """Stop listening and stop the MQTT threads of all managers."""
+        for manager in list(self._managers):
+            manager.unload()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> EmulatedTuyaCloud:
+        """Start the cloud."""
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the cloud."""
+        await self.async_stop()
+
+    def fail_next(self, count: int = 1, code: int = CODE_RATE_LIMIT) -> None:
+        """Answer the next ``count`` API requests with error ``code``."""
+        self._injected.extend([code] * count)
+
+    def expire_tokens(self) -> None:
+        """Invalidate every issued access token, as after a secret reset."""
+        self._tokens.clear()
+
+    def set_status(self, device_id: str, status: dict[str, Any]) -> None:
+        """Change status codes, as from the appliance itself, and push them over MQTT."""
+        device = self.device(device_id)
+        if device is None:
+            raise KeyError(device_id)
+        device.status.update(status)
+        for manager in list(self._managers):
+            manager.mq.publish(device_id, dict(status))
+
+    def sharing_manager(self, *args: Any, **kwargs: Any) -> EmulatedSharingManager:
+        """Create a SmartLife manager on this cloud; accepts ``tuya_sharing.Manager`` arguments."""
+        manager = EmulatedSharingManager(self)
+        self._managers.append(manager)
+        return manager
+
+    # === Request handling ===
+
+    def _wrap(self, method: str, route: str, handler: Handler) -> Callable[[web.Request], Awaitable[web.Response]]:
+        """Wrap a route handler with latency, signature, quota and fault checks."""
+        route_key = f"{method} {route}"
+
+        async def _handle(request: web.Request) -> web.Response:
+            stats = self.stats
+            stats["requests"] += 1
+            self.route_stats[route_key] = self.route_stats.get(route_key, 0) + 1
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            try:
+                delay = self.latency + (self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+                if delay:
+                    await asyncio.sleep(delay)
+                if (code := await self._check_request(request, is_token_request=route == "/v1.0/token")) is not None:
+                    return _error(code)
+                device = None
+                if "device_id" in request.match_info:
+                    device = self.device(request.match_info["device_id"])
+                    if device is None:
+                        return _error(CODE_DEVICE_NOT_FOUND)
+                return _success(await handler(request, device))
+            finally:
+                stats["in_flight"] -= 1
+
+        return _handle
+
+    async def _check_request(self, request: web.Request, is_token_request: bool) -> int | None:
+        """Return the error code the platform would answer with, or None for a valid request."""
+        if self._injected:
+            code = self._injected.popleft()
+            self._count_failure(code)
+            return code
+
+        headers = request.headers
+        body = await request.text()
+        client_id = headers.get("client_id", "")
+        access_token = headers.get("access_token", "")
+        if client_id != self.client_id or not hmac.compare_digest(
+            headers.get("sign", ""), self._sign(request.method, request.path_qs, headers, body)
+        ):
+            self._count_failure(CODE_SIGN_INVALID)
+            return CODE_SIGN_INVALID
+        if not is_token_request and self._tokens.get(access_token, 0) <= time.time():
+            self._count_failure(CODE_TOKEN_INVALID)
+            return CODE_TOKEN_INVALID
+
+        if self.quota_per_minute is not None:
+            now = time.monotonic()
+            window = self._request_times.setdefault(client_id, deque())
+            while window and window[0] <= now - 60:
+                window.popleft()
+            if len(window) >= self.quota_per_minute:
+                self._count_failure(CODE_RATE_LIMIT)
+                return CODE_RATE_LIMIT
+            window.append(now)
+        return None
+
+    def _count_failure(self, code: int) -> None:
+        """Record an error answer in the stats."""
+        key = {CODE_RATE_LIMIT: "rate_limited", CODE_SIGN_INVALID: "sign_failures", CODE_TOKEN_INVALID: "token_failures"}
+        if code in key:
+            self.stats[key[code]] += 1
+
+    def _sign(self, method: str, path: str, headers: Any, body: str) -> str:
+        """Compute the HMAC-SHA256 signature the platform expects for a request."""
+        content_sha256 = hashlib.sha256(body.encode("utf-8")).hexdigest()
+        string_to_sign = f"{method}\n{content_sha256}\n\n{path}"
+        payload = (
+            self.client_id
+            + headers.get("access_token", "")
+            + headers.get("t", "")
+            + headers.get("nonce", "")
+            + string_to_sign
+        )
+        return hmac.new(self.client_secret.encode(), payload.encode(), hashlib.sha256).hexdigest().upper()
+
+    # === Routes ===
+
+    async def _handle_token(self, request: web.Request, device: EmulatedCloudDevice | None) -> dict[str, Any]:
+        """Issue an access token."""
+        self.stats["tokens"] += 1
+        token = uuid.uuid4().hex
+        self._tokens[token] = time.time() + self.token_ttl
+        return {"access_token": token, "refresh_token": uuid.uuid4().hex, "expire_time": self.token_ttl, "uid": "emu"}
+
+    async def _handle_device_list_v2(self, request: web.Request, device: EmulatedCloudDevice | None) -> list[Any]:
+        """Return the first page of devices (v2.0)."""
+        page_size = int(request.query.get("page_size", 20))
+        return [device.as_v2() for device in self.devices[:page_size]]
+
+    async def _handle_device_list_v1(self, request: web.Request, device: EmulatedCloudDevice | None) -> list[Any]:
+        """Return all devices (v1.0)."""
+        return [device.as_v1() for device in self.devices]
+
+    async def _handle_details_v1(self, request: web.Request, device: EmulatedCloudDevice | None) -> dict[str, Any]:
+        """Return one device (v1.0)."""
+        assert device is not None
+        return device.as_v1()
+
+    async def _handle_details_v2(self, request: web.Request, device: EmulatedCloudDevice | None) -> dict[str, Any]:
+        """Return one device (v2.0)."""
+        assert device is not None
+        return device.as_v2()
+
+    async def _handle_details_batch(self, request: web.Request, device: EmulatedCloudDevice | None) -> list[Any]:
+        """Return the requested devices (v2.0), skipping unknown ids."""
+        device_ids = request.query.get("device_ids", "").split(",")
+        return [found.as_v2() for device_id in device_ids if (found := self.device(device_id)) is not None]
+
+    async def _handle_model(self, request: web.Request, device: EmulatedCloudDevice | None) -> dict[str, Any]:
+        """Return the Things Data Model; the model itself is a JSON string, as on the real platform."""
+        assert device is not None
+        properties = [
+            {"abilityId": dp_id, "code": code, "accessMode": "rw", "typeSpec": dict(spec)}
+            for dp_id, code, spec in device.functions
+        ]
+        model = {"modelId": device.product_id, "services": [{"code": "", "properties": properties}]}
+        return {"category": device.category, "model": json.dumps(model)}
+
+    async def _handle_shadow(self, request: web.Request, device: EmulatedCloudDevice | None) -> dict[str, Any]:
+        """Return the shadow properties (v2.0 status)."""
+        assert device is not None
+        now = int(time.time() * 1000)
+        return {
+            "properties": [
+                {"code": code, "dp_id": dp_id, "type": spec["type"], "value": device.status.get(code), "time": now}
+                for dp_id, code, spec in device.functions
+                if code in device.status
+            ]
+        }
+
+    async def _handle_status(self, request: web.Request, device: EmulatedCloudDevice | None) -> list[Any]:
+        """Return the status (v1.0)."""
+        assert device is not None
+        return [{"code": code, "value": value} for code, value in device.status.items()]
+
+    async def _handle_upgrade_infos(self, request: web.Request, device: EmulatedCloudDevice | None) -> list[Any]:
+        """Return the firmware modules."""
+        assert device is not None
+        return [{"module_type": 9, "module_desc": "MCU", "current_version": device.firmware_version, "upgrade_status": 0}]
+
+    async def _handle_functions(self, request: web.Request, device: EmulatedCloudDevice | None) -> dict[str, Any]:
+        """Return the instruction set (v1.0 functions)."""
+        assert device is not None
+        return {
+            "category": device.category,
+            "functions": [
+                {"code": code, "dp_id": dp_id, "type": spec["type"].capitalize(), "values": json.dumps(spec)}
+                for dp_id, code, spec in device.functions
+            ],
+        }
+
+    async def _handle_commands(self, request: web.Request, device: EmulatedCloudDevice | None) -> bool:
+        """Apply commands and report the changes over MQTT, like the device would."""
+        assert device is not None
+        self.stats["commands"] += 1
+        commands = (await request.json()).get("commands", [])
+        changes = {}
+        for command in commands:
+            if (code := device.code_for(str(command.get("code")))) is not None:
+                changes[code] = command.get("value")
+        if changes:
+            self.set_status(device.device_id, changes)
+        return True
+
+
+class EmulatedCustomerDevice:
+    """The SDK's view of a device (``tuya_sharing.CustomerDevice``)."""
+
+    def __init__(self, device: EmulatedCloudDevice) -> None:
+        """Copy a cloud device, as ``update_device_cache()`` does."""
+        self.id = device.device_id
+        self.name = device.name
+        self.local_key = device.local_key
+        self.product_id = device.product_id
+        self.product_name = device.product_name
+        self.category = device.category
+        self.ip = device.ip
+        self.online = device.online
+        self.support_local = True
+        self.status: dict[str, Any] = copy.deepcopy(device.status)
+        self.local_strategy: dict[int, dict[str, Any]] = {
+            dp_id: {"status_code": code, "config_item": {"valueType": spec["type"].capitalize()}}
+            for dp_id, code, spec in device.functions
+        }
+
+
+class EmulatedSharingMQ(threading.Thread):
+    """Delivers status reports to a manager from a background thread, like ``SharingMQ``."""
+
+    def __init__(self, manager: EmulatedSharingManager) -> None:
+        """Initialize the thread (started by the manager)."""
+        super().__init__(name="EmulatedSharingMQ", daemon=True)
+        self.manager = manager
+        self.delivered = 0
+        self._queue: queue.Queue[tuple[str, dict[str, Any]] | None] = queue.Queue()
+
+    def publish(self, device_id: str, status: dict[str, Any]) -> None:
+        """Queue a status report for delivery."""
+        self._queue.put((device_id, status))
+
+    def stop(self) -> None:
+        """Stop after the reports queued so far."""
+        self._queue.put(None)
+
+    def run(self) -> None:
+        """Deliver queued reports until stopped."""
+        while (message := self._queue.get()) is not None:
+            if self.manager.cloud.mqtt_latency:
+                time.sleep(self.manager.cloud.mqtt_latency)
+            self.manager._on_device_report(*message)
+            self.delivered += 1
+
+
+class EmulatedSharingManager:
+    """Stand-in for ``tuya_sharing.Manager`` backed by an ``EmulatedTuyaCloud``.
+
+    ``update_device_cache()`` copies the cloud's devices into ``device_map``
+    (blocking for the cloud's latency, like the SDK's HTTP calls) and status
+    reports arrive through ``mq``.
+    """
+
+    def __init__(self, cloud: EmulatedTuyaCloud) -> None:
+        """Initialize the manager and start its MQTT thread."""
+        self.cloud = cloud
+        self.device_map: dict[str, EmulatedCustomerDevice] = {}
+        self.device_listeners: set[Any] = set()
+        self.stats: dict[str, int] = {"cache_updates": 0, "commands": 0}
+        self.mq = EmulatedSharingMQ(self)
+        self.mq.start()
+
+    def update_device_cache(self) -> None:
+        """Fetch every device of the account (runs in the executor)."""
+        if self.cloud.latency:
+            time.sleep(self.cloud.latency)
+        self.stats["cache_updates"] += 1
+        self.device_map = {device.device_id: EmulatedCustomerDevice(device) for device in self.cloud.devices}
+
+    def add_device_listener(self, listener: Any) -> None:
+        """Register a ``SharingDeviceListener``."""
+        self.device_listeners.add(listener)
+
+    def remove_device_listener(self, listener: Any) -> None:
+        """Unregister a ``SharingDeviceListener``."""
+        self.device_listeners.discard(listener)
+
+    def send_commands(self, device_id: str, commands: list[dict[str, Any]]) -> None:
+        """Send commands through the cloud; the changes come back as a report."""
+        device = self.cloud.device(device_id)
+        if device is None:
+            raise KeyError(device_id)
+        if self.cloud.latency:
+            time.sleep(self.cloud.latency)
+        self.stats["commands"] += 1
+        changes = {command["code"]: command["value"] for command in commands if device.code_for(command["code"])}
+        # The cloud state belongs to the event loop the server runs on
+        assert self.cloud._loop is not None
+        self.cloud._loop.call_soon_threadsafe(self.cloud.set_status, device_id, changes)
+
+    def unload(self) -> None:
+        """Stop the MQTT thread and detach from the cloud."""
+        self.mq.stop()
+        if self in self.cloud._managers:
+            self.cloud._managers.remove(self)
+
+    def _on_device_report(self, device_id: str, status: dict[str, Any]) -> None:
+        """Apply a report to the cached device and notify listeners (MQTT thread)."""
+        device = self.device_map.get(device_id)
+        if device is None:
+            return
+        device.status.update(status)
+        now = int(time.time() * 1000)
+        for listener in list(self.device_listeners):
+            listener.update_device(device, list(status), {code: now for code in status})
+
+
+@asynccontextmanager
+async def emulated_cloud(device_count: int = 1, **kwargs: Any) -> AsyncIterator[EmulatedTuyaCloud]:
+    """Run an emulated cloud project with ``device_count`` hoods; ``kwargs`` go to ``EmulatedTuyaCloud``."""
+    cloud = EmulatedTuyaCloud([EmulatedCloudDevice.hood(index) for index in range(device_count)], **kwargs)
+    await cloud.async_start()
+    try:
+        yield cloud
+    finally:
+        await cloud.async_stop()
+
+
+def _success(result: Any) -> web.Response:
+    """Return a successful OpenAPI answer."""
+    return web.json_response({"success": True, "result": result, "t": int(time.time() * 1000), "tid": uuid.uuid4().hex})
+
+
+def _error(code: int) -> web.Response:
+    """Return a failed OpenAPI answer; the platform uses HTTP 200 for these too."""
+    return web.json_response(
+        {"success": False, "code": code, "msg": _ERROR_MESSAGES.get(code, "error"), "t": int(time.time() * 1000)}
+    )
@@ -0,0 +1,389 @@
+"""Emulated Tuya LAN appliances for connection, load and latency tests.
+
+``EmulatedTuyaDevice`` is an asyncio TCP server on localhost that answers
+like a KKT Kolbe appliance on protocol 3.3, 3.4 or 3.5: it negotiates 3.4/3.5
+session keys, answers DP queries, acknowledges control commands, pushes the
+changed DPs as STATUS frames and replies to heartbeats. Both tinytuya and the
+asyncio transport can talk to it, so ``KKTKolbeTuyaDevice`` runs its real
+connection path against it:
+
+    async with emulated_devices(10, version=3.4) as devices:
+        device = KKTKolbeTuyaDevice(
+            devices[0].device_id, "127.0.0.1", devices[0].local_key, version="3.4", port=devices[0].port
+        )
+
+Every device can be made less cooperative:
+
+- ``latency``: seconds added before each response
+- ``packet_loss``: probability that a request is ignored
+- ``partial_status``: answer DP queries with at most this many DPs
+- ``rotate_key()``: re-pair with a new local key; clients using the old key
+  get undecodable answers (Error 914)
+- ``drop_connections()``: close all client sockets, e.g. for reconnect storms
+
+Frame layouts are shared with ``tuya_transport``; device frames additionally
+carry the return code that tinytuya expects in front of the payload.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import binascii
+import hmac
+import json
+import os
+import random
+import struct
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from hashlib import sha256
+from typing import Any
+
+from Crypto.Cipher import AES
+
+from custom_components.kkt_kolbe.tuya_transport import _HEADER_55AA
+from custom_components.kkt_kolbe.tuya_transport import _HEADER_6699
+from custom_components.kkt_kolbe.tuya_transport import _PREFIX_55AA_BYTES
+from custom_components.kkt_kolbe.tuya_transport import _PREFIX_6699_BYTES
+from custom_components.kkt_kolbe.tuya_transport import CONTROL
+from custom_components.kkt_kolbe.tuya_transport import CONTROL_NEW
+from custom_components.kkt_kolbe.tuya_transport import DP_QUERY
+from custom_components.kkt_kolbe.tuya_transport import DP_QUERY_NEW
+from custom_components.kkt_kolbe.tuya_transport import HEART_BEAT
+from custom_components.kkt_kolbe.tuya_transport import NO_PROTOCOL_HEADER_CMDS
+from custom_components.kkt_kolbe.tuya_transport import PREFIX_55AA
+from custom_components.kkt_kolbe.tuya_transport import PREFIX_6699
+from custom_components.kkt_kolbe.tuya_transport import SESS_KEY_NEG_FINISH
+from custom_components.kkt_kolbe.tuya_transport import SESS_KEY_NEG_RESP
+from custom_components.kkt_kolbe.tuya_transport import SESS_KEY_NEG_START
+from custom_components.kkt_kolbe.tuya_transport import STATUS
+from custom_components.kkt_kolbe.tuya_transport import SUFFIX_55AA
+from custom_components.kkt_kolbe.tuya_transport import SUFFIX_6699
+from custom_components.kkt_kolbe.tuya_transport import UPDATEDPS
+from custom_components.kkt_kolbe.tuya_transport import TuyaFrameCodec
+from custom_components.kkt_kolbe.tuya_transport import _pad
+from custom_components.kkt_kolbe.tuya_transport import derive_session_key
+from custom_components.kkt_kolbe.tuya_transport import extract_dps
+
+# Status of a HERMES & STYLE hood, used when a device is created without DPs
+DEFAULT_DPS: dict[str, Any] = {"1": True, "4": False, "6": False, "10": "low", "13": 0, "101": 0}
+
+_QUERY_CMDS = frozenset({DP_QUERY, DP_QUERY_NEW})
+_CONTROL_CMDS = frozenset({CONTROL, CONTROL_NEW})
+# Requests the device answers; the only ones packet loss applies to
+_REQUEST_CMDS = _QUERY_CMDS | _CONTROL_CMDS | {HEART_BEAT, UPDATEDPS}
+
+
+def encode_device_frame(version: float, key: bytes, seqno: int, cmd: int, payload: bytes, retcode: int = 0) -> bytes:
+    """Encode a frame as sent by a device.
+
+    Unlike client frames these start with a return code, and acknowledgements
+    have no payload at all (tinytuya treats them as a "null ack" and reads
+    on for the STATUS frame that follows).
+    """
+    version_header = f"{version:.1f}".encode() + b"\0" * 12 if payload and cmd not in NO_PROTOCOL_HEADER_CMDS else b""
+    retcode_bytes = struct.pack(">I", retcode)
+
+    if version == 3.5:
+        plain = retcode_bytes + version_header + payload
+        iv = os.urandom(12)
+        header = _HEADER_6699.pack(PREFIX_6699, 0, seqno, cmd, len(plain) + 28)
+        cipher = AES.new(key, AES.MODE_GCM, nonce=iv)
+        cipher.update(header[4:])
+        encrypted, tag = cipher.encrypt_and_digest(plain)
+        return header + iv + encrypted + tag + struct.pack(">I", SUFFIX_6699)
+
+    if version == 3.4:
+        body = retcode_bytes
+        if payload:
+            body += AES.new(key, AES.MODE_ECB).encrypt(_pad(version_header + payload))
+        header = _HEADER_55AA.pack(PREFIX_55AA, seqno, cmd, len(body) + 36)
+        integrity = hmac.new(key, header + body, sha256).digest()
+    else:
+        body = retcode_bytes
+        if payload:
+            body += version_header + AES.new(key, AES.MODE_ECB).encrypt(_pad(payload))
+        header = _HEADER_55AA.pack(PREFIX_55AA, seqno, cmd, len(body) + 8)
+        integrity = struct.pack(">I", binascii.crc32(header + body) & 0xFFFFFFFF)
+
+    return header + body + integrity + struct.pack(">I", SUFFIX_55AA)
+
+
+def _next_frame(buffer: bytearray, version: float) -> tuple[int, int, bytes] | None:
+    """Cut the next complete frame off the receive buffer.
+
+    Frames are handled one at a time since a 3.4/3.5 session key takes
+    effect right after SESS_KEY_NEG_FINISH, while the frames behind it in the
+    same read are already encrypted with it.
+
+    Returns:
+        (seqno, cmd, frame), or None until a complete frame has arrived.
+    """
+    prefix = _PREFIX_6699_BYTES if version == 3.5 else _PREFIX_55AA_BYTES
+    start = buffer.find(prefix)
+    if start < 0:
+        del buffer[: max(0, len(buffer) - 3)]
+        return None
+    del buffer[:start]
+
+    if version == 3.5:
+        if len(buffer) < _HEADER_6699.size:
+            return None
+        _, _, seqno, cmd, length = _HEADER_6699.unpack_from(buffer)
+        total = _HEADER_6699.size + length + 4
+    else:
+        if len(buffer) < _HEADER_55AA.size:
+            return None
+        _, seqno, cmd, length = _HEADER_55AA.unpack_from(buffer)
+        total = _HEADER_55AA.size + length
+    if len(buffer) < total:
+        return None
+
+    frame = bytes(buffer[:total])
+    del buffer[:total]
+    return seqno, cmd, frame
+
+
+class _DeviceSession(asyncio.Protocol):
+    """One client connection to an emulated device."""
+
+    def __init__(self, device: EmulatedTuyaDevice) -> None:
+        self.device = device
+        self.codec = TuyaFrameCodec(device.version, device.local_key_bytes)
+        self.transport: asyncio.Transport | None = None
+        self._buffer = bytearray()
+        self._local_nonce = b""
+        self._remote_nonce = b""
+        self._seqno = 0
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Register the session with its device."""
+        self.transport = transport  # type: ignore[assignment]
+        self.device.stats["connections"] += 1
+        self.device._sessions.add(self)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Forget the session."""
+        self.transport = None
+        self.device._sessions.discard(self)
+
+    def data_received(self, data: bytes) -> None:
+        """Handle every complete frame in arrival order."""
+        self._buffer.extend(data)
+        while (frame := _next_frame(self._buffer, self.device.version)) is not None:
+            self._handle_frame(*frame)
+
+    def close(self) -> None:
+        """Close the client socket."""
+        if self.transport is not None:
+            self.transport.close()
+
+    def write(self, frame: bytes) -> None:
+        """Write a frame unless the client has gone away in the meantime."""
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.write(frame)
+
+    def send(self, seqno: int, cmd: int, payload: bytes) -> None:
+        """Encode a frame with the current key and hand it to the device."""
+        self.device._send(self, encode_device_frame(self.device.version, self.codec.key, seqno, cmd, payload))
+
+    def push(self, dps: dict[str, Any]) -> None:
+        """Send the given DPs as an unsolicited STATUS frame."""
+        if self.device.version >= 3.4:
+            data: dict[str, Any] = {"protocol": 4, "t": int(time.time()), "data": {"dps": dps}}
+        else:
+            data = {"devId": self.device.device_id, "t": int(time.time()), "dps": dps}
+        # Seqno 0 so a push can't be mistaken for the answer to a request
+        self.send(0, STATUS, _dumps(data))
+
+    def _handle_frame(self, seqno: int, cmd: int, frame: bytes) -> None:
+        """Answer one client frame."""
+        device = self.device
+        if cmd in _REQUEST_CMDS:
+            device.stats["requests"] += 1
+            if device.packet_loss and device._random.random() < device.packet_loss:
+                device.stats["dropped"] += 1
+                return
+
+        message = self.codec.decode(bytearray(frame))[0]
+        if message.cmd < 0:
+            # Sealed with another key (typically the one before rotate_key()):
+            # answer with the current key, which the client can't decode
+            device.stats["undecodable"] += 1
+            if cmd == SESS_KEY_NEG_START:
+                self.send(seqno, SESS_KEY_NEG_RESP, os.urandom(48))
+            elif cmd != SESS_KEY_NEG_FINISH:
+                self.send(seqno, cmd, _dumps({"dps": {}}))
+            return
+
+        local_key = device.local_key_bytes
+        if cmd == SESS_KEY_NEG_START:
+            self._local_nonce = message.payload[:16]
+            self._remote_nonce = os.urandom(16)
+            self.send(
+                seqno, SESS_KEY_NEG_RESP, self._remote_nonce + hmac.new(local_key, self._local_nonce, sha256).digest()
+            )
+        elif cmd == SESS_KEY_NEG_FINISH:
+            expected = hmac.new(local_key, self._remote_nonce, sha256).digest()
+            if not self._remote_nonce or not hmac.compare_digest(message.payload[:32], expected):
+                self.close()
+                return
+            self.codec.key = derive_session_key(device.version, local_key, self._local_nonce, self._remote_nonce)
+        elif cmd in _QUERY_CMDS:
+            self.send(seqno, cmd, _dumps({"devId": device.device_id, "dps": device._status_dps()}))
+        elif cmd in _CONTROL_CMDS:
+            self.send(seqno, cmd, b"")
+            if dps := extract_dps(message.payload):
+                device.set_dps(dps)
+        elif cmd == HEART_BEAT:
+            self.send(seqno, HEART_BEAT, b"")
+        elif cmd == UPDATEDPS:
+            self.push(dict(device.dps))
+
+
+class EmulatedTuyaDevice:
+    """An appliance speaking the Tuya LAN protocol on a localhost port."""
+
+    def __init__(
+        self,
+        device_id: str,
+        local_key: str,
+        version: float = 3.3,
+        dps: dict[str, Any] | None = None,
+        *,
+        host: str = "127.0.0.1",
+        latency: float = 0.0,
+        packet_loss: float = 0.0,
+        partial_status: int | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the device (does not listen yet).
+
+        Args:
+            device_id: Tuya device ID
+            local_key: 16-character local key
+            version: Protocol version (3.3, 3.4 or 3.5)
+            dps: Initial DP values, keyed by DP id
+            host: Address to listen on
+            latency: Seconds added before each response
+            packet_loss: Probability (0-1) that a request is ignored
+            partial_status: Answer DP queries with at most this many DPs,
+                            cycling through all of them
+            seed: Seed for packet loss, for reproducible runs
+        """
+        self.device_id = device_id
+        self.version = version
+        self.host = host
+        self.port = 0
+        self.dps: dict[str, Any] = dict(DEFAULT_DPS if dps is None else dps)
+        self.latency = latency
+        self.packet_loss = packet_loss
+        self.partial_status = partial_status
+        self.local_key_bytes = local_key.encode("latin1")
+        self.stats: dict[str, int] = {"connections": 0, "requests": 0, "dropped": 0, "undecodable": 0, "pushes": 0}
+        self._random = random.Random(seed)
+        self._sessions: set[_DeviceSession] = set()
+        self._server: asyncio.Server | None = None
+        self._delayed_writes: set[asyncio.TimerHandle] = set()
+        self._status_offset = 0
+
+    @property
+    def local_key(self) -> str:
+        """Return the current local key."""
+        return self.local_key_bytes.decode("latin1")
+
+    @property
+    def connected_clients(self) -> int:
+        """Return the number of open client sockets."""
+        return len(self._sessions)
+
+    async def async_start(self) -> None:
+        """Listen on a free port of ``host``."""
+        self._server = await asyncio.get_running_loop().create_server(lambda: _DeviceSession(self), self.host, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def async_stop(self) -> None:
+        """Close all clients and stop listening."""
+        for handle in self._delayed_writes:
+            handle.cancel()
+        self._delayed_writes.clear()
+        self.drop_connections()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> EmulatedTuyaDevice:
+        """Start the device."""
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the device."""
+        await self.async_stop()
+
+    def set_dps(self, dps: dict[str, Any]) -> None:
+        """Change DPs, as from the appliance's own controls, and push them to all clients."""
+        dps = {str(dp): value for dp, value in dps.items()}
+        self.dps.update(dps)
+        self.stats["pushes"] += 1
+        for session in list(self._sessions):
+            session.push(dps)
+
+    def rotate_key(self, local_key: str) -> None:
+        """Re-pair with a new local key; the device drops its clients like a real re-pairing."""
+        self.local_key_bytes = local_key.encode("latin1")
+        self.drop_connections()
+
+    def drop_connections(self) -> None:
+        """Close every client socket."""
+        for session in list(self._sessions):
+            session.close()
+
+    def _status_dps(self) -> dict[str, Any]:
+        """Return the DPs for a query answer, a slice of them with ``partial_status``."""
+        if not self.partial_status or self.partial_status >= len(self.dps):
+            return dict(self.dps)
+        keys = list(self.dps)
+        start = self._status_offset % len(keys)
+        self._status_offset = start + self.partial_status
+        selected = (keys + keys)[start : start + self.partial_status]
+        return {key: self.dps[key] for key in selected}
+
+    def _send(self, session: _DeviceSession, frame: bytes) -> None:
+        """Write a frame, after ``latency`` seconds if set."""
+        if not self.latency:
+            session.write(frame)
+            return
+
+        def _write() -> None:
+            self._delayed_writes.discard(handle)
+            session.write(frame)
+
+        handle = asyncio.get_running_loop().call_later(self.latency, _write)
+        self._delayed_writes.add(handle)
+
+
+@asynccontextmanager
+async def emulated_devices(count: int, version: float = 3.3, **kwargs: Any) -> AsyncIterator[list[EmulatedTuyaDevice]]:
+    """Run ``count`` emulated appliances, each on its own port.
+
+    Device IDs and local keys are derived from the index; ``kwargs`` go to
+    every ``EmulatedTuyaDevice``.
+    """
+    devices = [
+        EmulatedTuyaDevice(f"bf{index:020x}", f"emulatedkey{index:05d}", version, **kwargs) for index in range(count)
+    ]
+    try:
+        for device in devices:
+            await device.async_start()
+        yield devices
+    finally:
+        for device in devices:
+            await device.async_stop()
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Serialize a payload as compact JSON, like the devices do."""
+    return json.dumps(data, separators=(",", ":")).encode()